@@ -285,9 +285,10 @@ export class TTSModule extends Module {
             });
 
             const result = await response.json();
-            if (result.success && (result.audioBase64 || result.audio_base64)) {
-                const base64Data = result.audioBase64 || result.audio_base64;
-                const audio = new Audio(`data:audio/mp3;base64,${base64Data}`);
+            const base64Data = result.audioBase64 || result.audio_base64;
+            if (result.success && (base64Data || result.audioUrl)) {
+                // 서버가 URL 전달 모드(/output/...)면 audioUrl로 바로 재생
+                const audio = new Audio(base64Data ? `data:audio/mp3;base64,${base64Data}` : result.audioUrl);
                 audio.play();
 
             } else {
@@ -0,0 +1,316 @@
+"""
+영상 렌더링 벤치마크
+FFmpeg lavfi(testsrc2/sine)로 합성 타임라인을 만들어 VideoService.generate_final_video 처리량 측정
+
+외부 API/네트워크 없이 실행되므로 커밋별로 같은 장비에서 렌더링 속도 변화를 추적할 수 있다.
+
+타임라인 종류:
+- images: 이미지 씬 + 씬별 TTS 오디오
+- clips: 짧은 영상 클립(1280x720 24fps, 오디오 포함) + 씬별 TTS 오디오
+- mixed: 이미지 / 영상 클립 / 비주얼 없음(검은 화면)을 번갈아 배치
+- master: 이미지 씬 + 공용 마스터 오디오 구간(#t=start,end)
+
+측정 항목 (타임라인 x 프로필 x 엔진별):
+- scenesPerMinute, realtimeFactor(타임라인 길이 / 렌더링 시간)
+- peakRssBytes (백엔드 + FFmpeg 자식 프로세스 합계 최대값)
+- peakTempBytes (렌더링 중 임시 폴더 최대 증가량), outputBytes
+
+사용법:
+    python benchmark_render.py
+    python benchmark_render.py --scenes 20 --duration 4 --profiles final,draft --engines segments,single_pass
+    python benchmark_render.py --timelines images,master --output bench.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import threading
+import subprocess
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from services.utils import OUTPUT_DIR
+from services.video_service import video_service
+
+TIMELINES = ("images", "clips", "mixed", "master")
+
+# 이미지 씬 원본 크기 (Flux 등 생성 이미지와 비슷한 비율)
+IMAGE_SIZE = "1344x768"
+CLIP_SIZE = "1280x720"
+CLIP_FPS = 24
+
+
+def _ffmpeg(args: List[str]):
+    cmd = ['ffmpeg', '-y', '-v', 'error'] + args
+    result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg 자산 생성 실패: {' '.join(cmd)}\n{result.stderr[-500:]}")
+
+
+def generate_assets(asset_dir: str, scenes: int, duration: float) -> Dict[str, Any]:
+    """
+    합성 자산 생성 (씬마다 다른 이미지/클립/톤, 공용 마스터 오디오 1개)
+
+    Returns:
+        {"images": [...], "clips": [...], "audios": [...], "master": url} - /output/ 기준 URL
+    """
+    os.makedirs(asset_dir, exist_ok=True)
+    url_base = "/output/" + os.path.relpath(asset_dir, OUTPUT_DIR).replace('\\', '/')
+
+    # testsrc2는 프레임마다 내용이 바뀌므로 1fps로 뽑으면 씬별로 다른 이미지
+    _ffmpeg(['-f', 'lavfi', '-i', f'testsrc2=size={IMAGE_SIZE}:rate=1:duration={scenes}',
+             os.path.join(asset_dir, 'img_%03d.png')])
+    images = [f"{url_base}/img_{i + 1:03d}.png" for i in range(scenes)]
+
+    clips, audios = [], []
+    for i in range(scenes):
+        clip_name = f"clip_{i:03d}.mp4"
+        _ffmpeg(['-f', 'lavfi', '-i', f'testsrc2=size={CLIP_SIZE}:rate={CLIP_FPS}:duration={duration}',
+                 '-f', 'lavfi', '-i', f'sine=frequency={220 + i * 20}:duration={duration}',
+                 '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p',
+                 '-c:a', 'aac', '-shortest', os.path.join(asset_dir, clip_name)])
+        clips.append(f"{url_base}/{clip_name}")
+
+        audio_name = f"tts_{i:03d}.mp3"
+        _ffmpeg(['-f', 'lavfi', '-i', f'sine=frequency={440 + i * 10}:duration={duration}',
+                 '-c:a', 'libmp3lame', '-b:a', '128k', os.path.join(asset_dir, audio_name)])
+        audios.append(f"{url_base}/{audio_name}")
+
+    _ffmpeg(['-f', 'lavfi', '-i', f'sine=frequency=330:duration={scenes * duration}',
+             '-c:a', 'libmp3lame', '-b:a', '128k', os.path.join(asset_dir, 'master.mp3')])
+
+    return {"images": images, "clips": clips, "audios": audios, "master": f"{url_base}/master.mp3"}
+
+
+def build_timeline(kind: str, assets: Dict[str, Any], scenes: int, duration: float) -> List[Dict[str, Any]]:
+    """합성 타임라인(standalone 씬 목록) 구성"""
+    timeline = []
+    for i in range(scenes):
+        scene: Dict[str, Any] = {"sceneId": i + 1, "script": f"벤치마크 씬 {i + 1}", "duration": duration,
+                                 "audioUrl": assets["audios"][i]}
+        if kind == "images":
+            scene["visualUrl"] = assets["images"][i]
+        elif kind == "clips":
+            scene["visualUrl"] = assets["clips"][i]
+        elif kind == "mixed":
+            if i % 3 == 0:
+                scene["visualUrl"] = assets["images"][i]
+            elif i % 3 == 1:
+                scene["visualUrl"] = assets["clips"][i]
+        elif kind == "master":
+            scene["visualUrl"] = assets["images"][i]
+            start, end = i * duration, (i + 1) * duration
+            scene["audioUrl"] = f"{assets['master']}#t={start:g},{end:g}"
+        timeline.append(scene)
+    return timeline
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ResourceSampler:
+    """렌더링 중 메모리(RSS)와 임시 폴더 크기를 주기적으로 샘플링"""
+
+    def __init__(self, temp_dir: str, interval: float = 0.2):
+        self.temp_dir = temp_dir
+        self.interval = interval
+        self.baseline_temp = _dir_size(temp_dir)
+        self.peak_rss = 0
+        self.peak_temp = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+        try:
+            import psutil
+            self._process = psutil.Process()
+        except ImportError:
+            # psutil이 없으면 resource 모듈의 최대 RSS 사용 (Unix 전용)
+            self._process = None
+
+    def _rss(self) -> int:
+        if self._process is None:
+            return 0
+        total = 0
+        try:
+            for proc in [self._process] + self._process.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, self._rss())
+            self.peak_temp = max(self.peak_temp, _dir_size(self.temp_dir) - self.baseline_temp)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        if self._process is None:
+            try:
+                import resource
+                # Linux는 KB 단위, 프로세스 수명 전체의 최대값 (자식은 가장 큰 FFmpeg 1개 기준)
+                usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+                self.peak_rss = usage * (1 if sys.platform == "darwin" else 1024)
+            except ImportError:
+                pass
+        return False
+
+
+def run_case(timeline: List[Dict[str, Any]], kind: str, profile: str, engine: str,
+             resolution: str, quiet: bool) -> Dict[str, Any]:
+    """타임라인 1개를 렌더링하고 처리량/자원 사용량 측정"""
+    timeline_seconds = sum(float(scene["duration"]) for scene in timeline)
+    case: Dict[str, Any] = {"timeline": kind, "profile": profile, "engine": engine,
+                            "scenes": len(timeline), "timelineSeconds": round(timeline_seconds, 3)}
+
+    output = open(os.devnull, 'w') if quiet else None
+    started = time.perf_counter()
+    try:
+        with ResourceSampler(video_service.processing_dir) as sampler:
+            with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+                result = video_service.generate_final_video(
+                    merged_groups=[], standalone=timeline, resolution=resolution,
+                    use_cache=False, render_engine=engine, profile=profile
+                )
+        elapsed = time.perf_counter() - started
+    except Exception as e:
+        case.update({"success": False, "error": str(e)})
+        return case
+    finally:
+        if output:
+            output.close()
+
+    final_path = os.path.join(OUTPUT_DIR, os.path.basename(result["videoUrl"]))
+    output_bytes = os.path.getsize(final_path) if os.path.exists(final_path) else 0
+    if os.path.exists(final_path):
+        os.remove(final_path)
+
+    stats = result.get("renderStats", {})
+    case.update({
+        "success": True,
+        "renderEngine": result.get("renderEngine"),
+        "audioMode": result.get("audioMode"),
+        "resolution": result.get("renderSettings", {}).get("resolution"),
+        "seconds": round(elapsed, 3),
+        "scenesPerMinute": round(len(timeline) / elapsed * 60, 2),
+        "realtimeFactor": round(timeline_seconds / elapsed, 3),
+        "peakRssBytes": sampler.peak_rss,
+        "peakTempBytes": sampler.peak_temp,
+        "outputBytes": output_bytes,
+        "sceneModes": {mode: stats.get(mode, 0)
+                       for mode in ("copied", "encoded", "cached", "filler", "failed") if stats.get(mode)}
+    })
+    return case
+
+
+def _environment() -> Dict[str, Any]:
+    env: Dict[str, Any] = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpuCount": os.cpu_count(),
+        "renderWorkers": video_service.render_workers,
+        "ffmpegThreads": video_service.ffmpeg_threads,
+    }
+    try:
+        version = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True).stdout.splitlines()
+        env["ffmpeg"] = version[0] if version else None
+    except Exception:
+        env["ffmpeg"] = None
+    try:
+        env["commit"] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                       text=True, cwd=project_root).stdout.strip() or None
+    except Exception:
+        env["commit"] = None
+    return env
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="VideoService 렌더링 벤치마크 (오프라인 합성 타임라인)")
+    parser.add_argument("--scenes", type=int, default=8, help="타임라인당 씬 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="씬 길이(초)")
+    parser.add_argument("--timelines", default=",".join(TIMELINES), help=f"타임라인 종류 ({', '.join(TIMELINES)})")
+    parser.add_argument("--profiles", default=",".join(video_service.RENDER_PROFILES), help="렌더링 프로필")
+    parser.add_argument("--engines", default="segments", help=f"렌더링 엔진 ({', '.join(video_service.RENDER_ENGINES)})")
+    parser.add_argument("--resolution", default="1080p", help="해상도 (1080p, vertical, 4k 등)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (생략 시 표준 출력만)")
+    parser.add_argument("--keep-assets", action="store_true", help="생성한 합성 자산 유지")
+    parser.add_argument("--verbose", action="store_true", help="VideoService 로그 출력")
+    args = parser.parse_args(argv)
+
+    timelines = [t.strip() for t in args.timelines.split(",") if t.strip()]
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    for kind in timelines:
+        if kind not in TIMELINES:
+            parser.error(f"지원하지 않는 타임라인: {kind}")
+    for name in profiles:
+        if name not in video_service.RENDER_PROFILES:
+            parser.error(f"지원하지 않는 프로필: {name}")
+    for name in engines:
+        if name not in video_service.RENDER_ENGINES:
+            parser.error(f"지원하지 않는 엔진: {name}")
+
+    asset_dir = os.path.join(OUTPUT_DIR, "benchmark", time.strftime("%Y%m%d_%H%M%S"))
+    print(f"[Benchmark] 합성 자산 생성 중... ({args.scenes}개 씬 x {args.duration}초)", file=sys.stderr)
+    try:
+        assets = generate_assets(asset_dir, args.scenes, args.duration)
+
+        results = []
+        for kind in timelines:
+            timeline = build_timeline(kind, assets, args.scenes, args.duration)
+            for name in profiles:
+                for engine in engines:
+                    print(f"[Benchmark] {kind} / {name} / {engine} 렌더링 중...", file=sys.stderr)
+                    case = run_case(timeline, kind, name, engine, args.resolution, quiet=not args.verbose)
+                    if case.get("success"):
+                        print(f"[Benchmark]   {case['seconds']}초, {case['scenesPerMinute']} scenes/min, "
+                              f"{case['realtimeFactor']}x realtime", file=sys.stderr)
+                    else:
+                        print(f"[Benchmark]   실패: {case.get('error')}", file=sys.stderr)
+                    results.append(case)
+    finally:
+        if not args.keep_assets:
+            shutil.rmtree(asset_dir, ignore_errors=True)
+            with contextlib.suppress(OSError):
+                os.rmdir(os.path.dirname(asset_dir))  # 다른 실행 결과가 없으면 benchmark 폴더도 정리
+
+    report = {
+        "environment": _environment(),
+        "settings": {"scenes": args.scenes, "duration": args.duration, "resolution": args.resolution},
+        "results": results
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
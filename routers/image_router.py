@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 from services.image_service import image_service
 from services.vision_service import vision_service
 from services.prompt_assembler import prompt_assembler
-from services.task_service import task_manager
+from services.task_service import task_manager, TaskCancelledError
 from services.utils import BASE_DIR
 
 router = APIRouter(tags=["Image"])
@@ -124,6 +124,8 @@ async def process_prompts(tid: str, scene_list: list, img_settings: dict):
             style_prompt = str(style_info or '')
 
         for i, scene in enumerate(scene_list):
+            # 취소된 작업이면 다음 장면의 LLM 호출을 시작하지 않음
+            task_manager.check_cancelled(tid)
             scene_id = scene.get('sceneId')
             script = scene.get('script', '')
             
@@ -218,6 +220,8 @@ Remember: 50-80 words, ONLY output the prompt text itself.
                 results.append({"sceneId": scene_id, "imagePrompt": assembled_prompt})
 
         task_manager.update_task(tid, status="completed", progress=100, message="모든 프롬프트 생성 완료!", result={"prompts": results})
+    except TaskCancelledError:
+        logger.info(f"Image prompt task cancelled: {tid} ({len(results)}/{len(scene_list)} done)")
     except Exception as e:
         logger.error(f"Error in process_prompts: {e}")
         task_manager.update_task(tid, status="failed", error=str(e))
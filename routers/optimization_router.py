@@ -12,6 +12,9 @@ from services.cache_service_with_redis import hybrid_cache_service
 from services.memory_monitor_service import memory_monitor_service
 from services.async_service import async_service
 from services.large_file_processing_service import large_file_processing_service
+from services.file_cache_service import segment_cache
+from services.media_probe_service import media_probe_service
+from services.tts_cache_service import tts_cache_service
 
 router = APIRouter(prefix="/api/optimization", tags=["optimization"])
 
@@ -35,6 +38,9 @@ async def get_cache_stats():
             "success": True,
             "memory_cache": memory_stats,
             "hybrid_cache": hybrid_stats,
+            "segment_cache": segment_cache.get_stats(),
+            "media_probe_cache": media_probe_service.get_stats(),
+            "tts_cache": tts_cache_service.get_stats(),
             "cache_service": {
                 "type": "in_memory",
                 "max_size": cache_service.max_size,
@@ -72,6 +78,51 @@ async def clear_cache(clear_redis: bool = False):
         raise HTTPException(status_code=500, detail=f"캐시 삭제 실패: {e}")
 
 
+@router.get("/segment-cache/stats")
+async def get_segment_cache_stats():
+    """
+    렌더링 세그먼트 캐시 통계 조회
+    - 히트/미스 횟수 및 히트율
+    - 디스크 사용량 / 용량 제한
+    - LRU 정리 횟수
+    """
+    try:
+        return {
+            "success": True,
+            "segment_cache": segment_cache.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세그먼트 캐시 통계 조회 실패: {e}")
+
+
+@router.post("/segment-cache/clear")
+async def clear_segment_cache():
+    """렌더링 세그먼트 캐시 파일 전체 삭제"""
+    try:
+        cleared = segment_cache.clear()
+        return {
+            "success": True,
+            "message": "세그먼트 캐시 삭제 완료",
+            "cleared_entries": cleared
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세그먼트 캐시 삭제 실패: {e}")
+
+
+@router.post("/tts-cache/clear")
+async def clear_tts_cache():
+    """TTS 오디오 캐시 파일 전체 삭제"""
+    try:
+        cleared = tts_cache_service.clear()
+        return {
+            "success": True,
+            "message": "TTS 캐시 삭제 완료",
+            "cleared_entries": cleared
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TTS 캐시 삭제 실패: {e}")
+
+
 @router.get("/memory/status")
 async def get_memory_status():
     """
@@ -252,6 +303,7 @@ async def get_performance_summary():
                 "memory_usage_percent": current_memory,
                 "cache_hit_rate_percent": cache_hit_rate,
                 "cache_entries": cache_service.get_stats().get('total_entries', 0),
+                "segment_cache_hit_rate_percent": segment_cache.get_stats().get('hit_rate_percent', 0),
                 "memory_alerts": len(memory_monitor_service.get_alerts())
             }
         }
@@ -282,6 +334,21 @@ async def get_optimization_health():
                 "error": str(e)
             }
         
+        # 세그먼트 캐시 건강 상태
+        try:
+            segment_stats = segment_cache.get_stats()
+            results["segment_cache"] = {
+                "status": "healthy",
+                "entries": segment_stats.get('total_entries', 0),
+                "hit_rate": segment_stats.get('hit_rate_percent', 0),
+                "size_mb": segment_stats.get('size_mb', 0)
+            }
+        except Exception as e:
+            results["segment_cache"] = {
+                "status": "unhealthy",
+                "error": str(e)
+            }
+        
         # 메모리 모니터링 서비스 건강 상태
         try:
             memory_status = memory_monitor_service.get_current_status()
@@ -19,3 +19,16 @@ async def get_task_status(task_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=404, detail="Task not found")
     
     return task
+
+@router.post("/{task_id}/cancel")
+async def cancel_task(task_id: str) -> Dict[str, Any]:
+    """
+    Cancel a running background task.
+    Kills its in-flight FFmpeg processes and stops scheduling further scenes/prompts.
+    """
+    task = task_manager.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    cancelled = task_manager.cancel_task(task_id)
+    return {"success": cancelled, "taskId": task_id, "status": task_manager.get_task(task_id)["status"]}
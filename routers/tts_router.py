@@ -1,8 +1,12 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from services.tts_service import tts_service
+from services.task_service import task_manager, TaskCancelledError
+from services.utils import OUTPUT_DIR
+import os
 import logging
+import threading
 
 # 라우터 설정
 router = APIRouter(tags=["TTS"])
@@ -15,12 +19,25 @@ class TTSSettings(BaseModel):
     voiceId: Optional[str] = None
     stability: float = 0.5
     speed: float = 1.0
+    delivery: Optional[str] = None  # url / inline / auto (None이면 서버 설정 TTS_AUDIO_DELIVERY)
 
 class TTSRequest(BaseModel):
     sceneId: str
     text: str
     settings: TTSSettings
 
+class TTSBatchRequest(BaseModel):
+    scenes: List[TTSRequest]
+
+class VoicePreviewBatchRequest(BaseModel):
+    engine: Optional[str] = None  # None이면 모든 엔진
+
+class LoudnessRequest(BaseModel):
+    audioUrls: List[str]               # /output/... URL 또는 출력 폴더 안의 파일 경로
+    targetLufs: Optional[float] = None  # None이면 서버 설정 TTS_LOUDNESS_TARGET
+    peakDb: Optional[float] = None      # None이면 서버 설정 TTS_LOUDNESS_PEAK_DB
+    peakLimit: bool = True
+
 # --- Endpoints ---
 
 @router.get("/api/tts/status")
@@ -33,10 +50,25 @@ async def api_tts_status():
         "details": "Ready" if status == "ok" else "Service not initialized"
     }
 
+def _generate_args(request: TTSRequest) -> Dict[str, Any]:
+    """요청 모델을 tts_service.generate() 인자로 변환"""
+    # generate(self, text, voice_id=None, language="ko-KR", speed=1.0, scene_id="unknown", engine=None, **kwargs)
+    return {
+        "text": request.text,
+        "voice_id": request.settings.voiceId,
+        "language": "ko-KR",  # 기본값
+        "speed": request.settings.speed,
+        "scene_id": request.sceneId,
+        "engine": request.settings.engine,
+        "stability": request.settings.stability,
+        "delivery": request.settings.delivery,
+        "settings": request.settings.dict()  # Google TTS가 settings 객체를 사용할 수 있도록 전달
+    }
+
 @router.post("/api/generate-tts")
-def generate_tts(request: TTSRequest):
+async def generate_tts(request: TTSRequest):
     """
-    TTS 오디오 생성 엔드포인트
+    TTS 오디오 생성 엔드포인트 (엔진 응답 대기 중 스레드풀 스레드를 점유하지 않도록 비동기 처리)
     """
     try:
         # TTS 서비스 초기화 확인
@@ -53,17 +85,7 @@ def generate_tts(request: TTSRequest):
         logger.info(f"  Text length: {len(request.text)}")
 
         # 서비스 호출
-        # generate(self, text, voice_id=None, language="ko-KR", speed=1.0, scene_id="unknown", engine=None, enable_fallback=True, **kwargs)
-        result = tts_service.generate(
-            text=request.text,
-            voice_id=voice_id,
-            language="ko-KR", # 기본값
-            speed=request.settings.speed,
-            scene_id=request.sceneId,
-            engine=request.settings.engine,
-            stability=request.settings.stability,
-            settings=request.settings.dict()  # Google TTS가 settings 객체를 사용할 수 있도록 전달
-        )
+        result = await tts_service.generate_async(**_generate_args(request))
 
         logger.info(f"[TTS Router] Result: success={result.get('success')}, engine={result.get('usedEngine')}")
 
@@ -81,9 +103,11 @@ def generate_tts(request: TTSRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/api/tts/voices")
-def get_voices():
+def get_voices(refresh: bool = False):
     """
-    사용 가능한 TTS 성우 목록 반환
+    사용 가능한 TTS 성우 목록 반환 (캐시된 목록, 미리듣기가 합성된 음성은 previewUrl 포함)
+
+    refresh=true면 캐시를 무시하고 엔진에서 목록을 새로 가져온다.
     """
     try:
         if tts_service is None:
@@ -91,7 +115,7 @@ def get_voices():
         
         return {
             "success": True,
-            "voices": tts_service.get_voices_list()
+            "voices": tts_service.get_voices_list(refresh=refresh)
         }
     except Exception as e:
         logger.error(f"Error fetching voices: {str(e)}")
@@ -100,3 +124,181 @@ def get_voices():
             "error": str(e),
             "voices": {"azure": [], "elevenlabs": []}
         }
+
+@router.get("/api/tts/voice-preview")
+def get_voice_preview(engine: str, voiceId: str):
+    """
+    음성 미리듣기 클립 URL 반환 (처음 요청 시에만 합성, 이후에는 저장된 파일 재사용)
+    """
+    if tts_service is None:
+        raise HTTPException(status_code=503, detail="TTS Service is not initialized")
+
+    result = tts_service.get_voice_preview(engine, voiceId)
+    if not result.get("success"):
+        raise HTTPException(status_code=500, detail=result.get("error", "미리듣기 생성 실패"))
+    return result
+
+@router.post("/api/tts/voice-previews")
+def render_voice_previews(request: VoicePreviewBatchRequest, background_tasks: BackgroundTasks):
+    """
+    아직 미리듣기가 없는 음성의 클립을 백그라운드에서 미리 합성 (/api/tasks/{taskId}로 진행 상황 확인)
+    """
+    if tts_service is None:
+        raise HTTPException(status_code=503, detail="TTS Service is not initialized")
+    if request.engine and request.engine not in tts_service.get_available_engines():
+        raise HTTPException(status_code=400, detail=f"엔진 '{request.engine}'을 찾을 수 없습니다.")
+
+    task_id = task_manager.create_task("tts_voice_previews")
+    background_tasks.add_task(process_voice_previews, task_id, request.engine)
+    return {"success": True, "taskId": task_id}
+
+def process_voice_previews(tid: str, engine: Optional[str]):
+    done = 0
+    failed = 0
+
+    def on_result(index: int, result: Dict[str, Any]):
+        nonlocal done, failed
+        done += 1
+        if not result.get("success"):
+            failed += 1
+        task_manager.update_task(tid, message=f"[{done}] 미리듣기 합성 중... (실패 {failed}개)")
+
+    try:
+        task_manager.update_task(tid, status="processing", progress=0, message="음성 미리듣기 합성 시작")
+        results = tts_service.render_voice_previews(engine, on_result=on_result, task_id=tid)
+        task_manager.update_task(
+            tid, status="completed", progress=100,
+            message=f"음성 미리듣기 합성 완료 ({len(results) - failed}/{len(results)})",
+            result={"results": results, "failed": failed}
+        )
+    except TaskCancelledError:
+        logger.info(f"Voice preview task cancelled: {tid} ({done} done)")
+    except Exception as e:
+        logger.error(f"Error in process_voice_previews: {e}")
+        task_manager.update_task(tid, status="failed", error=str(e))
+
+def _output_path(audio_url: str) -> str:
+    """/output/... URL 또는 경로를 출력 폴더 안의 실제 파일 경로로 변환 (출력 폴더 밖 파일은 거부)"""
+    clean = audio_url.split('#')[0].split('?')[0]
+    if clean.startswith("/output/"):
+        path = os.path.join(OUTPUT_DIR, *clean[len("/output/"):].split('/'))
+    else:
+        path = clean
+    path = os.path.realpath(path)
+    if os.path.commonpath([path, os.path.realpath(OUTPUT_DIR)]) != os.path.realpath(OUTPUT_DIR):
+        raise HTTPException(status_code=400, detail=f"출력 폴더 밖의 파일은 처리할 수 없습니다: {audio_url}")
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail=f"오디오 파일을 찾을 수 없습니다: {audio_url}")
+    return path
+
+@router.post("/api/tts/normalize-loudness")
+def normalize_loudness(request: LoudnessRequest, background_tasks: BackgroundTasks):
+    """
+    TTS 클립 라우드니스 일괄 정규화 작업 시작 (렌더링/Vrew 내보내기 전 씬 간 음량 통일, 파일을 덮어씀)
+
+    여러 씬이 같은 파일을 가리켜도 파일당 한 번만 처리한다.
+    """
+    from services.tts_loudness import LoudnessNormalizer
+
+    if not request.audioUrls:
+        raise HTTPException(status_code=400, detail="오디오 목록이 없습니다.")
+    paths = list(dict.fromkeys(_output_path(url) for url in request.audioUrls))
+    # 덮어쓰기 처리이므로 출력 코덱을 아는 오디오 형식만 허용 (렌더링된 영상 등은 거부)
+    unsupported = [path for path in paths if os.path.splitext(path)[1].lower() not in LoudnessNormalizer.CODECS]
+    if unsupported:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 오디오 형식입니다: "
+                                                    f"{', '.join(os.path.basename(path) for path in unsupported)}")
+
+    task_id = task_manager.create_task("tts_loudness")
+    background_tasks.add_task(process_loudness, task_id, paths, request)
+    return {"success": True, "taskId": task_id, "total": len(paths)}
+
+def process_loudness(tid: str, paths: List[str], request: LoudnessRequest):
+    from services.tts_loudness import loudness_normalizer
+
+    total = len(paths)
+    done = 0
+    # on_result는 여러 loudnorm 작업 스레드에서 호출됨
+    done_lock = threading.Lock()
+
+    def on_result(index: int, result: Dict[str, Any]):
+        nonlocal done
+        with done_lock:
+            done += 1
+            count = done
+        task_manager.update_task(tid, progress=int(count / total * 100),
+                                 message=f"[{count}/{total}] 라우드니스 정규화 중...")
+
+    try:
+        task_manager.update_task(tid, status="processing", progress=0, message=f"라우드니스 분석 시작 ({total}개 파일)")
+        results = loudness_normalizer.normalize_files(
+            paths, target_lufs=request.targetLufs, peak_db=request.peakDb, peak_limit=request.peakLimit,
+            on_result=on_result, task_id=tid
+        )
+        failed = sum(1 for result in results if not result["success"])
+        task_manager.update_task(
+            tid, status="completed", progress=100,
+            message=f"라우드니스 정규화 완료 ({total - failed}/{total})",
+            result={"results": results, "failed": failed}
+        )
+    except TaskCancelledError:
+        logger.info(f"Loudness task cancelled: {tid} ({done}/{total} done)")
+    except Exception as e:
+        logger.error(f"Error in process_loudness: {e}")
+        task_manager.update_task(tid, status="failed", error=str(e))
+
+@router.post("/api/generate-tts-batch")
+def generate_tts_batch(request: TTSBatchRequest, background_tasks: BackgroundTasks):
+    """
+    여러 씬 TTS 일괄 생성 작업 시작 (엔진별 동시 요청 한도 안에서 병렬 생성)
+
+    씬이 끝날 때마다 작업 상세(details.results)에 결과가 추가되므로
+    /api/tasks/{taskId} 폴링으로 완료된 씬부터 바로 사용할 수 있다.
+    """
+    if tts_service is None:
+        raise HTTPException(status_code=503, detail="TTS Service is not initialized")
+    if not request.scenes:
+        raise HTTPException(status_code=400, detail="씬 데이터가 없습니다.")
+
+    task_id = task_manager.create_task("tts_batch")
+    background_tasks.add_task(process_tts_batch, task_id, request.scenes)
+    return {"success": True, "taskId": task_id, "total": len(request.scenes)}
+
+async def process_tts_batch(tid: str, scenes: List[TTSRequest]):
+    total = len(scenes)
+    completed: List[Dict[str, Any]] = []
+    failed = 0
+    # 작업 상세는 하나의 dict/결과 목록을 계속 갱신 (결과마다 전체 목록을 복사하지 않도록)
+    details: Dict[str, Any] = {"total": total, "completed": 0, "failed": 0, "results": completed}
+
+    def on_result(index: int, result: Dict[str, Any]):
+        nonlocal failed
+        if not result.get("success"):
+            failed += 1
+        completed.append(dict(result, index=index))
+        details["completed"] = len(completed)
+        details["failed"] = failed
+        task_manager.update_task(
+            tid,
+            progress=int(len(completed) / total * 100),
+            message=f"[{len(completed)}/{total}] TTS 생성 중... (실패 {failed}개)",
+            details=details
+        )
+
+    try:
+        task_manager.update_task(tid, status="processing", progress=0, message=f"TTS 일괄 생성 시작 ({total}개 씬)")
+        results = await tts_service.generate_batch_async([_generate_args(scene) for scene in scenes],
+                                                         on_result=on_result, task_id=tid)
+        if failed == total:
+            task_manager.update_task(tid, status="failed", error=results[0].get("error", "TTS 생성 실패"))
+            return
+        task_manager.update_task(
+            tid, status="completed", progress=100,
+            message=f"TTS 일괄 생성 완료 ({total - failed}/{total})",
+            result={"results": results, "failed": failed}
+        )
+    except TaskCancelledError:
+        logger.info(f"TTS batch task cancelled: {tid} ({len(completed)}/{total} done)")
+    except Exception as e:
+        logger.error(f"Error in process_tts_batch: {e}")
+        task_manager.update_task(tid, status="failed", error=str(e))
@@ -11,14 +11,22 @@ from pydantic import BaseModel, Field
 
 from services.video_service import video_service
 from services.motion_service import motion_service
+from services.mezzanine_service import mezzanine_service
 from services.script_service import script_service
-from services.task_service import task_manager
+from services.task_service import task_manager, TaskCancelledError
 from services.project_service import project_service
 from services.utils import OUTPUT_DIR, ASSETS_DIR, BASE_DIR
 
 router = APIRouter(tags=["Video"])
 logger = logging.getLogger(__name__)
 
+# 모션 비율 -> 메자닌 변환 해상도 (없으면 서비스 기본 해상도)
+MOTION_ASPECT_RESOLUTIONS = {
+    "16:9": "1080p",
+    "9:16": "vertical",
+    "1:1": "square"
+}
+
 # --- Request Models ---
 
 class SceneData(BaseModel):
@@ -65,6 +73,14 @@ class VideoGenerationRequest(BaseModel):
     standalone: List[SceneData] = Field(default_factory=list)
     subtitle_style: Optional[Dict[str, Any]] = Field(None, alias="subtitleStyle")
     resolution: str = "1080p"
+    # "segments" (씬별 세그먼트 + concat) / "single_pass" (단일 필터 그래프), None이면 서버 기본값
+    render_engine: Optional[str] = Field(None, alias="renderEngine")
+    # "final" (서비스 설정) / "draft" (480p ultrafast 미리보기) - 작업별로 적용되어 공용 설정에 영향 없음
+    profile: str = "final"
+    # "auto" (공용 마스터 오디오 감지 시 최종 단계에서 1회 mux) / "per_scene" / "master", None이면 서버 기본값
+    audio_mode: Optional[str] = Field(None, alias="audioMode")
+    # 이미지 씬에 느린 팬(Ken Burns) 효과 적용, None이면 서버 기본값
+    ken_burns: Optional[bool] = Field(None, alias="kenBurns")
 
     class Config:
         populate_by_name = True
@@ -88,6 +104,7 @@ class SegmentAudioFromPathRequest(BaseModel):
     audioPath: str
     maxChars: Optional[int] = 30
     originalScript: Optional[str] = None
+    localAlignment: bool = False  # 대본 그대로 합성한 TTS 오디오면 Whisper 대신 로컬 정렬
 
 class BatchVrewRequest(BaseModel):
     audioFolder: str
@@ -160,7 +177,7 @@ def generate_motion_prompt(request: MotionPromptRequest):
 @router.post("/api/generate-motion")
 def api_generate_motion(request: MotionGenerationRequest):
     try:
-        return motion_service.generate(
+        result = motion_service.generate(
             image_url=request.imageUrl,
             prompt=request.motionPrompt,
             duration=request.duration,
@@ -168,35 +185,80 @@ def api_generate_motion(request: MotionGenerationRequest):
             scene_id=request.sceneId,
             model=request.model
         )
+
+        # 생성 즉시 백그라운드에서 메자닌 규격으로 변환 (최종 렌더링 시 스트림 복사)
+        if result.get("success") and result.get("videoUrl"):
+            try:
+                profile = video_service.get_render_profile(
+                    "final", MOTION_ASPECT_RESOLUTIONS.get(request.aspectRatio or "")
+                )
+                result["mezzanine"] = mezzanine_service.submit(
+                    result["videoUrl"], profile.resolution, profile.fps,
+                    preset=profile.preset, bitrate=profile.bitrate
+                )
+            except Exception as e:
+                logger.warning(f"Mezzanine ingest submit failed: {e}")
+
+        return result
     except Exception as e:
         logger.error(f"Motion generation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/api/mezzanine/stats")
+def api_mezzanine_stats():
+    """모션 클립 메자닌 변환 통계"""
+    return mezzanine_service.get_stats()
+
+def _process_video_task(tid: str, render: Any):
+    """영상 렌더링 작업 실행 (render: (진행 콜백, 텔레메트리 콜백)을 받아 렌더링 결과를 반환하는 함수)"""
+    try:
+        task_manager.update_task(tid, status="processing", progress=10, message="영상 생성 준비 중...")
+
+        def callback(progress, message):
+            task_manager.update_task(tid, progress=progress, message=message)
+
+        def telemetry(details):
+            task_manager.update_task(tid, details=details)
+
+        result = render(callback, telemetry)
+
+        if result.get("success"):
+            task_manager.update_task(tid, status="completed", progress=100, message="영상 생성 완료!", result=result)
+        else:
+            task_manager.update_task(tid, status="failed", error=result.get("error", "Unknown error"))
+    except TaskCancelledError:
+        # 상태는 cancel_task에서 이미 cancelled로 기록됨
+        logger.info(f"Video task cancelled: {tid}")
+    except Exception as e:
+        logger.error(f"Video process error: {e}")
+        task_manager.update_task(tid, status="failed", error=str(e))
+
 @router.post("/api/generate-video")
 async def api_generate_video(background_tasks: BackgroundTasks, request: VideoGenerationRequest):
+    if request.render_engine and request.render_engine not in video_service.RENDER_ENGINES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 렌더링 엔진: {request.render_engine}")
+    if request.profile not in video_service.RENDER_PROFILES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 렌더링 프로필: {request.profile}")
+    if request.audio_mode and request.audio_mode not in video_service.AUDIO_MODES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 오디오 방식: {request.audio_mode}")
     try:
         task_id = task_manager.create_task("video_generation")
         
         def process_video_generation(tid: str, req: VideoGenerationRequest):
-            try:
-                task_manager.update_task(tid, status="processing", progress=10, message="영상 생성 준비 중...")
-                
-                def callback(progress, message):
-                    task_manager.update_task(tid, progress=progress, message=message)
-                result = video_service.generate_final_video(
-                    merged_groups=[g.dict(by_alias=True) for g in req.merged_groups],
-                    standalone=[s.dict(by_alias=True) for s in req.standalone],
-                    resolution=req.resolution,
-                    progress_callback=callback
-                )
-
-                if result.get("success"):
-                    task_manager.update_task(tid, status="completed", progress=100, message="영상 생성 완료!", result=result)
-                else:
-                    task_manager.update_task(tid, status="failed", error=result.get("error", "Unknown error"))
-            except Exception as e:
-                logger.error(f"Video process error: {e}")
-                task_manager.update_task(tid, status="failed", error=str(e))
+            # 작업 ID로 렌더링 매니페스트를 남겨 백엔드 재시작 후 /api/resume-video로 이어서 렌더링
+            _process_video_task(tid, lambda callback, telemetry: video_service.generate_final_video(
+                merged_groups=[g.dict(by_alias=True) for g in req.merged_groups],
+                standalone=[s.dict(by_alias=True) for s in req.standalone],
+                resolution=req.resolution,
+                progress_callback=callback,
+                render_engine=req.render_engine,
+                profile=req.profile,
+                audio_mode=req.audio_mode,
+                telemetry_callback=telemetry,
+                ken_burns=req.ken_burns,
+                render_id=tid,
+                task_id=tid
+            ))
 
         background_tasks.add_task(process_video_generation, task_id, request)
         return {"success": True, "taskId": task_id}
@@ -204,6 +266,43 @@ async def api_generate_video(background_tasks: BackgroundTasks, request: VideoGe
         logger.error(f"API video generation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/api/renders/resumable")
+def api_resumable_renders():
+    """중단/실패하여 이어서 렌더링할 수 있는 작업 목록"""
+    return {"success": True, "renders": video_service.list_resumable_renders()}
+
+@router.post("/api/resume-video/{task_id}")
+async def api_resume_video(task_id: str, background_tasks: BackgroundTasks):
+    """
+    중단된 렌더링 작업에 다시 연결 (완료된 세그먼트는 건너뛰고 남은 씬 + 병합만 수행)
+    """
+    task = task_manager.get_task(task_id)
+    if task and task.get("status") in ("pending", "processing"):
+        # 아직 실행 중인 작업 - 그대로 진행 상황 조회
+        return {"success": True, "taskId": task_id, "resumed": False}
+
+    try:
+        manifest = video_service.load_render_manifest(task_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not manifest:
+        raise HTTPException(status_code=404, detail="이어서 렌더링할 작업을 찾을 수 없습니다.")
+
+    segments = manifest.get("segments", [])
+    task_manager.create_task("video_generation", task_id=task_id)
+    background_tasks.add_task(
+        _process_video_task, task_id,
+        lambda callback, telemetry: video_service.resume_render(task_id, progress_callback=callback,
+                                                                telemetry_callback=telemetry)
+    )
+    return {
+        "success": True,
+        "taskId": task_id,
+        "resumed": True,
+        "completedScenes": sum(1 for seg in segments if seg.get("status") == "done"),
+        "totalScenes": len(segments)
+    }
+
 @router.get("/api/get-task/{task_id}")
 def api_get_task(task_id: str):
     task = task_manager.get_task(task_id)
@@ -289,10 +388,12 @@ async def api_segment_audio_from_path(background_tasks: BackgroundTasks, request
     from services.audio_segmentation_service import audio_segmentation_service
     try:
         task_id = task_manager.create_task("audio_segmentation")
-        def process_segmentation(tid: str, path: str, chars: int, script: Optional[str]):
+        def process_segmentation(tid: str, path: str, chars: int, script: Optional[str], local_alignment: bool):
             try:
                 task_manager.update_task(tid, status="processing", progress=10, message="오디오 분석 중...")
-                session, scenes, prompt = audio_segmentation_service.segment_audio(path, max_chars=chars, original_script=script)
+                session, scenes, prompt = audio_segmentation_service.segment_audio(
+                    path, max_chars=chars, original_script=script, local_alignment=local_alignment
+                )
                 from dataclasses import asdict
                 segments_data = []
                 for s in scenes:
@@ -316,7 +417,8 @@ async def api_segment_audio_from_path(background_tasks: BackgroundTasks, request
             except Exception as e:
                 task_manager.update_task(tid, status="failed", error=str(e))
 
-        background_tasks.add_task(process_segmentation, task_id, request.audioPath, request.maxChars, request.originalScript)
+        background_tasks.add_task(process_segmentation, task_id, request.audioPath, request.maxChars, request.originalScript,
+                                  request.localAlignment)
         return {"success": True, "taskId": task_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -44,19 +44,34 @@ class AudioSegmentationService:
         audio_path: str,
         max_chars: int = 50,
         original_script: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        local_alignment: bool = False
     ) -> Tuple[str, List[SegmentedScene], str]:
         """
         긴 MP3 파일을 50자 이하 구간으로 세분화 (Logic 3.1 Refinement)
+
+        local_alignment=True이고 대본이 있으면 (대본 그대로 합성한 TTS 오디오 등)
+        Whisper 대신 로컬 에너지 기반 정렬로 단어 타임스탬프를 만든다. (업로드/API 비용 없음)
         """
         print("\n" + "="*60)
         print(f"오디오 세분화 시작: {Path(audio_path).name}")
         print(f"최대 문자 수: {max_chars}자")
         print("="*60)
         
-        # 1. Whisper로 전사
-        print("\n[Step 1/3] Whisper 음성 인식 중...")
-        word_timestamps, full_text = whisper_service.transcribe_audio(audio_path)
+        # 1. Whisper로 전사 (대본이 있으면 로컬 정렬 가능)
+        word_timestamps = None
+        if local_alignment and original_script:
+            print("\n[Step 1/3] 로컬 정렬 중 (휴지 구간 기반)...")
+            try:
+                from .tts_aligner import energy_aligner
+                word_timestamps = energy_aligner.align_file(original_script, audio_path)
+                full_text = " ".join(ts.text for ts in word_timestamps)
+            except Exception as e:
+                print(f"[WARN] 로컬 정렬 실패 - Whisper 사용: {e}")
+                word_timestamps = None
+        if not word_timestamps:
+            print("\n[Step 1/3] Whisper 음성 인식 중...")
+            word_timestamps, full_text = whisper_service.transcribe_audio(audio_path)
         
         print(f"[OK] 전체 텍스트: {len(full_text)}자")
         print(f"[OK] 단어 수: {len(word_timestamps)}개")
@@ -0,0 +1,93 @@
+"""
+FFmpeg Runner - 작업에 등록되는 FFmpeg 실행기
+
+영상 렌더링(VideoService)과 메자닌 변환(MezzanineService)이 함께 사용한다.
+- -progress pipe:1 출력을 실시간으로 파싱하여 진행 콜백 호출
+- 실행 중인 프로세스를 task_manager에 등록 (작업 취소 시 즉시 종료)
+- timeout 초과 시 프로세스를 종료하고 subprocess.TimeoutExpired 발생
+"""
+
+import threading
+import subprocess
+from collections import deque
+from typing import Callable, List, Optional
+
+from services.task_service import task_manager
+
+
+def run_ffmpeg(cmd: List[str], timeout: float,
+               on_progress: Optional[Callable[[float, Optional[float]], None]] = None,
+               cwd: Optional[str] = None,
+               task_id: Optional[str] = None) -> subprocess.CompletedProcess:
+    """
+    FFmpeg 실행 (-progress pipe:1 출력을 실시간으로 파싱)
+
+    subprocess.run(capture_output=True)은 종료 시까지 출력을 모아두므로 진행 상황을 알 수 없다.
+    stdout의 progress 블록마다 on_progress(인코딩된 출력 초, 속도 배율 또는 None)를 호출하고,
+    stderr는 별도 스레드에서 계속 읽어 파이프 버퍼가 가득 차 FFmpeg가 멈추지 않게 한다.
+
+    Args:
+        task_id: 전달 시 프로세스를 해당 작업에 등록 (취소 시 종료 대상)
+
+    Raises:
+        subprocess.TimeoutExpired: timeout 초과 시 (프로세스는 종료됨)
+    """
+    full_cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+    process = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, errors='replace', cwd=cwd)
+    task_manager.register_process(task_id, process)
+
+    # 오류 로그용으로 stderr 마지막 부분만 보관
+    stderr_lines = deque(maxlen=200)
+
+    def drain_stderr():
+        for line in process.stderr:
+            stderr_lines.append(line)
+
+    drainer = threading.Thread(target=drain_stderr, daemon=True)
+    drainer.start()
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.daemon = True
+    timer.start()
+
+    out_seconds = 0.0
+    speed = None
+    try:
+        for line in process.stdout:
+            key, _, value = line.strip().partition('=')
+            if key in ('out_time_us', 'out_time_ms'):
+                # 두 키 모두 마이크로초 단위 (out_time_ms는 FFmpeg의 오래된 이름)
+                try:
+                    out_seconds = max(0.0, int(value) / 1_000_000)
+                except ValueError:
+                    pass
+            elif key == 'speed':
+                try:
+                    speed = float(value.rstrip('x'))
+                except ValueError:
+                    speed = None
+            elif key == 'progress' and on_progress:
+                try:
+                    on_progress(out_seconds, speed)
+                except Exception as e:
+                    print(f"[WARN] FFmpeg 진행률 콜백 오류: {e}")
+        process.wait()
+    finally:
+        timer.cancel()
+        task_manager.unregister_process(task_id, process)
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    drainer.join(timeout=5)
+    stderr_text = ''.join(stderr_lines)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(full_cmd, timeout, stderr=stderr_text)
+    return subprocess.CompletedProcess(full_cmd, process.returncode, stdout="", stderr=stderr_text)
@@ -0,0 +1,287 @@
+"""
+파일 캐시 서비스 - 콘텐츠 주소 기반 디스크 캐시
+렌더링된 세그먼트 등 생성 비용이 큰 파일을 해시 키로 저장하고 재사용
+
+특징:
+- 입력 파일 바이트 + 파라미터 해시를 키로 사용 (내용이 같으면 경로가 달라도 적중)
+- 용량 제한 + LRU(Least Recently Used) 기반 자동 정리
+- 히트/미스 통계 (최적화 API로 노출)
+- 스레드 안전 (병렬 렌더링 워커에서 동시 접근)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class FileCacheService:
+    """콘텐츠 주소 기반 디스크 LRU 캐시"""
+
+    def __init__(self, name: str, cache_dir: str, max_size_mb: int = 5120, suffix: str = ""):
+        """
+        Args:
+            name: 캐시 이름 (로그/통계용)
+            cache_dir: 캐시 파일 저장 디렉토리
+            max_size_mb: 최대 캐시 용량 (MB), 초과 시 가장 오래전에 사용된 항목부터 삭제
+            suffix: 캐시 파일 확장자 (예: ".mp4")
+        """
+        self.name = name
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.suffix = suffix
+
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> 파일 크기 (LRU 순서)
+        self._total_size = 0
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+        print(f"[OK] File Cache '{name}' 초기화 ({len(self._entries)}개 항목, "
+              f"{self._total_size / 1024 / 1024:.1f}MB / {max_size_mb}MB)")
+
+    def _load_index(self):
+        """디스크의 기존 캐시 파일을 마지막 사용 시각 순으로 인덱싱 (재시작 후에도 캐시 유지)"""
+        found = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(self.suffix) or filename.endswith(".tmp"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            key = filename[:len(filename) - len(self.suffix)] if self.suffix else filename
+            found.append((stat.st_mtime, key, stat.st_size + self._metadata_size(key)))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_size += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def _metadata_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.meta.json")
+
+    def _metadata_size(self, key: str) -> int:
+        try:
+            return os.path.getsize(self._metadata_path(key))
+        except OSError:
+            return 0
+
+    @staticmethod
+    def update_hash_with_file(hasher, path: Optional[str], chunk_size: int = 1024 * 1024):
+        """파일 내용을 해시에 반영 (파일이 없으면 고정 마커 사용)"""
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    hasher.update(chunk)
+        else:
+            hasher.update(b"<none>")
+
+    def make_key(self, files: Optional[Dict[str, Optional[str]]] = None, **params) -> str:
+        """
+        입력 파일 내용과 파라미터로 캐시 키 생성
+
+        Args:
+            files: {라벨: 파일 경로} - 파일 바이트가 키에 반영됨 (경로 자체는 반영되지 않음)
+            **params: JSON 직렬화 가능한 파라미터 (해상도, 프리셋 등)
+
+        Returns:
+            SHA-256 해시 문자열
+        """
+        hasher = hashlib.sha256()
+        for label in sorted(files or {}):
+            hasher.update(f"[{label}]".encode("utf-8"))
+            self.update_hash_with_file(hasher, files[label])
+        hasher.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str, output_path: str, link: bool = True, track_stats: bool = True) -> bool:
+        """
+        캐시 적중 시 output_path에 파일을 배치 (하드링크 우선, 실패 시 복사)
+
+        Args:
+            link: False면 항상 복사 (호출 측이 파일을 제자리에서 수정할 수 있는 경우)
+            track_stats: False면 적중/미스 통계에 포함하지 않음 (내부 보조 파일 조회용)
+
+        Returns:
+            적중 여부
+        """
+        with self.lock:
+            cached_path = self._path(key)
+            if key not in self._entries or not os.path.exists(cached_path):
+                if key in self._entries:
+                    self._total_size -= self._entries.pop(key)
+                if track_stats:
+                    self.misses += 1
+                return False
+            self._entries.move_to_end(key)
+            if track_stats:
+                self.hits += 1
+
+        try:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            if link:
+                try:
+                    os.link(cached_path, output_path)
+                except OSError:
+                    # 다른 파일 시스템이거나 하드링크를 지원하지 않으면 복사
+                    shutil.copyfile(cached_path, output_path)
+            else:
+                shutil.copyfile(cached_path, output_path)
+            # 마지막 사용 시각 갱신 (재시작 후 LRU 순서 복원용)
+            os.utime(cached_path, None)
+            return True
+        except Exception as e:
+            print(f"[WARN] {self.name} 캐시 조회 실패: {e}")
+            if track_stats:
+                with self.lock:
+                    self.hits -= 1
+                    self.misses += 1
+            return False
+
+    def get_path(self, key: str, track_stats: bool = True) -> Optional[str]:
+        """
+        캐시 적중 시 캐시 파일 경로를 직접 반환 (복사 없이 읽기 전용으로 사용)
+
+        Args:
+            track_stats: False면 통계에 포함하지 않음 (호출 측이 결과를 쓸 수 있는지 확인한 뒤 record_lookup()으로 기록)
+        """
+        with self.lock:
+            cached_path = self._path(key)
+            if key in self._entries and os.path.exists(cached_path):
+                self._entries.move_to_end(key)
+                if track_stats:
+                    self.hits += 1
+            else:
+                if track_stats:
+                    self.misses += 1
+                return None
+        try:
+            os.utime(cached_path, None)
+        except OSError:
+            pass
+        return cached_path
+
+    def record_lookup(self, hit: bool):
+        """적중/미스 통계 기록 (track_stats=False로 조회한 결과를 호출 측이 판정한 경우)"""
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """put() 시 함께 저장한 메타데이터 조회"""
+        try:
+            with open(self._metadata_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, source_path: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        파일을 캐시에 저장 (원본은 그대로 유지)
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+            source_path: 저장할 파일 경로
+            metadata: 함께 저장할 JSON 메타데이터 (선택)
+
+        Returns:
+            성공 여부
+        """
+        if not os.path.exists(source_path):
+            return False
+
+        cached_path = self._path(key)
+        tmp_path = f"{cached_path}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+            if metadata is not None:
+                with open(self._metadata_path(key), "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"[WARN] {self.name} 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        size = os.path.getsize(cached_path) + self._metadata_size(key)
+        with self.lock:
+            if key in self._entries:
+                self._total_size -= self._entries.pop(key)
+            self._entries[key] = size
+            self._total_size += size
+            self.stores += 1
+            self._evict_if_needed()
+        return True
+
+    def _evict_if_needed(self):
+        """용량 초과 시 가장 오래전에 사용된 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        while self._total_size > self.max_size_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_size -= size
+            self.evictions += 1
+            for path in (self._path(key), self._metadata_path(key)):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError as e:
+                    print(f"[WARN] {self.name} 캐시 정리 실패: {e}")
+
+    def clear(self) -> int:
+        """모든 캐시 파일 삭제 (삭제된 항목 수 반환)"""
+        with self.lock:
+            count = len(self._entries)
+            for key in list(self._entries):
+                for path in (self._path(key), self._metadata_path(key)):
+                    try:
+                        if os.path.exists(path):
+                            os.remove(path)
+                    except OSError:
+                        pass
+            self._entries.clear()
+            self._total_size = 0
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self.lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "name": self.name,
+                "cache_dir": self.cache_dir,
+                "total_entries": len(self._entries),
+                "size_mb": round(self._total_size / 1024 / 1024, 2),
+                "max_size_mb": round(self.max_size_bytes / 1024 / 1024, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_percent": round(hit_rate, 2),
+                "stores": self.stores,
+                "evictions": self.evictions
+            }
+
+
+# 렌더링 세그먼트 캐시 (SEGMENT_CACHE_MAX_MB로 용량 조정)
+segment_cache = FileCacheService(
+    name="segment",
+    cache_dir=os.path.join(tempfile.gettempdir(), "realhunalo_segment_cache"),
+    max_size_mb=int(os.getenv("SEGMENT_CACHE_MAX_MB", "5120")),
+    suffix=".mp4"
+)
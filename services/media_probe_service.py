@@ -0,0 +1,312 @@
+"""
+Media Probe Service - 미디어 파일 정보 조회 + 디스크 캐시
+
+영상 렌더링(VideoService), Vrew 내보내기(VrewServiceNew), Vrew 자동 배치(VrewAutoFillService)가
+같은 파일을 각자 ffprobe/OpenCV로 여러 번 열던 것을 한 곳으로 모은다.
+
+특징:
+- ffprobe 1회 실행으로 스트림/길이/코덱/해상도/fps/오디오 유무를 함께 조회
+- 파일 크기 + 앞/뒤 64KB 해시를 키로 사용 (경로가 달라도 복사본이면 적중, 내용이 바뀌면 미스)
+- JSON 파일에 저장하여 백엔드 재시작 후에도 재사용, 항목 수 제한 + LRU 정리
+- 저장은 조회마다 하지 않고 잠시 모았다가 한 번에 (전역 잠금 밖에서 파일 쓰기)
+- ffprobe가 없으면 OpenCV로 비디오 정보만 조회 (결과는 캐시하지 않음)
+"""
+
+import os
+import copy
+import json
+import atexit
+import hashlib
+import tempfile
+import threading
+import subprocess
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# 결과 형식이 바뀌면 올려서 기존 캐시 무효화
+PROBE_FORMAT_VERSION = 1
+
+# 파일 지문에 사용하는 앞/뒤 샘플 크기
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+
+class MediaProbeService:
+    """ffprobe 결과를 파일 내용 지문 기준으로 캐시하는 미디어 정보 조회 서비스"""
+
+    def __init__(self, cache_path: Optional[str] = None, max_entries: Optional[int] = None,
+                 save_delay: Optional[float] = None):
+        self.cache_path = cache_path or os.path.join(tempfile.gettempdir(), "realhunalo_media_probe.json")
+        if max_entries is None:
+            try:
+                max_entries = max(1, int(os.getenv("MEDIA_PROBE_CACHE_MAX", "5000")))
+            except ValueError:
+                max_entries = 5000
+        self.max_entries = max_entries
+
+        # 새 조회 결과는 save_delay초 동안 모았다가 한 번에 저장 (렌더링 중 씬마다 전체 파일을 다시 쓰지 않도록)
+        if save_delay is None:
+            try:
+                save_delay = max(0.0, float(os.getenv("MEDIA_PROBE_SAVE_DELAY", "2")))
+            except ValueError:
+                save_delay = 2.0
+        self.save_delay = save_delay
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 파일 쓰기 직렬화 (조회 잠금과 분리)
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+        self._load()
+        # 종료 시 아직 저장하지 않은 조회 결과 기록
+        atexit.register(self.flush)
+        print(f"[OK] Media Probe Service 초기화 ({len(self._entries)}개 항목 캐시됨)")
+
+    def _load(self):
+        """저장된 조회 결과 불러오기 (손상되었으면 빈 캐시로 시작)"""
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != PROBE_FORMAT_VERSION:
+                return
+            for key, info in data.get("entries", {}).items():
+                self._entries[key] = info
+        except Exception as e:
+            print(f"[WARN] 미디어 정보 캐시 읽기 실패 - 새로 시작: {e}")
+            self._entries.clear()
+
+    def _schedule_save(self):
+        """저장 예약 (lock 안에서 호출, 이미 예약되어 있으면 그 저장에 합쳐짐)"""
+        self._dirty = True
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(self.save_delay, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush(self):
+        """변경된 조회 결과를 파일에 저장 (스냅샷만 잠금 안에서 만들고 쓰기는 잠금 밖에서)"""
+        with self._save_lock:
+            with self.lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = dict(self._entries)
+            self._save(snapshot)
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]):
+        """캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": PROBE_FORMAT_VERSION, "entries": entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"[WARN] 미디어 정보 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def fingerprint(file_path: str) -> Optional[str]:
+        """
+        파일 내용 지문 (크기 + 앞/뒤 샘플 해시) - 전체를 읽지 않으므로 대용량 영상도 즉시 계산
+
+        Returns:
+            지문 문자열 (로컬 파일이 아니면 None)
+        """
+        try:
+            size = os.path.getsize(file_path)
+            digest = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+                if size > FINGERPRINT_SAMPLE_BYTES * 2:
+                    f.seek(-FINGERPRINT_SAMPLE_BYTES, os.SEEK_END)
+                    digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+            return f"{size}:{digest.hexdigest()[:32]}"
+        except OSError:
+            return None
+
+    def probe(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        미디어 정보 조회
+
+        Returns:
+            {"duration", "format", "has_video", "has_audio", "video", "audio", "streams"} 또는 None
+            video: {"codec", "profile", "width", "height", "pix_fmt", "fps", "cfr", "sar"}
+            audio: {"codec", "sample_rate", "channels"}
+            (캐시 항목의 사본이므로 호출 측이 수정해도 캐시에 영향 없음)
+        """
+        key = self.fingerprint(file_path) if os.path.isfile(file_path) else None
+        if key:
+            with self.lock:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(cached)
+                self.misses += 1
+
+        info = self._run_ffprobe(file_path)
+        if info is None:
+            # ffprobe를 쓸 수 없는 환경 - OpenCV로 비디오 정보만 조회 (캐시하지 않음)
+            with self.lock:
+                self.failures += 1
+            return self._probe_with_opencv(file_path)
+
+        if key:
+            with self.lock:
+                self._entries[key] = info
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._schedule_save()
+            return copy.deepcopy(info)
+        return info
+
+    def has_audio(self, file_path: str) -> bool:
+        """오디오 스트림 유무"""
+        info = self.probe(file_path)
+        return bool(info and info.get("has_audio"))
+
+    def video_info(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """첫 번째 비디오 스트림 정보 (없으면 None)"""
+        info = self.probe(file_path)
+        return info.get("video") if info else None
+
+    @staticmethod
+    def _parse_rate(rate: Optional[str]) -> float:
+        try:
+            num, _, den = (rate or "0/1").partition('/')
+            return float(num) / float(den or 1)
+        except (ValueError, ZeroDivisionError):
+            return 0.0
+
+    @staticmethod
+    def _parse_float(value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _run_ffprobe(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """ffprobe 1회 실행으로 포맷 + 전체 스트림 정보 조회"""
+        try:
+            cmd = [
+                'ffprobe', '-v', 'error',
+                '-show_entries',
+                'format=duration,format_name:'
+                'stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,avg_frame_rate,'
+                'sample_aspect_ratio,sample_rate,channels,duration',
+                '-of', 'json', file_path
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+            data = json.loads(result.stdout or "{}")
+        except Exception as e:
+            print(f"[MediaProbe] ffprobe 실패: {e}")
+            return None
+
+        streams = []
+        for stream in data.get("streams") or []:
+            codec_type = stream.get("codec_type")
+            entry: Dict[str, Any] = {
+                "type": codec_type,
+                "codec": stream.get("codec_name"),
+                "duration": self._parse_float(stream.get("duration"))
+            }
+            if codec_type == "video":
+                fps = self._parse_rate(stream.get("avg_frame_rate"))
+                entry.update({
+                    "profile": stream.get("profile"),
+                    "width": int(stream.get("width") or 0),
+                    "height": int(stream.get("height") or 0),
+                    "pix_fmt": stream.get("pix_fmt"),
+                    "fps": fps,
+                    # r_frame_rate와 avg_frame_rate가 다르면 가변 프레임레이트(VFR)
+                    "cfr": abs(self._parse_rate(stream.get("r_frame_rate")) - fps) < 0.01,
+                    "sar": stream.get("sample_aspect_ratio")
+                })
+            elif codec_type == "audio":
+                entry.update({
+                    "sample_rate": int(stream.get("sample_rate") or 0),
+                    "channels": int(stream.get("channels") or 0)
+                })
+            streams.append(entry)
+
+        fmt = data.get("format") or {}
+        duration = self._parse_float(fmt.get("duration"))
+
+        video = next((s for s in streams if s["type"] == "video"), None)
+        audio = next((s for s in streams if s["type"] == "audio"), None)
+        return {
+            "duration": duration,
+            "format": fmt.get("format_name"),
+            "has_video": video is not None,
+            "has_audio": audio is not None,
+            "video": {k: v for k, v in video.items() if k not in ("type", "duration")} if video else None,
+            "audio": {k: v for k, v in audio.items() if k not in ("type", "duration")} if audio else None,
+            "streams": streams
+        }
+
+    @staticmethod
+    def _probe_with_opencv(file_path: str) -> Optional[Dict[str, Any]]:
+        """ffprobe 대체 조회 (OpenCV가 설치된 경우에만, 오디오 정보 없음)"""
+        try:
+            import cv2
+        except ImportError:
+            return None
+
+        try:
+            cap = cv2.VideoCapture(file_path)
+            if not cap.isOpened():
+                return None
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            cap.release()
+        except Exception as e:
+            print(f"[MediaProbe] OpenCV 조회 실패 ({file_path}): {e}")
+            return None
+
+        video = {"codec": None, "profile": None, "width": width, "height": height,
+                 "pix_fmt": None, "fps": fps, "cfr": True, "sar": None}
+        return {
+            "duration": frame_count / fps if fps > 0 else None,
+            "format": None,
+            "has_video": True,
+            "has_audio": False,
+            "video": video,
+            "audio": None,
+            "streams": [dict(video, type="video", duration=None)]
+        }
+
+    def clear(self):
+        """캐시 비우기"""
+        with self.lock:
+            self._entries.clear()
+            self._dirty = True
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회/캐시 통계"""
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "cache_path": self.cache_path,
+                "total_entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_percent": round(self.hits / total * 100, 2) if total > 0 else 0,
+                "failures": self.failures
+            }
+
+
+# 싱글톤 인스턴스
+media_probe_service = MediaProbeService()
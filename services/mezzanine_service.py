@@ -0,0 +1,243 @@
+"""
+Mezzanine Service - 생성된 모션/영상 클립의 백그라운드 정규화
+
+Replicate 등에서 생성된 영상은 fps/해상도/코덱이 제각각이라 최종 렌더링 때마다 전체 재인코딩이 필요하다.
+클립이 생성되는 즉시 백그라운드에서 한 번만 프로젝트 메자닌 규격
+(목표 해상도, CFR fps, yuv420p, H.264 High, 고정 GOP)으로 변환해 두면
+최종 렌더링은 VideoService의 스트림 복사 경로로 이어붙이기만 하면 된다.
+
+특징:
+- 원본 URL + 규격으로 결정되는 파일명 (같은 클립은 한 번만 변환, 재시작 후에도 재사용)
+- 원본 URL이 만료되어도(Replicate 임시 URL) 변환된 파일로 렌더링 가능
+- 렌더링 시 원본 URL + 규격으로 변환 결과 조회 (프로젝트 파일은 수정하지 않음)
+- 변환 중에는 task_manager 작업에 FFmpeg 프로세스 등록 (/api/tasks/{task_id}/cancel로 취소)
+  결과는 변환 작업 상태(jobs)에 남기고 끝난 작업 기록은 삭제 (클립마다 작업이 쌓이지 않도록)
+"""
+
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from services.utils import OUTPUT_DIR
+from services.ffmpeg_runner import run_ffmpeg
+from services.task_service import task_manager, TaskCancelledError
+
+
+class MezzanineService:
+    """생성 영상 클립을 메자닌 규격으로 미리 변환하는 백그라운드 인제스트 서비스"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.mezzanine_dir = os.path.join(OUTPUT_DIR, "mezzanine")
+        os.makedirs(self.mezzanine_dir, exist_ok=True)
+
+        # 최종 렌더링과 CPU를 나눠 쓰므로 기본 1개씩 순차 변환 (MEZZANINE_WORKERS로 조정)
+        if max_workers is None:
+            try:
+                max_workers = max(1, int(os.getenv("MEZZANINE_WORKERS", "1")))
+            except ValueError:
+                max_workers = 1
+        self.max_workers = max_workers
+        self.enabled = os.getenv("MEZZANINE_INGEST", "1") != "0"
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mezzanine")
+
+        self.jobs: Dict[str, Dict[str, Any]] = {}  # key -> 작업 상태
+        self.lock = threading.Lock()
+
+        self.completed = 0
+        self.reused = 0
+        self.failed = 0
+
+        print(f"[OK] Mezzanine Service 초기화 (workers={max_workers}, enabled={self.enabled})")
+
+    @staticmethod
+    def make_key(source_url: str, resolution: str, fps: int) -> str:
+        """원본 URL + 규격으로 메자닌 파일 키 생성"""
+        digest = hashlib.sha256(f"{source_url}|{resolution}|{fps}".encode("utf-8")).hexdigest()[:20]
+        return f"{digest}_{resolution}_{fps}fps"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.mezzanine_dir, f"{key}.mp4")
+
+    def lookup(self, source_url: Optional[str], resolution: str, fps: int) -> Optional[str]:
+        """
+        변환 완료된 메자닌 클립 URL 조회
+
+        Returns:
+            "/output/mezzanine/<key>.mp4" 또는 None (아직 변환 중이거나 변환하지 않은 클립)
+        """
+        if not source_url or source_url.startswith('data:'):
+            return None
+        key = self.make_key(source_url, resolution, fps)
+        if os.path.exists(self._path(key)):
+            return f"/output/mezzanine/{key}.mp4"
+        return None
+
+    def submit(self, source_url: str, resolution: str, fps: int,
+               preset: str = "medium", bitrate: str = "8M") -> Dict[str, Any]:
+        """
+        메자닌 변환 작업을 백그라운드에 등록 (즉시 반환)
+
+        Returns:
+            작업 상태 {"key", "status", "mezzanineUrl", "taskId"} (taskId는 변환이 끝나면 None, 작업 기록도 삭제)
+        """
+        key = self.make_key(source_url, resolution, fps)
+        with self.lock:
+            job = self.jobs.get(key)
+            if job and job["status"] in ("queued", "processing"):
+                return dict(job)
+
+            job = {
+                "key": key,
+                "sourceUrl": source_url,
+                "resolution": resolution,
+                "fps": fps,
+                "status": "queued",
+                "mezzanineUrl": None,
+                "error": None,
+                "taskId": None
+            }
+            self.jobs[key] = job
+
+            if not self.enabled:
+                job["status"] = "disabled"
+                return dict(job)
+
+            job["taskId"] = task_manager.create_task("mezzanine")
+            # 변환이 바로 끝나 taskId가 지워지기 전의 상태를 반환
+            submitted = dict(job)
+
+        self.executor.submit(self._run_job, key, source_url, resolution, fps, preset, bitrate, submitted["taskId"])
+        return submitted
+
+    def _run_job(self, key: str, source_url: str, resolution: str, fps: int,
+                 preset: str, bitrate: str, task_id: str):
+        """submit()으로 등록한 변환 실행 후 작업 기록 삭제 (결과는 변환 작업 상태에 남음)"""
+        try:
+            self.ingest(source_url, resolution, fps, preset, bitrate, task_id)
+        finally:
+            self._update_job(key, taskId=None)
+            task_manager.remove_task(task_id)
+
+    def ingest(self, source_url: str, resolution: str, fps: int,
+               preset: str = "medium", bitrate: str = "8M",
+               task_id: Optional[str] = None) -> Optional[str]:
+        """
+        클립을 다운로드하여 메자닌 규격으로 변환 (워커 스레드에서 실행)
+
+        task_id: 전달 시 진행 상태를 기록하고 FFmpeg 프로세스를 등록 (작업 취소 시 변환 중단)
+
+        Returns:
+            메자닌 클립 URL (실패 시 None)
+        """
+        key = self.make_key(source_url, resolution, fps)
+        output_path = self._path(key)
+        mezzanine_url = f"/output/mezzanine/{key}.mp4"
+        self._update_job(key, status="processing")
+
+        if os.path.exists(output_path):
+            with self.lock:
+                self.reused += 1
+            self._update_job(key, status="completed", mezzanineUrl=mezzanine_url)
+            task_manager.update_task(task_id, status="completed", progress=100, result={"mezzanineUrl": mezzanine_url})
+            return mezzanine_url
+
+        temp_dir = tempfile.mkdtemp(prefix="mezzanine_")
+        try:
+            task_manager.check_cancelled(task_id)
+            task_manager.update_task(task_id, status="processing", progress=10, message="메자닌 변환 중...")
+            source_path = self._fetch_source(source_url, temp_dir)
+
+            w, h = resolution.split('x')
+            gop = int(fps) * 2
+            tmp_output = os.path.join(temp_dir, "mezzanine.mp4")
+            cmd = [
+                'ffmpeg', '-y', '-i', source_path,
+                '-map', '0:v:0', '-map', '0:a:0?',
+                '-vf', (f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+                        f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1/1,fps={fps},format=yuv420p"),
+                '-c:v', 'libx264', '-profile:v', 'high', '-preset', preset,
+                '-pix_fmt', 'yuv420p', '-r', str(fps), '-b:v', bitrate,
+                # 고정 GOP (장면 전환 키프레임 삽입 없음) - 스트림 복사로 자를 때 키프레임 간격 예측 가능
+                '-g', str(gop), '-keyint_min', str(gop), '-sc_threshold', '0',
+                '-c:a', 'aac', '-b:a', '192k', '-ar', '44100', '-ac', '2',
+                '-movflags', '+faststart',
+                tmp_output
+            ]
+            print(f"[Mezzanine] 변환 시작: {source_url[:80]} -> {key}")
+            result = run_ffmpeg(cmd, timeout=600, task_id=task_id)
+            task_manager.check_cancelled(task_id)
+            if result.returncode != 0 or not os.path.exists(tmp_output):
+                raise Exception(f"FFmpeg 변환 실패 (코드: {result.returncode}): {result.stderr[-500:]}")
+
+            # 완성된 파일만 노출 (렌더링 중 반쯤 쓰인 파일을 읽지 않도록)
+            shutil.move(tmp_output, output_path)
+
+            with self.lock:
+                self.completed += 1
+            self._update_job(key, status="completed", mezzanineUrl=mezzanine_url)
+            task_manager.update_task(task_id, status="completed", progress=100, result={"mezzanineUrl": mezzanine_url})
+            print(f"[OK] Mezzanine 변환 완료: {mezzanine_url}")
+            return mezzanine_url
+
+        except TaskCancelledError:
+            self._update_job(key, status="cancelled")
+            print(f"[Mezzanine] 변환 취소됨: {key}")
+            return None
+
+        except Exception as e:
+            with self.lock:
+                self.failed += 1
+            self._update_job(key, status="failed", error=str(e))
+            task_manager.update_task(task_id, status="failed", error=str(e))
+            print(f"[WARN] Mezzanine 변환 실패 (최종 렌더링 시 원본 사용): {e}")
+            return None
+
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _fetch_source(self, source_url: str, temp_dir: str) -> str:
+        """원본 클립을 로컬 경로로 준비 (로컬 /output 파일은 복사 없이 사용)"""
+        from urllib.parse import unquote
+
+        decoded = unquote(source_url)
+        if decoded.startswith('/output/') or 'localhost:8000/output/' in decoded or '127.0.0.1:8000/output/' in decoded:
+            local_path = os.path.join(OUTPUT_DIR, decoded.split('/output/', 1)[-1])
+            if os.path.exists(local_path):
+                return local_path
+
+        source_path = os.path.join(temp_dir, "source.mp4")
+        urllib.request.urlretrieve(source_url, source_path)
+        return source_path
+
+    def _update_job(self, key: str, **fields):
+        with self.lock:
+            job = self.jobs.setdefault(key, {"key": key})
+            job.update(fields)
+
+    def get_job(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            job = self.jobs.get(key)
+            return dict(job) if job else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인제스트 통계"""
+        with self.lock:
+            pending = sum(1 for job in self.jobs.values() if job.get("status") in ("queued", "processing"))
+            return {
+                "enabled": self.enabled,
+                "workers": self.max_workers,
+                "mezzanine_dir": self.mezzanine_dir,
+                "pending": pending,
+                "completed": self.completed,
+                "reused": self.reused,
+                "failed": self.failed
+            }
+
+
+# 싱글톤 인스턴스
+mezzanine_service = MezzanineService()
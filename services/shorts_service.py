@@ -255,21 +255,13 @@ class ShortsService:
         """
         장면 리스트를 기반으로 최종 영상을 렌더링합니다.
         """
-        video_url = video_service.generate_final_video(
+        result = video_service.generate_final_video(
             merged_groups=[],
             standalone=scenes,
-            resolution="shorts", # 9:16 강제
-            subtitle_style={ 
-                "enabled": True, 
-                "fontFamily": "Malgun Gothic", 
-                "fontSize": 70,  # 모바일 화면 고려
-                "position": "center",
-                "fontColor": "#FFFF00", # 노란색 자막
-                "outlineColor": "#000000"
-            },
+            resolution="shorts", # 9:16 강제 (자막은 Vrew 내보내기로 대체)
             progress_callback=lambda p, m: progress_callback(50 + int(p * 0.5), m) if progress_callback else None
         )
-        return video_url
+        return result.get("videoUrl")
 
     async def _process_scenes_to_video(self, scenes: List[Dict], progress_callback=None) -> Dict:
         """
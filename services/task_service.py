@@ -1,7 +1,13 @@
 import threading
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+
+class TaskCancelledError(Exception):
+    """작업이 사용자 요청으로 취소됨 (작업 루프에서 다음 단계를 진행하지 않고 빠져나올 때 사용)"""
+    pass
+
 
 class TaskManager:
     """
@@ -10,9 +16,12 @@ class TaskManager:
     def __init__(self):
         self.tasks: Dict[str, Dict[str, Any]] = {}
         self.lock = threading.Lock()
+        # 작업별 실행 중인 자식 프로세스 (취소 시 종료)
+        self.processes: Dict[str, List[Any]] = {}
 
-    def create_task(self, task_type: str) -> str:
-        task_id = str(uuid.uuid4())
+    def create_task(self, task_type: str, task_id: Optional[str] = None) -> str:
+        # task_id 지정 시 기존 ID로 재등록 (백엔드 재시작 후 이어서 렌더링하는 작업 등)
+        task_id = task_id or str(uuid.uuid4())
         with self.lock:
             self.tasks[task_id] = {
                 "id": task_id,
@@ -27,22 +36,103 @@ class TaskManager:
             }
         return task_id
 
-    def update_task(self, task_id: str, status: str = None, progress: int = None, 
-                       message: str = None, result: Any = None, error: str = None):
+    def update_task(self, task_id: str, status: str = None, progress: int = None,
+                       message: str = None, result: Any = None, error: str = None,
+                       details: Dict[str, Any] = None):
         with self.lock:
             if task_id in self.tasks:
                 task = self.tasks[task_id]
+                # 취소된 작업은 늦게 도착한 진행/완료 업데이트로 상태가 바뀌지 않도록 무시
+                if task["status"] == "cancelled":
+                    return
                 if status: task["status"] = status
                 if progress is not None: task["progress"] = progress
                 if message: task["message"] = message
                 if result is not None: task["result"] = result
                 if error: task["error"] = error
+                if details is not None: task["details"] = details  # 진행 상세 (속도, 남은 시간 등)
                 task["updated_at"] = datetime.now().isoformat()
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         with self.lock:
             return self.tasks.get(task_id)
 
+    def cancel_task(self, task_id: str) -> bool:
+        """
+        작업 취소 - 상태를 cancelled로 바꾸고 실행 중인 자식 프로세스(FFmpeg 등)를 즉시 종료
+
+        작업 루프는 check_cancelled()로 다음 씬/프롬프트를 시작하기 전에 멈춘다.
+
+        Returns:
+            취소 여부 (없는 작업이거나 이미 끝난 작업이면 False)
+        """
+        with self.lock:
+            task = self.tasks.get(task_id)
+            if not task or task["status"] in ("completed", "failed", "cancelled"):
+                return False
+            task["status"] = "cancelled"
+            task["message"] = "작업이 취소되었습니다."
+            task["updated_at"] = datetime.now().isoformat()
+            processes = self.processes.pop(task_id, [])
+
+        for process in processes:
+            try:
+                if process.poll() is None:
+                    process.kill()
+            except Exception as e:
+                print(f"[WARN] 작업 프로세스 종료 실패 ({task_id}): {e}")
+        print(f"[TaskManager] 작업 취소: {task_id} (종료한 프로세스 {len(processes)}개)")
+        return True
+
+    def is_cancelled(self, task_id: Optional[str]) -> bool:
+        if not task_id:
+            return False
+        with self.lock:
+            task = self.tasks.get(task_id)
+            return bool(task and task["status"] == "cancelled")
+
+    def check_cancelled(self, task_id: Optional[str]):
+        """취소된 작업이면 TaskCancelledError 발생"""
+        if self.is_cancelled(task_id):
+            raise TaskCancelledError(f"작업이 취소되었습니다: {task_id}")
+
+    def register_process(self, task_id: Optional[str], process: Any):
+        """
+        작업의 자식 프로세스 등록 (취소 시 종료 대상)
+
+        이미 취소된 작업이면 등록 대신 바로 종료한다.
+        """
+        if not task_id:
+            return
+        with self.lock:
+            task = self.tasks.get(task_id)
+            cancelled = bool(task and task["status"] == "cancelled")
+            if not cancelled:
+                self.processes.setdefault(task_id, []).append(process)
+        if cancelled:
+            try:
+                process.kill()
+            except Exception:
+                pass
+
+    def unregister_process(self, task_id: Optional[str], process: Any):
+        if not task_id:
+            return
+        with self.lock:
+            processes = self.processes.get(task_id)
+            if processes and process in processes:
+                processes.remove(process)
+                if not processes:
+                    del self.processes[task_id]
+
+    def remove_task(self, task_id: Optional[str]):
+        """작업 기록 삭제 (결과를 다른 곳에 보관하는 내부 작업이 끝난 뒤 정리용)"""
+        if not task_id:
+            return
+        with self.lock:
+            self.tasks.pop(task_id, None)
+            self.processes.pop(task_id, None)
+
     def cleanup_old_tasks(self, max_age_hours: int = 24):
         # TODO: 필요시 구현
         pass
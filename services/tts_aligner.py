@@ -0,0 +1,157 @@
+"""
+TTS Aligner - 단어 타임스탬프를 주지 않는 엔진(Gemini)용 로컬 에너지 기반 정렬
+
+Gemini TTS는 PCM만 반환하므로 자막/세분화를 위해 같은 오디오를 Whisper로 다시 보내야 했다.
+합성한 텍스트는 이미 알고 있으므로, PCM의 RMS 에너지로 휴지 구간(무음)을 찾고
+문장/절 경계를 글자 수 비율로 예상한 위치에서 가장 가까운 휴지 구간에 맞춘다.
+구 내부의 단어는 글자 수 비율로 나눈다. (네트워크 호출 없이 수 ms 안에 처리)
+"""
+
+import os
+import subprocess
+from typing import List, Tuple
+
+import numpy as np
+
+from .tts_base import WordTimestamp
+from .tts_chunking import split_phrases
+
+
+class EnergyAligner:
+    """RMS 에너지 휴지 구간 검출 + 텍스트 구 경계 정렬"""
+
+    # 발화 레벨과 관계없이 항상 무음으로 보는 절대 레벨 (dBFS)
+    SILENCE_FLOOR_DB = -60.0
+
+    # 휴지 구간을 찾을 예상 위치 허용 오차 (최소값, 구 길이 비율)
+    MIN_TOLERANCE_MS = 300
+    TOLERANCE_RATIO = 0.5
+
+    def __init__(self, frame_ms: int = 20, min_pause_ms: int = 150, silence_db: float = 30.0):
+        """
+        Args:
+            frame_ms: RMS 계산 프레임 길이
+            min_pause_ms: 휴지 구간으로 인정할 최소 무음 길이
+            silence_db: 발화 레벨(상위 10%)보다 이만큼 낮으면 무음으로 판단
+        """
+        self.frame_ms = frame_ms
+        self.min_pause_ms = min_pause_ms
+        self.silence_db = silence_db
+
+    def detect_pauses(self, samples: np.ndarray, sample_rate: int) -> Tuple[int, int, List[Tuple[int, int]]]:
+        """
+        발화 구간과 내부 휴지 구간 검출
+
+        Args:
+            samples: 모노 샘플 (-1.0 ~ 1.0 float)
+            sample_rate: 샘플레이트
+
+        Returns:
+            (발화 시작 ms, 발화 끝 ms, [(휴지 시작 ms, 휴지 끝 ms), ...]) - 발화가 없으면 (0, 0, [])
+        """
+        frame = max(1, int(sample_rate * self.frame_ms / 1000))
+        n_frames = len(samples) // frame
+        if n_frames == 0:
+            return 0, 0, []
+
+        frames = samples[:n_frames * frame].reshape(n_frames, frame)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        db = 20 * np.log10(rms + 1e-10)
+        threshold = max(np.percentile(db, 90) - self.silence_db, self.SILENCE_FLOOR_DB)
+        silent = db < threshold
+
+        voiced = np.flatnonzero(~silent)
+        if len(voiced) == 0:
+            return 0, 0, []
+        first, last = voiced[0], voiced[-1] + 1
+
+        # 발화 구간 내부의 연속 무음 프레임 구간 (시작, 끝) 검출
+        inner = silent[first:last]
+        edges = np.diff(np.concatenate(([0], inner.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1) + first
+        ends = np.flatnonzero(edges == -1) + first
+        min_frames = max(1, int(np.ceil(self.min_pause_ms / self.frame_ms)))
+        keep = (ends - starts) >= min_frames
+
+        pauses = [(int(s) * self.frame_ms, int(e) * self.frame_ms) for s, e in zip(starts[keep], ends[keep])]
+        return int(first) * self.frame_ms, int(last) * self.frame_ms, pauses
+
+    def align(self, text: str, samples: np.ndarray, sample_rate: int) -> List[WordTimestamp]:
+        """
+        텍스트를 오디오에 정렬하여 단어 타임스탬프 생성
+
+        구 경계마다 (이전 경계 ~ 발화 끝)을 남은 글자 수 비율로 나눈 예상 위치 근처의 휴지 구간을 고른다.
+        문장 끝은 긴 휴지 구간을 우선하고, 맞는 휴지 구간이 없으면 예상 위치를 그대로 쓴다.
+        """
+        phrases = split_phrases(text)
+        if not phrases:
+            return []
+        speech_start, speech_end, pauses = self.detect_pauses(samples, sample_rate)
+        if speech_end <= speech_start:
+            return []
+
+        weights = [max(1, len(phrase.replace(" ", ""))) for phrase, _ in phrases]
+        bounds: List[Tuple[int, int]] = []  # 구 경계 (앞 구 끝 ms, 다음 구 시작 ms)
+        prev = speech_start
+        next_pause = 0
+        for index in range(len(phrases) - 1):
+            remaining = sum(weights[index:])
+            span = weights[index] / remaining * (speech_end - prev)
+            expected = prev + span
+            tolerance = max(self.MIN_TOLERANCE_MS, span * self.TOLERANCE_RATIO)
+            bonus = 0.5 if phrases[index][1] else 0.2  # 문장 끝일수록 긴 휴지를 우선
+
+            best, best_score = None, None
+            for candidate in range(next_pause, len(pauses)):
+                start, end = pauses[candidate]
+                center = (start + end) / 2
+                if start < prev:
+                    continue
+                if center > expected + tolerance:
+                    break
+                if center < expected - tolerance:
+                    continue
+                score = abs(center - expected) - bonus * (end - start)
+                if best_score is None or score < best_score:
+                    best, best_score = candidate, score
+
+            if best is None:
+                bounds.append((int(expected), int(expected)))
+                prev = int(expected)
+            else:
+                bounds.append(pauses[best])
+                prev = pauses[best][1]
+                next_pause = best + 1
+
+        starts = [speech_start] + [end for _, end in bounds]
+        ends = [start for start, _ in bounds] + [speech_end]
+
+        timestamps: List[WordTimestamp] = []
+        for (phrase, _), start_ms, end_ms in zip(phrases, starts, ends):
+            words = phrase.split()
+            cumulative = np.cumsum([0] + [len(word) for word in words])
+            edges = start_ms + (end_ms - start_ms) * cumulative / cumulative[-1]
+            for word, word_start, word_end in zip(words, edges[:-1], edges[1:]):
+                timestamps.append(WordTimestamp(text=word, start_ms=int(round(word_start)),
+                                                end_ms=int(round(word_end))))
+        return timestamps
+
+    def align_pcm(self, text: str, pcm: bytes, sample_rate: int, channels: int = 1) -> List[WordTimestamp]:
+        """16-bit little-endian PCM 바이트 정렬 (스테레오는 채널 평균)"""
+        samples = np.frombuffer(pcm, dtype='<i2').astype(np.float32) / 32768.0
+        if channels > 1:
+            samples = samples[:len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+        return self.align(text, samples, sample_rate)
+
+    def align_file(self, text: str, audio_path: str, sample_rate: int = 16000) -> List[WordTimestamp]:
+        """오디오 파일을 FFmpeg로 모노 PCM 디코딩 후 정렬"""
+        cmd = ['ffmpeg', '-v', 'error', '-i', audio_path, '-ac', '1', '-ar', str(sample_rate),
+               '-f', 's16le', '-']
+        result = subprocess.run(cmd, capture_output=True, timeout=120)
+        if result.returncode != 0:
+            raise RuntimeError(f"오디오 디코딩 실패: {result.stderr.decode('utf-8', 'replace')[-300:]}")
+        return self.align_pcm(text, result.stdout, sample_rate)
+
+
+# 싱글톤 인스턴스 (TTS_ALIGN_MIN_PAUSE_MS로 휴지 구간 최소 길이 조정)
+energy_aligner = EnergyAligner(min_pause_ms=int(os.getenv("TTS_ALIGN_MIN_PAUSE_MS", "150")))
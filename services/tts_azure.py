@@ -4,12 +4,63 @@ Azure Speech SDK를 사용한 음성 합성 및 타임스탬프 추출
 """
 import os
 import uuid
-import base64
-from typing import List, Optional
+import queue
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
 import azure.cognitiveservices.speech as speechsdk
-from .tts_base import TTSEngineBase, TTSResult, WordTimestamp
+from .tts_base import TTSEngineBase, TTSResult, WordTimestamp, output_url
 from .utils import OUTPUT_DIR
 
+class _PooledSynthesizer:
+    """
+    재사용 가능한 SpeechSynthesizer + 서비스 연결
+
+    Word Boundary 핸들러는 생성 시 한 번만 연결하고, 요청마다 timestamps에 그 요청 전용 리스트를 지정한다.
+    (한 번에 한 요청만 빌려 쓰므로 다른 요청의 단어가 섞이지 않음)
+    비동기 요청은 on_done에 완료 콜백을 지정해 합성 완료/취소 이벤트로 결과를 받는다.
+    """
+
+    def __init__(self, speech_config, open_connection: bool = False):
+        # audio_config=None: 오디오를 스피커/파일 대신 result.audio_data로 받음
+        self.synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+        self.timestamps: Optional[List[WordTimestamp]] = None
+        self.on_done = None
+        self.synthesizer.synthesis_word_boundary.connect(self._on_word_boundary)
+        self.synthesizer.synthesis_completed.connect(self._on_synthesis_done)
+        self.synthesizer.synthesis_canceled.connect(self._on_synthesis_done)
+        self.connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        if open_connection:
+            # 미리 연결해 두면 첫 요청의 TLS/웹소켓 연결 시간이 빠짐
+            self.connection.open(True)
+
+    def _on_word_boundary(self, evt):
+        """
+        Word Boundary 이벤트 핸들러
+        Azure가 단어를 발음할 때마다 호출됨
+        """
+        if self.timestamps is None:
+            return
+        # evt 객체에서 타임스탬프 정보 추출
+        self.timestamps.append(WordTimestamp(
+            text=evt.text,
+            start_ms=int(evt.audio_offset / 10000),  # 100-nanosecond → milliseconds
+            end_ms=int((evt.audio_offset + evt.duration) / 10000)
+        ))
+
+    def _on_synthesis_done(self, evt):
+        """합성 완료/취소 이벤트 핸들러 (SDK 스레드에서 호출됨)"""
+        callback = self.on_done
+        if callback is not None:
+            callback(evt.result)
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+
+
 class AzureTTSEngine(TTSEngineBase):
     """Azure Cognitive Services 기반 TTS 엔진"""
 
@@ -132,19 +183,93 @@ class AzureTTSEngine(TTSEngineBase):
                 "환경변수 AZURE_SPEECH_KEY를 설정하거나 생성자에 api_key를 전달하세요."
             )
         
-        # Speech Config 초기화
-        self.speech_config = speechsdk.SpeechConfig(
+        # 음성별 재사용 Synthesizer 풀 (연결을 미리 열어 두어 첫 바이트 지연 감소)
+        # 요청마다 풀에서 하나를 빌려 단독으로 사용하므로 동시 요청 간 타임스탬프/음성이 섞이지 않음
+        try:
+            self.pool_size = max(1, int(os.getenv("AZURE_TTS_POOL_SIZE", "4")))
+        except ValueError:
+            self.pool_size = 4
+        self._pools: Dict[str, "queue.LifoQueue[_PooledSynthesizer]"] = {}
+        self._pools_lock = threading.Lock()
+        self.pool_stats = {"created": 0, "reused": 0, "discarded": 0}
+
+        # 비동기 합성 완료 대기 시간 (초)
+        try:
+            self.async_timeout = max(1.0, float(os.getenv("AZURE_TTS_TIMEOUT", "60")))
+        except ValueError:
+            self.async_timeout = 60.0
+
+        # 기본 음성 Synthesizer 미리 준비 (AZURE_TTS_PREWARM=0 이면 비활성화, 초기화를 막지 않도록 백그라운드)
+        if os.getenv("AZURE_TTS_PREWARM", "1") != "0":
+            threading.Thread(
+                target=self.prewarm, args=([self.VOICE_SHORTCUTS["female"]],), daemon=True
+            ).start()
+
+    def _new_speech_config(self, voice_name: str):
+        """Synthesizer 전용 Speech Config 생성 (인스턴스 간 공유하지 않음)"""
+        speech_config = speechsdk.SpeechConfig(
             subscription=self.api_key,
             region=self.region
         )
-        
-        # 출력 포맷 설정 (MP3 44.1kHz 128kbps)
-        self.speech_config.set_speech_synthesis_output_format(
+        # 출력 포맷 설정 (MP3 16kHz 32kbps)
+        speech_config.set_speech_synthesis_output_format(
             speechsdk.SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3
         )
-        
-        # 타임스탬프 수집용 리스트
-        self.word_timestamps: List[WordTimestamp] = []
+        speech_config.speech_synthesis_voice_name = voice_name
+        return speech_config
+
+    def _pool(self, voice_name: str) -> "queue.LifoQueue[_PooledSynthesizer]":
+        with self._pools_lock:
+            pool = self._pools.get(voice_name)
+            if pool is None:
+                pool = queue.LifoQueue(maxsize=self.pool_size)
+                self._pools[voice_name] = pool
+            return pool
+
+    def _acquire_synthesizer(self, voice_name: str) -> "_PooledSynthesizer":
+        """풀에서 Synthesizer를 빌림 (없으면 새로 생성)"""
+        try:
+            pooled = self._pool(voice_name).get_nowait()
+            self._count("reused")
+            return pooled
+        except queue.Empty:
+            self._count("created")
+            return _PooledSynthesizer(self._new_speech_config(voice_name))
+
+    def _release_synthesizer(self, voice_name: str, pooled: "_PooledSynthesizer", healthy: bool = True):
+        """사용한 Synthesizer 반납 (오류가 난 연결이거나 풀이 가득 찼으면 폐기)"""
+        pooled.timestamps = None
+        pooled.on_done = None
+        if healthy:
+            try:
+                self._pool(voice_name).put_nowait(pooled)
+                return
+            except queue.Full:
+                pass
+        self._count("discarded")
+        pooled.close()
+
+    def prewarm(self, voice_names: List[str], count: int = 1):
+        """지정한 음성의 Synthesizer를 미리 만들어 서비스 연결을 열어 둠"""
+        for voice_name in voice_names:
+            for _ in range(min(count, self.pool_size)):
+                try:
+                    pooled = _PooledSynthesizer(self._new_speech_config(voice_name), open_connection=True)
+                    self._count("created")
+                    self._release_synthesizer(voice_name, pooled)
+                except Exception as e:
+                    print(f"[WARN] Azure Synthesizer 사전 준비 실패 ({voice_name}): {e}")
+                    return
+
+    def _count(self, name: str):
+        with self._pools_lock:
+            self.pool_stats[name] += 1
+
+    def get_pool_stats(self) -> dict:
+        """Synthesizer 풀 통계 (생성/재사용/폐기 횟수, 음성별 대기 중인 수)"""
+        with self._pools_lock:
+            idle = {voice: pool.qsize() for voice, pool in self._pools.items()}
+            return dict(self.pool_stats, idle=idle, pool_size=self.pool_size)
     
     def validate_credentials(self) -> bool:
         """API 키 유효성 검증"""
@@ -159,19 +284,38 @@ class AzureTTSEngine(TTSEngineBase):
             print(f"[X] Azure 인증 실패: {e}")
             return False
     
-    def _on_word_boundary(self, evt):
+    def resolve_voice(self, voice_id: str = None, **kwargs) -> str:
         """
-        Word Boundary 이벤트 핸들러
-        Azure가 단어를 발음할 때마다 호출됨
+        음성 ID를 Azure 음성 이름으로 변환
+        (숏컷 → VOICES 키 → 직접 전달된 Azure 음성 이름 → 기본 여성 목소리 순)
         """
-        # evt 객체에서 타임스탬프 정보 추출
-        word_timestamp = WordTimestamp(
-            text=evt.text,
-            start_ms=int(evt.audio_offset / 10000),  # 100-nanosecond → milliseconds
-            end_ms=int((evt.audio_offset + evt.duration) / 10000)
-        )
-        self.word_timestamps.append(word_timestamp)
-    
+        # 1. VOICE_SHORTCUTS 확인 (하위 호환성)
+        if voice_id and voice_id in self.VOICE_SHORTCUTS:
+            return self.VOICE_SHORTCUTS[voice_id]
+        # 2. VOICES 딕셔너리에서 직접 확인
+        if voice_id and voice_id in self.VOICES:
+            return self.VOICES[voice_id]["name"]
+        # 3. 직접 Azure 음성 이름이 전달된 경우
+        if voice_id and voice_id.startswith("ko-KR-"):
+            return voice_id
+        # 4. 기본값 사용
+        return self.VOICE_SHORTCUTS["female"]
+
+    def voice_gender(self, voice_id: str = None, **kwargs) -> Optional[str]:
+        """목록에 있는 음성(또는 기본 음성)만 성별 반환 - 목록 밖 음성 이름은 대응 불가"""
+        voice_name = self.resolve_voice(voice_id)
+        if voice_id and voice_id not in self.VOICE_SHORTCUTS and voice_id not in self.VOICES:
+            return None
+        gender = self.VOICES.get(voice_name, {}).get("gender")
+        return {"여성": "female", "남성": "male"}.get(gender)
+
+    def voice_for_gender(self, gender: str) -> Optional[str]:
+        return self.VOICE_SHORTCUTS.get(gender)
+
+    def cache_params(self, **kwargs) -> dict:
+        """출력 포맷이 바뀌면 캐시된 오디오를 재사용하지 않도록 키에 반영"""
+        return {"format": "Audio16Khz32KBitRateMonoMp3"}
+
     def synthesize_speech(
         self,
         text: str,
@@ -193,123 +337,175 @@ class AzureTTSEngine(TTSEngineBase):
         Returns:
             TTSResult: 오디오 및 타임스탬프 데이터
         """
+        pooled = None
+        voice_name = None
+        healthy = True
         try:
-            # 타임스탬프 리스트 초기화
-            self.word_timestamps = []
-
-            # 음성 선택 (기본값: 여성 목소리)
-            # 1. VOICE_SHORTCUTS 확인 (하위 호환성)
-            if voice_id and voice_id in self.VOICE_SHORTCUTS:
-                voice_name = self.VOICE_SHORTCUTS[voice_id]
-                print(f"[TTS] 음성 숏컷 '{voice_id}' → '{voice_name}'으로 변환")
-            # 2. VOICES 딕셔너리에서 직접 확인
-            elif voice_id and voice_id in self.VOICES:
-                voice_name = self.VOICES[voice_id]["name"]
-                print(f"[TTS] 음성 '{voice_id}' 사용: {self.VOICES[voice_id]['display_name']} ({self.VOICES[voice_id]['style']})")
-            # 3. 직접 Azure 음성 이름이 전달된 경우
-            elif voice_id and voice_id.startswith("ko-KR-"):
-                voice_name = voice_id
-                print(f"[TTS] 직접 음성 이름 사용: '{voice_name}'")
-            # 4. 기본값 사용
-            else:
-                voice_name = self.VOICE_SHORTCUTS["female"]
-                print(f"[TTS] 기본 음성 사용: '{voice_name}'")
-
-            self.speech_config.speech_synthesis_voice_name = voice_name
-            
-            # SSML 생성 (속도 조절 포함)
-            ssml = self._create_ssml(text, voice_name, speed)
+            voice_name, ssml, audio_path = self._prepare_request(text, voice_id, speed)
 
-            # 오디오 파일 경로 미리 생성
-            audio_filename = f"tts_{uuid.uuid4()}.mp3"
-            audio_path = os.path.join(OUTPUT_DIR, audio_filename)
-            
-            # 파일 출력을 위한 AudioConfig 설정
-            audio_config = speechsdk.audio.AudioOutputConfig(filename=audio_path)
+            # 풀에서 Synthesizer 대여 (이 요청 전용 타임스탬프 리스트 연결)
+            pooled = self._acquire_synthesizer(voice_name)
+            word_timestamps: List[WordTimestamp] = []
+            pooled.timestamps = word_timestamps
+
+            # 음성 합성 실행 (오디오는 메모리로 받아 파일로 저장)
+            print(f"[TTS] Azure TTS 생성 중... (음성: {voice_name}, 속도: {speed}x)")
             
-            # Synthesizer 생성
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=self.speech_config,
-                audio_config=audio_config
+            result = pooled.synthesizer.speak_ssml_async(ssml).get()
+            tts_result, healthy = self._build_result(result, audio_path, word_timestamps)
+            return tts_result
+        
+        except Exception as e:
+            healthy = False
+            print(f"[X] Azure TTS 예외: {e}")
+            return TTSResult(
+                success=False,
+                audio_url="",
+                engine="azure",
+                error=str(e)
             )
 
-            # Word Boundary 이벤트 연결
-            synthesizer.synthesis_word_boundary.connect(self._on_word_boundary)
+        finally:
+            if pooled is not None:
+                self._release_synthesizer(voice_name, pooled, healthy)
 
-            # 음성 합성 실행
-            print(f"[TTS] Azure TTS 생성 중... (음성: {voice_name}, 속도: {speed}x)")
+    async def synthesize_speech_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        language: str = "ko-KR",
+        speed: float = 1.0,
+        **kwargs
+    ) -> TTSResult:
+        """
+        비동기 합성 - speak_ssml_async()의 완료/취소 이벤트를 이벤트 루프 Future로 받음
+
+        동기 버전처럼 ResultFuture.get()으로 스레드를 막지 않으므로 대기 중에 스레드를 점유하지 않는다.
+        """
+        pooled = None
+        voice_name = None
+        healthy = True
+        try:
+            voice_name, ssml, audio_path = self._prepare_request(text, voice_id, speed)
+
+            pooled = self._acquire_synthesizer(voice_name)
+            word_timestamps: List[WordTimestamp] = []
+            pooled.timestamps = word_timestamps
+
+            loop = asyncio.get_running_loop()
+            done = loop.create_future()
+
+            def on_done(result):
+                # SDK 스레드 → 이벤트 루프로 결과 전달
+                loop.call_soon_threadsafe(lambda: done.done() or done.set_result(result))
+
+            pooled.on_done = on_done
+            print(f"[TTS] Azure TTS 생성 중... (음성: {voice_name}, 속도: {speed}x, async)")
+            pooled.synthesizer.speak_ssml_async(ssml)
+
+            result = await asyncio.wait_for(done, timeout=self.async_timeout)
+            tts_result, healthy = self._build_result(result, audio_path, word_timestamps)
+            return tts_result
+
+        except asyncio.CancelledError:
+            # 배치 취소 등으로 중단됨 - 아직 합성 중이므로 반납하면 이전 요청의 이벤트가 다음 요청에 섞임
+            # (CancelledError는 Exception이 아니어서 아래 except로 잡히지 않음)
+            healthy = False
+            raise
+
+        except asyncio.TimeoutError:
+            healthy = False
+            error_msg = f"Azure TTS 시간 초과 ({self.async_timeout:.0f}초)"
+            print(f"[X] {error_msg}")
+            return TTSResult(success=False, audio_url="", engine="azure", error=error_msg)
+
+        except Exception as e:
+            healthy = False
+            print(f"[X] Azure TTS 예외: {e}")
+            return TTSResult(
+                success=False,
+                audio_url="",
+                engine="azure",
+                error=str(e)
+            )
+
+        finally:
+            if pooled is not None:
+                self._release_synthesizer(voice_name, pooled, healthy)
+
+    def _prepare_request(self, text: str, voice_id: str, speed: float) -> Tuple[str, str, str]:
+        """음성 이름, SSML, 저장할 오디오 경로 준비 (동기/비동기 공통)"""
+        # 음성 선택 (기본값: 여성 목소리)
+        voice_name = self.resolve_voice(voice_id)
+        print(f"[TTS] 음성 '{voice_id}' → '{voice_name}'")
+
+        # SSML 생성 (속도 조절 포함)
+        ssml = self._create_ssml(text, voice_name, speed)
+
+        # 오디오 파일 경로 미리 생성
+        audio_filename = f"tts_{uuid.uuid4()}.mp3"
+        audio_path = os.path.join(OUTPUT_DIR, audio_filename)
+        return voice_name, ssml, audio_path
+
+    def _build_result(self, result, audio_path: str,
+                      word_timestamps: List[WordTimestamp]) -> Tuple[TTSResult, bool]:
+        """
+        합성 결과를 TTSResult로 변환 (동기/비동기 공통)
+
+        Returns:
+            (TTSResult, Synthesizer 재사용 가능 여부)
+        """
+        # 결과 확인
+        healthy = True
+        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            audio_data = result.audio_data
+            if not audio_data:
+                raise Exception("TTS 완료되었으나 오디오 데이터가 없습니다.")
+            with open(audio_path, "wb") as f:
+                f.write(audio_data)
+            
+            # 총 길이 계산 (마지막 단어의 end_ms)
+            total_duration_ms = word_timestamps[-1].end_ms if word_timestamps else 0
             
-            result = synthesizer.speak_ssml_async(ssml).get()
+            # SRT 생성
+            srt = self.generate_srt(word_timestamps)
             
-            # 결과 확인
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                # 파일이 생성되었는지 확인 및 데이터 로드
-                if os.path.exists(audio_path) and os.path.getsize(audio_path) > 0:
-                    with open(audio_path, "rb") as f:
-                        audio_data = f.read()
-                    audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                else:
-                    # 파일이 없으면 audio_data에서 시도 (Fallback)
-                    audio_data = result.audio_data
-                    if audio_data:
-                         with open(audio_path, "wb") as f:
-                            f.write(audio_data)
-                         audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                    else:
-                        raise Exception("TTS 완료되었으나 오디오 데이터가 없습니다.")
-
-                audio_url = f"data:audio/mpeg;base64,{audio_base64}"
-                
-                # 총 길이 계산 (마지막 단어의 end_ms)
-                total_duration_ms = self.word_timestamps[-1].end_ms if self.word_timestamps else 0
-                
-                # SRT 생성
-                srt = self.generate_srt(self.word_timestamps)
-                
-                print(f"[OK] Azure TTS 완료: {len(self.word_timestamps)}개 단어, {total_duration_ms/1000:.2f}초")
-                
-                return TTSResult(
-                    success=True,
-                    audio_url=audio_url,
-                    audio_path=audio_path,
-                    audio_base64=audio_base64,
-                    timestamps=self.word_timestamps,
-                    total_duration_ms=total_duration_ms,
-                    srt=srt,
-                    engine="azure"
-                )
+            print(f"[OK] Azure TTS 완료: {len(word_timestamps)}개 단어, {total_duration_ms/1000:.2f}초")
             
-            elif result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = result.cancellation_details
-                error_msg = f"Azure TTS 취소됨: {cancellation.reason}"
-                if cancellation.reason == speechsdk.CancellationReason.Error:
-                    error_msg += f" (에러 코드: {cancellation.error_code}, 상세: {cancellation.error_details})"
-                
-                print(f"[X] {error_msg}")
-                return TTSResult(
-                    success=False,
-                    audio_url="",
-                    engine="azure",
-                    error=error_msg
-                )
+            return TTSResult(
+                success=True,
+                audio_url=output_url(audio_path, OUTPUT_DIR),
+                audio_path=audio_path,
+                timestamps=word_timestamps,
+                total_duration_ms=total_duration_ms,
+                srt=srt,
+                engine="azure"
+            ), healthy
+        
+        elif result.reason == speechsdk.ResultReason.Canceled:
+            cancellation = result.cancellation_details
+            error_msg = f"Azure TTS 취소됨: {cancellation.reason}"
+            if cancellation.reason == speechsdk.CancellationReason.Error:
+                # 연결 오류 등 - 이 Synthesizer는 재사용하지 않음
+                healthy = False
+                error_msg += f" (에러 코드: {cancellation.error_code}, 상세: {cancellation.error_details})"
             
-            else:
-                return TTSResult(
-                    success=False,
-                    audio_url="",
-                    engine="azure",
-                    error=f"알 수 없는 상태: {result.reason}"
-                )
+            print(f"[X] {error_msg}")
+            return TTSResult(
+                success=False,
+                audio_url="",
+                engine="azure",
+                error=error_msg
+            ), healthy
         
-        except Exception as e:
-            print(f"[X] Azure TTS 예외: {e}")
+        else:
             return TTSResult(
                 success=False,
                 audio_url="",
                 engine="azure",
-                error=str(e)
-            )
-    
+                error=f"알 수 없는 상태: {result.reason}"
+            ), healthy
+
     def _create_ssml(self, text: str, voice_name: str, speed: float) -> str:
         """
         SSML(Speech Synthesis Markup Language) 생성
@@ -2,10 +2,18 @@
 TTS Base Interface
 모든 TTS 엔진이 구현해야 하는 추상 인터페이스 정의
 """
+import os
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+def output_url(audio_path: str, output_dir: str) -> str:
+    """출력 폴더 안의 파일 경로를 정적 서빙 URL(/output/...)로 변환"""
+    relative = os.path.relpath(audio_path, output_dir).replace(os.sep, '/')
+    return f"/output/{relative}"
+
+
 @dataclass
 class WordTimestamp:
     """단어별 타임스탬프 데이터 구조"""
@@ -32,7 +40,7 @@ class WordTimestamp:
 class TTSResult:
     """TTS 생성 결과 데이터 구조"""
     success: bool                           # 성공 여부
-    audio_url: str                          # 오디오 파일 URL (Base64 또는 HTTP)
+    audio_url: str                          # 오디오 파일 URL (/output/... 또는 Base64 data URI)
     audio_path: Optional[str] = None        # 로컬 파일 경로
     audio_base64: Optional[str] = None      # Base64 인코딩된 오디오
     timestamps: List[WordTimestamp] = None  # 단어별 타임스탬프
@@ -123,6 +131,64 @@ class TTSEngineBase(ABC):
         """
         pass
     
+    async def synthesize_speech_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        language: str = "ko-KR",
+        speed: float = 1.0,
+        **kwargs
+    ) -> TTSResult:
+        """
+        synthesize_speech()의 비동기 버전입니다.
+        
+        기본 구현은 동기 메서드를 스레드에서 실행합니다. 비동기 클라이언트를 쓸 수 있는 엔진은
+        재정의하여 응답을 기다리는 동안 스레드를 점유하지 않도록 합니다.
+        
+        Returns:
+            TTSResult: synthesize_speech()와 같은 결과
+        """
+        return await asyncio.to_thread(
+            self.synthesize_speech, text=text, voice_id=voice_id, language=language, speed=speed, **kwargs
+        )
+    
+    def resolve_voice(self, voice_id: str = None, **kwargs) -> str:
+        """
+        요청된 음성 ID를 엔진이 실제로 사용하는 음성 이름으로 변환합니다.
+        (숏컷/별칭/기본값 처리 - 캐시 키에 사용되므로 실제 합성과 같은 규칙이어야 함)
+        
+        Returns:
+            str: 실제 음성 이름
+        """
+        return voice_id or "default"
+    
+    def cache_params(self, **kwargs) -> Dict[str, Any]:
+        """
+        음성/텍스트/속도 외에 출력 오디오에 영향을 주는 엔진 설정을 반환합니다. (캐시 키용)
+        
+        Returns:
+            dict: 모델 이름, 안정성 등 엔진별 설정
+        """
+        return {}
+    
+    def voice_gender(self, voice_id: str = None, **kwargs) -> Optional[str]:
+        """
+        요청된 음성의 성별을 반환합니다. (다른 엔진으로 라우팅할 때 호환 음성 선택용)
+        
+        Returns:
+            str: "female" / "male", 엔진 고유 음성이라 대응시킬 수 없으면 None
+        """
+        return None
+    
+    def voice_for_gender(self, gender: str) -> Optional[str]:
+        """
+        성별에 대응하는 이 엔진의 기본 음성 ID를 반환합니다.
+        
+        Returns:
+            str: 음성 ID, 라우팅 대상이 될 수 없는 엔진이면 None
+        """
+        return None
+    
     def generate_srt(self, timestamps: List[WordTimestamp]) -> str:
         """
         타임스탬프 리스트로부터 SRT 포맷 자막을 생성합니다.
@@ -0,0 +1,163 @@
+"""
+TTS Cache Service - 생성된 TTS 오디오 + 타임스탬프 디스크 캐시
+
+편집 중 같은 문장을 반복해서 다시 생성할 때마다 외부 TTS API(Google/Azure/ElevenLabs)를
+호출하던 것을 (엔진, 실제 음성 이름, 정규화된 텍스트, 속도, 엔진별 설정) 해시로 재사용한다.
+
+특징:
+- FileCacheService 기반 (MP3 파일 + 메타데이터 JSON에 단어 타임스탬프/SRT 저장)
+- 음성 ID는 엔진의 resolve_voice()로 실제 음성 이름으로 변환 후 키에 반영
+  (숏컷 "female"과 "ko-KR-SunHiNeural"처럼 같은 음성이면 같은 항목 적중)
+- 용량 제한 + LRU 자동 정리, 히트/미스 통계
+- 적중 시 출력 폴더에는 항목마다 고정 이름 사본 하나만 두고 재사용 (적중할 때마다 파일이 늘지 않도록)
+"""
+
+import os
+import uuid
+import shutil
+import filecmp
+import tempfile
+import unicodedata
+from typing import Any, Dict, Optional
+
+from .file_cache_service import FileCacheService
+from .tts_base import TTSEngineBase, TTSResult, WordTimestamp, output_url
+from .utils import OUTPUT_DIR
+
+# 키 구성/메타데이터 형식이 바뀌면 올려서 기존 캐시 무효화
+TTS_CACHE_VERSION = 1
+
+
+class TTSCacheService:
+    """TTS 결과 캐시 (키 생성 + 조회/저장)"""
+
+    def __init__(self, cache: FileCacheService, enabled: bool = True, output_dir: str = OUTPUT_DIR):
+        self.cache = cache
+        self.enabled = enabled
+        self.output_dir = output_dir
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """유니코드 정규화(NFC) + 공백 정리 (줄바꿈/연속 공백 차이로 캐시가 빗나가지 않도록)"""
+        return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+    def make_key(self, engine: TTSEngineBase, text: str, voice_id: Optional[str] = None,
+                 language: str = "ko-KR", speed: float = 1.0, **kwargs) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            engine: TTS 엔진 (음성 이름 해석 + 출력에 영향을 주는 설정 조회)
+            text: 변환할 텍스트
+            voice_id: 요청된 음성 ID
+            language: 언어 코드
+            speed: 재생 속도
+            **kwargs: 엔진별 추가 옵션 (stability 등)
+        """
+        return self.cache.make_key(
+            version=TTS_CACHE_VERSION,
+            engine=engine.engine_name,
+            voice=engine.resolve_voice(voice_id, **kwargs),
+            text=self.normalize_text(text),
+            language=language,
+            speed=round(float(speed or 1.0), 3),
+            params=engine.cache_params(**kwargs)
+        )
+
+    def get(self, key: str) -> Optional[TTSResult]:
+        """
+        캐시 적중 시 출력 폴더의 MP3 사본으로 TTSResult 반환
+
+        호출 측이 오디오 파일을 제자리에서 수정(라우드니스 정규화 등)해도 캐시 원본이 영향받지 않도록
+        하드링크 대신 복사한다. 사본은 항목마다 고정 이름(tts_<키>.mp3) 하나를 재사용하므로
+        같은 문장을 반복 생성해도 출력 폴더가 커지지 않는다. 기존 사본이 수정되었으면
+        그 파일은 그대로 두고 새 이름으로 복사한다.
+        """
+        # 통계는 사본까지 만들어 결과를 돌려줄 수 있을 때만 적중으로 기록
+        metadata = self.cache.get_metadata(key)
+        cached_path = self.cache.get_path(key, track_stats=False) if metadata is not None else None
+        if cached_path is None:
+            # 없는 항목이거나 메타데이터가 없어 타임스탬프를 복원할 수 없으면 미스로 처리
+            self.cache.record_lookup(hit=False)
+            return None
+
+        try:
+            timestamps = [
+                WordTimestamp(text=ts["text"], start_ms=ts["start_ms"], end_ms=ts["end_ms"])
+                for ts in metadata.get("timestamps", [])
+            ]
+        except Exception as e:
+            print(f"[WARN] TTS 캐시 항목 읽기 실패 - 새로 생성: {e}")
+            self.cache.record_lookup(hit=False)
+            return None
+
+        audio_path = os.path.join(self.output_dir, f"tts_{key[:32]}.mp3")
+        if not self._is_unmodified_copy(audio_path, cached_path):
+            if os.path.exists(audio_path):
+                audio_path = os.path.join(self.output_dir, f"tts_{uuid.uuid4()}.mp3")
+            tmp_path = f"{audio_path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                shutil.copyfile(cached_path, tmp_path)
+                os.replace(tmp_path, audio_path)
+            except OSError as e:
+                # 복사 중 캐시 정리로 원본이 삭제된 경우 등 - 미스로 처리
+                print(f"[WARN] TTS 캐시 사본 생성 실패 - 새로 생성: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                self.cache.record_lookup(hit=False)
+                return None
+
+        self.cache.record_lookup(hit=True)
+        return TTSResult(
+            success=True,
+            audio_url=output_url(audio_path, self.output_dir),
+            audio_path=audio_path,
+            timestamps=timestamps,
+            total_duration_ms=metadata.get("total_duration_ms", 0),
+            srt=metadata.get("srt"),
+            engine=metadata.get("engine", "unknown")
+        )
+
+    @staticmethod
+    def _is_unmodified_copy(path: str, cached_path: str) -> bool:
+        """출력 폴더의 사본이 캐시 원본과 같은 내용인지 확인"""
+        try:
+            return os.path.getsize(path) == os.path.getsize(cached_path) and \
+                filecmp.cmp(path, cached_path, shallow=False)
+        except OSError:
+            return False
+
+    def put(self, key: str, result: TTSResult) -> bool:
+        """성공한 TTS 결과 저장 (로컬 오디오 파일이 있는 경우만)"""
+        if not result.success or not result.audio_path or not os.path.exists(result.audio_path):
+            return False
+        metadata = {
+            "engine": result.engine,
+            "total_duration_ms": result.total_duration_ms,
+            "srt": result.srt,
+            "timestamps": [
+                {"text": ts.text, "start_ms": ts.start_ms, "end_ms": ts.end_ms}
+                for ts in result.timestamps
+            ]
+        }
+        return self.cache.put(key, result.audio_path, metadata=metadata)
+
+    def clear(self) -> int:
+        return self.cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.cache.get_stats()
+        stats["enabled"] = self.enabled
+        return stats
+
+
+# TTS 캐시 (TTS_CACHE_ENABLED=0 이면 비활성화, TTS_CACHE_MAX_MB로 용량 조정)
+tts_cache_service = TTSCacheService(
+    cache=FileCacheService(
+        name="tts",
+        cache_dir=os.path.join(tempfile.gettempdir(), "realhunalo_tts_cache"),
+        max_size_mb=int(os.getenv("TTS_CACHE_MAX_MB", "1024")),
+        suffix=".mp3"
+    ),
+    enabled=os.getenv("TTS_CACHE_ENABLED", "1") != "0"
+)
@@ -0,0 +1,153 @@
+"""
+TTS Chunking - 긴 텍스트를 문장 단위 청크로 나누고, 청크별 합성 결과를 하나의 오디오로 이어붙임
+
+긴 나레이션을 한 번에 요청하면 지연 시간이 글자 수에 비례하고 한 번의 실패로 전체를 잃는다.
+문장 경계에서 나눈 청크를 병렬로 합성한 뒤 샘플 단위로 정확하게 이어붙이고,
+단어 타임스탬프는 앞 청크들의 실제 샘플 수만큼 밀어 하나의 타임라인으로 합친다.
+"""
+
+import os
+import re
+import wave
+import subprocess
+from typing import List, Tuple
+
+from .tts_base import TTSResult, WordTimestamp
+
+# 문장 끝 (마침표/물음표/느낌표/말줄임표 + 닫는 따옴표/괄호) 뒤 공백
+_SENTENCE_END = re.compile(r'([.!?。…]["\'”’)\]]*)\s+')
+# 문장이 청크 크기보다 길 때 차선으로 나눌 위치 (쉼표/세미콜론 뒤 공백)
+_CLAUSE_BOUNDARY = re.compile(r'(?<=[,;:，])\s+')
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """청크 크기보다 긴 문장을 절 → 공백 순으로 나눔"""
+    pieces = [p for p in _CLAUSE_BOUNDARY.split(sentence) if p]
+    if len(pieces) == 1:
+        pieces = sentence.split(' ')
+
+    parts: List[str] = []
+    current = ""
+    for piece in pieces:
+        candidate = f"{current} {piece}".strip()
+        if current and len(candidate) > max_chars:
+            parts.append(current)
+            current = piece
+        else:
+            current = candidate
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    문장 경계에서 텍스트를 나누어 max_chars 이하 청크로 묶음 (문장 순서 유지)
+
+    Returns:
+        청크 목록 (max_chars 이하면 원문 1개)
+    """
+    text = (text or "").strip()
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text] if text else []
+
+    sentences: List[str] = []
+    # 문장 끝 공백을 줄바꿈으로 바꾼 뒤 줄 단위로 분리 (문장부호/따옴표는 앞 문장에 유지)
+    for sentence in _SENTENCE_END.sub(r'\1\n', text).split('\n'):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        sentences.extend(_split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence])
+
+    chunks: List[str] = []
+    current = ""
+    for sentence in sentences:
+        candidate = f"{current} {sentence}" if current else sentence
+        if current and len(candidate) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_phrases(text: str) -> List[Tuple[str, bool]]:
+    """
+    문장/절 경계로 텍스트를 나눈 구 목록 (오디오 휴지 구간과 맞추는 정렬용)
+
+    Returns:
+        [(구, 문장 끝 여부), ...] - 줄바꿈도 문장 끝으로 취급
+    """
+    phrases: List[Tuple[str, bool]] = []
+    for sentence in _SENTENCE_END.sub(r'\1\n', (text or "").strip()).split('\n'):
+        parts = [part.strip() for part in _CLAUSE_BOUNDARY.split(sentence) if part.strip()]
+        for index, part in enumerate(parts):
+            phrases.append((part, index == len(parts) - 1))
+    return phrases
+
+
+def _decode_to_wav(audio_path: str, wav_path: str, sample_rate: int = None) -> None:
+    """오디오를 모노 16-bit WAV로 디코딩 (sample_rate 지정 시 해당 샘플레이트로 변환)"""
+    cmd = ['ffmpeg', '-y', '-v', 'error', '-i', audio_path, '-ac', '1', '-c:a', 'pcm_s16le']
+    if sample_rate:
+        cmd.extend(['-ar', str(sample_rate)])
+    cmd.append(wav_path)
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, errors='replace')
+    if result.returncode != 0 or not os.path.exists(wav_path):
+        raise RuntimeError(f"청크 오디오 디코딩 실패: {result.stderr[-300:]}")
+
+
+def stitch_chunks(chunks: List[TTSResult], output_path: str, work_dir: str,
+                  bitrate: str = "128k") -> Tuple[List[WordTimestamp], int]:
+    """
+    청크별 합성 결과를 순서대로 이어붙여 MP3 1개로 저장
+
+    각 청크를 PCM으로 디코딩하여 샘플 그대로 연결하므로 경계에서 MP3 프레임 패딩으로 인한
+    어긋남이 누적되지 않는다. (최종 MP3 인코딩은 1회)
+
+    Args:
+        chunks: 성공한 청크 결과 (audio_path 필수, 입력 순서)
+        output_path: 최종 MP3 경로
+        work_dir: 중간 WAV 파일 디렉토리
+
+    Returns:
+        (하나의 타임라인으로 보정된 단어 타임스탬프, 전체 길이 ms)
+    """
+    timestamps: List[WordTimestamp] = []
+    stitched_wav = os.path.join(work_dir, "stitched.wav")
+    sample_rate = None
+    total_frames = 0
+
+    with wave.open(stitched_wav, 'wb') as out:
+        for index, chunk in enumerate(chunks):
+            chunk_wav = os.path.join(work_dir, f"chunk_{index:04d}.wav")
+            # 첫 청크의 샘플레이트로 통일 (같은 엔진/음성이면 변환 없음)
+            _decode_to_wav(chunk.audio_path, chunk_wav, sample_rate)
+            with wave.open(chunk_wav, 'rb') as src:
+                if sample_rate is None:
+                    sample_rate = src.getframerate()
+                    out.setnchannels(1)
+                    out.setsampwidth(src.getsampwidth())
+                    out.setframerate(sample_rate)
+                frames = src.getnframes()
+                out.writeframes(src.readframes(frames))
+
+            offset_ms = total_frames * 1000 / sample_rate
+            for ts in chunk.timestamps:
+                timestamps.append(WordTimestamp(
+                    text=ts.text,
+                    start_ms=int(round(ts.start_ms + offset_ms)),
+                    end_ms=int(round(ts.end_ms + offset_ms))
+                ))
+            total_frames += frames
+            os.remove(chunk_wav)
+
+    cmd = ['ffmpeg', '-y', '-v', 'error', '-i', stitched_wav, '-c:a', 'libmp3lame', '-b:a', bitrate, output_path]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, errors='replace')
+    os.remove(stitched_wav)
+    if result.returncode != 0 or not os.path.exists(output_path):
+        raise RuntimeError(f"청크 오디오 MP3 인코딩 실패: {result.stderr[-300:]}")
+
+    return timestamps, int(round(total_frames * 1000 / sample_rate)) if sample_rate else 0
@@ -3,17 +3,19 @@ ElevenLabs TTS Engine implementation
 Adapts the original ElevenLabs logic to the new TTSEngineBase interface.
 """
 import os
+import asyncio
 import requests
 import base64
 import uuid
 from typing import List, Optional
-from .tts_base import TTSEngineBase, TTSResult, WordTimestamp
+from .tts_base import TTSEngineBase, TTSResult, WordTimestamp, output_url
 from .utils import OUTPUT_DIR
 
 class ElevenLabsTTSEngine(TTSEngineBase):
     """ElevenLabs API 기반 TTS 엔진"""
     
     DEFAULT_VOICE_ID = "nPczCjzI2devNBz1zQrb" # 기존 코드의 default voice
+    MODEL_ID = "eleven_multilingual_v2"
     
     def __init__(self, api_key: str = None):
         super().__init__("elevenlabs")
@@ -22,12 +24,165 @@ class ElevenLabsTTSEngine(TTSEngineBase):
         if not self.api_key:
             raise ValueError("ELEVENLABS_API_KEY is not configured")
 
+        # 비동기 요청용 공유 클라이언트 (요청마다 연결/TLS 핸드셰이크를 새로 하지 않도록)
+        self._async_client = None
+        self._async_client_loop = None
+
     def validate_credentials(self) -> bool:
         if not self.api_key:
             return False
         # 간단한 헤더 체크 정도만 수행 (실제 호출 비용 방지)
         return True 
 
+    def resolve_voice(self, voice_id: str = None, **kwargs) -> str:
+        return voice_id or self.DEFAULT_VOICE_ID
+
+    def cache_params(self, **kwargs) -> dict:
+        """음성 설정(안정성/유사도)과 모델은 출력 오디오에 영향을 주므로 캐시 키에 반영"""
+        return {
+            "model_id": self.MODEL_ID,
+            "stability": kwargs.get("stability", 0.5),
+            "similarity": kwargs.get("similarity", 0.75)
+        }
+
+    def _request(self, text: str, voice_id: str, **kwargs):
+        """요청 URL/헤더/본문 (동기/비동기 공통)"""
+        headers = {
+            "Content-Type": "application/json",
+            "xi-api-key": self.api_key
+        }
+        
+        payload = {
+            "text": text,
+            "model_id": self.MODEL_ID,
+            "voice_settings": {
+                "stability": kwargs.get("stability", 0.5),
+                "similarity_boost": kwargs.get("similarity", 0.75),
+                "style": 0,
+                "use_speaker_boost": True
+            }
+            # "output_format": "mp3_44100_128" # Default
+        }
+        return self._url(voice_id), headers, payload
+
+    @staticmethod
+    def _url(voice_id: str) -> str:
+        return f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/with-timestamps"
+
+    def _parse_response(self, result: dict) -> TTSResult:
+        """API 응답(JSON)을 오디오 파일 + 단어 타임스탬프로 변환"""
+        if not result.get("audio_base64"):
+            raise Exception("No audio data in response")
+
+        # 1. Audio Data 처리
+        audio_base64 = result["audio_base64"]
+        audio_bytes = base64.b64decode(audio_base64)
+        
+        # 파일 저장
+        filename = f"tts_eleven_{uuid.uuid4()}.mp3"
+        filepath = os.path.join(OUTPUT_DIR, filename)
+        with open(filepath, "wb") as f:
+            f.write(audio_bytes)
+            
+        # 2. Timestamp 처리
+        timestamps = []
+        alignment = result.get("alignment", {})
+        chars = alignment.get("characters", [])
+        char_starts = alignment.get("character_start_times_seconds", [])
+        char_ends = alignment.get("character_end_times_seconds", [])
+        
+        # ElevenLabs는 character 단위로 주는 경우가 많음 (v1 endpoint logic)
+        # 하지만 with-timestamps 엔드포인트는 character alignment를 줌.
+        # Vrew 호환을 위해 단어 단위로 묶는 로직 필요할 수 있으나,
+        # 기존 서비스 로직을 참고하여 'words' 필드가 있는지 확인.
+        # *참고*: 최신 ElevenLabs API는 characters alignment를 줍니다.
+        # 기존 코드는 alignment['words']를 썼었음? (Step 820 확인)
+        # Step 820의 코드를 보면: result["alignment"].get("words", []) 라고 되어 있었음.
+        # 따라서 API가 words를 반환한다고 가정하고 처리.
+        
+        # *업데이트*: 실제 ElevenLabs API 문서에 따르면 /with-timestamps는 
+        # characters, character_start_times_seconds, character_end_times_seconds 를 반환함.
+        # 그러나 Turbo v2.5 등 모델에 따라 다를 수 있음.
+        # 기존 코드가 동작했다면 그 방식을 따름.
+        
+        words = alignment.get("words", [])
+        word_ends = alignment.get("word_end_times_seconds", [])
+
+        # 만약 words가 없다면 characters 기반으로 재조합
+        if not words and chars and char_starts and char_ends:
+            print(f"[TTS] ElevenLabs returned character-level alignment. Converting to words...")
+            # Character-level data를 word-level로 변환
+            current_word = ""
+            word_start = 0.0
+
+            for i, char in enumerate(chars):
+                if i < len(char_starts) and i < len(char_ends):
+                    char_start = char_starts[i]
+                    char_end = char_ends[i]
+
+                    # 단어의 시작
+                    if not current_word:
+                        word_start = char_start
+
+                    current_word += char
+
+                    # 단어의 끝 (공백, 구두점, 또는 마지막 문자)
+                    is_last = (i == len(chars) - 1)
+                    next_is_space = (i + 1 < len(chars) and chars[i + 1] in [' ', '\n', '\t'])
+
+                    if is_last or next_is_space or char in [' ', '.', ',', '!', '?', ':', ';']:
+                        word = current_word.strip()
+                        if word:  # 빈 단어 제외
+                            timestamps.append(WordTimestamp(
+                                text=word,
+                                start_ms=int(word_start * 1000),
+                                end_ms=int(char_end * 1000)
+                            ))
+                        current_word = ""
+
+            print(f"[TTS] Converted {len(chars)} characters to {len(timestamps)} words")
+
+        elif words and word_ends:
+            # API가 word-level 데이터를 직접 제공한 경우
+            for i, word in enumerate(words):
+                if i < len(word_ends):
+                    start_sec = 0.0 if i == 0 else word_ends[i-1]
+                    end_sec = word_ends[i]
+
+                    timestamps.append(WordTimestamp(
+                        text=word,
+                        start_ms=int(start_sec * 1000),
+                        end_ms=int(end_sec * 1000)
+                    ))
+
+        # Total Duration
+        total_duration_ms = timestamps[-1].end_ms if timestamps else 0
+        
+        # SRT 생성
+        srt = self.generate_srt(timestamps)
+
+        print(f"[OK] ElevenLabs TTS 완료: {len(timestamps)}개 단어")
+
+        return TTSResult(
+            success=True,
+            audio_url=output_url(filepath, OUTPUT_DIR),
+            audio_path=filepath,
+            audio_base64=audio_base64,  # API 응답에 이미 포함되어 있으므로 인라인 전달 시 재사용
+            timestamps=timestamps,
+            total_duration_ms=total_duration_ms,
+            srt=srt,
+            engine="elevenlabs"
+        )
+
+    def _failure(self, e: Exception) -> TTSResult:
+        print(f"[X] ElevenLabs TTS 오류: {e}")
+        return TTSResult(
+            success=False,
+            audio_url="",
+            engine="elevenlabs",
+            error=str(e)
+        )
+
     def synthesize_speech(
         self,
         text: str,
@@ -40,28 +195,11 @@ class ElevenLabsTTSEngine(TTSEngineBase):
         ElevenLabs API를 사용하여 음성 및 타임스탬프 생성
         """
         try:
-            voice_id = voice_id or self.DEFAULT_VOICE_ID
+            voice_id = self.resolve_voice(voice_id)
             
             # ElevenLabs does not support speed control via simple parameter in the same way,
             # but we pass the request as before.
-            
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/with-timestamps"
-            headers = {
-                "Content-Type": "application/json",
-                "xi-api-key": self.api_key
-            }
-            
-            payload = {
-                "text": text,
-                "model_id": "eleven_multilingual_v2",
-                "voice_settings": {
-                    "stability": kwargs.get("stability", 0.5),
-                    "similarity_boost": kwargs.get("similarity", 0.75),
-                    "style": 0,
-                    "use_speaker_boost": True
-                }
-                # "output_format": "mp3_44100_128" # Default
-            }
+            url, headers, payload = self._request(text, voice_id, **kwargs)
 
             print(f"[TTS] ElevenLabs TTS 생성 요청 (Voice: {voice_id})...")
             response = requests.post(url, json=payload, headers=headers, timeout=30)
@@ -69,125 +207,56 @@ class ElevenLabsTTSEngine(TTSEngineBase):
             # If voice ID is invalid/not accessible, retry once with default voice
             if response.status_code in (400, 404) and voice_id != self.DEFAULT_VOICE_ID:
                 print(f"[WARN] Voice ID '{voice_id}' failed. Retrying with default voice.")
-                url = f"https://api.elevenlabs.io/v1/text-to-speech/{self.DEFAULT_VOICE_ID}/with-timestamps"
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = requests.post(self._url(self.DEFAULT_VOICE_ID), json=payload, headers=headers, timeout=30)
 
             response.raise_for_status()
-            
-            result = response.json()
-            
-            if not result.get("audio_base64"):
-                raise Exception("No audio data in response")
+            return self._parse_response(response.json())
 
-            # 1. Audio Data 처리
-            audio_base64 = result["audio_base64"]
-            audio_bytes = base64.b64decode(audio_base64)
-            audio_url = f"data:audio/mpeg;base64,{audio_base64}"
-            
-            # 파일 저장
-            filename = f"tts_eleven_{uuid.uuid4()}.mp3"
-            filepath = os.path.join(OUTPUT_DIR, filename)
-            with open(filepath, "wb") as f:
-                f.write(audio_bytes)
-                
-            # 2. Timestamp 처리
-            timestamps = []
-            alignment = result.get("alignment", {})
-            chars = alignment.get("characters", [])
-            char_starts = alignment.get("character_start_times_seconds", [])
-            char_ends = alignment.get("character_end_times_seconds", [])
-            
-            # ElevenLabs는 character 단위로 주는 경우가 많음 (v1 endpoint logic)
-            # 하지만 with-timestamps 엔드포인트는 character alignment를 줌.
-            # Vrew 호환을 위해 단어 단위로 묶는 로직 필요할 수 있으나,
-            # 기존 서비스 로직을 참고하여 'words' 필드가 있는지 확인.
-            # *참고*: 최신 ElevenLabs API는 characters alignment를 줍니다.
-            # 기존 코드는 alignment['words']를 썼었음? (Step 820 확인)
-            # Step 820의 코드를 보면: result["alignment"].get("words", []) 라고 되어 있었음.
-            # 따라서 API가 words를 반환한다고 가정하고 처리.
-            
-            # *업데이트*: 실제 ElevenLabs API 문서에 따르면 /with-timestamps는 
-            # characters, character_start_times_seconds, character_end_times_seconds 를 반환함.
-            # 그러나 Turbo v2.5 등 모델에 따라 다를 수 있음.
-            # 기존 코드가 동작했다면 그 방식을 따름.
-            
-            words = alignment.get("words", [])
-            word_ends = alignment.get("word_end_times_seconds", [])
-
-            # 만약 words가 없다면 characters 기반으로 재조합
-            if not words and chars and char_starts and char_ends:
-                print(f"[TTS] ElevenLabs returned character-level alignment. Converting to words...")
-                # Character-level data를 word-level로 변환
-                current_word = ""
-                word_start = 0.0
-
-                for i, char in enumerate(chars):
-                    if i < len(char_starts) and i < len(char_ends):
-                        char_start = char_starts[i]
-                        char_end = char_ends[i]
-
-                        # 단어의 시작
-                        if not current_word:
-                            word_start = char_start
-
-                        current_word += char
-
-                        # 단어의 끝 (공백, 구두점, 또는 마지막 문자)
-                        is_last = (i == len(chars) - 1)
-                        next_is_space = (i + 1 < len(chars) and chars[i + 1] in [' ', '\n', '\t'])
-
-                        if is_last or next_is_space or char in [' ', '.', ',', '!', '?', ':', ';']:
-                            word = current_word.strip()
-                            if word:  # 빈 단어 제외
-                                timestamps.append(WordTimestamp(
-                                    text=word,
-                                    start_ms=int(word_start * 1000),
-                                    end_ms=int(char_end * 1000)
-                                ))
-                            current_word = ""
-
-                print(f"[TTS] Converted {len(chars)} characters to {len(timestamps)} words")
-
-            elif words and word_ends:
-                # API가 word-level 데이터를 직접 제공한 경우
-                for i, word in enumerate(words):
-                    if i < len(word_ends):
-                        start_sec = 0.0 if i == 0 else word_ends[i-1]
-                        end_sec = word_ends[i]
-
-                        timestamps.append(WordTimestamp(
-                            text=word,
-                            start_ms=int(start_sec * 1000),
-                            end_ms=int(end_sec * 1000)
-                        ))
-
-            # Total Duration
-            total_duration_ms = timestamps[-1].end_ms if timestamps else 0
-            
-            # SRT 생성
-            srt = self.generate_srt(timestamps)
-
-            print(f"[OK] ElevenLabs TTS 완료: {len(timestamps)}개 단어")
-
-            return TTSResult(
-                success=True,
-                audio_url=audio_url,
-                audio_path=filepath,
-                audio_base64=audio_base64,
-                timestamps=timestamps,
-                total_duration_ms=total_duration_ms,
-                srt=srt,
-                engine="elevenlabs"
-            )
+        except Exception as e:
+            return self._failure(e)
+
+    async def synthesize_speech_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        language: str = "ko",
+        speed: float = 1.0,
+        **kwargs
+    ) -> TTSResult:
+        """httpx 비동기 클라이언트로 요청 - 응답 대기 중 스레드를 점유하지 않음"""
+        try:
+            import httpx
+
+            voice_id = self.resolve_voice(voice_id)
+            url, headers, payload = self._request(text, voice_id, **kwargs)
+
+            print(f"[TTS] ElevenLabs TTS 생성 요청 (Voice: {voice_id}, async)...")
+            client = self._get_async_client(httpx)
+            response = await client.post(url, json=payload, headers=headers)
+
+            # If voice ID is invalid/not accessible, retry once with default voice
+            if response.status_code in (400, 404) and voice_id != self.DEFAULT_VOICE_ID:
+                print(f"[WARN] Voice ID '{voice_id}' failed. Retrying with default voice.")
+                response = await client.post(self._url(self.DEFAULT_VOICE_ID), json=payload, headers=headers)
+
+            response.raise_for_status()
+            # Base64 디코딩 + 파일 저장은 이벤트 루프를 막지 않도록 스레드에서
+            return await asyncio.to_thread(self._parse_response, response.json())
 
         except Exception as e:
-            print(f"[X] ElevenLabs TTS 오류: {e}")
-            return TTSResult(
-                success=False,
-                audio_url="",
-                engine="elevenlabs",
-                error=str(e)
-            )
+            return self._failure(e)
+
+    def _get_async_client(self, httpx):
+        """
+        이벤트 루프마다 하나의 httpx.AsyncClient를 재사용
+
+        클라이언트의 연결 풀은 만들어진 이벤트 루프에 묶이므로 루프가 바뀌면(테스트의 asyncio.run 등) 새로 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(timeout=30)
+            self._async_client_loop = loop
+        return self._async_client
 
     def get_voices_list(self) -> list:
         """UI 표시용 음성 목록 반환 (기본 보이스)"""
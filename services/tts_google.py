@@ -3,24 +3,37 @@ Google Gemini 2.5 TTS Engine (Generative Audio) - FIXED VERSION
 """
 import os
 import uuid
-import base64
 import json
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from google import genai
 from google.genai import types
 
-from .tts_base import TTSEngineBase, TTSResult, WordTimestamp
+from .tts_base import TTSEngineBase, TTSResult, WordTimestamp, output_url
 from .utils import OUTPUT_DIR
 
 logger = logging.getLogger(__name__)
 
 class GoogleTTSEngine(TTSEngineBase):
+    MODEL_NAME = "models/gemini-2.5-flash-preview-tts"
+
+    # 30인 마스터 리스트
+    GEMINI_MASTER_VOICES = {
+        "Achernar", "Achird", "Algenib", "Algieba", "Alnilam", "Aoede", "Autonoe", 
+        "Callirrhoe", "Charon", "Despina", "Enceladus", "Erinome", "Fenrir", "Gacrux", 
+        "Iapetus", "Kore", "Laomedeia", "Leda", "Orus", "Pulcherrima", "Puck", 
+        "Rasalgethi", "Sadachbia", "Sadaltager", "Schedar", "Sulafat", "Umbriel", 
+        "Vindemiatrix", "Zephyr", "Zubenelgenubi"
+    }
+
     def __init__(self, api_key: str = None):
         super().__init__("google")
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.client = None
         self.personas = {}
+        # Gemini는 단어 타임스탬프를 주지 않으므로 PCM 휴지 구간으로 로컬 정렬 (TTS_LOCAL_ALIGNMENT=0 이면 비활성화)
+        self.local_alignment = os.getenv("TTS_LOCAL_ALIGNMENT", "1") != "0"
         
         if self.api_key:
             try:
@@ -46,6 +59,204 @@ class GoogleTTSEngine(TTSEngineBase):
     def validate_credentials(self) -> bool:
         return self.client is not None
 
+    @staticmethod
+    def _requested_voice_id(voice_id: str = None, **kwargs) -> Optional[str]:
+        settings = kwargs.get('settings') or {}
+        return voice_id or kwargs.get('voiceId') or settings.get('voiceId')
+
+    def resolve_voice(self, voice_id: str = None, **kwargs) -> str:
+        """요청된 voiceId를 Gemini 음성 이름으로 변환 (마스터 리스트 → 페르소나 성별 → 기본 Aoede)"""
+        actual_voice_id = self._requested_voice_id(voice_id, **kwargs)
+
+        # 30인 마스터 리스트 대조
+        master_lower = {v.lower(): v for v in self.GEMINI_MASTER_VOICES}
+        if actual_voice_id and str(actual_voice_id).lower() in master_lower:
+            return master_lower[str(actual_voice_id).lower()]
+
+        # ID가 없거나 매칭되지 않으면 페르소나 검색 시도 (성별 기반)
+        persona = self.personas.get(actual_voice_id)
+        if persona:
+            return "Aoede" if persona.get("gender") == "Female" else "Charon"
+        return "Aoede"
+
+    def cache_params(self, **kwargs) -> dict:
+        return {"model": self.MODEL_NAME, "bitrate": "128k", "alignment": self.local_alignment}
+
+    def voice_gender(self, voice_id: str = None, **kwargs) -> Optional[str]:
+        """페르소나 설정의 성별 (요청 ID 우선, 없으면 실제 사용할 마스터 음성 기준)"""
+        persona = (self.personas.get(self._requested_voice_id(voice_id, **kwargs))
+                   or self.personas.get(self.resolve_voice(voice_id, **kwargs)))
+        if persona:
+            return {"Female": "female", "Male": "male"}.get(persona.get("gender"))
+        return {"Aoede": "female", "Charon": "male"}.get(self.resolve_voice(voice_id, **kwargs))
+
+    def voice_for_gender(self, gender: str) -> Optional[str]:
+        return {"female": "Aoede", "male": "Charon"}.get(gender)
+
+    def _prepare_request(self, voice_id: str = None, speed: float = 1.0, **kwargs) -> Tuple[str, Any]:
+        """요청 음성 이름 + 생성 설정 준비 (동기/비동기 공통)"""
+        if not self.client:
+            raise ValueError("Gemini API Client 미설정")
+
+        # [Logic 11] 배송 사고 방지: 어떤 경로로든 voiceId 확보
+        actual_voice_id = self._requested_voice_id(voice_id, **kwargs)
+        target_voice_name = self.resolve_voice(voice_id, **kwargs)
+
+        # 페르소나 정보 가져오기 (지시사항용)
+        # 주의: target_voice_name은 Google의 내부 이름이므로, 
+        # 실제 사용자가 선택한 persona의 정보를 가져오려면 actual_voice_id를 써야 함.
+        # 하지만 fallback situation일 수 있으므로 안전하게 처리
+        persona_for_instruction = self.personas.get(actual_voice_id, {})
+        base_instr = persona_for_instruction.get('base_instruction', 'Professional tone.')
+        full_instruction = f"Persona: {base_instr}. Pace: {speed}x."
+
+        print(f"🎤 [Gemini TTS] Requesting Voice: {target_voice_name} (Origin: {actual_voice_id})")
+
+        # [NO FALLBACK] system_instruction 없이 직접 생성
+        # Gemini 2.5 TTS는 voice_name만으로도 페르소나 특성 발현
+        logger.info(f"🎤 [Gemini TTS] Generating with voice: {target_voice_name}")
+
+        config = types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=target_voice_name
+                    )
+                )
+            )
+        )
+        return target_voice_name, config
+
+    def _extract_audio(self, response) -> bytes:
+        """응답에서 PCM 오디오 추출 (SDK 버전별 응답 형식 대응)"""
+        audio_data = None
+
+        # Method 1: Check response.parts directly (new SDK format)
+        if hasattr(response, 'parts') and response.parts:
+            logger.info(f"🔍 [Gemini TTS] Found response.parts ({len(response.parts)} parts)")
+            for i, part in enumerate(response.parts):
+                logger.info(f"🔍 [Gemini TTS] Part {i}: {type(part)}")
+                if hasattr(part, 'inline_data') and part.inline_data:
+                    if hasattr(part.inline_data, 'data'):
+                        audio_data = part.inline_data.data
+                        logger.info(f"✅ [Gemini TTS] Audio from part.inline_data.data ({len(audio_data)} bytes)")
+                        break
+                # Check for 'data' attribute directly
+                if hasattr(part, 'data') and part.data:
+                    audio_data = part.data
+                    logger.info(f"✅ [Gemini TTS] Audio from part.data ({len(audio_data)} bytes)")
+                    break
+
+        # Method 2: Check audio_bytes attribute
+        if not audio_data and hasattr(response, 'audio_bytes') and response.audio_bytes:
+            audio_data = response.audio_bytes
+            logger.info(f"✅ [Gemini TTS] Audio from audio_bytes ({len(audio_data)} bytes)")
+
+        # Method 3: Check candidates (old format)
+        if not audio_data and hasattr(response, 'candidates') and response.candidates:
+            logger.info(f"🔍 [Gemini TTS] Checking candidates ({len(response.candidates)} found)")
+            for candidate in response.candidates:
+                if hasattr(candidate, 'content') and candidate.content:
+                    if hasattr(candidate.content, 'parts') and candidate.content.parts:
+                        for part in candidate.content.parts:
+                            if hasattr(part, 'inline_data') and part.inline_data:
+                                if hasattr(part.inline_data, 'data'):
+                                    audio_data = part.inline_data.data
+                                    logger.info(f"✅ [Gemini TTS] Audio from candidate ({len(audio_data)} bytes)")
+                                    break
+                if audio_data:
+                    break
+
+        if not audio_data:
+            logger.error(f"❌ [Gemini TTS] Could not extract audio from response")
+            logger.error(f"   Response type: {type(response)}")
+            logger.error(f"   Response attributes: {[a for a in dir(response) if not a.startswith('_')]}")
+            raise Exception("오디오 데이터 추출 실패 - response에서 audio를 찾을 수 없음")
+
+        return audio_data
+
+    def _save_audio(self, audio_data: bytes, text: str) -> TTSResult:
+        """PCM 오디오를 MP3 파일로 저장 (+ 로컬 정렬로 단어 타임스탬프/SRT 생성)"""
+        logger.info(f"✅ [Gemini TTS] Audio data extracted: {len(audio_data)} bytes (PCM format)")
+
+        # [CRITICAL FIX] Google Gemini returns PCM audio (audio/L16), not MP3!
+        # Must convert PCM to MP3 using pydub
+        from pydub import AudioSegment
+
+        # PCM parameters from Gemini API
+        sample_rate = 24000  # 24kHz
+        sample_width = 2  # 16-bit = 2 bytes
+        channels = 1  # Mono
+
+        logger.info(f"🔄 [Gemini TTS] Converting PCM to MP3...")
+
+        # Create AudioSegment from raw PCM data
+        audio_segment = AudioSegment(
+            data=audio_data,
+            sample_width=sample_width,
+            frame_rate=sample_rate,
+            channels=channels
+        )
+
+        # Export as MP3 file
+        audio_filename = f"tts_gemini_{uuid.uuid4()}.mp3"
+        audio_path = os.path.join(OUTPUT_DIR, audio_filename)
+
+        # MP3 인코딩은 파일로 1회만 수행 (인라인 전달이 필요하면 TTSService가 파일을 읽어 Base64 변환)
+        audio_segment.export(
+            audio_path,
+            format="mp3",
+            bitrate="128k"
+        )
+
+        logger.info(f"✅ [Gemini TTS] Converted to MP3: {audio_path}")
+
+        timestamps = self._align(text, audio_data, sample_rate)
+
+        return TTSResult(
+            success=True,
+            audio_url=output_url(audio_path, OUTPUT_DIR),
+            audio_path=audio_path,
+            timestamps=timestamps,
+            total_duration_ms=len(audio_segment),  # pydub 길이 단위는 밀리초
+            srt=self.generate_srt(timestamps) if timestamps else None,
+            engine="google"
+        )
+
+    def _align(self, text: str, audio_data: bytes, sample_rate: int) -> List[WordTimestamp]:
+        """PCM 휴지 구간 기반 단어 타임스탬프 (Whisper 재전송 없이 로컬 처리, 실패해도 합성은 성공 처리)"""
+        if not self.local_alignment:
+            return []
+        try:
+            from .tts_aligner import energy_aligner
+            timestamps = energy_aligner.align_pcm(text, audio_data, sample_rate)
+            logger.info(f"✅ [Gemini TTS] 로컬 정렬: {len(timestamps)}개 단어")
+            return timestamps
+        except Exception as e:
+            logger.warning(f"⚠️ [Gemini TTS] 로컬 정렬 실패 - 타임스탬프 없이 반환: {e}")
+            return []
+
+    def _failure(self, e: Exception, target_voice_name: Optional[str], text: str) -> TTSResult:
+        """실패 결과 (자세한 에러 로깅 포함)"""
+        # 자세한 에러 로깅
+        import traceback
+        error_details = traceback.format_exc()
+        logger.error(f"❌ [Gemini TTS] Failed:")
+        logger.error(f"   Voice: {target_voice_name}")
+        logger.error(f"   Text length: {len(text)}")
+        logger.error(f"   Error: {e}")
+        logger.error(f"   Full traceback:\n{error_details}")
+
+        print(f"❌ [Gemini TTS] 실패: {e}")
+
+        return TTSResult(
+            success=False,
+            audio_url="",
+            error=f"Google TTS failed: {str(e)}",
+            engine="google"
+        )
+
     def synthesize_speech(
         self,
         text: str,
@@ -54,177 +265,42 @@ class GoogleTTSEngine(TTSEngineBase):
         speed: float = 1.0,
         **kwargs
     ) -> TTSResult:
+        target_voice_name = None
         try:
-            if not self.client:
-                raise ValueError("Gemini API Client 미설정")
-
-            # [Logic 11] 배송 사고 방지: 어떤 경로로든 voiceId 확보
-            settings = kwargs.get('settings', {})
-            actual_voice_id = voice_id or kwargs.get('voiceId') or settings.get('voiceId')
-            
-            # 30인 마스터 리스트 대조
-            GEMINI_MASTER_VOICES = {
-                "Achernar", "Achird", "Algenib", "Algieba", "Alnilam", "Aoede", "Autonoe", 
-                "Callirrhoe", "Charon", "Despina", "Enceladus", "Erinome", "Fenrir", "Gacrux", 
-                "Iapetus", "Kore", "Laomedeia", "Leda", "Orus", "Pulcherrima", "Puck", 
-                "Rasalgethi", "Sadachbia", "Sadaltager", "Schedar", "Sulafat", "Umbriel", 
-                "Vindemiatrix", "Zephyr", "Zubenelgenubi"
-            }
-            
-            target_voice_name = "Aoede"
-            master_lower = {v.lower(): v for v in GEMINI_MASTER_VOICES}
-            if actual_voice_id and str(actual_voice_id).lower() in master_lower:
-                target_voice_name = master_lower[str(actual_voice_id).lower()]
-            else:
-                 # ID가 없거나 매칭되지 않으면 페르소나 검색 시도 (성별 기반)
-                 persona = self.personas.get(actual_voice_id)
-                 if persona:
-                     target_voice_name = "Aoede" if persona.get("gender") == "Female" else "Charon"
-
-            # 페르소나 정보 가져오기 (지시사항용)
-            # 주의: target_voice_name은 Google의 내부 이름이므로, 
-            # 실제 사용자가 선택한 persona의 정보를 가져오려면 actual_voice_id를 써야 함.
-            # 하지만 fallback situation일 수 있으므로 안전하게 처리
-            persona_for_instruction = self.personas.get(actual_voice_id, {})
-            base_instr = persona_for_instruction.get('base_instruction', 'Professional tone.')
-            full_instruction = f"Persona: {base_instr}. Pace: {speed}x."
-
-            print(f"🎤 [Gemini TTS] Requesting Voice: {target_voice_name} (Origin: {actual_voice_id})")
-
-            # [NO FALLBACK] system_instruction 없이 직접 생성
-            # Gemini 2.5 TTS는 voice_name만으로도 페르소나 특성 발현
-            logger.info(f"🎤 [Gemini TTS] Generating with voice: {target_voice_name}")
-
+            target_voice_name, config = self._prepare_request(voice_id, speed, **kwargs)
             response = self.client.models.generate_content(
-                model="models/gemini-2.5-flash-preview-tts",
+                model=self.MODEL_NAME,
                 contents=text,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=target_voice_name
-                            )
-                        )
-                    )
-                )
+                config=config
             )
-
             logger.info(f"✅ [Gemini TTS] API call successful")
+            return self._save_audio(self._extract_audio(response), text)
+        except Exception as e:
+            return self._failure(e, target_voice_name, text)
 
-            # 오디오 추출 (자세한 로깅)
-            audio_data = None
-
-            # Method 1: Check response.parts directly (new SDK format)
-            if hasattr(response, 'parts') and response.parts:
-                logger.info(f"🔍 [Gemini TTS] Found response.parts ({len(response.parts)} parts)")
-                for i, part in enumerate(response.parts):
-                    logger.info(f"🔍 [Gemini TTS] Part {i}: {type(part)}")
-                    if hasattr(part, 'inline_data') and part.inline_data:
-                        if hasattr(part.inline_data, 'data'):
-                            audio_data = part.inline_data.data
-                            logger.info(f"✅ [Gemini TTS] Audio from part.inline_data.data ({len(audio_data)} bytes)")
-                            break
-                    # Check for 'data' attribute directly
-                    if hasattr(part, 'data') and part.data:
-                        audio_data = part.data
-                        logger.info(f"✅ [Gemini TTS] Audio from part.data ({len(audio_data)} bytes)")
-                        break
-
-            # Method 2: Check audio_bytes attribute
-            if not audio_data and hasattr(response, 'audio_bytes') and response.audio_bytes:
-                audio_data = response.audio_bytes
-                logger.info(f"✅ [Gemini TTS] Audio from audio_bytes ({len(audio_data)} bytes)")
-
-            # Method 3: Check candidates (old format)
-            if not audio_data and hasattr(response, 'candidates') and response.candidates:
-                logger.info(f"🔍 [Gemini TTS] Checking candidates ({len(response.candidates)} found)")
-                for candidate in response.candidates:
-                    if hasattr(candidate, 'content') and candidate.content:
-                        if hasattr(candidate.content, 'parts') and candidate.content.parts:
-                            for part in candidate.content.parts:
-                                if hasattr(part, 'inline_data') and part.inline_data:
-                                    if hasattr(part.inline_data, 'data'):
-                                        audio_data = part.inline_data.data
-                                        logger.info(f"✅ [Gemini TTS] Audio from candidate ({len(audio_data)} bytes)")
-                                        break
-                    if audio_data:
-                        break
-
-            if not audio_data:
-                logger.error(f"❌ [Gemini TTS] Could not extract audio from response")
-                logger.error(f"   Response type: {type(response)}")
-                logger.error(f"   Response attributes: {[a for a in dir(response) if not a.startswith('_')]}")
-                raise Exception("오디오 데이터 추출 실패 - response에서 audio를 찾을 수 없음")
-
-            logger.info(f"✅ [Gemini TTS] Audio data extracted: {len(audio_data)} bytes (PCM format)")
-
-            # [CRITICAL FIX] Google Gemini returns PCM audio (audio/L16), not MP3!
-            # Must convert PCM to MP3 using pydub
-            from pydub import AudioSegment
-            import io as BytesIO
-
-            # PCM parameters from Gemini API
-            sample_rate = 24000  # 24kHz
-            sample_width = 2  # 16-bit = 2 bytes
-            channels = 1  # Mono
-
-            logger.info(f"🔄 [Gemini TTS] Converting PCM to MP3...")
-
-            # Create AudioSegment from raw PCM data
-            audio_segment = AudioSegment(
-                data=audio_data,
-                sample_width=sample_width,
-                frame_rate=sample_rate,
-                channels=channels
-            )
-
-            # Export as MP3 file
-            audio_filename = f"tts_gemini_{uuid.uuid4()}.mp3"
-            audio_path = os.path.join(OUTPUT_DIR, audio_filename)
-
-            audio_segment.export(
-                audio_path,
-                format="mp3",
-                bitrate="128k"
-            )
-
-            logger.info(f"✅ [Gemini TTS] Converted to MP3: {audio_path}")
-
-            # Also create base64 MP3 for immediate playback
-            mp3_buffer = BytesIO.BytesIO()
-            audio_segment.export(mp3_buffer, format="mp3", bitrate="128k")
-            mp3_data = mp3_buffer.getvalue()
-            audio_base64 = base64.b64encode(mp3_data).decode('utf-8')
-
-            logger.info(f"✅ [Gemini TTS] MP3 base64 created: {len(audio_base64)} chars")
-
-            return TTSResult(
-                success=True,
-                audio_url=f"data:audio/mpeg;base64,{audio_base64}",
-                audio_path=audio_path,
-                audio_base64=audio_base64,
-                engine="google"
+    async def synthesize_speech_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        language: str = "ko-KR",
+        speed: float = 1.0,
+        **kwargs
+    ) -> TTSResult:
+        """비동기 클라이언트(client.aio)로 요청 - 응답 대기 중 스레드를 점유하지 않음"""
+        target_voice_name = None
+        try:
+            target_voice_name, config = self._prepare_request(voice_id, speed, **kwargs)
+            response = await self.client.aio.models.generate_content(
+                model=self.MODEL_NAME,
+                contents=text,
+                config=config
             )
-
+            logger.info(f"✅ [Gemini TTS] API call successful (async)")
+            audio_data = self._extract_audio(response)
+            # MP3 인코딩(FFmpeg)/로컬 정렬은 블로킹이므로 스레드에서 실행
+            return await asyncio.to_thread(self._save_audio, audio_data, text)
         except Exception as e:
-            # 자세한 에러 로깅
-            import traceback
-            error_details = traceback.format_exc()
-            logger.error(f"❌ [Gemini TTS] Failed:")
-            logger.error(f"   Voice: {target_voice_name}")
-            logger.error(f"   Text length: {len(text)}")
-            logger.error(f"   Error: {e}")
-            logger.error(f"   Full traceback:\n{error_details}")
-
-            print(f"❌ [Gemini TTS] 실패: {e}")
-
-            return TTSResult(
-                success=False,
-                audio_url="",
-                error=f"Google TTS failed: {str(e)}",
-                engine="google"
-            )
+            return self._failure(e, target_voice_name, text)
 
     def get_voices_list(self) -> list:
         """
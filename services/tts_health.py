@@ -0,0 +1,136 @@
+"""
+TTS Engine Health - 엔진별 최근 지연 시간/오류율 추적 + 서킷 브레이커
+
+엔진 상태(_engine_status)는 validate_api_keys() 호출 때만 갱신되어, 공급자 장애 중에도
+모든 씬이 타임아웃까지 기다린 뒤 실패했다. 실제 요청 결과로 상태를 계속 갱신하고
+연속 실패가 쌓이면 회로를 열어 한동안 해당 엔진 호출을 건너뛴다.
+
+상태:
+- closed: 정상 (모든 요청 허용)
+- open: 연속 실패로 차단 (cooldown 동안 요청 거부)
+- half_open: cooldown 경과 후 시험 요청 1개만 허용 (성공 시 closed, 실패 시 다시 open)
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Any, Dict
+
+
+class EngineHealth:
+    """엔진 하나의 최근 요청 결과 (슬라이딩 윈도우) + 서킷 브레이커 상태"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown_seconds: float = 30.0,
+                 window: int = 20):
+        """
+        Args:
+            name: 엔진 이름
+            failure_threshold: 회로를 여는 연속 실패 횟수
+            cooldown_seconds: 회로가 열린 뒤 시험 요청을 허용하기까지 대기 시간
+            window: 오류율/지연 시간 계산에 사용하는 최근 요청 수
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.samples = deque(maxlen=max(1, window))  # (성공 여부, 지연 시간 초)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.open_count = 0
+        self.probe_in_flight = False
+        self.probe_started = 0.0
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def _refresh(self, now: float):
+        """cooldown이 지난 open 회로를 half_open으로 전환 (lock 안에서 호출)"""
+        if self.state == self.OPEN and now - self.opened_at >= self.cooldown_seconds:
+            self.state = self.HALF_OPEN
+            self.probe_in_flight = False
+        elif self.probe_in_flight and now - self.probe_started >= self.cooldown_seconds:
+            # 결과가 기록되지 않은 시험 요청 (호출 전 예외 등) 때문에 회로가 영영 막히지 않도록 슬롯 반환
+            self.probe_in_flight = False
+
+    def is_available(self) -> bool:
+        """요청을 보낼 수 있는 상태인지 (시험 요청 슬롯을 차지하지 않음, 라우팅 후보 판단용)"""
+        with self.lock:
+            self._refresh(time.time())
+            if self.state == self.HALF_OPEN:
+                return not self.probe_in_flight
+            return self.state == self.CLOSED
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부 (half_open이면 시험 요청 1개만 허용하고 슬롯을 차지)
+
+        Returns:
+            False면 엔진을 호출하지 않고 바로 실패 처리
+        """
+        with self.lock:
+            self._refresh(time.time())
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                self.probe_started = time.time()
+                return True
+            return False
+
+    def record(self, success: bool, latency_seconds: float, error: str = None):
+        """요청 결과 기록 (성공 시 회로 닫힘, 연속 실패가 임계값에 도달하거나 시험 요청 실패 시 열림)"""
+        with self.lock:
+            self.samples.append((success, latency_seconds))
+            self.probe_in_flight = False
+            if success:
+                self.consecutive_failures = 0
+                if self.state != self.CLOSED:
+                    print(f"[TTS] {self.name} 회로 닫힘 (시험 요청 성공)")
+                self.state = self.CLOSED
+                return
+
+            self.consecutive_failures += 1
+            self.last_error = (error or "")[:200]
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.time()
+                self.open_count += 1
+                print(f"[WARN] {self.name} 회로 열림: 연속 {self.consecutive_failures}회 실패, "
+                      f"{self.cooldown_seconds:.0f}초 동안 요청 차단 (마지막 오류: {self.last_error})")
+
+    @property
+    def error_rate(self) -> float:
+        with self.lock:
+            if not self.samples:
+                return 0.0
+            return sum(1 for ok, _ in self.samples if not ok) / len(self.samples)
+
+    @property
+    def avg_latency(self) -> float:
+        """최근 성공 요청 평균 지연 시간 (초, 기록이 없으면 0)"""
+        with self.lock:
+            latencies = [latency for ok, latency in self.samples if ok]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            self._refresh(time.time())
+            state = self.state
+            retry_in = max(0.0, self.cooldown_seconds - (time.time() - self.opened_at)) \
+                if state == self.OPEN else 0.0
+            snapshot = {
+                "state": state,
+                "consecutiveFailures": self.consecutive_failures,
+                "openCount": self.open_count,
+                "retryInSeconds": round(retry_in, 1),
+                "samples": len(self.samples),
+                "lastError": self.last_error
+            }
+        snapshot["errorRatePercent"] = round(self.error_rate * 100, 1)
+        snapshot["avgLatencySeconds"] = round(self.avg_latency, 2)
+        return snapshot
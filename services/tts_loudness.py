@@ -0,0 +1,322 @@
+"""
+TTS Loudness - TTS 클립 일괄 라우드니스 정규화 (ITU-R BS.1770 통합 라우드니스)
+
+엔진/음성마다 클립 음량이 달라 렌더링/Vrew 내보내기 후 씬마다 볼륨이 튀었다.
+클립별로 FFmpeg loudnorm 2-pass를 돌리면 200개 클립에 400번의 디코딩/분석이 필요하므로,
+클립을 한 번씩만 NumPy 배열로 디코딩한 뒤 여러 클립을 한 배열로 묶어 측정하고
+이득(+ 선택적 피크 제한)을 한 번에 적용해 다시 인코딩한다.
+
+- K-weighting 필터는 주파수 영역에서 적용 (묶음 전체를 FFT 한 번으로 처리)
+- 400ms 블록 / 75% 겹침, 절대(-70 LUFS) + 상대(-10 LU) 게이팅을 클립 축으로 벡터화
+- 피크 제한은 샘플 피크 기준 (트루 피크 오버샘플링은 하지 않음)
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .task_service import task_manager
+
+
+class LoudnessNormalizer:
+    """클립 묶음 라우드니스 측정 + 이득/피크 제한 적용"""
+
+    # 분석/출력 샘플레이트 (K-weighting 계수가 48kHz 기준)
+    SAMPLE_RATE = 48000
+
+    # BS.1770 K-weighting (고역 쉘프 + 고역 통과, 48kHz 바이쿼드 계수)
+    SHELF_B = (1.53512485958697, -2.69169618940638, 1.19839281085285)
+    SHELF_A = (1.0, -1.69065929318241, 0.73248077421585)
+    HIGHPASS_B = (1.0, -2.0, 1.0)
+    HIGHPASS_A = (1.0, -1.99004745483398, 0.99007225036621)
+
+    # 게이팅 블록 (400ms 블록을 100ms 간격으로)
+    BLOCK_SEGMENTS = 4
+    SEGMENT_SECONDS = 0.1
+    ABSOLUTE_GATE_LUFS = -70.0
+    RELATIVE_GATE_LU = -10.0
+
+    # K-weighting 필터링 프레임 (100ms 구간 5개) + FFT 길이 (나머지는 필터 응답 꼬리, overlap-add)
+    FRAME_SEGMENTS = 5
+    FFT_SIZE = 32768
+
+    # 피크 제한 게인 계산 블록 (초)
+    LIMITER_BLOCK_SECONDS = 0.005
+
+    # 이보다 작은 이득 변화는 다시 인코딩하지 않음 (dB)
+    MIN_GAIN_DB = 0.1
+
+    # 출력 확장자별 코덱 (없는 확장자는 FFmpeg 기본값)
+    CODECS = {
+        ".mp3": ['-c:a', 'libmp3lame', '-b:a', '128k'],
+        ".wav": ['-c:a', 'pcm_s16le'],
+        ".m4a": ['-c:a', 'aac', '-b:a', '128k'],
+    }
+
+    def __init__(self, target_lufs: float = -16.0, peak_db: Optional[float] = -1.0,
+                 max_gain_db: float = 20.0, max_batch_samples: int = 1 << 23, workers: int = 4):
+        """
+        Args:
+            target_lufs: 목표 통합 라우드니스
+            peak_db: 샘플 피크 상한 (dBFS, None이면 피크 제한 없이 클리핑만 방지)
+            max_gain_db: 최대 증폭 (거의 무음인 클립의 잡음이 과하게 커지지 않도록)
+            max_batch_samples: 한 번에 FFT로 처리할 (클립 수 x 최대 길이) 샘플 수 상한 (메모리 제한)
+            workers: 디코딩/인코딩 FFmpeg 동시 실행 수
+        """
+        self.target_lufs = target_lufs
+        self.peak_db = peak_db
+        self.max_gain_db = max_gain_db
+        self.max_batch_samples = max_batch_samples
+        self.workers = max(1, workers)
+        self._response = self._k_weighting(self.FFT_SIZE)
+
+    # --- 측정 ---
+
+    def _k_weighting(self, n_fft: int) -> np.ndarray:
+        """rfft 주파수 빈별 K-weighting 복소 응답"""
+        z = np.exp(-1j * np.pi * np.arange(n_fft // 2 + 1) / (n_fft // 2))  # z^-1
+
+        def biquad(b, a):
+            return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+        return biquad(self.SHELF_B, self.SHELF_A) * biquad(self.HIGHPASS_B, self.HIGHPASS_A)
+
+    def _batches(self, lengths: List[int]) -> List[List[int]]:
+        """FFT 버퍼 크기가 상한을 넘지 않도록 클립을 순서대로 묶음 분할"""
+        frame = int(self.SAMPLE_RATE * self.SEGMENT_SECONDS) * self.FRAME_SEGMENTS
+        batches: List[List[int]] = []
+        current: List[int] = []
+        size = 0
+        for index, length in enumerate(lengths):
+            frames = max(1, -(-length // frame))
+            if current and (size + frames) * self.FFT_SIZE > self.max_batch_samples:
+                batches.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += frames
+        if current:
+            batches.append(current)
+        return batches
+
+    def measure(self, signals: List[np.ndarray]) -> np.ndarray:
+        """
+        클립별 통합 라우드니스 (LUFS, 무음이면 -inf)
+
+        Args:
+            signals: SAMPLE_RATE 모노 float 샘플 목록
+        """
+        loudness = np.full(len(signals), -np.inf)
+        for batch in self._batches([len(signal) for signal in signals]):
+            loudness[batch] = self._measure_batch([signals[i] for i in batch])
+        return loudness
+
+    def _measure_batch(self, signals: List[np.ndarray]) -> np.ndarray:
+        segment = int(self.SAMPLE_RATE * self.SEGMENT_SECONDS)
+        frame = segment * self.FRAME_SEGMENTS
+        tail = self.FFT_SIZE - frame
+        lengths = np.array([len(signal) for signal in signals])
+        n_frames = np.maximum(1, -(-lengths // frame))
+        first = np.concatenate(([0], np.cumsum(n_frames)[:-1]))
+
+        # 모든 클립을 프레임 경계에서 시작하도록 한 버퍼에 배치 → 프레임별 FFT로 K-weighting (overlap-add)
+        buffer = np.zeros((int(n_frames.sum()), frame), dtype=np.float32)
+        flat = buffer.reshape(-1)
+        for signal, start in zip(signals, first):
+            flat[start * frame:start * frame + len(signal)] = signal
+        spectrum = np.fft.rfft(buffer, n=self.FFT_SIZE, axis=1)
+        spectrum *= self._response
+        filtered = np.fft.irfft(spectrum, n=self.FFT_SIZE, axis=1)
+        weighted = filtered[:, :frame]
+        continues = np.ones(len(buffer), dtype=bool)
+        continues[first] = False  # 앞 클립의 필터 꼬리는 다음 클립에 더하지 않음
+        weighted[1:, :tail] += filtered[:-1, frame:] * continues[1:, None]
+
+        # 100ms 구간별 평균 제곱 → 4구간(400ms) 이동 평균 = 75% 겹친 게이팅 블록
+        power = np.square(weighted).reshape(-1, segment).mean(axis=1)
+        window = np.cumsum(np.concatenate(([0.0], power)))
+        blocks = (window[self.BLOCK_SEGMENTS:] - window[:-self.BLOCK_SEGMENTS]) / self.BLOCK_SEGMENTS
+        labels = np.repeat(np.arange(len(signals)), n_frames * self.FRAME_SEGMENTS)[:len(blocks)]
+        offsets = np.arange(len(blocks)) - (first * self.FRAME_SEGMENTS)[labels]
+        valid = offsets + self.BLOCK_SEGMENTS <= (lengths // segment)[labels]
+
+        with np.errstate(divide='ignore'):
+            block_lufs = -0.691 + 10 * np.log10(blocks)
+        gated = valid & (block_lufs > self.ABSOLUTE_GATE_LUFS)
+        relative = self._lufs(self._gated_mean(blocks, labels, gated, len(signals))) + self.RELATIVE_GATE_LU
+        gated &= block_lufs > relative[labels]
+        loudness = self._lufs(self._gated_mean(blocks, labels, gated, len(signals)))
+
+        # 400ms보다 짧은 클립은 전체를 블록 하나로 측정
+        for index in np.flatnonzero(lengths < segment * self.BLOCK_SEGMENTS):
+            start = first[index] * frame
+            energy = float(np.mean(np.square(weighted.reshape(-1)[start:start + lengths[index]]))) \
+                if lengths[index] else 0.0
+            loudness[index] = self._lufs(np.array([energy]))[0] if energy > 0 else -np.inf
+        return loudness
+
+    @staticmethod
+    def _gated_mean(blocks: np.ndarray, labels: np.ndarray, mask: np.ndarray, count: int) -> np.ndarray:
+        """클립별 게이트 통과 블록 평균 제곱 (통과 블록이 없으면 0)"""
+        sums = np.bincount(labels[mask], weights=blocks[mask], minlength=count)
+        counts = np.bincount(labels[mask], minlength=count)
+        return np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+
+    @staticmethod
+    def _lufs(mean_square: np.ndarray) -> np.ndarray:
+        """평균 제곱 → LUFS (0이면 -inf)"""
+        with np.errstate(divide='ignore'):
+            return -0.691 + 10 * np.log10(mean_square)
+
+    # --- 이득 적용 ---
+
+    def limit_peaks(self, signal: np.ndarray, ceiling: float) -> np.ndarray:
+        """
+        짧은 블록별 피크 기준 감쇠 (앞뒤 블록까지 고려한 게인을 샘플 단위로 보간하여 클릭 없이 적용)
+
+        블록 게인을 이웃 블록과의 최솟값으로 잡으므로 보간된 게인이 어떤 샘플에서도
+        자기 블록에 필요한 감쇠보다 커지지 않는다 (상한 초과 없음).
+        """
+        block = max(1, int(self.SAMPLE_RATE * self.LIMITER_BLOCK_SECONDS))
+        n_blocks = -(-len(signal) // block)
+        if n_blocks == 0:
+            return signal
+        padded = np.zeros(n_blocks * block, dtype=signal.dtype)
+        padded[:len(signal)] = np.abs(signal)
+        peaks = padded.reshape(n_blocks, block).max(axis=1)
+        if peaks.max() <= ceiling:
+            return signal
+
+        gains = np.minimum(1.0, ceiling / np.maximum(peaks, 1e-12))
+        neighbors = np.pad(gains, 1, mode='edge')
+        gains = np.minimum(np.minimum(neighbors[:-2], neighbors[1:-1]), neighbors[2:])
+        centers = np.arange(n_blocks) * block + (block - 1) / 2
+        envelope = np.interp(np.arange(len(signal)), centers, gains)
+        return (signal * envelope).astype(signal.dtype)
+
+    def apply_gain(self, signal: np.ndarray, gain_db: float, peak_db: Optional[float]) -> np.ndarray:
+        """이득 적용 + 피크 제한 (peak_db가 None이면 클리핑 방지만)"""
+        scaled = signal * np.float32(10 ** (gain_db / 20))
+        ceiling = 10 ** (peak_db / 20) if peak_db is not None else 1.0
+        return np.clip(self.limit_peaks(scaled, ceiling), -1.0, 1.0)
+
+    # --- 파일 처리 ---
+
+    def _decode(self, path: str) -> np.ndarray:
+        """오디오 파일 → SAMPLE_RATE 모노 float32 배열"""
+        cmd = ['ffmpeg', '-v', 'error', '-i', path, '-ac', '1', '-ar', str(self.SAMPLE_RATE), '-f', 'f32le', '-']
+        result = subprocess.run(cmd, capture_output=True, timeout=120)
+        if result.returncode != 0:
+            raise RuntimeError(f"오디오 디코딩 실패 ({os.path.basename(path)}): "
+                               f"{result.stderr.decode('utf-8', 'replace')[-300:]}")
+        return np.frombuffer(result.stdout, dtype='<f4')
+
+    def _encode(self, signal: np.ndarray, output_path: str):
+        """float32 배열 → 출력 확장자에 맞는 오디오 파일 (임시 파일 → rename으로 교체)"""
+        root, ext = os.path.splitext(output_path)
+        if ext.lower() not in self.CODECS:
+            # 영상 등 다른 파일을 48kHz 모노 오디오로 덮어쓰지 않도록 지정된 오디오 형식만 허용
+            raise ValueError(f"지원하지 않는 오디오 형식: {os.path.basename(output_path)}")
+        temp_path = f"{root}.loudnorm{ext}"
+        cmd = ['ffmpeg', '-y', '-v', 'error', '-f', 'f32le', '-ar', str(self.SAMPLE_RATE), '-ac', '1', '-i', '-']
+        cmd += self.CODECS[ext.lower()] + [temp_path]
+        result = subprocess.run(cmd, input=signal.astype('<f4').tobytes(), capture_output=True, timeout=120)
+        if result.returncode != 0 or not os.path.exists(temp_path):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise RuntimeError(f"오디오 인코딩 실패 ({os.path.basename(output_path)}): "
+                               f"{result.stderr.decode('utf-8', 'replace')[-300:]}")
+        os.replace(temp_path, output_path)
+
+    def normalize_files(
+        self,
+        paths: List[str],
+        output_paths: Optional[List[str]] = None,
+        target_lufs: Optional[float] = None,
+        peak_db: Optional[float] = None,
+        peak_limit: bool = True,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 오디오 파일을 목표 라우드니스로 정규화
+
+        Args:
+            paths: 입력 파일 경로 목록
+            output_paths: 출력 경로 목록 (None이면 입력 파일을 덮어씀)
+            target_lufs: 목표 라우드니스 (None이면 기본값)
+            peak_db: 샘플 피크 상한 dBFS (None이면 기본값)
+            peak_limit: False면 피크 제한 없이 클리핑만 방지
+            on_result: 파일 하나가 끝날 때마다 호출되는 콜백 (입력 순서 인덱스, 결과)
+            task_id: 작업 ID (취소되면 남은 파일은 처리하지 않음)
+
+        Returns:
+            입력 순서대로 [{"path", "success", "inputLufs", "gainDb", "outputPeakDb", "skipped", "error"}, ...]
+        """
+        target = self.target_lufs if target_lufs is None else target_lufs
+        if not peak_limit:
+            peak_db = None
+        elif peak_db is None:
+            peak_db = self.peak_db
+        outputs = output_paths or paths
+        results: List[Dict[str, Any]] = [{"path": path, "success": False} for path in paths]
+
+        def decode(index: int) -> Optional[np.ndarray]:
+            task_manager.check_cancelled(task_id)
+            try:
+                if os.path.splitext(outputs[index])[1].lower() not in self.CODECS:
+                    raise ValueError(f"지원하지 않는 오디오 형식: {os.path.basename(outputs[index])}")
+                return self._decode(paths[index])
+            except Exception as e:
+                results[index]["error"] = str(e)
+                if on_result:
+                    on_result(index, results[index])
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="loudnorm") as executor:
+            decoded = list(executor.map(decode, range(len(paths))))
+            ok = [index for index, signal in enumerate(decoded) if signal is not None]
+            loudness = self.measure([decoded[index] for index in ok]) if ok else []
+
+            def write(item) -> None:
+                index, measured = item
+                result = results[index]
+                task_manager.check_cancelled(task_id)
+                try:
+                    signal = decoded[index]
+                    result["inputLufs"] = round(float(measured), 2) if np.isfinite(measured) else None
+                    gain_db = float(min(target - measured, self.max_gain_db)) if np.isfinite(measured) else 0.0
+                    peak = float(np.abs(signal).max()) if len(signal) else 0.0
+                    ceiling = 10 ** (peak_db / 20) if peak_db is not None else 1.0
+                    needs_limit = peak * 10 ** (gain_db / 20) > ceiling
+
+                    if abs(gain_db) < self.MIN_GAIN_DB and not needs_limit and outputs[index] == paths[index]:
+                        result.update(success=True, skipped=True, gainDb=0.0,
+                                      outputPeakDb=round(float(20 * np.log10(max(peak, 1e-10))), 2))
+                    else:
+                        normalized = self.apply_gain(signal, gain_db, peak_db)
+                        self._encode(normalized, outputs[index])
+                        out_peak = float(np.abs(normalized).max()) if len(normalized) else 0.0
+                        result.update(success=True, skipped=False, gainDb=round(gain_db, 2),
+                                      outputPeakDb=round(float(20 * np.log10(max(out_peak, 1e-10))), 2))
+                        result["path"] = outputs[index]
+                except Exception as e:
+                    result["error"] = str(e)
+                if on_result:
+                    on_result(index, result)
+
+            list(executor.map(write, zip(ok, loudness)))
+
+        done = sum(1 for result in results if result["success"])
+        print(f"[OK] 라우드니스 정규화 완료: {done}/{len(paths)}개 (목표 {target} LUFS)")
+        return results
+
+
+# 싱글톤 인스턴스 (TTS_LOUDNESS_TARGET / TTS_LOUDNESS_PEAK_DB / TTS_LOUDNESS_WORKERS로 조정)
+loudness_normalizer = LoudnessNormalizer(
+    target_lufs=float(os.getenv("TTS_LOUDNESS_TARGET", "-16")),
+    peak_db=float(os.getenv("TTS_LOUDNESS_PEAK_DB", "-1")),
+    workers=int(os.getenv("TTS_LOUDNESS_WORKERS", str(min(8, os.cpu_count() or 4))))
+)
@@ -4,13 +4,27 @@ TTS Service - 통합 TTS 서비스
 """
 import os
 import time
+import uuid
+import shutil
+import base64
+import asyncio
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
-from .tts_base import TTSEngineBase, TTSResult
+from .tts_base import TTSEngineBase, TTSResult, output_url
 from .tts_azure import azure_tts_engine
 from .tts_elevenlabs import elevenlabs_tts_engine
 from .tts_google import google_tts_engine
+from .tts_cache_service import tts_cache_service
+from .task_service import task_manager, TaskCancelledError
+from .tts_chunking import split_text, stitch_chunks
+from .tts_health import EngineHealth
+from .tts_voice_catalog import VoiceCatalog, voice_preview_store
+from .utils import OUTPUT_DIR
 
 
 @dataclass
@@ -24,6 +38,18 @@ class TTSUsageStats:
     engine_usage: Dict[str, int] = field(default_factory=dict)
     last_request_time: Optional[str] = None
     errors: List[Dict[str, Any]] = field(default_factory=list)
+    cache_hits: int = 0      # 캐시에서 바로 반환한 요청 (API 호출 없음)
+    cache_misses: int = 0    # 캐시에 없어 엔진을 호출한 요청
+
+    def record_cache(self, hit: bool):
+        """캐시 조회 결과 기록 (적중 시 API 호출 없이 성공한 요청으로 집계)"""
+        if hit:
+            self.cache_hits += 1
+            self.total_requests += 1
+            self.successful_requests += 1
+            self.last_request_time = datetime.now().isoformat()
+        else:
+            self.cache_misses += 1
 
     def record_request(self, engine: str, success: bool, chars: int = 0, duration_ms: int = 0, error: str = None):
         """요청 기록"""
@@ -51,6 +77,7 @@ class TTSUsageStats:
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
+        lookups = self.cache_hits + self.cache_misses
         return {
             "totalRequests": self.total_requests,
             "successfulRequests": self.successful_requests,
@@ -59,10 +86,94 @@ class TTSUsageStats:
             "totalDurationSeconds": self.total_duration_ms / 1000,
             "engineUsage": self.engine_usage,
             "lastRequestTime": self.last_request_time,
-            "recentErrors": self.errors[-5:]  # 최근 5개 에러만 노출
+            "recentErrors": self.errors[-5:],  # 최근 5개 에러만 노출
+            "cacheHits": self.cache_hits,
+            "cacheMisses": self.cache_misses,
+            "cacheHitRatePercent": round(self.cache_hits / lookups * 100, 2) if lookups > 0 else 0
         }
 
 
+@dataclass
+class _GenerationPlan:
+    """캐시 미스 후 실제로 합성할 엔진/음성 (generate/generate_async 공통 준비 결과)"""
+    start_time: float
+    requested_engine: str
+    engine: str
+    voice_id: Optional[str]
+    kwargs: Dict[str, Any]
+    cache_key: Optional[str]
+    route_reason: str
+    char_count: int
+
+
+class EngineSlot:
+    """
+    엔진 동시 요청 한도 (스레드의 동기 요청과 이벤트 루프의 비동기 요청이 같은 한도를 공유)
+
+    동기 요청은 with 문으로 블로킹 대기하고, 비동기 요청은 acquire_async()로 스레드를 점유하지 않고 기다린다.
+    슬롯이 반환되면 먼저 기다린 비동기 요청에 슬롯을 바로 넘겨준다 (폴링 없음).
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._cond = threading.Condition()
+        self._async_waiters: deque = deque()  # (event loop, future)
+
+    def __enter__(self):
+        with self._cond:
+            while self.in_use >= self.limit or self._async_waiters:
+                self._cond.wait()
+            self.in_use += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def acquire_async(self):
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self.in_use < self.limit and not self._async_waiters:
+                self.in_use += 1
+                return
+            future = loop.create_future()
+            self._async_waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._cond:
+                if (loop, future) in self._async_waiters:
+                    self._async_waiters.remove((loop, future))
+                    self._cond.notify_all()
+                    raise
+            # 슬롯을 넘겨받은 직후 취소됨 - 받은 슬롯을 반환
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        with self._cond:
+            if self._async_waiters:
+                # 슬롯을 그대로 다음 비동기 대기자에게 넘김 (in_use 유지)
+                loop, future = self._async_waiters.popleft()
+            else:
+                self.in_use -= 1
+                self._cond.notify()
+                return
+        try:
+            loop.call_soon_threadsafe(self._hand_over, future)
+        except RuntimeError:
+            # 대기자의 이벤트 루프가 이미 닫힘
+            self.release()
+
+    def _hand_over(self, future: "asyncio.Future"):
+        """대기자의 이벤트 루프에서 실행 - 그 사이 취소되었으면 슬롯을 다음 대기자에게 넘김"""
+        if future.done():
+            self.release()
+        else:
+            future.set_result(True)
+
+
 class TTSService:
     """
     TTS 통합 서비스
@@ -72,8 +183,32 @@ class TTSService:
     - 자동 Fallback (기본 엔진 실패 시 대체 엔진 사용)
     - API 키 검증
     - 사용량 모니터링
+    - 생성 결과 디스크 캐시 (같은 엔진/음성/텍스트/설정이면 API 호출 없이 반환)
+    - 엔진별 동시 요청 수 제한 + 여러 씬 일괄 생성
+    - 긴 텍스트는 문장 단위 청크로 나누어 병렬 합성 후 이어붙임
+    - 엔진별 지연 시간/오류율 추적 + 서킷 브레이커 (장애 엔진은 타임아웃을 기다리지 않고 바로 실패)
+    - 요청 엔진의 회로가 열려 있으면 호환 음성이 있는 가장 건강한 엔진으로 라우팅
+      (한 요청 안에서 실패 후 다른 엔진으로 재시도하지는 않음 - NO FALLBACK 유지)
+    - 비동기 인터페이스 (generate_async / generate_batch_async - 엔진 응답 대기 중 스레드 미점유)
+    - 음성 목록 TTL 캐시 (만료 시 백그라운드 갱신) + 음성별 미리듣기 클립 1회 합성 후 재사용
     """
 
+    # 오디오 전달 방식: url (/output/... 경로만 반환), inline (Base64 data URI 포함), auto (작은 파일만 inline)
+    DELIVERY_MODES = ("url", "inline", "auto")
+
+    # 라우팅 기록 최대 보관 수 (get_status 노출용)
+    ROUTING_LOG_SIZE = 20
+
+    # 청크 합성 실패 시 시도 횟수 (청크 하나의 일시적 오류로 전체를 잃지 않도록)
+    CHUNK_ATTEMPTS = 2
+
+    # 엔진별 기본 동시 요청 수 (TTS_CONCURRENCY_<ENGINE> 환경변수로 조정, 공급자 rate limit 보호)
+    DEFAULT_CONCURRENCY = {
+        "google": 2,
+        "azure": 4,
+        "elevenlabs": 2
+    }
+
 
     def __init__(self):
         """TTS 엔진 초기화"""
@@ -107,6 +242,59 @@ class TTSService:
         else:
             self.primary_engine = None
 
+        # 기본 오디오 전달 방식 (TTS_AUDIO_DELIVERY) + auto 모드의 인라인 최대 크기 (TTS_INLINE_MAX_KB)
+        delivery = os.getenv("TTS_AUDIO_DELIVERY", "url").lower()
+        self.default_delivery = delivery if delivery in self.DELIVERY_MODES else "url"
+        try:
+            self.inline_max_bytes = max(0, int(os.getenv("TTS_INLINE_MAX_KB", "64"))) * 1024
+        except ValueError:
+            self.inline_max_bytes = 64 * 1024
+
+        # 이 글자 수를 넘는 텍스트는 문장 단위 청크로 나누어 병렬 합성 (TTS_CHUNK_CHARS=0 이면 비활성화)
+        try:
+            self.chunk_chars = max(0, int(os.getenv("TTS_CHUNK_CHARS", "400")))
+        except ValueError:
+            self.chunk_chars = 400
+
+        # 엔진별 동시 요청 슬롯 (단일 요청과 일괄 요청이 같은 한도를 공유)
+        self.engine_concurrency: Dict[str, int] = {}
+        self._engine_slots: Dict[str, EngineSlot] = {}
+        for name in self.engines:
+            default = self.DEFAULT_CONCURRENCY.get(name, 1)
+            try:
+                limit = max(1, int(os.getenv(f"TTS_CONCURRENCY_{name.upper()}", str(default))))
+            except ValueError:
+                limit = default
+            self.engine_concurrency[name] = limit
+            self._engine_slots[name] = EngineSlot(limit)
+
+        # 엔진별 상태 추적 (TTS_BREAKER_FAILURES회 연속 실패 시 TTS_BREAKER_COOLDOWN초 동안 회로 열림)
+        try:
+            failure_threshold = max(1, int(os.getenv("TTS_BREAKER_FAILURES", "3")))
+        except ValueError:
+            failure_threshold = 3
+        try:
+            cooldown_seconds = max(1.0, float(os.getenv("TTS_BREAKER_COOLDOWN", "30")))
+        except ValueError:
+            cooldown_seconds = 30.0
+        self.health: Dict[str, EngineHealth] = {
+            name: EngineHealth(name, failure_threshold, cooldown_seconds) for name in self.engines
+        }
+
+        # 회로가 열린 엔진 요청을 호환 음성이 있는 다른 엔진으로 라우팅 (TTS_HEALTH_ROUTING=0 이면 바로 실패)
+        self.health_routing = os.getenv("TTS_HEALTH_ROUTING", "1") != "0"
+        self.routing_counts: Dict[str, int] = {}
+        self.routing_log = deque(maxlen=self.ROUTING_LOG_SIZE)
+        self._routing_lock = threading.Lock()
+
+        # 음성 목록 캐시 (TTS_VOICE_CATALOG_TTL초가 지나면 이전 목록을 반환하면서 백그라운드 갱신)
+        try:
+            catalog_ttl = max(0.0, float(os.getenv("TTS_VOICE_CATALOG_TTL", "3600")))
+        except ValueError:
+            catalog_ttl = 3600.0
+        self.voice_catalog = VoiceCatalog(self._load_voices_list, catalog_ttl)
+        self.voice_previews = voice_preview_store
+
         if not self.engines:
             raise RuntimeError(
                 "사용 가능한 TTS 엔진이 없습니다. "
@@ -116,6 +304,7 @@ class TTSService:
         print(f"[OK] TTS Service 초기화 완료")
         print(f"   - Primary Engine: {self.primary_engine}")
         print(f"   - Available Engines: {list(self.engines.keys())}")
+        print(f"   - Concurrency: {self.engine_concurrency}")
 
     def validate_api_keys(self) -> Dict[str, Any]:
         """
@@ -151,6 +340,8 @@ class TTSService:
         speed: float = 1.0,
         scene_id: str = "unknown",
         engine: str = None,
+        use_cache: bool = True,
+        delivery: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -162,100 +353,252 @@ class TTSService:
             language: 언어 코드 (기본: ko-KR)
             speed: 재생 속도 (기본: 1.0)
             scene_id: 씬 ID (로깅용)
-            engine: 사용할 엔진 이름 (None이면 primary 사용)
+            engine: 사용할 엔진 이름 (None 또는 "auto"면 primary 사용, 회로가 열려 있으면 라우팅될 수 있음)
+            use_cache: False면 캐시를 건너뛰고 항상 새로 생성 (결과는 캐시에 저장)
+            delivery: 오디오 전달 방식 (url/inline/auto, None이면 TTS_AUDIO_DELIVERY 설정)
             **kwargs: 엔진별 추가 옵션
 
         Returns:
             dict: TTS 결과 (audioUrl, timestamps, srt 등)
         """
+        response, plan = self._prepare_generate(
+            text, voice_id, language, speed, scene_id, engine, use_cache, delivery, kwargs
+        )
+        if response is not None:
+            return response
+
+        try:
+            result = self._synthesize(
+                engine_instance=self.engines[plan.engine],
+                engine_name=plan.engine,
+                text=text,
+                voice_id=plan.voice_id,
+                language=language,
+                speed=speed,
+                **plan.kwargs
+            )
+        except Exception as e:
+            print(f"[X] {plan.engine} 예외: {e}")
+            result = TTSResult(success=False, audio_url="", engine=plan.engine, error=str(e))
+
+        return self._finish_generate(plan, result, scene_id, delivery)
+
+    async def generate_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        language: str = "ko-KR",
+        speed: float = 1.0,
+        scene_id: str = "unknown",
+        engine: str = None,
+        use_cache: bool = True,
+        delivery: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        generate()의 비동기 버전 (인자/반환값 동일)
+
+        엔진 호출은 synthesize_speech_async()로 이벤트 루프에서 기다리므로
+        동시에 많은 요청이 진행 중이어도 요청마다 스레드를 점유하지 않는다.
+        캐시 조회/저장과 오디오 파일 읽기(Base64 인코딩)는 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+        """
+        response, plan = await asyncio.to_thread(
+            self._prepare_generate, text, voice_id, language, speed, scene_id, engine, use_cache, delivery, kwargs
+        )
+        if response is not None:
+            return response
+
+        try:
+            result = await self._synthesize_async(
+                engine_instance=self.engines[plan.engine],
+                engine_name=plan.engine,
+                text=text,
+                voice_id=plan.voice_id,
+                language=language,
+                speed=speed,
+                **plan.kwargs
+            )
+        except Exception as e:
+            print(f"[X] {plan.engine} 예외: {e}")
+            result = TTSResult(success=False, audio_url="", engine=plan.engine, error=str(e))
+
+        return await asyncio.to_thread(self._finish_generate, plan, result, scene_id, delivery)
+
+    def _prepare_generate(
+        self,
+        text: str,
+        voice_id: Optional[str],
+        language: str,
+        speed: float,
+        scene_id: str,
+        engine: Optional[str],
+        use_cache: bool,
+        delivery: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional["_GenerationPlan"]]:
+        """
+        엔진 확인 → 캐시 조회 → 상태 기반 라우팅 (generate/generate_async 공통)
+
+        Returns:
+            (바로 반환할 응답, None) 또는 (None, 합성 계획)
+        """
         start_time = time.time()
-        target_engine_name = engine or self.primary_engine
+        target_engine_name = engine if engine and engine != "auto" else self.primary_engine
         char_count = len(text)
 
         print(f"[TTS] 생성 시작 (Scene: {scene_id}, 엔진: {target_engine_name}, 글자수: {char_count})")
-        
-        # 시도할 엔진 설정
-        engines_to_try = [target_engine_name] if target_engine_name in self.engines else []
 
-        if not engines_to_try:
+        if target_engine_name not in self.engines:
             error_msg = f"사용 가능한 엔진이 없습니다. (요청: {target_engine_name})"
             self.stats.record_request(target_engine_name or "none", False, error=error_msg)
             return {
                 "success": False,
                 "error": error_msg,
                 "sceneId": scene_id
-            }
-
-        last_error = None
-        used_engine = None
-
-        for engine_name in engines_to_try:
-            engine_instance = self.engines.get(engine_name)
-            if not engine_instance:
-                continue
-
+            }, None
 
+        # 캐시 조회 (엔진이 실제로 사용할 음성 이름 기준)
+        cache_key = None
+        if tts_cache_service.enabled:
             try:
-                result = self._try_generate(
-                    engine_instance=engine_instance,
-                    engine_name=engine_name,
-                    text=text,
-                    voice_id=voice_id,
-                    language=language,
-                    speed=speed,
-                    **kwargs
+                cache_key = tts_cache_service.make_key(
+                    self.engines[target_engine_name], text, voice_id, language, speed, **kwargs
                 )
+                cached = tts_cache_service.get(cache_key) if use_cache else None
+            except Exception as e:
+                print(f"[WARN] TTS 캐시 조회 실패 - 새로 생성: {e}")
+                cache_key, cached = None, None
 
-                if result.success:
-                    used_engine = engine_name
-                    elapsed = time.time() - start_time
+            self.stats.record_cache(cached is not None)
+            if cached is not None:
+                elapsed = time.time() - start_time
+                response = self._build_response(cached, scene_id, target_engine_name, elapsed, delivery)
+                response["cacheHit"] = True
+                print(f"[OK] TTS 캐시 적중 (엔진: {target_engine_name}, 처리시간: {elapsed * 1000:.0f}ms)")
+                return response, None
 
-                    # 통계 기록
-                    self.stats.record_request(
-                        engine=engine_name,
-                        success=True,
-                        chars=char_count,
-                        duration_ms=result.total_duration_ms
+        # 엔진 상태 기반 라우팅 (요청 엔진의 회로가 열려 있으면 호환 음성이 있는 엔진으로, 없으면 바로 실패)
+        routed_engine, routed_voice, route_reason = self._route(target_engine_name, voice_id, **kwargs)
+        if routed_engine is None:
+            error_msg = f"{target_engine_name} 엔진 일시 차단 중 (연속 실패로 회로 열림, 호환 대체 엔진 없음)"
+            self.stats.record_request(target_engine_name, False, error=error_msg)
+            print(f"[ERROR] TTS 생성 건너뜀 - {error_msg}")
+            return {
+                "success": False,
+                "error": f"TTS 생성 실패 (Engine: {target_engine_name}): {error_msg}",
+                "sceneId": scene_id,
+                "engine": target_engine_name,
+                "fallbackUsed": False,
+                "circuitOpen": True
+            }, None
+        if routed_engine != target_engine_name:
+            voice_id = routed_voice
+            # 라우팅된 엔진/음성 기준으로 캐시 키 재계산 (이전 엔진 기준 음성 설정이 섞이지 않도록)
+            kwargs = {k: v for k, v in kwargs.items() if k not in ("voiceId", "settings")}
+            if cache_key:
+                try:
+                    cache_key = tts_cache_service.make_key(
+                        self.engines[routed_engine], text, voice_id, language, speed, **kwargs
                     )
+                except Exception as e:
+                    print(f"[WARN] TTS 캐시 키 생성 실패: {e}")
+                    cache_key = None
+
+        return None, _GenerationPlan(
+            start_time=start_time,
+            requested_engine=target_engine_name,
+            engine=routed_engine,
+            voice_id=voice_id,
+            kwargs=kwargs,
+            cache_key=cache_key,
+            route_reason=route_reason,
+            char_count=char_count
+        )
+
+    def _finish_generate(self, plan: "_GenerationPlan", result: TTSResult, scene_id: str,
+                         delivery: Optional[str]) -> Dict[str, Any]:
+        """합성 결과 통계 기록 + 캐시 저장 + 응답 생성 (generate/generate_async 공통)"""
+        if result.success:
+            elapsed = time.time() - plan.start_time
 
-                    # 응답 생성
-                    response = result.to_dict()
-                    response["sceneId"] = scene_id
-                    response["audioUrl"] = result.audio_url
-                    response["audioPath"] = result.audio_path  # 다음 단계(세분화)를 위해 경로 반환
-                    response["audioBase64"] = result.audio_base64
-                    response["srtData"] = result.srt
-                    response["usedEngine"] = used_engine
-                    response["processingTimeSeconds"] = round(elapsed, 2)
+            # 통계 기록
+            self.stats.record_request(
+                engine=plan.engine,
+                success=True,
+                chars=plan.char_count,
+                duration_ms=result.total_duration_ms
+            )
 
-                    print(f"[OK] TTS 생성 완료 (엔진: {used_engine}, 처리시간: {elapsed:.2f}s)")
-                    return response
+            if plan.cache_key:
+                tts_cache_service.put(plan.cache_key, result)
 
-                else:
-                    last_error = result.error
-                    print(f"[WARN] {engine_name} 실패: {last_error}")
+            # 응답 생성
+            response = self._build_response(result, scene_id, plan.engine, elapsed, delivery)
+            response["cacheHit"] = False
+            if plan.engine != plan.requested_engine:
+                response["routedFrom"] = plan.requested_engine
+                response["routingReason"] = plan.route_reason
 
-            except Exception as e:
-                last_error = str(e)
-                print(f"[X] {engine_name} 예외: {last_error}")
+            print(f"[OK] TTS 생성 완료 (엔진: {plan.engine}, 처리시간: {elapsed:.2f}s)")
+            return response
 
         # 엔진 실패 (NO FALLBACK)
+        last_error = result.error
+        print(f"[WARN] {plan.engine} 실패: {last_error}")
         self.stats.record_request(
-            engine=target_engine_name or "none",
+            engine=plan.requested_engine or "none",
             success=False,
             error=last_error
         )
 
-        print(f"[ERROR] TTS 생성 실패 - Engine: {target_engine_name}, Error: {last_error}")
+        print(f"[ERROR] TTS 생성 실패 - Engine: {plan.requested_engine}, Error: {last_error}")
 
         return {
             "success": False,
-            "error": f"TTS 생성 실패 (Engine: {target_engine_name}): {last_error}",
+            "error": f"TTS 생성 실패 (Engine: {plan.requested_engine}): {last_error}",
             "sceneId": scene_id,
-            "engine": target_engine_name,
+            "engine": plan.requested_engine,
             "fallbackUsed": False
         }
 
+    def _resolve_delivery(self, result: TTSResult, delivery: Optional[str]) -> str:
+        """전달 방식 결정 (auto는 파일 크기 기준으로 url/inline 선택, 로컬 파일이 없으면 inline)"""
+        mode = (delivery or self.default_delivery).lower()
+        if mode not in self.DELIVERY_MODES:
+            mode = self.default_delivery
+        if not result.audio_path or not os.path.exists(result.audio_path):
+            return "inline"
+        if mode == "auto":
+            return "inline" if os.path.getsize(result.audio_path) <= self.inline_max_bytes else "url"
+        return mode
+
+    def _build_response(self, result: TTSResult, scene_id: str, used_engine: str, elapsed: float,
+                        delivery: Optional[str] = None) -> Dict[str, Any]:
+        """
+        TTS 결과를 API 응답 형식으로 변환
+
+        url 모드는 /output/... 경로만 반환하여 응답/프로젝트 JSON/작업 기록에 오디오 전체가 실리지 않도록 한다.
+        inline 모드는 기존처럼 Base64 data URI를 포함한다 (엔진이 Base64를 주지 않았으면 파일에서 1회 변환).
+        """
+        audio_url = result.audio_url
+        audio_base64 = None
+        if self._resolve_delivery(result, delivery) == "inline":
+            audio_base64 = result.audio_base64
+            if audio_base64 is None and result.audio_path and os.path.exists(result.audio_path):
+                with open(result.audio_path, "rb") as f:
+                    audio_base64 = base64.b64encode(f.read()).decode('utf-8')
+            if audio_base64:
+                audio_url = f"data:audio/mpeg;base64,{audio_base64}"
+
+        response = result.to_dict()
+        response["sceneId"] = scene_id
+        response["audioUrl"] = audio_url
+        response["audioPath"] = result.audio_path  # 다음 단계(세분화)를 위해 경로 반환
+        response["audioBase64"] = audio_base64
+        response["srtData"] = result.srt
+        response["usedEngine"] = used_engine
+        response["processingTimeSeconds"] = round(elapsed, 2)
+        return response
 
     def _try_generate(
         self,
@@ -267,15 +610,409 @@ class TTSService:
         speed: float,
         **kwargs
     ) -> TTSResult:
-        """단일 엔진으로 TTS 생성 시도"""
-        return engine_instance.synthesize_speech(
-            text=text,
-            voice_id=voice_id,
-            language=language,
-            speed=speed,
-            **kwargs
+        """단일 엔진으로 TTS 생성 시도 (엔진별 동시 요청 한도 안에서 실행, 결과/지연 시간은 엔진 상태에 기록)"""
+        health = self.health.get(engine_name)
+        with self._engine_slots[engine_name]:
+            started = time.time()
+            try:
+                result = engine_instance.synthesize_speech(
+                    text=text,
+                    voice_id=voice_id,
+                    language=language,
+                    speed=speed,
+                    **kwargs
+                )
+            except Exception as e:
+                if health:
+                    health.record(False, time.time() - started, str(e))
+                raise
+        if health:
+            health.record(result.success, time.time() - started, result.error)
+        return result
+
+    async def _try_generate_async(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        text: str,
+        voice_id: str,
+        language: str,
+        speed: float,
+        **kwargs
+    ) -> TTSResult:
+        """
+        _try_generate()의 비동기 버전
+
+        동기 요청과 같은 엔진 슬롯을 공유하되, 슬롯이 빌 때까지 스레드를 점유하지 않고 이벤트 루프에서 기다린다.
+        """
+        health = self.health.get(engine_name)
+        slot = self._engine_slots[engine_name]
+        await slot.acquire_async()
+        try:
+            started = time.time()
+            try:
+                result = await engine_instance.synthesize_speech_async(
+                    text=text,
+                    voice_id=voice_id,
+                    language=language,
+                    speed=speed,
+                    **kwargs
+                )
+            except Exception as e:
+                if health:
+                    health.record(False, time.time() - started, str(e))
+                raise
+        finally:
+            slot.release()
+        if health:
+            health.record(result.success, time.time() - started, result.error)
+        return result
+
+    def _route(self, engine_name: str, voice_id: str = None, **kwargs) -> Tuple[Optional[str], Optional[str], str]:
+        """
+        요청을 보낼 엔진 결정
+
+        요청 엔진의 회로가 닫혀 있으면 그대로 사용한다 (음성 일관성 유지).
+        열려 있으면 같은 성별 음성으로 대응시킬 수 있는 엔진 중 오류율 → 평균 지연 시간이 가장 낮은 엔진을 고른다.
+
+        Returns:
+            (엔진 이름, 음성 ID, 사유) - 보낼 엔진이 없으면 엔진 이름이 None
+        """
+        health = self.health.get(engine_name)
+        if health is None or health.allow_request():
+            return engine_name, voice_id, "requested"
+
+        candidates = []
+        gender = None
+        if self.health_routing:
+            try:
+                gender = self.engines[engine_name].voice_gender(voice_id, **kwargs)
+            except Exception as e:
+                print(f"[WARN] {engine_name} 음성 성별 확인 실패: {e}")
+            if gender:
+                for name, engine_instance in self.engines.items():
+                    if name == engine_name or not self.health[name].is_available():
+                        continue
+                    mapped_voice = engine_instance.voice_for_gender(gender)
+                    if mapped_voice:
+                        candidates.append((self.health[name].error_rate, self.health[name].avg_latency, name, mapped_voice))
+
+        for _, _, name, mapped_voice in sorted(candidates):
+            if self.health[name].allow_request():
+                reason = f"{engine_name} 회로 열림 → {name} ({gender} 음성 {mapped_voice})"
+                self._record_routing(engine_name, name, reason)
+                print(f"[TTS] 라우팅: {reason}")
+                return name, mapped_voice, reason
+
+        self._record_routing(engine_name, None, f"{engine_name} 회로 열림 → 차단" + (
+            "" if gender else " (호환 음성 없음)"))
+        return None, None, "circuit_open"
+
+    def _record_routing(self, requested: str, routed: Optional[str], reason: str):
+        """라우팅 결정 기록 (요청 엔진 → 실제 엔진별 횟수 + 최근 결정)"""
+        key = f"{requested}->{routed or 'rejected'}"
+        with self._routing_lock:
+            self.routing_counts[key] = self.routing_counts.get(key, 0) + 1
+            self.routing_log.append({
+                "time": datetime.now().isoformat(),
+                "requested": requested,
+                "routed": routed,
+                "reason": reason
+            })
+
+    def get_health(self) -> Dict[str, Any]:
+        """엔진별 상태 (회로 상태, 오류율, 평균 지연 시간) + 라우팅 통계"""
+        with self._routing_lock:
+            routing = {
+                "enabled": self.health_routing,
+                "counts": dict(self.routing_counts),
+                "recent": list(self.routing_log)[-5:]
+            }
+        return {
+            "engines": {name: health.snapshot() for name, health in self.health.items()},
+            "routing": routing
+        }
+
+    def _synthesize(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        text: str,
+        voice_id: str,
+        language: str,
+        speed: float,
+        **kwargs
+    ) -> TTSResult:
+        """TTS 합성 (chunk_chars를 넘는 텍스트는 청크 병렬 합성, 아니면 한 번에 합성)"""
+        chunks = split_text(text, self.chunk_chars)
+        if len(chunks) <= 1:
+            return self._try_generate(engine_instance, engine_name, text, voice_id, language, speed, **kwargs)
+        return self._generate_chunked(engine_instance, engine_name, chunks, voice_id, language, speed, **kwargs)
+
+    async def _synthesize_async(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        text: str,
+        voice_id: str,
+        language: str,
+        speed: float,
+        **kwargs
+    ) -> TTSResult:
+        """_synthesize()의 비동기 버전"""
+        chunks = split_text(text, self.chunk_chars)
+        if len(chunks) <= 1:
+            return await self._try_generate_async(engine_instance, engine_name, text, voice_id, language, speed,
+                                                  **kwargs)
+        return await self._generate_chunked_async(engine_instance, engine_name, chunks, voice_id, language, speed,
+                                                  **kwargs)
+
+    def _generate_chunked(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        chunks: List[str],
+        voice_id: str,
+        language: str,
+        speed: float,
+        **kwargs
+    ) -> TTSResult:
+        """
+        문장 단위 청크를 엔진 동시 요청 한도만큼 병렬 합성한 뒤 하나의 MP3로 이어붙임
+
+        단어 타임스탬프는 앞 청크들의 실제 샘플 수만큼 보정되어 하나의 타임라인/SRT가 된다.
+        """
+        start_time = time.time()
+        workers = min(len(chunks), self.engine_concurrency.get(engine_name, 1))
+        print(f"[TTS] 청크 병렬 합성: {len(chunks)}개 청크 (엔진: {engine_name}, 동시 {workers}개)")
+
+        def run(index: int) -> TTSResult:
+            result = None
+            for attempt in range(1, self.CHUNK_ATTEMPTS + 1):
+                try:
+                    result = self._try_generate(engine_instance, engine_name, chunks[index],
+                                                voice_id, language, speed, **kwargs)
+                except Exception as e:
+                    result = TTSResult(success=False, audio_url="", engine=engine_name, error=str(e))
+                if result.success and result.audio_path and os.path.exists(result.audio_path):
+                    return result
+                print(f"[WARN] 청크 {index + 1}/{len(chunks)} 합성 실패 (시도 {attempt}/{self.CHUNK_ATTEMPTS}): "
+                      f"{result.error}")
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"tts-chunk-{engine_name}") as executor:
+            results = list(executor.map(run, range(len(chunks))))
+
+        return self._stitch_chunk_results(engine_instance, engine_name, chunks, results, start_time)
+
+    async def _generate_chunked_async(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        chunks: List[str],
+        voice_id: str,
+        language: str,
+        speed: float,
+        **kwargs
+    ) -> TTSResult:
+        """_generate_chunked()의 비동기 버전 (청크는 코루틴으로 동시 실행, 병합은 스레드에서)"""
+        start_time = time.time()
+        print(f"[TTS] 청크 병렬 합성: {len(chunks)}개 청크 (엔진: {engine_name}, async)")
+
+        async def run(index: int) -> TTSResult:
+            result = None
+            for attempt in range(1, self.CHUNK_ATTEMPTS + 1):
+                try:
+                    result = await self._try_generate_async(engine_instance, engine_name, chunks[index],
+                                                            voice_id, language, speed, **kwargs)
+                except Exception as e:
+                    result = TTSResult(success=False, audio_url="", engine=engine_name, error=str(e))
+                if result.success and result.audio_path and os.path.exists(result.audio_path):
+                    return result
+                print(f"[WARN] 청크 {index + 1}/{len(chunks)} 합성 실패 (시도 {attempt}/{self.CHUNK_ATTEMPTS}): "
+                      f"{result.error}")
+            return result
+
+        results = await asyncio.gather(*(run(index) for index in range(len(chunks))))
+        return await asyncio.to_thread(
+            self._stitch_chunk_results, engine_instance, engine_name, chunks, list(results), start_time
         )
 
+    def _stitch_chunk_results(
+        self,
+        engine_instance: TTSEngineBase,
+        engine_name: str,
+        chunks: List[str],
+        results: List[TTSResult],
+        start_time: float
+    ) -> TTSResult:
+        """
+        청크 합성 결과를 하나의 MP3로 이어붙임 (하나라도 실패하면 전체 실패)
+
+        청크별 중간 오디오 파일은 성공/실패와 관계없이 정리한다.
+        """
+        work_dir = tempfile.mkdtemp(prefix="realhunalo_tts_chunks_")
+        try:
+            for index, result in enumerate(results):
+                if not (result.success and result.audio_path and os.path.exists(result.audio_path)):
+                    return TTSResult(
+                        success=False,
+                        audio_url="",
+                        engine=engine_name,
+                        error=f"청크 {index + 1}/{len(chunks)} 합성 실패: {result.error}"
+                    )
+
+            audio_path = os.path.join(OUTPUT_DIR, f"tts_{uuid.uuid4()}.mp3")
+            timestamps, total_duration_ms = stitch_chunks(results, audio_path, work_dir)
+            print(f"[OK] 청크 병합 완료: {len(chunks)}개 청크, {total_duration_ms / 1000:.2f}초 "
+                  f"(처리시간: {time.time() - start_time:.2f}s)")
+
+            return TTSResult(
+                success=True,
+                audio_url=output_url(audio_path, OUTPUT_DIR),
+                audio_path=audio_path,
+                timestamps=timestamps,
+                total_duration_ms=total_duration_ms,
+                srt=engine_instance.generate_srt(timestamps) if timestamps else None,
+                engine=engine_name
+            )
+        except Exception as e:
+            print(f"[X] 청크 병합 실패: {e}")
+            return TTSResult(success=False, audio_url="", engine=engine_name, error=f"청크 병합 실패: {e}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            # 청크별 중간 오디오 파일 정리 (최종 파일만 남김)
+            for result in results:
+                if result and result.audio_path and os.path.exists(result.audio_path):
+                    try:
+                        os.remove(result.audio_path)
+                    except OSError:
+                        pass
+
+    def generate_batch(
+        self,
+        items: List[Dict[str, Any]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 씬 TTS 일괄 생성 - 엔진별로 동시 요청 한도만큼 병렬 실행
+
+        Args:
+            items: generate() 인자 딕셔너리 목록 (text, voice_id, speed, scene_id, engine, ...)
+            on_result: 씬 하나가 끝날 때마다 호출되는 콜백 (입력 순서 인덱스, generate() 결과)
+            task_id: 작업 ID (취소되면 아직 시작하지 않은 씬은 실행하지 않음)
+
+        Returns:
+            입력 순서대로 정렬된 generate() 결과 목록
+
+        Raises:
+            TaskCancelledError: 작업이 취소된 경우
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if not items:
+            return []
+
+        # 엔진별 전용 스레드 풀 (한 엔진의 대기열이 다른 엔진 요청을 막지 않도록)
+        groups: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(item.get("engine") or self.primary_engine, []).append(index)
+
+        def run(index: int) -> Dict[str, Any]:
+            task_manager.check_cancelled(task_id)
+            return self.generate(**items[index])
+
+        executors = []
+        futures = {}
+        try:
+            for engine_name, indices in groups.items():
+                workers = min(len(indices), self.engine_concurrency.get(engine_name, 1))
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"tts-{engine_name}")
+                executors.append(executor)
+                for index in indices:
+                    futures[executor.submit(run, index)] = index
+
+            per_engine = {name: len(indices) for name, indices in groups.items()}
+            print(f"[TTS] 일괄 생성 시작: {len(items)}개 씬, 엔진별 {per_engine}")
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except TaskCancelledError:
+                    raise
+                except Exception as e:
+                    result = {
+                        "success": False,
+                        "error": str(e),
+                        "sceneId": items[index].get("scene_id", "unknown")
+                    }
+                results[index] = result
+                if on_result:
+                    on_result(index, result)
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    async def generate_batch_async(
+        self,
+        items: List[Dict[str, Any]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        generate_batch()의 비동기 버전 - 씬마다 스레드 대신 코루틴으로 실행
+
+        엔진별 동시 요청 한도는 같고, 차례를 기다리는 씬은 스레드를 점유하지 않는다.
+
+        Raises:
+            TaskCancelledError: 작업이 취소된 경우
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if not items:
+            return []
+
+        # 엔진별 대기열 (generate_batch의 엔진별 스레드 풀과 같은 역할)
+        groups: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(item.get("engine") or self.primary_engine, []).append(index)
+        gates = {
+            engine_name: asyncio.Semaphore(self.engine_concurrency.get(engine_name, 1))
+            for engine_name in groups
+        }
+
+        async def run(engine_name: str, index: int):
+            async with gates[engine_name]:
+                task_manager.check_cancelled(task_id)
+                try:
+                    result = await self.generate_async(**items[index])
+                except Exception as e:
+                    result = {
+                        "success": False,
+                        "error": str(e),
+                        "sceneId": items[index].get("scene_id", "unknown")
+                    }
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+
+        per_engine = {name: len(indices) for name, indices in groups.items()}
+        print(f"[TTS] 일괄 생성 시작 (async): {len(items)}개 씬, 엔진별 {per_engine}")
+
+        tasks = [
+            asyncio.ensure_future(run(engine_name, index))
+            for engine_name, indices in groups.items() for index in indices
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return results
+
     def get_available_engines(self) -> List[str]:
         """사용 가능한 엔진 목록 반환"""
         return list(self.engines.keys())
@@ -297,21 +1034,153 @@ class TTSService:
         return info
 
     def get_usage_stats(self) -> Dict[str, Any]:
-        """사용량 통계 반환"""
-        return self.stats.to_dict()
+        """사용량 통계 반환 (TTS 캐시 용량/적중률 포함)"""
+        stats = self.stats.to_dict()
+        stats["cache"] = tts_cache_service.get_stats()
+        return stats
 
     def get_status(self) -> Dict[str, Any]:
         """서비스 상태 반환"""
         return {
             "primaryEngine": self.primary_engine,
             "availableEngines": self.get_available_engines(),
-            "engineStatus": self._engine_status.copy(),
+            # API 키 검증 결과 + 회로가 열리지 않은 엔진만 사용 가능으로 표시
+            "engineStatus": {
+                name: valid and self.health[name].is_available()
+                for name, valid in self._engine_status.items()
+            },
+            "engineHealth": self.get_health(),
+            "engineConcurrency": self.engine_concurrency.copy(),
+            "enginePools": {
+                name: engine.get_pool_stats()
+                for name, engine in self.engines.items() if hasattr(engine, 'get_pool_stats')
+            },
+            "voiceCatalog": dict(self.voice_catalog.get_stats(), **self.voice_previews.get_stats()),
             "stats": self.get_usage_stats()
         }
 
-    def get_voices_list(self) -> dict:
+    def get_voices_list(self, refresh: bool = False) -> dict:
+        """
+        사용 가능한 모든 엔진의 음성 목록 반환 (통합, 캐시된 목록 + 이미 합성된 미리듣기 URL)
+
+        Args:
+            refresh: True면 캐시를 무시하고 엔진에서 목록을 새로 가져옴
+        """
+        voices = {}
+        for engine_name, engine_voices in self.voice_catalog.get(force_refresh=refresh).items():
+            engine = self.engines.get(engine_name)
+            voices[engine_name] = [
+                dict(voice, previewUrl=self._preview_url(engine, voice.get("id")))
+                for voice in engine_voices
+            ]
+        return voices
+
+    def _preview_url(self, engine: Optional[TTSEngineBase], voice_id: Optional[str]) -> Optional[str]:
+        """이미 합성된 미리듣기 URL (없거나 확인 실패 시 None)"""
+        if engine is None or not voice_id:
+            return None
+        try:
+            return self.voice_previews.get_url(engine, voice_id)
+        except Exception:
+            return None
+
+    def get_voice_preview(self, engine_name: str, voice_id: str) -> Dict[str, Any]:
+        """
+        음성 미리듣기 클립 반환 (처음 요청 시에만 합성하여 output/voice_previews/ 에 저장)
+
+        Returns:
+            {"success", "engine", "voiceId", "previewUrl", "cached"} 또는 실패 시 {"success": False, "error"}
+        """
+        engine = self.engines.get(engine_name)
+        if engine is None:
+            return {"success": False, "error": f"엔진 '{engine_name}'을 찾을 수 없습니다."}
+
+        path = self.voice_previews.path_for(engine, voice_id)
+        with self.voice_previews.lock_for(path):
+            if os.path.exists(path):
+                return {"success": True, "engine": engine_name, "voiceId": voice_id,
+                        "previewUrl": output_url(path, self.voice_previews.output_dir), "cached": True}
+
+            # 회로가 열린 엔진은 다른 엔진/음성으로 대체하지 않음 (이 음성의 미리듣기가 아니게 되므로)
+            health = self.health.get(engine_name)
+            if health and not health.allow_request():
+                return {"success": False, "engine": engine_name, "voiceId": voice_id,
+                        "error": f"{engine_name} 엔진을 일시적으로 사용할 수 없습니다."}
+
+            # generate()를 거치면 출력 폴더 파일 + TTS 캐시 항목이 함께 남으므로 엔진으로 직접 합성하여
+            # 합성된 파일을 미리듣기 경로로 옮긴다 (음성마다 파일 하나만 보관)
+            text = self.voice_previews.text
+            try:
+                result = self._synthesize(engine, engine_name, text, voice_id, "ko-KR", 1.0)
+            except Exception as e:
+                result = TTSResult(success=False, audio_url="", engine=engine_name, error=str(e))
+            if not (result.success and result.audio_path and os.path.exists(result.audio_path)):
+                self.stats.record_request(engine_name, False, error=result.error)
+                return {"success": False, "engine": engine_name, "voiceId": voice_id,
+                        "error": result.error or "미리듣기 오디오 파일이 없습니다."}
+            self.stats.record_request(engine_name, True, chars=len(text), duration_ms=result.total_duration_ms)
+
+            preview_url = self.voice_previews.save(result.audio_path, path)
+            print(f"[OK] 음성 미리듣기 저장: {engine_name}/{voice_id} -> {preview_url}")
+            return {"success": True, "engine": engine_name, "voiceId": voice_id,
+                    "previewUrl": preview_url, "cached": False}
+
+    def render_voice_previews(
+        self,
+        engine_name: Optional[str] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        아직 미리듣기가 없는 음성의 클립을 미리 합성 (엔진별 동시 요청 한도 안에서 병렬)
+
+        Args:
+            engine_name: 특정 엔진만 (None이면 전체)
+            on_result: 음성 하나가 끝날 때마다 호출되는 콜백 (인덱스, get_voice_preview() 결과)
+            task_id: 작업 ID (취소되면 아직 시작하지 않은 음성은 합성하지 않음)
+
+        Returns:
+            새로 합성을 시도한 음성의 결과 목록
+        """
+        targets = [
+            (name, voice["id"])
+            for name, voices in self.voice_catalog.get().items()
+            if engine_name in (None, name) and name in self.engines
+            for voice in voices
+            if voice.get("id") and not os.path.exists(self.voice_previews.path_for(self.engines[name], voice["id"]))
+        ]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+        if not targets:
+            return []
+
+        def run(index: int) -> Dict[str, Any]:
+            task_manager.check_cancelled(task_id)
+            return self.get_voice_preview(*targets[index])
+
+        # 엔진 동시 요청 한도는 generate()의 슬롯이 지키므로 스레드 수는 가장 큰 한도로 충분
+        workers = min(len(targets), max(self.engine_concurrency.values()))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-preview")
+        try:
+            futures = {executor.submit(run, index): index for index in range(len(targets))}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except TaskCancelledError:
+                    raise
+                except Exception as e:
+                    name, voice_id = targets[index]
+                    result = {"success": False, "engine": name, "voiceId": voice_id, "error": str(e)}
+                results[index] = result
+                if on_result:
+                    on_result(index, result)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _load_voices_list(self) -> dict:
         """
-        사용 가능한 모든 엔진의 음성 목록 반환 (통합)
+        각 엔진에서 음성 목록을 새로 가져옴 (음성 목록 캐시의 loader)
         """
         voices = {
             "azure": [],
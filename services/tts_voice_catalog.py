@@ -0,0 +1,176 @@
+"""
+TTS Voice Catalog - 음성 목록 TTL 캐시 + 음성별 미리듣기 클립 저장소
+
+/api/tts/voices 요청마다 모든 엔진의 음성 목록을 새로 만들고, 음성 미리듣기도 매번 새로 합성했다.
+- 음성 목록은 TTL 동안 메모리에서 바로 반환하고, 만료되면 이전 목록을 반환하면서 백그라운드에서 갱신
+- 미리듣기 클립은 음성마다 한 번만 합성하여 output/voice_previews/ 에 저장 (이후 요청은 파일 URL만 반환)
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from .tts_base import TTSEngineBase, output_url
+from .utils import OUTPUT_DIR
+
+# 미리듣기 클립 문장 (TTS_PREVIEW_TEXT로 변경, 바뀌면 새 파일로 다시 합성)
+DEFAULT_PREVIEW_TEXT = "안녕하세요. 이 목소리로 영상의 나레이션을 들려드릴게요."
+
+
+class VoiceCatalog:
+    """
+    음성 목록 TTL 캐시 (만료 시 이전 목록을 반환하면서 백그라운드 갱신)
+
+    목록을 처음 만들 때만 호출 측이 기다리고, 이후에는 항상 메모리에 있는 목록을 바로 반환한다.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[str, list]], ttl_seconds: float = 3600.0):
+        """
+        Args:
+            loader: 엔진별 음성 목록을 새로 만드는 함수 ({엔진 이름: [음성, ...]})
+            ttl_seconds: 목록 유효 시간 (지나면 다음 조회 때 백그라운드 갱신)
+        """
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.voices: Optional[Dict[str, list]] = None
+        self.loaded_at = 0.0
+        self.refreshing = False
+        self.refresh_count = 0
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def get(self, force_refresh: bool = False) -> Dict[str, list]:
+        """
+        음성 목록 반환
+
+        Args:
+            force_refresh: True면 백그라운드 갱신 없이 바로 새로 만들어 반환
+        """
+        with self.lock:
+            voices = self.voices
+            stale = time.time() - self.loaded_at >= self.ttl_seconds
+
+        if voices is None or force_refresh:
+            return self.refresh()
+        if stale:
+            self._refresh_in_background()
+        return voices
+
+    def refresh(self) -> Dict[str, list]:
+        """목록을 새로 만들어 저장 (실패하면 이전 목록 유지, 이전 목록도 없으면 예외 전달)"""
+        try:
+            voices = self.loader()
+        except Exception as e:
+            with self.lock:
+                self.last_error = str(e)[:200]
+                self.refreshing = False
+                if self.voices is None:
+                    raise
+                # 다음 조회 때 곧바로 다시 시도하지 않도록 이전 목록을 한 주기 더 사용
+                self.loaded_at = time.time()
+                print(f"[WARN] 음성 목록 갱신 실패 - 이전 목록 사용: {e}")
+                return self.voices
+
+        with self.lock:
+            self.voices = voices
+            self.loaded_at = time.time()
+            self.refreshing = False
+            self.refresh_count += 1
+            self.last_error = None
+        return voices
+
+    def _refresh_in_background(self):
+        """갱신 스레드 시작 (이미 갱신 중이면 무시)"""
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        threading.Thread(target=self._background_refresh, name="tts-voice-catalog", daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"[WARN] 음성 목록 백그라운드 갱신 실패: {e}")
+
+    def invalidate(self):
+        """다음 조회 때 갱신하도록 만료 처리 (목록은 유지)"""
+        with self.lock:
+            self.loaded_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            age = time.time() - self.loaded_at if self.voices is not None else None
+            return {
+                "loaded": self.voices is not None,
+                "ageSeconds": round(age, 1) if age is not None else None,
+                "ttlSeconds": self.ttl_seconds,
+                "refreshing": self.refreshing,
+                "refreshCount": self.refresh_count,
+                "lastError": self.last_error
+            }
+
+
+class VoicePreviewStore:
+    """
+    음성별 미리듣기 클립 파일 저장소
+
+    파일 이름은 (엔진, 요청 음성 ID, 실제 음성 이름, 미리듣기 문장, 엔진 설정) 해시로 정하므로
+    문장이나 엔진 설정이 바뀌면 자동으로 새 클립을 합성한다.
+    """
+
+    def __init__(self, preview_dir: str, text: str = DEFAULT_PREVIEW_TEXT, output_dir: str = OUTPUT_DIR):
+        self.preview_dir = preview_dir
+        self.text = text
+        self.output_dir = output_dir
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(preview_dir, exist_ok=True)
+
+    def path_for(self, engine: TTSEngineBase, voice_id: str) -> str:
+        """음성의 미리듣기 파일 경로 (존재 여부와 무관)"""
+        key = "|".join([
+            engine.engine_name,
+            str(voice_id),
+            engine.resolve_voice(voice_id),
+            self.text,
+            repr(sorted(engine.cache_params().items()))
+        ])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.preview_dir, f"{engine.engine_name}_{digest}.mp3")
+
+    def get_url(self, engine: TTSEngineBase, voice_id: str) -> Optional[str]:
+        """이미 합성된 미리듣기 URL (없으면 None)"""
+        path = self.path_for(engine, voice_id)
+        return output_url(path, self.output_dir) if os.path.exists(path) else None
+
+    def lock_for(self, path: str) -> threading.Lock:
+        """같은 음성 미리듣기를 동시에 두 번 합성하지 않도록 파일별 잠금"""
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def save(self, source_path: str, path: str) -> str:
+        """
+        합성된 오디오 파일을 미리듣기 파일로 이동 (사본을 남기지 않음)
+
+        임시 이름으로 옮긴 뒤 rename하여 다른 요청에 불완전한 파일이 노출되지 않도록 한다.
+        """
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        shutil.move(source_path, temp_path)
+        os.replace(temp_path, path)
+        return output_url(path, self.output_dir)
+
+    def get_stats(self) -> Dict[str, Any]:
+        files = [name for name in os.listdir(self.preview_dir) if name.endswith(".mp3")] \
+            if os.path.isdir(self.preview_dir) else []
+        return {"previews": len(files), "text": self.text}
+
+
+# 싱글톤 인스턴스 (미리듣기 클립은 /output 정적 경로로 제공)
+voice_preview_store = VoicePreviewStore(
+    os.path.join(OUTPUT_DIR, "voice_previews"),
+    text=os.getenv("TTS_PREVIEW_TEXT", DEFAULT_PREVIEW_TEXT)
+)
@@ -33,12 +33,26 @@ LosslessCut 통합 평가 결과: **비추천**
 권장 설정: 그대로 유지 (최적의 균형점)
 """
 import os
+import json
+import time
 import uuid
+import hashlib
 import subprocess
+import threading
 import urllib.request
 import tempfile
-from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from services.utils import OUTPUT_DIR
+from services.file_cache_service import segment_cache
+from services.mezzanine_service import mezzanine_service
+from services.media_probe_service import media_probe_service
+from services.task_service import task_manager, TaskCancelledError
+from services.ffmpeg_runner import run_ffmpeg
+
+# 세그먼트 캐시 키에 포함되는 파이프라인 버전 (인코딩 방식이 바뀌면 올려서 기존 캐시 무효화)
+SEGMENT_PIPELINE_VERSION = 1
 
 # 디버그용 로그 파일 경로 (uvicorn reload 방지를 위해 시스템 임시 폴더 사용)
 import tempfile
@@ -55,6 +69,230 @@ def log_video_debug(msg):
     except:
         pass
 
+@dataclass
+class RenderProfile:
+    """작업 단위 인코딩 설정 (서비스 공용 설정을 바꾸지 않고 렌더링 요청별로 적용)"""
+    name: str
+    resolution: str             # FFmpeg 형식 해상도 (예: "1920x1080")
+    fps: int
+    preset: str
+    bitrate: str
+    audio_bitrate: str = "192k"
+    audio_channels: int = 2
+
+    def encode_args(self) -> List[str]:
+        """libx264 + AAC 출력 인코딩 옵션"""
+        return self.video_encode_args() + self.audio_encode_args()
+
+    def video_encode_args(self) -> List[str]:
+        """libx264 비디오 인코딩 옵션"""
+        return [
+            '-c:v', 'libx264',
+            '-preset', self.preset,
+            '-pix_fmt', 'yuv420p',
+            '-r', str(self.fps),
+            '-b:v', self.bitrate,
+        ]
+
+    def audio_encode_args(self) -> List[str]:
+        """AAC 오디오 인코딩 옵션"""
+        return [
+            '-c:a', 'aac',
+            '-b:a', self.audio_bitrate,
+            '-ar', '44100',
+            '-ac', str(self.audio_channels)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RenderProgress:
+    """
+    씬별 FFmpeg 진행 상황(인코딩된 초)을 모아 전체 진행률 / 처리 속도(실시간 배율) / 남은 시간 계산
+
+    병렬 워커에서 동시에 호출되므로 lock으로 보호하고,
+    FFmpeg 진행 보고(초당 수 회)는 min_interval 간격으로만 콜백에 전달한다.
+    """
+
+    def __init__(self, durations: List[float],
+                 progress_callback: Optional[Callable] = None,
+                 telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 start: int = 10, span: int = 70, min_interval: float = 0.5):
+        self.durations = [max(float(d or 0), 0.001) for d in durations]
+        self.total = sum(self.durations)
+        self.encoded = [0.0] * len(self.durations)
+        self.completed = 0
+        self.encoder_speed: Optional[float] = None
+        self.progress_callback = progress_callback
+        self.telemetry_callback = telemetry_callback
+        self.start = start
+        self.span = span
+        self.min_interval = min_interval
+        self.started_at = time.time()
+        self._last_report = 0.0
+        self.lock = threading.Lock()
+
+    def update(self, index: int, out_seconds: float, speed: Optional[float] = None):
+        """FFmpeg 진행 보고 반영 (씬 인덱스, 인코딩된 출력 초, FFmpeg speed 값)"""
+        with self.lock:
+            self.encoded[index] = max(self.encoded[index], min(out_seconds, self.durations[index]))
+            if speed:
+                self.encoder_speed = speed
+            if time.time() - self._last_report < self.min_interval:
+                return
+            self._report_locked(None)
+
+    def scene_done(self, index: int):
+        """씬 완료 (캐시 적중 / 대체 세그먼트 포함)"""
+        with self.lock:
+            self.encoded[index] = self.durations[index]
+            self.completed += 1
+            self._report_locked(f"씬 {self.completed}/{len(self.durations)} 완료")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> Dict[str, Any]:
+        done = sum(self.encoded)
+        elapsed = time.time() - self.started_at
+        # 전체 처리 속도: 인코딩된 타임라인 초 / 경과 시간 (병렬 워커 합산)
+        speed = done / elapsed if elapsed > 0 and done > 0 else None
+        eta = (self.total - done) / speed if speed else None
+        return {
+            "stage": "render",
+            "percent": round(done / self.total * 100, 1) if self.total else 0,
+            "encodedSeconds": round(done, 2),
+            "totalSeconds": round(self.total, 2),
+            "completedScenes": self.completed,
+            "totalScenes": len(self.durations),
+            "speed": round(speed, 2) if speed else None,
+            "encoderSpeed": self.encoder_speed,
+            "elapsedSeconds": round(elapsed, 1),
+            "etaSeconds": round(eta, 1) if eta is not None else None
+        }
+
+    def _report_locked(self, message: Optional[str]):
+        self._last_report = time.time()
+        details = self._snapshot_locked()
+        if self.progress_callback:
+            progress = self.start + int(details["percent"] / 100 * self.span)
+            if message is None:
+                message = f"렌더링 중 {details['percent']:.0f}%"
+                if details["speed"]:
+                    message += f" ({details['speed']:.1f}x"
+                    if details["etaSeconds"] is not None:
+                        message += f", 남은 시간 약 {details['etaSeconds']:.0f}초"
+                    message += ")"
+            self.progress_callback(progress, message)
+        if self.telemetry_callback:
+            self.telemetry_callback(details)
+
+
+class EncodeSpeedEstimator:
+    """
+    프리셋 + 해상도별 인코딩 속도(실시간 배율 = 영상 초 / 실제 소요 초)를 측정값으로 갱신하여
+    FFmpeg 타임아웃 계산
+
+    고정 타임아웃은 느린 프리셋/긴 씬에서 거의 끝난 인코딩을 죽이고 검은 화면으로 대체하게 만든다.
+    측정값은 지수 이동 평균(EWMA)으로 반영하고 파일에 저장하여 재시작 후에도 유지한다.
+    측정값이 없으면 프리셋별 보수적인 1080p 기준값을 픽셀 수에 비례해 조정하여 사용한다.
+    """
+
+    # 1080p 기준 예상 실시간 배율 (저사양 장비 기준으로 보수적으로 설정)
+    PRESET_PRIORS = {
+        "ultrafast": 3.0, "superfast": 2.0, "veryfast": 1.5, "faster": 1.0, "fast": 0.8,
+        "medium": 0.5, "slow": 0.25, "slower": 0.15, "veryslow": 0.08
+    }
+    REFERENCE_PIXELS = 1920 * 1080
+    # 병합 단계(비디오 복사 + 오디오 인코딩)의 보수적인 실시간 배율
+    CONCAT_SPEED = 20.0
+    # 이보다 짧게 끝난 실행은 프로세스 시작 비용이 대부분이라 속도 측정에서 제외
+    MIN_SAMPLE_SECONDS = 0.5
+
+    def __init__(self, state_path: Optional[str] = None, alpha: float = 0.3,
+                 safety: float = 3.0, min_timeout: float = 60.0, overhead: float = 30.0):
+        self.state_path = state_path
+        self.alpha = alpha
+        self.safety = safety
+        self.min_timeout = min_timeout
+        self.overhead = overhead
+        self.estimates: Dict[str, Dict[str, Any]] = {}  # "preset@해상도" -> {"speed", "samples"}
+        self.lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def key(profile: RenderProfile) -> str:
+        return f"{profile.preset}@{profile.resolution}"
+
+    def _load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.estimates = json.load(f)
+        except Exception as e:
+            log_video_debug(f"[WARN] 인코딩 속도 기록 읽기 실패 - 기본값 사용: {e}")
+            self.estimates = {}
+
+    def _save_locked(self):
+        if not self.state_path:
+            return
+        try:
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.estimates, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            log_video_debug(f"[WARN] 인코딩 속도 기록 저장 실패: {e}")
+
+    def prior(self, profile: RenderProfile) -> float:
+        """측정값이 없을 때의 예상 실시간 배율 (해상도 픽셀 수에 반비례)"""
+        base = self.PRESET_PRIORS.get(profile.preset, self.PRESET_PRIORS["medium"])
+        try:
+            w, h = (int(v) for v in profile.resolution.split('x'))
+            pixels = max(w * h, 1)
+        except ValueError:
+            pixels = self.REFERENCE_PIXELS
+        return base * self.REFERENCE_PIXELS / pixels
+
+    def estimate(self, profile: RenderProfile) -> float:
+        """현재 예상 실시간 배율"""
+        with self.lock:
+            entry = self.estimates.get(self.key(profile))
+        return entry["speed"] if entry else self.prior(profile)
+
+    def record(self, profile: RenderProfile, media_seconds: float, wall_seconds: float):
+        """인코딩 1회 측정값 반영 (타임아웃으로 끝난 경우 wall_seconds=타임아웃 → 예상 속도가 낮아짐)"""
+        if media_seconds <= 0 or wall_seconds < self.MIN_SAMPLE_SECONDS:
+            return
+        measured = media_seconds / wall_seconds
+        key = self.key(profile)
+        with self.lock:
+            entry = self.estimates.get(key)
+            if entry:
+                entry["speed"] = round(self.alpha * measured + (1 - self.alpha) * entry["speed"], 4)
+                entry["samples"] += 1
+            else:
+                entry = {"speed": round(measured, 4), "samples": 1}
+                self.estimates[key] = entry
+            self._save_locked()
+
+    def timeout(self, profile: RenderProfile, media_seconds: float) -> float:
+        """영상 길이 / 예상 속도 x 안전 배수 + 시작 오버헤드 (최소 min_timeout초)"""
+        speed = max(self.estimate(profile), 0.001)
+        return round(max(self.min_timeout, float(media_seconds) / speed * self.safety + self.overhead), 1)
+
+    def concat_timeout(self, media_seconds: float) -> float:
+        """세그먼트 병합(비디오 스트림 복사 + 오디오 인코딩) 타임아웃 - 인코딩보다 빠르므로 기존 300초를 하한으로 사용"""
+        return round(max(300.0, float(media_seconds) / self.CONCAT_SPEED * self.safety + self.overhead), 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {key: dict(entry) for key, entry in self.estimates.items()}
+
+
 class VideoService:
     """최종 영상 합성 서비스"""
     
@@ -68,6 +306,37 @@ class VideoService:
         "square": "1080x1080"
     }
 
+    # 렌더링 엔진: 씬별 세그먼트 + concat / 전체 타임라인 단일 필터 그래프
+    RENDER_ENGINES = ("segments", "single_pass")
+
+    # Ken Burns(팬) 모드에서 정지 이미지를 목표 해상도보다 크게 만드는 비율 (crop 창이 이동할 여유분)
+    KEN_BURNS_SCALE = 1.1
+
+    # 오디오 처리 방식: auto (공용 마스터 오디오 감지 시 master), per_scene (씬별 오디오 인코딩), master (마스터 오디오 1회 mux)
+    AUDIO_MODES = ("auto", "per_scene", "master")
+
+    # 스트림 복사 클립이 인코딩 세그먼트와 같아야 하는 x264 옵션 (SPS/PPS와 디코딩 방식을 결정)
+    # concat 결과 MP4는 첫 세그먼트의 SPS/PPS(avcC) 하나만 가지므로 다르면 디코딩이 깨짐
+    X264_STREAM_OPTIONS = (
+        "cabac", "ref", "deblock", "8x8dct", "cqm", "chroma_qp_offset", "bframes", "b_pyramid",
+        "weightb", "weightp", "interlaced", "constrained_intra", "rc"
+    )
+
+    # x264 SEI(인코딩 옵션 문자열)를 찾을 때 읽는 파일 앞부분 크기 (faststart면 moov 뒤에 위치)
+    X264_SEI_SCAN_BYTES = 8 << 20
+
+    # 렌더링 프로필 - final: 서비스 설정(update_settings) 그대로 사용, draft: 빠른 미리보기용 저화질
+    RENDER_PROFILES = {
+        "final": {},
+        "draft": {
+            "short_side": 480,
+            "preset": "ultrafast",
+            "bitrate": "800k",
+            "audio_bitrate": "64k",
+            "audio_channels": 1
+        }
+    }
+
     def __init__(self):
         self.output_dir = OUTPUT_DIR
         # 기본 해상도를 1920x1080으로 바로 설정
@@ -76,6 +345,38 @@ class VideoService:
         self.preset = "medium"
         self.bitrate = "8M"  # 기본 비트레이트 상향
 
+        # 병렬 씬 렌더링 설정 (코어 수 기반, VIDEO_PARALLEL_RENDER=0 이면 순차 처리)
+        self.parallel_render = os.getenv("VIDEO_PARALLEL_RENDER", "1") != "0"
+        self.render_workers, self.ffmpeg_threads = self._plan_render_parallelism()
+
+        # 세그먼트 캐시 사용 여부 (SEGMENT_CACHE_ENABLED=0 이면 항상 재인코딩)
+        self.segment_cache_enabled = os.getenv("SEGMENT_CACHE_ENABLED", "1") != "0"
+
+        # 렌더링 설정과 일치하는 영상 클립은 스트림 복사 (VIDEO_STREAM_COPY=0 이면 항상 재인코딩)
+        self.stream_copy_enabled = os.getenv("VIDEO_STREAM_COPY", "1") != "0"
+
+        # 대체(검은 화면) 세그먼트 단위 생성 잠금
+        self._filler_lock = threading.Lock()
+
+        # x264 인코딩 옵션 캐시 (클립 지문 / 프로필 설정 → 옵션, 스트림 복사 판단용)
+        self._x264_options_cache: Dict[Any, Optional[Dict[str, str]]] = {}
+        self._x264_options_lock = threading.Lock()
+
+        # 이미지 씬 고속 경로 (Pillow로 1회 축소/패딩 + 1초 단위 반복, VIDEO_STILL_FAST_PATH=0 이면 기존 방식)
+        self.still_image_fast_path = os.getenv("VIDEO_STILL_FAST_PATH", "1") != "0"
+        # 이미지 씬 기본 Ken Burns(느린 팬) 적용 여부 (요청별로 ken_burns 인자로 변경 가능)
+        self.ken_burns = os.getenv("VIDEO_KEN_BURNS", "0") == "1"
+
+        # 기본 렌더링 엔진 (요청별로 render_engine 인자로 변경 가능)
+        self.render_engine = os.getenv("VIDEO_RENDER_ENGINE", "segments")
+        if self.render_engine not in self.RENDER_ENGINES:
+            self.render_engine = "segments"
+
+        # 오디오 처리 방식 (요청별로 audio_mode 인자로 변경 가능)
+        self.audio_mode = os.getenv("VIDEO_AUDIO_MODE", "auto")
+        if self.audio_mode not in self.AUDIO_MODES:
+            self.audio_mode = "auto"
+
         # FFmpeg 설치 확인
         self._check_ffmpeg()
 
@@ -84,14 +385,108 @@ class VideoService:
         self.processing_dir = os.path.join(tempfile.gettempdir(), "realhunalo_video_temp")
         os.makedirs(self.processing_dir, exist_ok=True)
 
+        # 렌더링별 매니페스트 + 세그먼트 폴더 (백엔드 재시작 후 이어서 렌더링)
+        self.renders_dir = os.path.join(self.processing_dir, "renders")
+        os.makedirs(self.renders_dir, exist_ok=True)
+        self._manifest_lock = threading.Lock()
+
+        # 현재 스레드가 처리 중인 작업 ID (FFmpeg 프로세스를 작업에 등록하여 취소 시 종료)
+        self._render_context = threading.local()
+
+        # FFmpeg 타임아웃 = 영상 길이 / 측정된 인코딩 속도 x 안전 배수 (VIDEO_TIMEOUT_SAFETY, VIDEO_TIMEOUT_MIN)
+        try:
+            timeout_safety = max(1.0, float(os.getenv("VIDEO_TIMEOUT_SAFETY", "3")))
+        except ValueError:
+            timeout_safety = 3.0
+        try:
+            timeout_min = max(10.0, float(os.getenv("VIDEO_TIMEOUT_MIN", "60")))
+        except ValueError:
+            timeout_min = 60.0
+        self.encode_speed = EncodeSpeedEstimator(
+            state_path=os.path.join(self.processing_dir, "encode_speed.json"),
+            safety=timeout_safety, min_timeout=timeout_min
+        )
+
         log_video_debug("\n" + "="*60)
         log_video_debug("[VideoService] 초기화 완료")
         log_video_debug(f"   - 해상도: {self.resolution}")
         log_video_debug(f"   - FPS: {self.fps}")
         log_video_debug(f"   - 프리셋: {self.preset}")
         log_video_debug(f"   - 비트레이트: {self.bitrate}")
+        log_video_debug(f"   - 병렬 렌더링: {self.parallel_render} ({self.render_workers} workers x {self.ffmpeg_threads} threads)")
         log_video_debug("="*60 + "\n")
 
+    def _plan_render_parallelism(self) -> Tuple[int, int]:
+        """
+        코어 수에서 동시 세그먼트 인코딩 수와 프로세스당 FFmpeg -threads 값 결정
+
+        libx264는 프로세스당 스레드가 늘수록 효율이 떨어지므로
+        16코어 기준 4개 프로세스 x 4스레드 형태로 나눈다.
+        환경변수 VIDEO_RENDER_WORKERS / VIDEO_FFMPEG_THREADS로 재정의 가능.
+        """
+        cpu_count = os.cpu_count() or 1
+        if cpu_count >= 8:
+            threads = 4
+        elif cpu_count >= 4:
+            threads = 2
+        else:
+            threads = 1
+        # 4K 세그먼트 동시 인코딩 시 메모리 사용량을 고려해 최대 8개로 제한
+        workers = max(1, min(8, cpu_count // threads))
+
+        try:
+            workers = max(1, int(os.getenv("VIDEO_RENDER_WORKERS", workers)))
+        except ValueError:
+            pass
+        try:
+            threads = max(1, int(os.getenv("VIDEO_FFMPEG_THREADS", threads)))
+        except ValueError:
+            pass
+
+        return workers, threads
+
+    def _normalize_resolution(self, resolution: Optional[str] = None) -> str:
+        """해상도 별칭("1080p", "shorts" 등)을 FFmpeg 형식("WxH")으로 변환"""
+        target_resolution = resolution if resolution else self.resolution
+        if target_resolution.lower() in self.RESOLUTION_MAP:
+            target_resolution = self.RESOLUTION_MAP[target_resolution.lower()]
+        return target_resolution
+
+    def get_render_profile(self, profile: Optional[str] = None, resolution: Optional[str] = None) -> RenderProfile:
+        """
+        렌더링 프로필 생성 (서비스 공용 설정은 변경하지 않음)
+
+        Args:
+            profile: 프로필 이름 ("final", "draft"), None이면 final
+            resolution: 해상도 오버라이드 (draft는 이 해상도의 비율을 유지한 채 축소)
+        """
+        name = (profile or "final").lower()
+        if name not in self.RENDER_PROFILES:
+            raise ValueError(f"지원하지 않는 렌더링 프로필입니다: {name} (지원: {', '.join(self.RENDER_PROFILES)})")
+
+        overrides = self.RENDER_PROFILES[name]
+        target_resolution = self._normalize_resolution(resolution)
+
+        short_side = overrides.get("short_side")
+        if short_side:
+            # 종횡비를 유지하며 짧은 변을 short_side로 축소 (libx264는 짝수 크기 필요)
+            w, h = (int(v) for v in target_resolution.split('x'))
+            scale = short_side / min(w, h)
+            if scale < 1:
+                w = int(round(w * scale / 2)) * 2
+                h = int(round(h * scale / 2)) * 2
+                target_resolution = f"{w}x{h}"
+
+        return RenderProfile(
+            name=name,
+            resolution=target_resolution,
+            fps=overrides.get("fps", self.fps),
+            preset=overrides.get("preset", self.preset),
+            bitrate=overrides.get("bitrate", self.bitrate),
+            audio_bitrate=overrides.get("audio_bitrate", "192k"),
+            audio_channels=overrides.get("audio_channels", 2)
+        )
+
     def _check_ffmpeg(self):
         """FFmpeg 설치 확인"""
         try:
@@ -110,18 +505,295 @@ class VideoService:
         except Exception as e:
             print(f"[WARN] FFmpeg 확인 실패: {e}")
 
+    def _run_ffmpeg(self, cmd: List[str], timeout: float,
+                    on_progress: Optional[Callable[[float, Optional[float]], None]] = None,
+                    cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+        """
+        FFmpeg 실행 (진행 상황 파싱 + 현재 렌더링 작업에 프로세스 등록, 취소 시 즉시 종료)
+
+        렌더링 중 실행하는 모든 FFmpeg 명령은 이 메서드를 거친다.
+
+        Raises:
+            subprocess.TimeoutExpired: timeout 초과 시 (프로세스는 종료됨)
+        """
+        return run_ffmpeg(cmd, timeout, on_progress=on_progress, cwd=cwd,
+                          task_id=getattr(self._render_context, "task_id", None))
+
     def _has_audio(self, file_path: str) -> bool:
-        """파일에 오디오 스트림이 있는지 확인"""
-        try:
-            cmd = [
-                'ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type',
-                '-of', 'csv=p=0', file_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return 'audio' in result.stdout
-        except Exception as e:
-            print(f"[VideoService] ffprobe 실패: {e}")
+        """파일에 오디오 스트림이 있는지 확인 (공용 미디어 정보 캐시 사용)"""
+        return media_probe_service.has_audio(file_path)
+
+    def _probe_video_stream(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        첫 번째 비디오 스트림 정보 조회 (스트림 복사 가능 여부 판단용, 공용 미디어 정보 캐시 사용)
+
+        Returns:
+            {"codec", "profile", "width", "height", "pix_fmt", "fps", "cfr", "sar"} 또는 None
+        """
+        return media_probe_service.video_info(file_path)
+
+    def _is_stream_copy_compatible(self, file_path: str, profile: RenderProfile) -> bool:
+        """
+        영상이 이미 렌더링 설정(H.264, 해상도, CFR fps, yuv420p, x264 인코딩 옵션)과 일치하는지 확인
+
+        일치하면 재인코딩 없이 스트림 복사로 잘라 붙여도 concat 결과가 다른 세그먼트와 호환된다.
+        concat은 SPS/PPS를 하나만 남기므로 코덱/프로필 이름만 같고 엔트로피 코딩(CABAC/CAVLC),
+        참조 프레임 수 등이 다른 클립(다른 인코더나 프리셋)은 복사하지 않는다.
+        """
+        info = self._probe_video_stream(file_path)
+        if not info:
             return False
+        w, h = (int(v) for v in profile.resolution.split('x'))
+        if not (
+            info["codec"] == "h264"
+            and (info["width"], info["height"]) == (w, h)
+            and info["pix_fmt"] == "yuv420p"
+            and info["cfr"]
+            and abs(info["fps"] - profile.fps) < 0.01
+            and info["sar"] in (None, "1:1", "0:1", "N/A")
+        ):
+            return False
+
+        clip_options = self._clip_x264_options(file_path)
+        profile_options = self._profile_x264_options(profile)
+        if not clip_options or not profile_options:
+            # x264가 아닌 인코더이거나 옵션을 알 수 없으면 재인코딩
+            return False
+        return all(clip_options.get(key) == profile_options.get(key) for key in self.X264_STREAM_OPTIONS)
+
+    @staticmethod
+    def _parse_x264_options(data: bytes) -> Optional[Dict[str, str]]:
+        """x264 SEI의 "options: cabac=1 ref=3 ..." 문자열을 dict로 변환 (없으면 None)"""
+        start = data.find(b"x264 - core ")
+        if start < 0:
+            return None
+        options_at = data.find(b" - options: ", start)
+        if options_at < 0:
+            return None
+        end = data.find(b"\x00", options_at)
+        text = data[options_at + len(b" - options: "):end if end >= 0 else None].decode("ascii", "replace")
+        options = {}
+        for item in text.split():
+            key, sep, value = item.partition("=")
+            if sep:
+                options[key] = value
+        return options or None
+
+    def _clip_x264_options(self, file_path: str) -> Optional[Dict[str, str]]:
+        """클립의 x264 인코딩 옵션 (파일 앞부분의 SEI에서 읽음, 파일 지문 기준 캐시)"""
+        fingerprint = media_probe_service.fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        with self._x264_options_lock:
+            if fingerprint in self._x264_options_cache:
+                return self._x264_options_cache[fingerprint]
+        try:
+            with open(file_path, 'rb') as f:
+                options = self._parse_x264_options(f.read(self.X264_SEI_SCAN_BYTES))
+        except OSError:
+            return None
+        with self._x264_options_lock:
+            self._x264_options_cache[fingerprint] = options
+        return options
+
+    def _profile_x264_options(self, profile: RenderProfile) -> Optional[Dict[str, str]]:
+        """
+        렌더링 프로필로 인코딩한 세그먼트의 x264 옵션 (프레임 1개를 인코딩해 SEI를 읽음, 설정별 캐시)
+
+        Returns:
+            옵션 dict (FFmpeg/libx264 실행 실패 시 None)
+        """
+        key = ("profile",) + tuple(profile.video_encode_args()) + (profile.resolution,)
+        with self._x264_options_lock:
+            if key in self._x264_options_cache:
+                return self._x264_options_cache[key]
+        cmd = [
+            'ffmpeg', '-v', 'error', '-f', 'lavfi',
+            '-i', f'color=black:s={profile.resolution}:r={profile.fps}:d=1',
+            '-frames:v', '1'
+        ] + profile.video_encode_args() + ['-f', 'h264', '-']
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+            options = self._parse_x264_options(result.stdout) if result.returncode == 0 else None
+        except (OSError, subprocess.TimeoutExpired) as e:
+            log_video_debug(f"[WARN] 프로필 x264 옵션 확인 실패: {e}")
+            return None
+        if options:
+            with self._x264_options_lock:
+                self._x264_options_cache[key] = options
+        return options
+
+    def _covers_duration(self, file_path: str, duration: float) -> bool:
+        """파일 길이가 duration 이상인지 확인 (길이를 알 수 없으면 False, 공용 미디어 정보 캐시 사용)"""
+        info = media_probe_service.probe(file_path)
+        media_duration = info.get("duration") if info else None
+        return bool(media_duration) and media_duration + 0.01 >= float(duration)
+
+    def _resolve_local_path(self, url: str) -> Optional[str]:
+        """
+        로컬 URL(/output/..., /assets/..., localhost:8000/...)을 실제 파일 경로로 변환 (복사 없음)
+
+        Returns:
+            로컬 파일 경로 (data: URI나 외부 HTTP URL이면 None)
+
+        Raises:
+            Exception: 로컬 URL이지만 파일을 찾을 수 없는 경우
+        """
+        from urllib.parse import unquote
+        from .utils import OUTPUT_DIR, ASSETS_DIR
+
+        if url.startswith('data:'):
+            return None
+
+        if url.startswith('/') or ('localhost' not in url and '127.0.0.1' not in url and '://' not in url):
+            # 상대 경로 (/output/..., /assets/...) 또는 로컬 파일명 처리
+            # 경로 정규화 (앞의 / 제거)
+            clean_url = url.lstrip('/')
+            decoded_url = unquote(clean_url)
+
+            if decoded_url.startswith('output/'):
+                filename = decoded_url.replace('output/', '', 1)
+                source_path = os.path.join(OUTPUT_DIR, filename)
+            elif decoded_url.startswith('assets/') or decoded_url.startswith('uploads/'):
+                filename = decoded_url.split('/')[-1]
+                source_path = os.path.join(ASSETS_DIR, filename)
+            else:
+                # 기본적으로 ASSETS_DIR에서 찾기 시도
+                source_path = os.path.join(ASSETS_DIR, os.path.basename(decoded_url))
+
+        elif 'localhost:8000' in url or '127.0.0.1:8000' in url:
+            # 로컬 서버 절대 URL 처리
+            decoded_url = unquote(url)
+
+            if '/output/' in decoded_url:
+                filename = decoded_url.split('/output/')[-1]
+                source_path = os.path.join(OUTPUT_DIR, filename)
+            elif '/assets/' in decoded_url or '/uploads/' in decoded_url:
+                filename = decoded_url.split('/')[-1]
+                source_path = os.path.join(ASSETS_DIR, filename)
+            else:
+                raise Exception(f"로컬 URL 경로 인식 실패: {url}")
+        else:
+            return None
+
+        if not os.path.exists(source_path):
+            raise Exception(f"로컬 파일을 찾을 수 없음: {source_path}")
+        return source_path
+
+    def _mezzanine_visual(self, scene: Dict, visual_url: Optional[str], profile: RenderProfile) -> Optional[str]:
+        """
+        백그라운드에서 미리 변환해 둔 메자닌 클립이 있으면 그 URL로 대체 (스트림 복사 대상이 됨)
+
+        원본 URL + 렌더링 규격으로 결정되는 파일명으로 조회하므로 프로젝트에 따로 기록하지 않는다.
+        """
+        if not visual_url or visual_url == "undefined" or self._is_image(self._get_file_extension(visual_url)):
+            return visual_url
+
+        mezzanine_url = mezzanine_service.lookup(visual_url, profile.resolution, profile.fps)
+        if mezzanine_url:
+            log_video_debug(f"[VideoService] 메자닌 클립 사용: {mezzanine_url}")
+            return mezzanine_url
+        return visual_url
+
+    def _resolve_input(self, url: str, dest_dir: str, name: str) -> str:
+        """
+        입력 URL을 FFmpeg가 읽을 수 있는 로컬 경로로 변환
+        로컬 파일은 복사 없이 원본 경로를 그대로 사용하고, data: URI / 외부 URL만 dest_dir에 저장
+        """
+        source_path = self._resolve_local_path(url)
+        if source_path:
+            return source_path
+
+        output_path = os.path.join(dest_dir, f"{name}{self._get_file_extension(url)}")
+        self._download_file(url, output_path)
+        return output_path
+
+    @staticmethod
+    def _parse_media_fragment(url: str) -> Tuple[str, Optional[str], float, Optional[float]]:
+        """
+        Media Fragment(#t=start,end) 분리
+
+        Returns:
+            (fragment를 제거한 URL, fragment 문자열, 시작 초, 종료 초 또는 None)
+        """
+        if '#t=' not in url:
+            return url, None, 0.0, None
+
+        clean_url, fragment = url.split('#t=', 1)
+        parts = fragment.split(',')
+        start, end = 0.0, None
+        try:
+            start = float(parts[0]) if parts[0] else 0.0
+        except ValueError:
+            pass
+        if len(parts) > 1:
+            try:
+                end = float(parts[1])
+            except ValueError:
+                pass
+        return clean_url, fragment, start, end
+
+    def _detect_master_audio(self, scenes: List[Dict]) -> Optional[Dict[str, Any]]:
+        """
+        모든 씬이 같은 오디오 파일의 구간(#t=start,end)을 가리키는지 확인 (AudioSegmentationService 결과)
+
+        마스터 오디오를 그대로 쓰면 씬 경계마다 오디오를 자르고 재인코딩할 필요가 없으므로,
+        씬 영상 길이는 "다음 씬 시작 - 현재 씬 시작"으로 맞춰 타임라인이 마스터 오디오와 어긋나지 않게 한다.
+        (마지막 씬은 구간 종료 시각까지, 종료 시각이 없으면 씬 duration 사용)
+
+        Returns:
+            {"url", "start", "durations", "total"} 또는 None (마스터 오디오 방식 사용 불가)
+        """
+        if not scenes:
+            return None
+
+        master_url = None
+        starts: List[float] = []
+        last_end = None
+        for scene in scenes:
+            audio_url = scene.get('audioUrl')
+            if not audio_url or audio_url == "undefined" or '#t=' not in audio_url:
+                return None
+            clean_url, _, start, end = self._parse_media_fragment(audio_url)
+            if master_url is None:
+                master_url = clean_url
+            elif clean_url != master_url:
+                return None
+            if starts and start <= starts[-1]:
+                return None
+            starts.append(start)
+            last_end = end
+
+        durations = [round(starts[i + 1] - starts[i], 3) for i in range(len(starts) - 1)]
+        last_scene = scenes[-1]
+        if last_end is not None and last_end > starts[-1]:
+            durations.append(round(last_end - starts[-1], 3))
+        else:
+            durations.append(float(last_scene.get('duration', 5)))
+
+        # 비주얼 오디오를 섞어야 하는 씬이 있으면 씬별 오디오 처리 필요
+        for scene in scenes:
+            visual_url = scene.get('visualUrl') or scene.get('generatedUrl')
+            if not visual_url or visual_url == "undefined" or scene.get('videoVolume', 1.0) == 0:
+                continue
+            if self._is_image(self._get_file_extension(visual_url)):
+                continue
+            if visual_url.startswith('data:'):
+                return None
+            try:
+                probe_path = self._resolve_local_path(visual_url) or visual_url
+            except Exception:
+                # 파일이 없으면 렌더링 시 검은 화면으로 대체되므로 오디오도 없음
+                continue
+            if self._has_audio(probe_path):
+                return None
+
+        return {
+            "url": master_url,
+            "start": starts[0],
+            "durations": durations,
+            "total": round(sum(durations), 3)
+        }
 
     def _download_file(self, url: str, output_path: str):
         """URL에서 파일 다운로드 (http://, data: URI 또는 상대 경로 처리)"""
@@ -142,62 +814,20 @@ class VideoService:
                     f.write(decoded)
                 log_video_debug(f"[OK] Base64 데이터 저장: {output_path} ({len(decoded)} bytes)")
             
-            elif url.startswith('/') or ('localhost' not in url and '127.0.0.1' not in url and '://' not in url):
-                # 상대 경로 (/output/..., /assets/...) 또는 로컬 파일명 처리
-                import shutil
-                from urllib.parse import unquote
-                from .utils import OUTPUT_DIR, ASSETS_DIR
-                
-                # 경로 정규화 (앞의 / 제거)
-                clean_url = url.lstrip('/')
-                decoded_url = unquote(clean_url)
-                
-                if decoded_url.startswith('output/'):
-                    filename = decoded_url.replace('output/', '', 1)
-                    source_path = os.path.join(OUTPUT_DIR, filename)
-                elif decoded_url.startswith('assets/') or decoded_url.startswith('uploads/'):
-                    filename = decoded_url.split('/')[-1]
-                    source_path = os.path.join(ASSETS_DIR, filename)
-                else:
-                    # 기본적으로 ASSETS_DIR에서 찾기 시도
-                    source_path = os.path.join(ASSETS_DIR, os.path.basename(decoded_url))
-                
-                log_video_debug(f"[Local Direct] {source_path} -> {output_path}")
-                if not os.path.exists(source_path):
-                    raise Exception(f"로컬 파일을 찾을 수 없음: {source_path}")
-                
-                shutil.copy(source_path, output_path)
-                log_video_debug(f"[OK] 로컬 파일 직접 복사 완료: {output_path}")
-
-            elif 'localhost:8000' in url or '127.0.0.1:8000' in url:
-                # 로컬 서버 절대 URL 처리
-                import shutil
-                from urllib.parse import unquote
-                from .utils import OUTPUT_DIR, ASSETS_DIR
-                
-                decoded_url = unquote(url)
-                
-                if '/output/' in decoded_url:
-                    filename = decoded_url.split('/output/')[-1]
-                    source_path = os.path.join(OUTPUT_DIR, filename)
-                elif '/assets/' in decoded_url or '/uploads/' in decoded_url:
-                    filename = decoded_url.split('/')[-1]
-                    source_path = os.path.join(ASSETS_DIR, filename)
-                else:
-                    raise Exception(f"로컬 URL 경로 인식 실패: {url}")
-
-                log_video_debug(f"[Local Copy] {source_path} -> {output_path}")
-                if not os.path.exists(source_path):
-                    raise Exception(f"로컬 파일을 찾을 수 없음: {source_path}")
-
-                shutil.copy(source_path, output_path)
-                log_video_debug(f"[OK] 로컬 파일 복사 완료: {output_path}")
             else:
-                # 외부 HTTP URL에서 다운로드
-                import urllib.request
-                log_video_debug(f"[Download] {url[:80]}... -> {output_path}")
-                urllib.request.urlretrieve(url, output_path)
-                log_video_debug(f"[OK] 다운로드 완료: {output_path}")
+                source_path = self._resolve_local_path(url)
+                if source_path:
+                    # 로컬 파일 복사
+                    import shutil
+                    log_video_debug(f"[Local Copy] {source_path} -> {output_path}")
+                    shutil.copy(source_path, output_path)
+                    log_video_debug(f"[OK] 로컬 파일 복사 완료: {output_path}")
+                else:
+                    # 외부 HTTP URL에서 다운로드
+                    import urllib.request
+                    log_video_debug(f"[Download] {url[:80]}... -> {output_path}")
+                    urllib.request.urlretrieve(url, output_path)
+                    log_video_debug(f"[OK] 다운로드 완료: {output_path}")
 
             # 파일 존재 확인
             if not os.path.exists(output_path):
@@ -448,24 +1078,38 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                        duration: float, output_path: str,
                        progress_callback: Optional[Callable] = None,
                        video_volume: float = 1.0,
-                       resolution: Optional[str] = None) -> bool:
-        """단일 씬 세그먼트 생성 (개선된 버전)"""
+                       resolution: Optional[str] = None,
+                       threads: Optional[int] = None,
+                       use_cache: Optional[bool] = None,
+                       profile: Optional[RenderProfile] = None,
+                       video_only: bool = False,
+                       render_info: Optional[Dict[str, Any]] = None,
+                       ken_burns: Optional[bool] = None) -> bool:
+        """
+        단일 씬 세그먼트 생성 (개선된 버전)
+
+        threads: FFmpeg -threads 값 (병렬 렌더링 시 프로세스당 스레드 제한, None이면 FFmpeg 자동)
+        use_cache: 입력 파일/설정이 같은 세그먼트가 캐시에 있으면 인코딩 없이 재사용 (None이면 서비스 설정)
+        profile: 작업별 인코딩 설정 (None이면 resolution + 서비스 설정으로 final 프로필 구성)
+        video_only: 오디오 트랙 없이 영상만 인코딩 (마스터 오디오를 마지막에 한 번만 mux하는 경우)
+        render_info: 전달 시 처리 방식("copied", "encoded", "cached")을 "mode" 키, FFmpeg 속도 배율을 "speed" 키에 기록
+        progress_callback: FFmpeg 진행 콜백 (인코딩된 초, 속도 배율)
+        ken_burns: 이미지 씬에 느린 팬 효과 적용 (None이면 서비스 설정)
+        """
         temp_dir = None
         try:
-            # 해상도 결정 (오버라이드 우선)
-            target_resolution = resolution if resolution else self.resolution
-            # "shorts" 등의 별칭 처리
-            if target_resolution.lower() in self.RESOLUTION_MAP:
-                target_resolution = self.RESOLUTION_MAP[target_resolution.lower()]
-                
+            # 인코딩 설정 결정 (작업별 프로필 우선, "shorts" 등의 해상도 별칭 처리 포함)
+            if profile is None:
+                profile = self.get_render_profile("final", resolution)
+            target_resolution = profile.resolution
+
             temp_dir = tempfile.mkdtemp()
             log_video_debug(f"[VideoService] 임시 디렉토리 생성: {temp_dir}")
 
-            # FFmpeg 명령 구성
-            cmd = ['ffmpeg', '-y']
-
-            # Visual 입력 처리
+            # Visual 입력 처리 (이미지 고속 경로 준비는 캐시 조회 후로 미룸)
             visual_path = None
+            visual_is_image = False
+            visual_inputs: List[str] = []
             has_visual_audio = False
             if visual_url and visual_url != "undefined":
                 try:
@@ -480,43 +1124,30 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
                     # 비디오 파일인지 확인 및 오디오 스트림 확인
                     is_image = self._is_image(visual_ext)
+                    visual_is_image = is_image
                     if not is_image:
                         has_visual_audio = self._has_audio(visual_path)
-
-                    if is_image:
-                        # 이미지인 경우 루프
-                        log_video_debug(f"[VideoService] 이미지 모드: 루프 재생")
-                        cmd.extend(['-loop', '1', '-i', visual_path])
-                    else:
                         # 비디오인 경우 (duration 제한은 -i 앞에 위치해야 해당 입력에만 적용됨)
                         log_video_debug(f"[VideoService] 비디오 모드 (오디오 스트림: {has_visual_audio})")
-                        cmd.extend(['-t', str(duration), '-i', visual_path])
+                        visual_inputs = ['-t', str(duration), '-i', visual_path]
 
                 except Exception as e:
                     log_video_debug(f"[X] Visual 처리 실패: {e}")
                     log_video_debug(f"[WARN] 검은 화면으로 대체")
                     visual_path = None
+                    visual_is_image = False
                     has_visual_audio = False
 
-            if not visual_path:
-                # 검은 화면
-                log_video_debug(f"[VideoService] 검은 화면 사용")
-                cmd.extend(['-f', 'lavfi', '-i', f'color=black:s={target_resolution}:d={duration}'])
+            use_ken_burns = visual_is_image and (self.ken_burns if ken_burns is None else ken_burns)
 
             # Audio 입력 처리
             audio_path = None
-            if audio_url and audio_url != "undefined":
+            audio_fragment = None
+            audio_inputs: List[str] = []
+            if audio_url and audio_url != "undefined" and not video_only:
                 try:
                     # Fragment 처리 (#t=start,end)
-                    audio_seek = 0.0
-                    clean_audio_url = audio_url
-                    
-                    if '#t=' in audio_url:
-                        clean_audio_url, fragment = audio_url.split('#t=')
-                        try:
-                            audio_seek = float(fragment.split(',')[0])
-                        except:
-                            pass
+                    clean_audio_url, audio_fragment, audio_seek, _ = self._parse_media_fragment(audio_url)
 
                     audio_ext = self._get_file_extension(clean_audio_url)
                     audio_path = os.path.join(temp_dir, f'audio{audio_ext}')
@@ -529,20 +1160,93 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
                     # Seeking & Trimming
                     if audio_seek > 0:
-                        cmd.extend(['-ss', str(audio_seek)])
+                        audio_inputs.extend(['-ss', str(audio_seek)])
                     
-                    cmd.extend(['-t', str(duration)])
-                    cmd.extend(['-i', audio_path])
+                    audio_inputs.extend(['-t', str(duration)])
+                    audio_inputs.extend(['-i', audio_path])
 
                 except Exception as e:
                     log_video_debug(f"[X] Audio 처리 실패: {e}")
                     log_video_debug(f"[WARN] 무음으로 대체")
                     audio_path = None
+                    audio_inputs = []
 
-            if not audio_path:
+            if not audio_path and not video_only:
                 # 무음
                 log_video_debug(f"[VideoService] 무음 사용")
-                cmd.extend(['-f', 'lavfi', '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100:d={duration}'])
+                audio_inputs = ['-f', 'lavfi', '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100:d={duration}']
+
+            # 세그먼트 캐시 조회 (입력 파일 내용 + 인코딩 설정이 같으면 재사용)
+            # 이미지 사전 처리/단위 인코딩 전에 조회하고, 키는 고속 경로 성공 여부와 무관하게 구성
+            cache_key = None
+            cache_enabled = self.segment_cache_enabled if use_cache is None else use_cache
+            if cache_enabled:
+                cache_key = segment_cache.make_key(
+                    files={"visual": visual_path, "audio": audio_path},
+                    visual_ext=os.path.splitext(visual_path)[1].lower() if visual_path else None,
+                    audio_fragment=audio_fragment if audio_path else None,
+                    duration=float(duration),
+                    video_volume=float(video_volume),
+                    resolution=target_resolution,
+                    fps=profile.fps,
+                    preset=profile.preset,
+                    bitrate=profile.bitrate,
+                    audio_bitrate=profile.audio_bitrate,
+                    audio_channels=profile.audio_channels,
+                    video_only=video_only,
+                    ken_burns=use_ken_burns,
+                    pipeline=SEGMENT_PIPELINE_VERSION
+                )
+                if segment_cache.get(cache_key, output_path):
+                    log_video_debug(f"[OK] 세그먼트 캐시 적중: {cache_key[:12]} -> {output_path}")
+                    if render_info is not None:
+                        render_info["mode"] = "cached"
+                    return True
+
+            still_mode = None  # "still" / "ken_burns" (이미지 고속 경로), None이면 기존 방식
+            if visual_is_image:
+                still_path = None
+                if self.still_image_fast_path:
+                    still_path = self._prepare_still_image(visual_path, profile, temp_dir, use_ken_burns)
+
+                unit_path = None
+                if still_path and not use_ken_burns:
+                    unit_path = self._encode_still_unit(still_path, profile, temp_dir, threads)
+
+                if unit_path:
+                    # 1초 단위 세그먼트를 스트림 복사로 반복 (씬 길이와 무관하게 1초 분량만 인코딩)
+                    still_mode = "still"
+                    log_video_debug(f"[VideoService] 이미지 고속 모드: 1초 단위 반복")
+                    visual_inputs = ['-stream_loop', '-1', '-i', unit_path]
+                elif still_path and use_ken_burns:
+                    # 크게 만든 이미지를 출력 fps로 루프하고 crop 창만 이동 (프레임마다 스케일링 없음)
+                    still_mode = "ken_burns"
+                    log_video_debug(f"[VideoService] 이미지 고속 모드: ken_burns")
+                    visual_inputs = ['-loop', '1', '-framerate', str(profile.fps), '-i', still_path]
+                else:
+                    # 이미지인 경우 루프
+                    log_video_debug(f"[VideoService] 이미지 모드: 루프 재생")
+                    visual_inputs = ['-loop', '1', '-i', visual_path]
+
+            if not visual_path:
+                # 검은 화면
+                log_video_debug(f"[VideoService] 검은 화면 사용")
+                visual_inputs = ['-f', 'lavfi', '-i', f'color=black:s={target_resolution}:d={duration}']
+
+            # FFmpeg 명령 구성 (입력 0: 비주얼, 입력 1: 오디오)
+            cmd = ['ffmpeg', '-y'] + visual_inputs + audio_inputs
+
+            # 스마트 렌더: 이미 렌더링 설정과 일치하는 영상은 재인코딩 없이 스트림 복사로 자르기만 함
+            stream_copy = bool(
+                visual_path and not visual_is_image and self.stream_copy_enabled
+                and self._is_stream_copy_compatible(visual_path, profile)
+            )
+            # 마스터 오디오 모드는 -shortest로 함께 잘리지 않으므로 씬보다 짧은 클립은 패딩 필요 (복사 불가)
+            if stream_copy and video_only and not self._covers_duration(visual_path, duration):
+                log_video_debug(f"[VideoService] 클립이 씬보다 짧아 패딩 인코딩 (스트림 복사 안 함)")
+                stream_copy = False
+            if stream_copy:
+                log_video_debug(f"[VideoService] 스트림 복사 모드 (코덱/해상도/fps 일치)")
 
             # 비디오 필터 구성 (자막 기능 제거 - Vrew 내보내기로 대체)
             w, h = target_resolution.split('x')
@@ -551,12 +1255,31 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2",
                 "setsar=1/1"
             ]
+            if still_mode == "ken_burns":
+                # 크게 만든 이미지에서 목표 해상도 창을 씬 길이 동안 대각선으로 이동 (스케일링 없이 crop만)
+                progress_expr = f"min(t/{float(duration)},1)"
+                v_filters = [
+                    f"crop={w}:{h}:x='(iw-ow)*{progress_expr}':y='(ih-oh)*{progress_expr}'",
+                    "setsar=1/1",
+                    "format=yuv420p"
+                ]
+            elif video_only and visual_path and not visual_is_image:
+                # 씬보다 짧은 클립은 마지막 프레임을 유지해 씬 길이를 채움 (단일 패스 그래프와 동일)
+                # 짧아지면 이후 씬이 모두 마스터 오디오와 어긋남
+                v_filters.append(f"tpad=stop_mode=clone:stop_duration={duration}")
 
             # FFmpeg 필터 구성 개선 (단순화된 버전)
             complex_filters = []
             
-            # 비디오 필터
-            complex_filters.append(f"[0:v]{','.join(v_filters)}[v_out]")
+            # 비디오 필터 (스트림 복사/이미지 단위 반복 시 필터 없이 입력 비디오 스트림 사용)
+            copy_video = stream_copy or still_mode == "still"
+            if not copy_video:
+                complex_filters.append(f"[0:v]{','.join(v_filters)}[v_out]")
+            video_map = '0:v:0' if copy_video else '[v_out]'
+            video_args = ['-c:v', 'copy'] if copy_video else profile.video_encode_args()
+            if still_mode == "still":
+                # 무한 반복 입력이므로 씬 길이만큼의 프레임에서 정확히 자름
+                video_args = video_args + ['-frames:v', str(max(1, int(round(float(duration) * profile.fps))))]
             
             # 오디오 필터 구성 - 모든 경우에 대해 단순화
             input_count = len(cmd) // 2  # -i 옵션의 개수 (대략적 추정)
@@ -568,7 +1291,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             log_video_debug(f"[VideoService] 입력 개수: {input_count}, 비주얼 오디오: {has_visual_audio}")
             
             # 오디오 처리 로직 개선 - video_volume 적용 보장
-            if audio_path and has_visual_audio:
+            if video_only:
+                # 오디오는 최종 단계에서 마스터 오디오로 mux
+                pass
+            elif audio_path and has_visual_audio:
                 # 비주얼 오디오 + TTS 오디오 모두 있는 경우
                 complex_filters.append(f"[0:a]volume={actual_volume}[v_audio]")
                 complex_filters.append(f"[v_audio][1:a]amix=inputs=2:duration=first[a_out]")
@@ -584,23 +1310,20 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             # FFmpeg filter_complex는 체인 구분자로 반드시 세미콜론(;) 사용 (공백 불가)
             filter_str = ';'.join(complex_filters)
-            cmd.extend(['-filter_complex', filter_str])
-            cmd.extend(['-map', '[v_out]', '-map', '[a_out]'])
-
-            # 출력 옵션
-            cmd.extend([
-                '-c:v', 'libx264',
-                '-preset', self.preset,
-                '-pix_fmt', 'yuv420p',
-                '-r', str(self.fps),
-                '-b:v', self.bitrate,
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-ar', '44100',
-                '-ac', '2',
-                '-shortest',
-                output_path
-            ])
+            if filter_str:
+                cmd.extend(['-filter_complex', filter_str])
+            if video_only:
+                cmd.extend(['-map', video_map, '-an'])
+                # 이미지 루프 입력은 길이가 없으므로 씬 길이로 제한
+                cmd.extend(video_args + ['-t', str(duration)])
+            else:
+                cmd.extend(['-map', video_map, '-map', '[a_out]'])
+                # 출력 옵션
+                cmd.extend(video_args + profile.audio_encode_args())
+                cmd.append('-shortest')
+            if threads:
+                cmd.extend(['-threads', str(threads)])
+            cmd.append(output_path)
             
             # 볼륨 로깅
             if video_volume == 0:
@@ -610,7 +1333,28 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             log_video_debug(f"  {' '.join(cmd)}\n")
 
             # FFmpeg 실행 (현재 디렉토리를 temp_dir로 설정하여 ass=sub.ass가 동작)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, errors='replace', cwd=temp_dir)
+            last_speed: List[Optional[float]] = [None]
+
+            def on_ffmpeg_progress(out_seconds: float, speed: Optional[float]):
+                if speed:
+                    last_speed[0] = speed
+                if progress_callback:
+                    progress_callback(out_seconds, speed)
+
+            # 타임아웃 = 씬 길이 / 측정된 인코딩 속도 x 안전 배수 (고정 120초는 느린 프리셋/긴 씬에서 부족)
+            encode_timeout = self.encode_speed.timeout(profile, duration)
+            encode_started = time.time()
+            try:
+                result = self._run_ffmpeg(cmd, timeout=encode_timeout, on_progress=on_ffmpeg_progress, cwd=temp_dir)
+            except subprocess.TimeoutExpired:
+                log_video_debug(f"[X] FFmpeg 타임아웃 ({encode_timeout}초, 씬 {duration}초) - 예상 인코딩 속도 하향")
+                if not copy_video:
+                    self.encode_speed.record(profile, duration, encode_timeout)
+                return False
+
+            # 스트림 복사(클립 복사, 정지 이미지 루프)는 인코딩 속도 측정에서 제외
+            if result.returncode == 0 and not copy_video:
+                self.encode_speed.record(profile, duration, time.time() - encode_started)
 
             if result.returncode != 0:
                 log_video_debug(f"[X] FFmpeg 실행 실패 (코드: {result.returncode})")
@@ -627,6 +1371,14 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             file_size = os.path.getsize(output_path)
             log_video_debug(f"[OK] 세그먼트 생성 완료: {output_path} ({file_size} bytes)")
 
+            # 스트림 복사 결과는 다시 만들어도 비용이 적으므로 캐시하지 않음
+            # ken_burns 사전 처리에 실패해 팬 효과 없이 만든 결과도 같은 키로 저장하지 않음
+            if cache_key and not stream_copy and not (use_ken_burns and still_mode != "ken_burns"):
+                segment_cache.put(cache_key, output_path)
+
+            if render_info is not None:
+                render_info["mode"] = "copied" if stream_copy else "encoded"
+                render_info["speed"] = last_speed[0]
             return True
 
         except Exception as e:
@@ -645,37 +1397,199 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 except Exception as e:
                     log_video_debug(f"[WARN] 임시 디렉토리 정리 실패: {e}")
 
-    def _create_empty_segment(self, duration: float, output_path: str, resolution: Optional[str] = None) -> bool:
-        """빈 세그먼트 생성 (검은 화면 + 무음)"""
+    def _create_empty_segment(self, duration: float, output_path: str, resolution: Optional[str] = None,
+                              threads: Optional[int] = None,
+                              profile: Optional[RenderProfile] = None,
+                              video_only: bool = False) -> bool:
+        """
+        빈 세그먼트 생성 (검은 화면 + 무음, video_only면 검은 화면만)
+
+        캐시된 1초 단위 대체 세그먼트를 -stream_loop + 스트림 복사로 원하는 길이만큼 이어 붙이므로
+        인코딩 없이 수 밀리초에 끝난다. 단위 세그먼트를 준비하지 못하면 직접 인코딩.
+        """
+        if profile is None:
+            profile = self.get_render_profile("final", resolution)
+
+        # 단위 세그먼트는 렌더링 폴더로 하드링크/복사하여 사용 (읽는 동안 캐시 정리로 삭제되지 않도록)
+        unit_path = f"{os.path.splitext(output_path)[0]}_filler_unit.mp4"
+        if self._get_filler_unit(profile, unit_path, video_only):
+            try:
+                cmd = [
+                    'ffmpeg', '-y',
+                    '-stream_loop', '-1', '-i', unit_path,
+                    '-t', str(duration),
+                    '-c', 'copy',
+                    output_path
+                ]
+                result = self._run_ffmpeg(cmd, timeout=60)
+                if result.returncode == 0 and os.path.exists(output_path):
+                    log_video_debug(f"[OK] 빈 세그먼트 생성 완료 (캐시된 단위 반복): {output_path} ({duration}초)")
+                    return True
+                log_video_debug(f"[WARN] 대체 세그먼트 반복 실패 - 직접 인코딩: {result.stderr[-300:]}")
+            except Exception as e:
+                log_video_debug(f"[WARN] 대체 세그먼트 반복 오류 - 직접 인코딩: {e}")
+            finally:
+                if os.path.exists(unit_path):
+                    os.remove(unit_path)
+
+        return self._encode_empty_segment(duration, output_path, threads=threads, profile=profile,
+                                          video_only=video_only)
+
+    def _prepare_still_image(self, image_path: str, profile: RenderProfile, temp_dir: str,
+                             ken_burns: bool = False) -> Optional[str]:
+        """
+        이미지를 목표 해상도로 한 번만 축소/패딩하여 저장 (FFmpeg가 프레임마다 스케일링하지 않도록)
+
+        ken_burns면 팬 여유분(KEN_BURNS_SCALE)만큼 크게 만든다.
+
+        Returns:
+            준비된 PNG 경로 (Pillow가 없거나 처리 실패 시 None → 기존 방식 사용)
+        """
         try:
-            # 해상도 결정
-            target_resolution = resolution if resolution else self.resolution
-            if target_resolution.lower() in self.RESOLUTION_MAP:
-                target_resolution = self.RESOLUTION_MAP[target_resolution.lower()]
-                
+            from PIL import Image
+        except ImportError:
+            return None
+
+        try:
+            w, h = (int(v) for v in profile.resolution.split('x'))
+            if ken_burns:
+                w = int(round(w * self.KEN_BURNS_SCALE / 2)) * 2
+                h = int(round(h * self.KEN_BURNS_SCALE / 2)) * 2
+
+            with Image.open(image_path) as img:
+                img.load()
+                if img.mode in ("RGBA", "LA", "P"):
+                    # 투명 영역은 기존 pad 색상과 같은 검정 배경으로 합성
+                    rgba = img.convert("RGBA")
+                    frame = Image.new("RGB", rgba.size, (0, 0, 0))
+                    frame.paste(rgba, mask=rgba.split()[-1])
+                else:
+                    frame = img.convert("RGB")
+
+            ratio = min(w / frame.width, h / frame.height)
+            size = (max(1, round(frame.width * ratio)), max(1, round(frame.height * ratio)))
+            if size != frame.size:
+                frame = frame.resize(size, Image.LANCZOS)
+
+            canvas = Image.new("RGB", (w, h), (0, 0, 0))
+            canvas.paste(frame, ((w - size[0]) // 2, (h - size[1]) // 2))
+
+            still_path = os.path.join(temp_dir, "still.png")
+            canvas.save(still_path, compress_level=1)
+            return still_path
+
+        except Exception as e:
+            log_video_debug(f"[WARN] 이미지 사전 처리 실패 - 기존 방식 사용: {e}")
+            return None
+
+    def _encode_still_unit(self, still_path: str, profile: RenderProfile, temp_dir: str,
+                           threads: Optional[int] = None) -> Optional[str]:
+        """
+        준비된 이미지로 1초(GOP 1개) 길이의 비디오 단위 세그먼트 인코딩
+
+        정지 화면은 모든 프레임이 같으므로 1초만 인코딩하고 나머지는 -stream_loop 스트림 복사로 채운다.
+
+        Returns:
+            단위 세그먼트 경로 (실패 시 None → 기존 방식 사용)
+        """
+        unit_path = os.path.join(temp_dir, "still_unit.mp4")
+        cmd = [
+            'ffmpeg', '-y',
+            '-loop', '1', '-framerate', '1', '-i', still_path,
+            '-vf', f"setsar=1/1,fps={profile.fps},format=yuv420p",
+            '-t', '1'
+        ] + profile.video_encode_args() + [
+            '-g', str(profile.fps), '-keyint_min', str(profile.fps), '-sc_threshold', '0', '-an'
+        ]
+        if 'libx264' in cmd:
+            # 정지 화면용 튜닝 (디블로킹 약화, 세부 묘사 보존)
+            cmd.extend(['-tune', 'stillimage'])
+        if threads:
+            cmd.extend(['-threads', str(threads)])
+        cmd.append(unit_path)
+
+        try:
+            result = self._run_ffmpeg(cmd, timeout=self.encode_speed.timeout(profile, 1))
+            if result.returncode != 0 or not os.path.exists(unit_path):
+                log_video_debug(f"[WARN] 이미지 단위 세그먼트 인코딩 실패 - 기존 방식 사용: {result.stderr[-300:]}")
+                return None
+            return unit_path
+        except Exception as e:
+            log_video_debug(f"[WARN] 이미지 단위 세그먼트 인코딩 오류 - 기존 방식 사용: {e}")
+            return None
+
+    def _get_filler_unit(self, profile: RenderProfile, dest_path: str, video_only: bool = False) -> bool:
+        """
+        1초 길이의 검은 화면(+무음) 단위 세그먼트를 dest_path에 배치 (없으면 한 번 인코딩하여 세그먼트 캐시에 저장)
+
+        해상도/fps/프리셋/비트레이트별로 한 번만 만들어지며, 1초마다 키프레임이 오도록 GOP를 fps로 고정.
+        씬 세그먼트 캐시 적중률이 왜곡되지 않도록 통계에는 포함하지 않는다.
+        """
+        key = segment_cache.make_key(
+            kind="filler_unit",
+            resolution=profile.resolution,
+            fps=profile.fps,
+            preset=profile.preset,
+            bitrate=profile.bitrate,
+            audio_bitrate=profile.audio_bitrate,
+            audio_channels=profile.audio_channels,
+            video_only=video_only,
+            pipeline=SEGMENT_PIPELINE_VERSION
+        )
+        # 병렬 워커가 동시에 같은 단위를 인코딩하지 않도록 잠금
+        with self._filler_lock:
+            if segment_cache.get(key, dest_path, track_stats=False):
+                return True
+
+            unit_path = os.path.join(self.processing_dir, f"filler_unit_{uuid.uuid4().hex[:8]}.mp4")
+            try:
+                if not self._encode_empty_segment(1, unit_path, profile=profile, video_only=video_only,
+                                                  gop=profile.fps):
+                    return False
+                if segment_cache.put(key, unit_path, metadata={"kind": "filler_unit", **profile.to_dict()}):
+                    log_video_debug(f"[OK] 대체 세그먼트 단위 캐시 저장: {profile.resolution} {profile.fps}fps {profile.preset}")
+                import shutil
+                shutil.move(unit_path, dest_path)
+                return True
+            finally:
+                if os.path.exists(unit_path):
+                    os.remove(unit_path)
+
+    def _encode_empty_segment(self, duration: float, output_path: str,
+                              threads: Optional[int] = None,
+                              profile: Optional[RenderProfile] = None,
+                              video_only: bool = False,
+                              gop: Optional[int] = None) -> bool:
+        """검은 화면(+무음) 세그먼트를 직접 인코딩"""
+        try:
+            # 인코딩 설정 결정
+            if profile is None:
+                profile = self.get_render_profile("final")
+            target_resolution = profile.resolution
+
             log_video_debug(f"[VideoService] 빈 세그먼트 생성 중: {duration}초, {target_resolution}")
             
             # FFmpeg 명령: 검은 화면 + 무음
-            cmd = [
-                'ffmpeg', '-y',
-                '-f', 'lavfi', '-i', f'color=black:s={target_resolution}:d={duration}',
-                '-f', 'lavfi', '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100:d={duration}',
-                '-c:v', 'libx264',
-                '-preset', self.preset,
-                '-pix_fmt', 'yuv420p',
-                '-r', str(self.fps),
-                '-b:v', self.bitrate,
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-ar', '44100',
-                '-ac', '2',
-                '-shortest',
-                output_path
-            ]
+            if video_only:
+                cmd = [
+                    'ffmpeg', '-y',
+                    '-f', 'lavfi', '-i', f'color=black:s={target_resolution}:r={profile.fps}:d={duration}'
+                ] + profile.video_encode_args() + ['-an']
+            else:
+                cmd = [
+                    'ffmpeg', '-y',
+                    '-f', 'lavfi', '-i', f'color=black:s={target_resolution}:r={profile.fps}:d={duration}',
+                    '-f', 'lavfi', '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100:d={duration}'
+                ] + profile.encode_args() + ['-shortest']
+            if gop:
+                cmd.extend(['-g', str(gop), '-keyint_min', str(gop), '-sc_threshold', '0'])
+            if threads:
+                cmd.extend(['-threads', str(threads)])
+            cmd.append(output_path)
             
             log_video_debug(f"[VideoService] 빈 세그먼트 FFmpeg 명령: {' '.join(cmd)}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, errors='replace')
+            result = self._run_ffmpeg(cmd, timeout=self.encode_speed.timeout(profile, duration))
             
             if result.returncode != 0:
                 log_video_debug(f"[X] 빈 세그먼트 생성 실패 (코드: {result.returncode})")
@@ -696,22 +1610,545 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             log_video_debug(traceback.format_exc())
             return False
 
+    def _render_scene(self, i: int, scene: Dict, total_scenes: int,
+                      resolution: Optional[str] = None,
+                      threads: Optional[int] = None,
+                      use_cache: Optional[bool] = None,
+                      profile: Optional[RenderProfile] = None,
+                      video_only: bool = False,
+                      on_progress: Optional[Callable[[int, float, Optional[float]], None]] = None,
+                      ken_burns: Optional[bool] = None,
+                      task_id: Optional[str] = None
+                      ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        단일 씬을 세그먼트 파일로 렌더링 (실패 시 검은 화면 + 무음 세그먼트로 대체)
+
+        on_progress: FFmpeg 진행 콜백 (씬 인덱스, 인코딩된 초, 속도 배율)
+        ken_burns: 이미지 씬 팬 효과 (None이면 서비스 설정)
+        task_id: 작업 ID - 취소된 작업이면 렌더링하지 않고 TaskCancelledError 발생
+
+        Returns:
+            (생성된 세그먼트 경로 - 빈 세그먼트 생성까지 실패하면 None,
+             처리 정보 {"mode": "copied"/"encoded"/"cached"/"filler"/"failed", "seconds": 소요 시간, "speed": 속도 배율})
+        """
+        visual_url = scene.get('visualUrl') or scene.get('generatedUrl')
+        audio_url = scene.get('audioUrl')
+        duration = scene.get('duration', 5)
+        scene_id = scene.get('sceneId', i+1)
+        visual_url = self._mezzanine_visual(scene, visual_url, profile or self.get_render_profile("final", resolution))
+
+        log_video_debug(f"\n[VideoService] 씬 {i+1}/{total_scenes} 처리 중 (ID: {scene_id})...")
+        log_video_debug(f"  - Visual: {visual_url}")
+        log_video_debug(f"  - Audio: {audio_url}")
+        log_video_debug(f"  - Duration: {duration}초")
+        log_video_debug(f"  - Scene data: {list(scene.keys())}")
+
+        # 세그먼트 생성 (임시 폴더 사용)
+        segment_file = os.path.join(self.processing_dir, f"segment_{i}_{uuid.uuid4().hex[:8]}.mp4")
+
+        video_volume = scene.get('videoVolume', 1.0)
+        render_info: Dict[str, Any] = {}
+        started_at = time.time()
+
+        def finish(path: Optional[str], mode: str) -> Tuple[Optional[str], Dict[str, Any]]:
+            info = {
+                "mode": mode,
+                "seconds": round(time.time() - started_at, 3),
+                "speed": render_info.get("speed") if mode == render_info.get("mode") else None
+            }
+            log_video_debug(f"[VideoService] 씬 {i+1} 렌더링 통계: {mode}, {info['seconds']}초, "
+                            f"speed={info['speed'] or '-'}x")
+            return path, info
+
+        scene_progress = (lambda t, sp: on_progress(i, t, sp)) if on_progress else None
+
+        # 취소된 작업이면 새 씬을 시작하지 않음 (워커 스레드의 FFmpeg도 작업에 등록)
+        task_manager.check_cancelled(task_id)
+        previous_task_id = getattr(self._render_context, "task_id", None)
+        self._render_context.task_id = task_id
+
+        try:
+            success = self._create_segment(visual_url, audio_url, duration, segment_file,
+                                          progress_callback=scene_progress,
+                                          video_volume=video_volume,
+                                          resolution=resolution,
+                                          threads=threads,
+                                          use_cache=use_cache,
+                                          profile=profile,
+                                          video_only=video_only,
+                                          render_info=render_info,
+                                          ken_burns=ken_burns)
+
+            if success and os.path.exists(segment_file):
+                mode = render_info.setdefault("mode", "encoded")
+                log_video_debug(f"[OK] 씬 {i+1} 세그먼트 생성 완료 ({mode})")
+                return finish(segment_file, mode)
+
+            log_video_debug(f"[WARN] 씬 {i+1} 세그먼트 생성 실패 - success={success}, file_exists={os.path.exists(segment_file) if segment_file else False}")
+            # 취소로 FFmpeg가 종료된 경우 대체 세그먼트를 만들지 않음
+            task_manager.check_cancelled(task_id)
+            # 실패해도 계속 진행 (빈 세그먼트 대신 기본 세그먼트 생성)
+            log_video_debug(f"[INFO] 빈 세그먼트로 대체하여 계속 진행")
+
+            # 빈 세그먼트 생성 (검은 화면 + 무음)
+            empty_segment_file = os.path.join(self.processing_dir, f"empty_{i}_{uuid.uuid4().hex[:8]}.mp4")
+            empty_success = self._create_empty_segment(duration, empty_segment_file, resolution,
+                                                       threads=threads, profile=profile,
+                                                       video_only=video_only)
+            if empty_success and os.path.exists(empty_segment_file):
+                log_video_debug(f"[OK] 씬 {i+1} 빈 세그먼트 생성 완료")
+                return finish(empty_segment_file, "filler")
+
+        except TaskCancelledError:
+            # 종료된 FFmpeg가 남긴 미완성 세그먼트 정리
+            if os.path.exists(segment_file):
+                os.remove(segment_file)
+            raise
+
+        except Exception as e:
+            log_video_debug(f"[ERROR] 씬 {i+1} 처리 중 예외 발생: {e}")
+            import traceback
+            log_video_debug(traceback.format_exc())
+            # 예외 발생해도 계속 진행
+            log_video_debug(f"[INFO] 예외 발생으로 빈 세그먼트 생성")
+            try:
+                empty_segment_file = os.path.join(self.processing_dir, f"empty_except_{i}_{uuid.uuid4().hex[:8]}.mp4")
+                empty_success = self._create_empty_segment(duration, empty_segment_file, resolution,
+                                                       threads=threads, profile=profile,
+                                                       video_only=video_only)
+                if empty_success and os.path.exists(empty_segment_file):
+                    log_video_debug(f"[OK] 씬 {i+1} 예외 처리 후 빈 세그먼트 생성 완료")
+                    return finish(empty_segment_file, "filler")
+            except Exception as e2:
+                log_video_debug(f"[CRITICAL] 빈 세그먼트 생성도 실패: {e2}")
+
+        finally:
+            self._render_context.task_id = previous_task_id
+
+        return finish(None, "failed")
+
+    def _prepare_single_pass_inputs(self, scenes: List[Dict], temp_dir: str,
+                                    profile: Optional[RenderProfile] = None) -> List[Dict[str, Any]]:
+        """
+        단일 패스 렌더링용 씬 입력 정리 (로컬 파일은 복사 없이 원본 경로 사용, 메자닌 클립 우선)
+
+        입력 처리에 실패한 씬은 세그먼트 방식과 동일하게 검은 화면 / 무음으로 대체
+        """
+        if profile is None:
+            profile = self.get_render_profile("final")
+        prepared = []
+        for i, scene in enumerate(scenes):
+            visual_url = self._mezzanine_visual(scene, scene.get('visualUrl') or scene.get('generatedUrl'), profile)
+            audio_url = scene.get('audioUrl')
+            item = {
+                "duration": float(scene.get('duration', 5)),
+                "video_volume": scene.get('videoVolume', 1.0),
+                "visual_path": None,
+                "is_image": False,
+                "has_visual_audio": False,
+                "audio_path": None,
+                "audio_seek": 0.0
+            }
+
+            if visual_url and visual_url != "undefined":
+                try:
+                    item["visual_path"] = self._resolve_input(visual_url, temp_dir, f"visual_{i}")
+                    item["is_image"] = self._is_image(os.path.splitext(item["visual_path"])[1])
+                    if not item["is_image"]:
+                        item["has_visual_audio"] = self._has_audio(item["visual_path"])
+                except Exception as e:
+                    log_video_debug(f"[X] 씬 {i+1} Visual 처리 실패 (검은 화면으로 대체): {e}")
+                    item["visual_path"] = None
+
+            if audio_url and audio_url != "undefined":
+                try:
+                    clean_audio_url, _, audio_seek, _ = self._parse_media_fragment(audio_url)
+                    item["audio_path"] = self._resolve_input(clean_audio_url, temp_dir, f"audio_{i}")
+                    item["audio_seek"] = audio_seek
+                except Exception as e:
+                    log_video_debug(f"[X] 씬 {i+1} Audio 처리 실패 (무음으로 대체): {e}")
+                    item["audio_path"] = None
+
+            prepared.append(item)
+        return prepared
+
+    def _build_single_pass_graph(self, inputs: List[Dict[str, Any]],
+                                 profile: RenderProfile,
+                                 master_audio: Optional[Dict[str, Any]] = None) -> Tuple[List[str], str]:
+        """
+        전체 타임라인을 하나의 FFmpeg 필터 그래프로 구성
+
+        각 씬: scale/pad/fps 정규화 후 씬 길이에 맞춰 trim(부족하면 마지막 프레임 복제),
+        오디오는 44.1kHz 스테레오로 맞춘 뒤 무음 패딩 + trim → 마지막에 concat 필터로 연결
+        master_audio({"path", "start", "total"})가 있으면 씬 오디오 대신 마스터 오디오 구간을 [a_out]으로 사용
+
+        Returns:
+            (FFmpeg 입력 인자 목록, filter_complex 문자열)
+        """
+        target_resolution = profile.resolution
+        w, h = target_resolution.split('x')
+        input_args: List[str] = []
+        filters: List[str] = []
+        concat_pads = []
+        input_index = 0
+
+        for i, item in enumerate(inputs):
+            duration = item["duration"]
+
+            # 비디오 입력 / 소스
+            if item["visual_path"]:
+                if item["is_image"]:
+                    input_args.extend(['-loop', '1', '-t', str(duration), '-i', item["visual_path"]])
+                else:
+                    input_args.extend(['-t', str(duration), '-i', item["visual_path"]])
+                visual_index = input_index
+                input_index += 1
+                video_src = f"[{visual_index}:v]"
+            else:
+                visual_index = None
+                filters.append(f"color=black:s={target_resolution}:r={profile.fps}:d={duration}[vsrc{i}]")
+                video_src = f"[vsrc{i}]"
+
+            filters.append(
+                f"{video_src}scale={w}:{h}:force_original_aspect_ratio=decrease,"
+                f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1/1,fps={profile.fps},format=yuv420p,"
+                f"tpad=stop_mode=clone:stop_duration={duration},"
+                f"trim=duration={duration},setpts=PTS-STARTPTS[v{i}]"
+            )
+
+            if master_audio:
+                concat_pads.append(f"[v{i}]")
+                continue
+
+            # 오디오 입력 / 소스
+            audio_src = None
+            if item["audio_path"]:
+                if item["audio_seek"] > 0:
+                    input_args.extend(['-ss', str(item["audio_seek"])])
+                input_args.extend(['-t', str(duration), '-i', item["audio_path"]])
+                audio_src = f"[{input_index}:a]"
+                input_index += 1
+
+            if item["has_visual_audio"] and visual_index is not None:
+                # video_volume이 0인 경우 완전 음소거 처리
+                volume = 0.000001 if item["video_volume"] == 0 else item["video_volume"]
+                filters.append(f"[{visual_index}:a]volume={volume}[va{i}]")
+                if audio_src:
+                    filters.append(f"[va{i}]{audio_src}amix=inputs=2:duration=longest[amix{i}]")
+                    audio_src = f"[amix{i}]"
+                else:
+                    audio_src = f"[va{i}]"
+
+            if not audio_src:
+                filters.append(f"anullsrc=channel_layout=stereo:sample_rate=44100[asrc{i}]")
+                audio_src = f"[asrc{i}]"
+
+            filters.append(
+                f"{audio_src}aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo,"
+                f"apad,atrim=duration={duration},asetpts=PTS-STARTPTS[a{i}]"
+            )
+            concat_pads.append(f"[v{i}][a{i}]")
+
+        if master_audio:
+            filters.append(f"{''.join(concat_pads)}concat=n={len(inputs)}:v=1:a=0[v_out]")
+            input_args.extend(['-ss', str(master_audio["start"]), '-t', str(master_audio["total"]),
+                               '-i', master_audio["path"]])
+            filters.append(
+                f"[{input_index}:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo,"
+                f"apad,atrim=duration={master_audio['total']},asetpts=PTS-STARTPTS[a_out]"
+            )
+        else:
+            filters.append(f"{''.join(concat_pads)}concat=n={len(inputs)}:v=1:a=1[v_out][a_out]")
+        return input_args, ';\n'.join(filters)
+
+    def _render_single_pass(self, scenes: List[Dict], final_path: str,
+                            profile: RenderProfile,
+                            threads: Optional[int] = None,
+                            master_audio: Optional[Dict[str, Any]] = None,
+                            on_progress: Optional[Callable[[float, Optional[float]], None]] = None) -> bool:
+        """
+        단일 패스 렌더링: 씬별 중간 MP4 없이 전체 타임라인을 한 번에 인코딩
+        (중간 파일 디스크 I/O와 concat 단계의 오디오 재인코딩 제거)
+
+        on_progress: FFmpeg 진행 콜백 (인코딩된 초, 속도 배율)
+        """
+        temp_dir = tempfile.mkdtemp(dir=self.processing_dir)
+        try:
+            inputs = self._prepare_single_pass_inputs(scenes, temp_dir, profile)
+            input_args, filter_graph = self._build_single_pass_graph(inputs, profile, master_audio)
+
+            # 씬이 많으면 명령줄 길이 제한(Windows 32K)을 넘기므로 필터 그래프는 파일로 전달
+            graph_file = os.path.join(temp_dir, "filter_graph.txt")
+            with open(graph_file, 'w', encoding='utf-8') as f:
+                f.write(filter_graph)
+
+            cmd = ['ffmpeg', '-y'] + input_args + [
+                '-filter_complex_script', graph_file,
+                '-map', '[v_out]', '-map', '[a_out]'
+            ] + profile.encode_args()
+            if threads:
+                cmd.extend(['-threads', str(threads)])
+            cmd.append(final_path)
+
+            total_duration = sum(item["duration"] for item in inputs)
+            log_video_debug(f"[VideoService] 단일 패스 렌더링: {len(inputs)}개 씬, {total_duration:.1f}초")
+            log_video_debug(f"  {' '.join(cmd)}")
+
+            encode_timeout = self.encode_speed.timeout(profile, total_duration)
+            encode_started = time.time()
+            try:
+                result = self._run_ffmpeg(cmd, timeout=encode_timeout, on_progress=on_progress)
+            except subprocess.TimeoutExpired:
+                log_video_debug(f"[X] 단일 패스 타임아웃 ({encode_timeout}초, 영상 {total_duration:.1f}초)")
+                self.encode_speed.record(profile, total_duration, encode_timeout)
+                return False
+            if result.returncode != 0 or not os.path.exists(final_path):
+                log_video_debug(f"[X] 단일 패스 렌더링 실패 (코드: {result.returncode})")
+                log_video_debug(f"[X] STDERR: {result.stderr[-1000:]}")
+                return False
+
+            self.encode_speed.record(profile, total_duration, time.time() - encode_started)
+            log_video_debug(f"[OK] 단일 패스 렌더링 완료: {final_path} ({os.path.getsize(final_path)} bytes)")
+            return True
+
+        except Exception as e:
+            log_video_debug(f"[X] 단일 패스 렌더링 오류: {e}")
+            import traceback
+            log_video_debug(traceback.format_exc())
+            return False
+
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _summarize_scenes(scenes: List[Dict], render_scenes: List[Dict],
+                          scene_infos: List[Dict[str, Any]], tracker: "RenderProgress") -> Dict[str, Any]:
+        """
+        씬별 처리 방식(copied/encoded/cached/filler/failed/resumed)과 인코딩 속도 집계
+        (렌더링 서버 사양 산정용 텔레메트리)
+        """
+        modes = [info.get("mode") for info in scene_infos]
+        summary: Dict[str, Any] = {mode: modes.count(mode)
+                                   for mode in ("copied", "encoded", "cached", "filler", "failed", "resumed")}
+        progress = tracker.snapshot()
+        summary["renderSeconds"] = progress["elapsedSeconds"]
+        summary["timelineSeconds"] = progress["totalSeconds"]
+        summary["realtimeFactor"] = progress["speed"]
+        summary["scenes"] = [
+            {
+                "sceneId": scene.get('sceneId', i + 1),
+                "mode": info.get("mode"),
+                "duration": render_scene.get('duration', 5),
+                "seconds": info.get("seconds"),
+                "speed": info.get("speed")
+            }
+            for i, (scene, render_scene, info) in enumerate(zip(scenes, render_scenes, scene_infos))
+        ]
+        return summary
+
+    def _concat_with_master_audio(self, video_files: List[str], master_audio: Dict[str, Any],
+                                  final_path: str, profile: RenderProfile):
+        """
+        영상만 있는 세그먼트를 스트림 복사로 이어붙이면서 마스터 오디오 구간을 한 번에 mux
+        (씬별 오디오 슬라이스/재인코딩이 없어 세그먼트 경계마다 오디오 오차가 누적되지 않음)
+        """
+        concat_file = os.path.join(self.processing_dir, f"concat_{uuid.uuid4().hex[:8]}.txt")
+        with open(concat_file, 'w') as f:
+            for vf in video_files:
+                # Windows 경로를 FFmpeg 형식으로 변환
+                safe_path = vf.replace('\\', '/')
+                f.write(f"file '{safe_path}'\n")
+
+        mux_cmd = [
+            'ffmpeg', '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', concat_file,
+            '-ss', str(master_audio["start"]),
+            '-t', str(master_audio["total"]),
+            '-i', master_audio["path"],
+            '-map', '0:v:0', '-map', '1:a:0',
+            '-c:v', 'copy'
+        ] + profile.audio_encode_args() + [final_path]
+
+        print(f"[VideoService] 세그먼트 병합 + 마스터 오디오 mux 중... "
+              f"(시작 {master_audio['start']}초, 길이 {master_audio['total']}초)")
+        print(f"[VideoService] FFmpeg 명령: {' '.join(mux_cmd)}")
+
+        result = self._run_ffmpeg(mux_cmd, timeout=self.encode_speed.concat_timeout(master_audio["total"]))
+
+        if result.returncode != 0:
+            print(f"[X] FFmpeg 병합 오류: {result.stderr}")
+            raise Exception("영상 병합 실패")
+
+        # 임시 파일 정리
+        os.remove(concat_file)
+        for vf in video_files:
+            if os.path.exists(vf):
+                os.remove(vf)
+
+    def _render_dir(self, render_id: str) -> str:
+        # 작업 ID가 경로로 쓰이므로 파일명에 안전한 문자만 허용
+        safe_id = "".join(c for c in str(render_id) if c.isalnum() or c in "-_")
+        if not safe_id:
+            raise ValueError(f"잘못된 렌더링 ID: {render_id}")
+        return os.path.join(self.renders_dir, safe_id)
+
+    def load_render_manifest(self, render_id: str) -> Optional[Dict[str, Any]]:
+        """렌더링 매니페스트 조회 (없거나 손상되면 None)"""
+        manifest_path = os.path.join(self._render_dir(render_id), "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[WARN] 렌더링 매니페스트 읽기 실패 ({render_id}): {e}")
+            return None
+
+    def _save_render_manifest(self, manifest: Dict[str, Any]):
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체하여 재시작 시 반쯤 쓰인 파일이 남지 않도록)"""
+        render_dir = self._render_dir(manifest["renderId"])
+        os.makedirs(render_dir, exist_ok=True)
+        manifest_path = os.path.join(render_dir, "manifest.json")
+        with self._manifest_lock:
+            manifest["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            tmp_path = f"{manifest_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    def _scene_fingerprint(scene: Dict, profile: RenderProfile, video_only: bool,
+                           ken_burns: Optional[bool]) -> str:
+        """씬 입력 + 인코딩 설정 지문 (이어서 렌더링할 때 바뀐 씬만 다시 렌더링)"""
+        payload = json.dumps({
+            "scene": scene,
+            "profile": profile.to_dict(),
+            "videoOnly": video_only,
+            "kenBurns": ken_burns,
+            "pipeline": SEGMENT_PIPELINE_VERSION
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    def _plan_render_segments(self, manifest: Dict[str, Any], render_scenes: List[Dict],
+                              fingerprints: List[str]) -> List[Dict[str, Any]]:
+        """
+        씬별 세그먼트 계획 작성 (이전 매니페스트에서 지문이 같고 파일이 남아 있는 세그먼트는 완료 유지)
+        """
+        render_dir = self._render_dir(manifest["renderId"])
+        previous = {seg.get("index"): seg for seg in manifest.get("segments", [])}
+        segments = []
+        for i, (scene, fingerprint) in enumerate(zip(render_scenes, fingerprints)):
+            planned = {
+                "index": i,
+                "sceneId": scene.get('sceneId', i + 1),
+                "file": f"segment_{i:04d}.mp4",
+                "duration": scene.get('duration', 5),
+                "fingerprint": fingerprint,
+                "status": "pending",
+                "mode": None
+            }
+            prev = previous.get(i)
+            if (prev and prev.get("status") == "done" and prev.get("fingerprint") == fingerprint
+                    and os.path.exists(os.path.join(render_dir, planned["file"]))):
+                planned["status"] = "done"
+                planned["mode"] = prev.get("mode")
+            segments.append(planned)
+        return segments
+
+    def _cleanup_render_segments(self, render_id: str):
+        """완료된 렌더링의 세그먼트 파일 삭제 (매니페스트는 결과 조회용으로 유지)"""
+        render_dir = self._render_dir(render_id)
+        if not os.path.isdir(render_dir):
+            return
+        for name in os.listdir(render_dir):
+            if name.startswith("segment_"):
+                try:
+                    os.remove(os.path.join(render_dir, name))
+                except OSError:
+                    pass
+
+    def list_resumable_renders(self) -> List[Dict[str, Any]]:
+        """완료되지 않은(중단/실패) 렌더링 목록"""
+        renders = []
+        if not os.path.isdir(self.renders_dir):
+            return renders
+        for render_id in sorted(os.listdir(self.renders_dir)):
+            manifest = self.load_render_manifest(render_id)
+            if not manifest or manifest.get("status") == "completed":
+                continue
+            segments = manifest.get("segments", [])
+            renders.append({
+                "renderId": manifest.get("renderId"),
+                "status": manifest.get("status"),
+                "completedScenes": sum(1 for seg in segments if seg.get("status") == "done"),
+                "totalScenes": len(segments),
+                "updatedAt": manifest.get("updatedAt")
+            })
+        return renders
+
+    def resume_render(self, render_id: str, progress_callback: Optional[Callable] = None,
+                      telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        매니페스트에 저장된 요청으로 렌더링 재개 (완료된 세그먼트는 건너뛰고 남은 씬 + 병합만 수행)
+
+        Raises:
+            ValueError: 매니페스트가 없는 경우
+        """
+        manifest = self.load_render_manifest(render_id)
+        if not manifest:
+            raise ValueError(f"이어서 렌더링할 매니페스트가 없습니다: {render_id}")
+
+        print(f"[VideoService] 렌더링 재개: {render_id}")
+        return self.generate_final_video(progress_callback=progress_callback,
+                                         telemetry_callback=telemetry_callback,
+                                         render_id=render_id,
+                                         task_id=render_id,
+                                         **manifest["request"])
+
     def generate_final_video(self, merged_groups: List[Dict], standalone: List[Dict],
                             resolution: Optional[str] = None,
-                            progress_callback: Optional[Callable] = None) -> str:
+                            progress_callback: Optional[Callable] = None,
+                            parallel: Optional[bool] = None,
+                            use_cache: Optional[bool] = None,
+                            render_engine: Optional[str] = None,
+                            profile: Optional[str] = None,
+                            audio_mode: Optional[str] = None,
+                            telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                            ken_burns: Optional[bool] = None,
+                            render_id: Optional[str] = None,
+                            task_id: Optional[str] = None) -> Dict[str, Any]:
         """
         최종 영상 생성
 
         Args:
             merged_groups: 오디오가 병합된 씬 그룹
             standalone: 독립 씬
-            subtitle_style: 자막 스타일 설정 (enabled, fontFamily, fontSize 등)
             resolution: 해상도 오버라이드 (예: "vertical", "shorts", "1080x1920")
             progress_callback: 진행률 콜백 함수
+            parallel: 씬 병렬 렌더링 여부 (None이면 서비스 설정 사용)
+            use_cache: 세그먼트 캐시 사용 여부 (None이면 서비스 설정 사용)
+            render_engine: "segments" (씬별 세그먼트 + concat) 또는 "single_pass" (단일 필터 그래프)
+            profile: 렌더링 프로필 ("final", "draft") - 서비스 공용 설정을 바꾸지 않고 이 작업에만 적용
+            audio_mode: "auto" (공용 마스터 오디오 감지 시 1회 mux), "per_scene", "master" (None이면 서비스 설정)
+            telemetry_callback: 렌더링 진행 상세(인코딩된 초, 처리 속도, 남은 시간) 콜백
+            ken_burns: 이미지 씬에 느린 팬 효과 적용 (None이면 서비스 설정, segments 엔진에만 적용)
+            render_id: 렌더링 매니페스트 ID (보통 작업 ID) - 지정 시 요청과 세그먼트 완료 상태를 기록하여
+                       백엔드 재시작 후 resume_render로 남은 씬부터 이어서 렌더링
+            task_id: 작업 ID - task_manager.cancel_task로 취소되면 실행 중인 FFmpeg를 종료하고
+                     남은 씬을 렌더링하지 않음 (TaskCancelledError 발생, 중간 파일 삭제)
 
         Returns:
-            생성된 영상 파일 URL
+            렌더링 결과 (videoUrl, profile, renderEngine, audioMode 등)
         """
+        master_dir = None
+        manifest = None
+        final_path = None
+        segment_results: List[Optional[str]] = []
+        previous_task_id = getattr(self._render_context, "task_id", None)
+        self._render_context.task_id = task_id
         try:
             print("\n" + "="*60)
             print("최종 영상 생성 시작")
@@ -729,84 +2166,224 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             if not all_scenes:
                 raise ValueError("씬이 없습니다.")
 
-            # 자막 스타일 설정 초기화
-            subtitle_style = {} # No longer passed as arg, initialize empty
-            subtitle_enabled = subtitle_style.get('enabled', False)
-
             print(f"[VideoService] 총 {len(all_scenes)}개 씬 처리")
 
+            if render_id:
+                manifest = self.load_render_manifest(render_id)
+                if manifest and manifest.get("status") == "completed" and manifest.get("result"):
+                    final_url = manifest["result"].get("videoUrl", "")
+                    if os.path.exists(os.path.join(self.output_dir, os.path.basename(final_url))):
+                        print(f"[OK] 이미 완료된 렌더링: {render_id}")
+                        if progress_callback:
+                            progress_callback(100, "영상 생성 완료!")
+                        return manifest["result"]
+                if not manifest:
+                    manifest = {
+                        "renderId": render_id,
+                        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "finalFilename": None,
+                        "segments": []
+                    }
+                manifest.update({
+                    "status": "rendering",
+                    "error": None,
+                    "result": None,
+                    "request": {
+                        "merged_groups": merged_groups,
+                        "standalone": standalone,
+                        "resolution": resolution,
+                        "render_engine": render_engine,
+                        "profile": profile,
+                        "audio_mode": audio_mode,
+                        "ken_burns": ken_burns
+                    }
+                })
+                self._save_render_manifest(manifest)
+
             if progress_callback:
                 progress_callback(10, f"{len(all_scenes)}개 씬 처리 중...")
 
-            # 각 씬의 비디오/이미지 + 오디오를 처리
-            video_files = []
-            total_scenes = len(all_scenes)
-
-            for i, scene in enumerate(all_scenes):
-                visual_url = scene.get('visualUrl') or scene.get('generatedUrl')
-                audio_url = scene.get('audioUrl')
-                duration = scene.get('duration', 5)
-                srt_data = scene.get('srtData') or scene.get('srt')
-                scene_id = scene.get('sceneId', i+1)
-
-                log_video_debug(f"\n[VideoService] 씬 {i+1}/{total_scenes} 처리 중 (ID: {scene_id})...")
-                log_video_debug(f"  - Visual: {visual_url}")
-                log_video_debug(f"  - Audio: {audio_url}")
-                log_video_debug(f"  - Duration: {duration}초")
-                log_video_debug(f"  - Scene data: {list(scene.keys())}")
-                
-                # 진행률 업데이트 (10% ~ 80%)
-                progress = 10 + int((i / total_scenes) * 70)
-                if progress_callback:
-                    progress_callback(progress, f"씬 {i+1}/{total_scenes} 처리 중...")
+            engine = (render_engine or self.render_engine).lower()
+            if engine not in self.RENDER_ENGINES:
+                raise ValueError(f"지원하지 않는 렌더링 엔진입니다: {engine} (지원: {', '.join(self.RENDER_ENGINES)})")
 
-                # 세그먼트 생성 (임시 폴더 사용)
-                segment_file = os.path.join(self.processing_dir, f"segment_{i}_{uuid.uuid4().hex[:8]}.mp4")
+            render_profile = self.get_render_profile(profile, resolution)
+            print(f"[VideoService] 렌더링 프로필: {render_profile.name} "
+                  f"({render_profile.resolution}, {render_profile.preset}, {render_profile.bitrate})")
 
-                video_volume = scene.get('videoVolume', 1.0)
+            mode = (audio_mode or self.audio_mode).lower()
+            if mode not in self.AUDIO_MODES:
+                raise ValueError(f"지원하지 않는 오디오 방식입니다: {mode} (지원: {', '.join(self.AUDIO_MODES)})")
 
-                # 자막 데이터 디버그 로그
-                if subtitle_enabled:
-                    if srt_data:
-                        log_video_debug(f"  [Subtitle] SRT Data len: {len(srt_data)}")
-                    else:
-                        log_video_debug(f"  [Subtitle] WARN: No SRT Data found for scene {scene_id}")
-
-                try:
-                    success = self._create_segment(visual_url, audio_url, duration, segment_file,
-                                                  progress_callback=progress_callback,
-                                                  video_volume=video_volume,
-                                                  resolution=resolution)
-
-                    if success and os.path.exists(segment_file):
-                        video_files.append(segment_file)
-                        log_video_debug(f"[OK] 씬 {i+1} 세그먼트 생성 완료")
-                    else:
-                        log_video_debug(f"[WARN] 씬 {i+1} 세그먼트 생성 실패 - success={success}, file_exists={os.path.exists(segment_file) if segment_file else False}")
-                        # 실패해도 계속 진행 (빈 세그먼트 대신 기본 세그먼트 생성)
-                        log_video_debug(f"[INFO] 빈 세그먼트로 대체하여 계속 진행")
-                        
-                        # 빈 세그먼트 생성 (검은 화면 + 무음)
-                        empty_segment_file = os.path.join(self.processing_dir, f"empty_{i}_{uuid.uuid4().hex[:8]}.mp4")
-                        empty_success = self._create_empty_segment(duration, empty_segment_file, resolution)
-                        if empty_success and os.path.exists(empty_segment_file):
-                            video_files.append(empty_segment_file)
-                            log_video_debug(f"[OK] 씬 {i+1} 빈 세그먼트 생성 완료")
-                        
-                except Exception as e:
-                    log_video_debug(f"[ERROR] 씬 {i+1} 처리 중 예외 발생: {e}")
-                    import traceback
-                    log_video_debug(traceback.format_exc())
-                    # 예외 발생해도 계속 진행
-                    log_video_debug(f"[INFO] 예외 발생으로 빈 세그먼트 생성")
+            # 모든 씬이 같은 오디오 파일의 구간이면 씬별 오디오 대신 마스터 오디오를 마지막에 1회 mux
+            master_audio = None
+            if mode != "per_scene":
+                master = self._detect_master_audio(all_scenes)
+                if master:
+                    master_dir = tempfile.mkdtemp(dir=self.processing_dir)
                     try:
-                        empty_segment_file = os.path.join(self.processing_dir, f"empty_except_{i}_{uuid.uuid4().hex[:8]}.mp4")
-                        empty_success = self._create_empty_segment(duration, empty_segment_file, resolution)
-                        if empty_success and os.path.exists(empty_segment_file):
-                            video_files.append(empty_segment_file)
-                            log_video_debug(f"[OK] 씬 {i+1} 예외 처리 후 빈 세그먼트 생성 완료")
-                    except Exception as e2:
-                        log_video_debug(f"[CRITICAL] 빈 세그먼트 생성도 실패: {e2}")
+                        master["path"] = self._resolve_input(master["url"], master_dir, "master_audio")
+                        master_audio = master
+                    except Exception as e:
+                        print(f"[WARN] 마스터 오디오 준비 실패 - 씬별 오디오 방식 사용: {e}")
+                elif mode == "master":
+                    print(f"[WARN] 공용 마스터 오디오를 찾지 못해 씬별 오디오 방식 사용")
+
+            render_scenes = all_scenes
+            if master_audio:
+                # 씬 영상 길이를 마스터 오디오 구간 시작 간격에 맞춤 (오디오는 영상 세그먼트에 넣지 않음)
+                render_scenes = [
+                    dict(scene, duration=duration, audioUrl=None)
+                    for scene, duration in zip(all_scenes, master_audio["durations"])
+                ]
+                print(f"[VideoService] 오디오 방식: master ({master_audio['url']}, "
+                      f"{master_audio['start']}초부터 {master_audio['total']}초)")
+            else:
+                print(f"[VideoService] 오디오 방식: per_scene")
+
+            # draft 결과물은 final과 같은 폴더에 접미사로 구분하여 저장
+            suffix = "" if render_profile.name == "final" else f"_{render_profile.name}"
+            final_filename = f"final_video_{uuid.uuid4().hex[:8]}{suffix}.mp4"
+            if manifest:
+                # 이어서 렌더링해도 같은 파일명 유지
+                final_filename = manifest.get("finalFilename") or final_filename
+                manifest["finalFilename"] = final_filename
+            final_path = os.path.join(self.output_dir, final_filename)
+
+            def build_result(used_engine: str, scene_infos: List[Dict[str, Any]],
+                             tracker: RenderProgress) -> Dict[str, Any]:
+                if progress_callback:
+                    progress_callback(100, "영상 생성 완료!")
+                print(f"[OK] 최종 영상 생성 완료: {final_filename}")
+                print("="*60 + "\n")
+                result = {
+                    "success": True,
+                    "videoUrl": f"/output/{final_filename}",
+                    "profile": render_profile.name,
+                    "isDraft": render_profile.name != "final",
+                    "renderSettings": render_profile.to_dict(),
+                    "renderEngine": used_engine,
+                    "audioMode": "master" if master_audio else "per_scene",
+                    "sceneCount": len(all_scenes),
+                    "renderStats": self._summarize_scenes(all_scenes, render_scenes, scene_infos, tracker)
+                }
+                if manifest:
+                    # 세그먼트는 병합 후 삭제되므로 결과만 남겨 재시작 후 조회 시 그대로 반환
+                    manifest.update({"status": "completed", "result": result})
+                    for seg in manifest.get("segments", []):
+                        seg["status"] = "merged"
+                    self._save_render_manifest(manifest)
+                    self._cleanup_render_segments(manifest["renderId"])
+                return result
+
+            if engine == "single_pass":
+                print(f"[VideoService] 렌더링 엔진: single_pass (중간 세그먼트 없이 1회 인코딩)")
+
+                timeline = sum(float(scene.get('duration', 5)) for scene in render_scenes)
+                tracker = RenderProgress([timeline], progress_callback, telemetry_callback, span=80)
+                if self._render_single_pass(render_scenes, final_path, render_profile,
+                                            master_audio=master_audio,
+                                            on_progress=lambda t, sp: tracker.update(0, t, sp)):
+                    scene_infos = [{"mode": "encoded", "seconds": None, "speed": None} for _ in render_scenes]
+                    return build_result("single_pass", scene_infos, tracker)
+
+                # 단일 패스 실패 시 기존 세그먼트 방식으로 재시도 (취소로 종료된 경우 제외)
+                task_manager.check_cancelled(task_id)
+                print(f"[WARN] 단일 패스 렌더링 실패 - 세그먼트 방식으로 재시도")
+                if os.path.exists(final_path):
+                    os.remove(final_path)
+
+            # 각 씬의 비디오/이미지 + 오디오를 처리
+            total_scenes = len(render_scenes)
+            video_only = master_audio is not None
+            use_parallel = self.parallel_render if parallel is None else parallel
+            workers = min(self.render_workers, total_scenes) if use_parallel else 1
+            # 순차 처리 시에는 스레드 수를 FFmpeg 자동 설정에 맡김
+            threads = self.ffmpeg_threads if workers > 1 else None
+            cache_enabled = self.segment_cache_enabled if use_cache is None else use_cache
+
+            print(f"[VideoService] 렌더링 모드: {'병렬' if workers > 1 else '순차'} ({workers} workers, threads={threads or 'auto'})")
+
+            # 완료 순서와 무관하게 씬 순서대로 결과를 보관
+            segment_results = [None] * total_scenes
+            scene_infos: List[Dict[str, Any]] = [{"mode": "failed"} for _ in range(total_scenes)]
+
+            # 진행률 업데이트 (10% ~ 80%) - FFmpeg가 실제로 인코딩한 타임라인 초 기준
+            tracker = RenderProgress([scene.get('duration', 5) for scene in render_scenes],
+                                     progress_callback, telemetry_callback)
+
+            pending = list(range(total_scenes))
+            if manifest:
+                # 매니페스트에 완료로 기록된 세그먼트는 다시 인코딩하지 않음
+                fingerprints = [self._scene_fingerprint(scene, render_profile, video_only, ken_burns)
+                                for scene in render_scenes]
+                manifest["segments"] = self._plan_render_segments(manifest, render_scenes, fingerprints)
+                self._save_render_manifest(manifest)
+                render_dir = self._render_dir(manifest["renderId"])
+                for seg in manifest["segments"]:
+                    if seg["status"] == "done":
+                        i = seg["index"]
+                        segment_results[i] = os.path.join(render_dir, seg["file"])
+                        scene_infos[i] = {"mode": "resumed", "seconds": 0.0, "speed": None}
+                        tracker.scene_done(i)
+                pending = [seg["index"] for seg in manifest["segments"] if seg["status"] != "done"]
+                print(f"[VideoService] 매니페스트: {total_scenes - len(pending)}개 세그먼트 재사용, "
+                      f"{len(pending)}개 렌더링")
+
+            def record_segment(i: int):
+                # 렌더링된 세그먼트를 매니페스트의 고정 경로로 옮기고 완료 기록
+                if not manifest or not segment_results[i]:
+                    return
+                seg = manifest["segments"][i]
+                planned_path = os.path.join(self._render_dir(manifest["renderId"]), seg["file"])
+                os.replace(segment_results[i], planned_path)
+                segment_results[i] = planned_path
+                seg["status"] = "done"
+                seg["mode"] = scene_infos[i].get("mode")
+                self._save_render_manifest(manifest)
+
+            if workers == 1:
+                for i in pending:
+                    segment_results[i], scene_infos[i] = self._render_scene(i, render_scenes[i], total_scenes, resolution, threads,
+                                                            cache_enabled, render_profile,
+                                                            video_only=video_only,
+                                                            on_progress=tracker.update,
+                                                            ken_burns=ken_burns,
+                                                            task_id=task_id)
+                    record_segment(i)
+                    tracker.scene_done(i)
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="video_render") as executor:
+                    futures = {
+                        executor.submit(self._render_scene, i, render_scenes[i], total_scenes, resolution, threads,
+                                        cache_enabled, render_profile, video_only=video_only,
+                                        on_progress=tracker.update, ken_burns=ken_burns, task_id=task_id): i
+                        for i in pending
+                    }
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        try:
+                            segment_results[i], scene_infos[i] = future.result()
+                            record_segment(i)
+                        except TaskCancelledError:
+                            # 아직 시작하지 않은 씬은 실행하지 않음
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            raise
+                        except Exception as e:
+                            log_video_debug(f"[CRITICAL] 씬 {i+1} 렌더링 작업 오류: {e}")
+                        tracker.scene_done(i)
+
+            # 병렬 워커 완료 직후 취소된 경우 병합하지 않음
+            task_manager.check_cancelled(task_id)
+
+            if master_audio:
+                # 마스터 오디오 모드에서 씬을 빼면 이후 씬이 모두 앞당겨져 오디오와 어긋나므로 중단
+                missing = [i + 1 for i, f in enumerate(segment_results) if not f]
+                if missing:
+                    raise ValueError(f"씬 {missing} 세그먼트 생성 실패 (대체 세그먼트 포함) - "
+                                     f"마스터 오디오 싱크를 유지할 수 없어 렌더링을 중단합니다.")
+
+            video_files = [f for f in segment_results if f]
 
             if not video_files:
                 raise ValueError("생성된 세그먼트가 없습니다.")
@@ -817,10 +2394,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 progress_callback(85, "영상 합성 중...")
 
             # 모든 세그먼트 병합
-            final_filename = f"final_video_{uuid.uuid4().hex[:8]}.mp4"
-            final_path = os.path.join(self.output_dir, final_filename)
-
-            if len(video_files) == 1:
+            if master_audio:
+                # 영상은 스트림 복사, 오디오는 마스터 오디오 1회 인코딩
+                self._concat_with_master_audio(video_files, master_audio, final_path, render_profile)
+            elif len(video_files) == 1:
                 # 세그먼트가 1개면 그냥 복사
                 import shutil
                 shutil.copy(video_files[0], final_path)
@@ -840,18 +2417,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     '-f', 'concat',
                     '-safe', '0',
                     '-i', concat_file,
-                    '-c:v', 'copy',           # 비디오는 복사 (빠름)
-                    '-c:a', 'aac',            # 오디오는 AAC로 재인코딩 (끊김 방지)
-                    '-b:a', '192k',           # 오디오 비트레이트
-                    '-ar', '44100',           # 샘플레이트 통일
-                    '-ac', '2',               # 스테레오
+                    '-c:v', 'copy'            # 비디오는 복사 (빠름)
+                ] + render_profile.audio_encode_args() + [  # 오디오는 AAC로 재인코딩 (끊김 방지)
                     final_path
                 ]
 
                 print(f"[VideoService] 세그먼트 병합 중... (오디오 재인코딩으로 끊김 방지)")
                 print(f"[VideoService] FFmpeg 명령: {' '.join(concat_cmd)}")
 
-                result = subprocess.run(concat_cmd, capture_output=True, text=True, timeout=300)
+                timeline = sum(float(scene.get('duration', 5)) for scene in render_scenes)
+                result = self._run_ffmpeg(concat_cmd, timeout=self.encode_speed.concat_timeout(timeline))
 
                 if result.returncode != 0:
                     print(f"[X] FFmpeg 병합 오류: {result.stderr}")
@@ -863,20 +2438,40 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     if os.path.exists(vf):
                         os.remove(vf)
 
-            if progress_callback:
-                progress_callback(100, "영상 생성 완료!")
+            scene_modes = [info["mode"] for info in scene_infos]
+            print(f"[VideoService] 스트림 복사 {scene_modes.count('copied')}개 / 인코딩 {scene_modes.count('encoded')}개 / "
+                  f"캐시 {scene_modes.count('cached')}개 / 대체 {scene_modes.count('filler')}개")
 
-            print(f"[OK] 최종 영상 생성 완료: {final_filename}")
-            print("="*60 + "\n")
+            return build_result("segments", scene_infos, tracker)
 
-            return f"/output/{final_filename}"
+        except TaskCancelledError:
+            # 취소된 렌더링은 이어서 렌더링하지 않으므로 중간 파일을 모두 삭제
+            print(f"[VideoService] 렌더링 취소됨: {task_id}")
+            for path in [f for f in segment_results if f] + ([final_path] if final_path else []):
+                if os.path.exists(path):
+                    os.remove(path)
+            if manifest:
+                import shutil
+                shutil.rmtree(self._render_dir(manifest["renderId"]), ignore_errors=True)
+            raise
 
         except Exception as e:
             print(f"[X] Video generation error: {e}")
             import traceback
             traceback.print_exc()
+            if manifest:
+                # 완료된 세그먼트는 남겨 두어 resume_render로 이어서 렌더링
+                manifest.update({"status": "failed", "error": str(e)})
+                self._save_render_manifest(manifest)
             raise
 
+        finally:
+            self._render_context.task_id = previous_task_id
+            # 외부 URL에서 받은 마스터 오디오 정리 (로컬 파일은 원본을 그대로 사용하므로 해당 없음)
+            if master_dir:
+                import shutil
+                shutil.rmtree(master_dir, ignore_errors=True)
+
     def get_status(self) -> Dict[str, Any]:
         """서비스 상태 조회"""
         return {
@@ -892,7 +2487,18 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             "resolution": self.resolution,
             "fps": self.fps,
             "preset": self.preset,
-            "bitrate": self.bitrate
+            "bitrate": self.bitrate,
+            "parallel_render": self.parallel_render,
+            "render_workers": self.render_workers,
+            "ffmpeg_threads": self.ffmpeg_threads,
+            "segment_cache_enabled": self.segment_cache_enabled,
+            "stream_copy_enabled": self.stream_copy_enabled,
+            "still_image_fast_path": self.still_image_fast_path,
+            "ken_burns": self.ken_burns,
+            "render_engine": self.render_engine,
+            "audio_mode": self.audio_mode,
+            "render_profiles": list(self.RENDER_PROFILES),
+            "encode_speed": self.encode_speed.snapshot()  # 프리셋@해상도별 측정 인코딩 속도 (타임아웃 계산용)
         }
 
     def update_settings(self, resolution: Optional[str] = None,
@@ -3,10 +3,10 @@ import json
 import uuid
 import zipfile
 import shutil
-import cv2  # 비디오 메타데이터 추출용
 from pathlib import Path
 from typing import List
 from services.utils import OUTPUT_DIR
+from services.media_probe_service import media_probe_service
 
 class VrewAutoFillService:
     """
@@ -23,33 +23,26 @@ class VrewAutoFillService:
         
     def _extract_video_metadata(self, file_path: str):
         """
-        OpenCV를 사용하여 비디오 파일의 해상도, 프레임 레이트, 재생 시간을 추출합니다.
+        비디오 파일의 해상도, 프레임 레이트, 재생 시간, 오디오 정보를 추출합니다.
+        (공용 미디어 정보 캐시 사용 - 같은 파일은 렌더링/내보내기와 합쳐 한 번만 조회)
         """
-        try:
-            cap = cv2.VideoCapture(file_path)
-            if not cap.isOpened():
-                return None
-                
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            
-            duration = 0.0
-            if fps > 0:
-                duration = frame_count / fps
-                
-            cap.release()
-            
-            return {
-                "width": width,
-                "height": height,
-                "fps": round(fps, 2),
-                "duration": round(duration, 2)
-            }
-        except Exception as e:
-            print(f"[VrewAutoFill] 메타데이터 추출 실패 ({file_path}): {e}")
+        info = media_probe_service.probe(file_path)
+        if not info or not info.get("video"):
+            print(f"[VrewAutoFill] 메타데이터 추출 실패 ({file_path})")
             return None
+
+        video = info["video"]
+        audio = info.get("audio") or {}
+        return {
+            "width": video.get("width") or 0,
+            "height": video.get("height") or 0,
+            "fps": round(video.get("fps") or 0, 2),
+            "duration": round(info.get("duration") or 0, 2),
+            "codec": video.get("codec"),
+            "audioCodec": audio.get("codec"),
+            "sampleRate": audio.get("sample_rate") or 0,
+            "channelCount": audio.get("channels") or 0
+        }
         
     def process_autofill(self, vrew_file_path: str, media_file_paths: List[str]) -> str:
         """
@@ -141,12 +134,12 @@ class VrewAutoFillService:
                             "videoInfo": {
                                 "size": {"width": v_width, "height": v_height},
                                 "frameRate": v_fps,
-                                "codec": "h264"
+                                "codec": (meta and meta["codec"]) or "h264"
                             },
                             "audioInfo": {
-                                "sampleRate": 44100,
-                                "codec": "aac",
-                                "channelCount": 2
+                                "sampleRate": (meta and meta["sampleRate"]) or 44100,
+                                "codec": (meta and meta["audioCodec"]) or "aac",
+                                "channelCount": (meta and meta["channelCount"]) or 2
                             },
                             "duration": v_duration,
                             "presumedDevice": "unknown",
@@ -630,12 +630,27 @@ class VrewProjectBuilder:
         if path_or_url.startswith("data:"):
             return self._decode_base64_url(path_or_url, default_ext)
 
+        # 정적 서빙 경로인 경우 (/output/tts_*.mp3 등 - TTS url 전달 방식)
+        if path_or_url.startswith("/output/"):
+            return self._resolve_output_path(path_or_url)
+
         # HTTP URL인 경우
         if path_or_url.startswith(("http://", "https://")):
             return download_file(path_or_url, default_ext)
 
         return None
 
+    def _resolve_output_path(self, url: str) -> Optional[str]:
+        """/output/... URL을 OUTPUT_DIR 안의 로컬 파일 경로로 변환 (폴더 밖을 가리키면 None)"""
+        from urllib.parse import unquote
+
+        relative = unquote(url.split("#", 1)[0].split("?", 1)[0])[len("/output/"):]
+        output_root = os.path.realpath(OUTPUT_DIR)
+        local_path = os.path.realpath(os.path.join(output_root, relative))
+        if os.path.commonpath([output_root, local_path]) != output_root or not os.path.isfile(local_path):
+            return None
+        return local_path
+
     def _decode_base64_url(self, data_url: str, default_ext: str) -> Optional[str]:
         """Base64 데이터 URL을 파일로 저장"""
         import base64
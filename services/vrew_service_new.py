@@ -13,6 +13,7 @@ import shutil
 from typing import Dict, Any, List
 from datetime import datetime
 from services.utils import OUTPUT_DIR, VREW_OUTPUT_DIR
+from services.media_probe_service import media_probe_service
 import requests
 from pydub import AudioSegment
 from urllib.parse import urlparse
@@ -166,9 +167,22 @@ class VrewServiceNew:
                             }
                             media_to_add.append((visual_abs_path, f"media/{visual_filename}"))
                             if is_video:
+                                # 실제 파일 정보 사용 (조회 실패 시 기존 기본값)
+                                probe = media_probe_service.probe(visual_abs_path) or {}
+                                p_video = probe.get("video") or {}
+                                p_audio = probe.get("audio") or {}
                                 visual_info["videoAudioMetaInfo"] = {
-                                    "videoInfo": {"width": 1920, "height": 1080, "codec": "h264", "fps": 30},
-                                    "audioInfo": {"sampleRate": 44100, "codec": "aac", "channelCount": 2},
+                                    "videoInfo": {
+                                        "width": p_video.get("width") or 1920,
+                                        "height": p_video.get("height") or 1080,
+                                        "codec": p_video.get("codec") or "h264",
+                                        "fps": round(p_video.get("fps") or 30, 2)
+                                    },
+                                    "audioInfo": {
+                                        "sampleRate": p_audio.get("sample_rate") or 44100,
+                                        "codec": p_audio.get("codec") or "aac",
+                                        "channelCount": p_audio.get("channels") or 2
+                                    },
                                     "duration": round(duration, 2),
                                     "mediaContainer": ext[1:]
                                 }
@@ -0,0 +1,100 @@
+"""
+FileCacheService 테스트
+콘텐츠 주소 기반 키 생성, 적중/미스 통계, LRU 용량 정리 검증
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.file_cache_service import FileCacheService
+
+
+class TestFileCacheService(unittest.TestCase):
+    """디스크 LRU 캐시 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.cache = FileCacheService("test", os.path.join(self.work_dir, "cache"), max_size_mb=1, suffix=".mp4")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.work_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_key_depends_on_content_not_path(self):
+        a = self._write("a.png", b"same-bytes")
+        b = self._write("b.png", b"same-bytes")
+        c = self._write("c.png", b"other-bytes")
+        self.assertEqual(self.cache.make_key({"visual": a}, fps=30), self.cache.make_key({"visual": b}, fps=30))
+        self.assertNotEqual(self.cache.make_key({"visual": a}, fps=30), self.cache.make_key({"visual": c}, fps=30))
+        self.assertNotEqual(self.cache.make_key({"visual": a}, fps=30), self.cache.make_key({"visual": a}, fps=60))
+
+    def test_hit_and_miss_counters(self):
+        segment = self._write("segment.mp4", b"x" * 100)
+        key = self.cache.make_key({"visual": segment})
+        out = os.path.join(self.work_dir, "out.mp4")
+
+        self.assertFalse(self.cache.get(key, out))
+        self.assertTrue(self.cache.put(key, segment))
+        self.assertTrue(self.cache.get(key, out))
+        with open(out, "rb") as f:
+            self.assertEqual(f.read(), b"x" * 100)
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["stores"], 1)
+
+    def test_untracked_path_lookup_is_recorded_by_caller(self):
+        segment = self._write("segment.mp4", b"x" * 100)
+        key = self.cache.make_key({"visual": segment})
+        self.cache.put(key, segment)
+
+        self.assertIsNotNone(self.cache.get_path(key, track_stats=False))
+        self.assertIsNone(self.cache.get_path("missing", track_stats=False))
+        self.assertEqual((self.cache.get_stats()["hits"], self.cache.get_stats()["misses"]), (0, 0))
+
+        self.cache.record_lookup(hit=True)
+        self.cache.record_lookup(hit=False)
+        self.assertEqual((self.cache.get_stats()["hits"], self.cache.get_stats()["misses"]), (1, 1))
+
+    def test_lru_eviction_respects_recent_use(self):
+        chunk = b"x" * (400 * 1024)
+        keys = []
+        for i in range(2):
+            path = self._write(f"seg{i}.mp4", chunk + bytes([i]))
+            keys.append(self.cache.make_key({"visual": path}))
+            self.cache.put(keys[-1], path)
+
+        # 첫 번째 항목을 최근 사용으로 갱신한 뒤 용량 초과 유발
+        self.assertTrue(self.cache.get(keys[0], os.path.join(self.work_dir, "hit.mp4")))
+        path = self._write("seg2.mp4", chunk + b"\x02")
+        keys.append(self.cache.make_key({"visual": path}))
+        self.cache.put(keys[2], path)
+
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+        self.assertFalse(self.cache.get(keys[1], os.path.join(self.work_dir, "miss.mp4")))
+        self.assertTrue(self.cache.get(keys[0], os.path.join(self.work_dir, "hit2.mp4")))
+
+    def test_index_survives_restart(self):
+        segment = self._write("segment.mp4", b"persisted")
+        key = self.cache.make_key({"visual": segment})
+        self.cache.put(key, segment, metadata={"duration": 3})
+
+        reloaded = FileCacheService("test", self.cache.cache_dir, max_size_mb=1, suffix=".mp4")
+        self.assertEqual(reloaded.get_stats()["total_entries"], 1)
+        self.assertEqual(reloaded.get_metadata(key), {"duration": 3})
+        self.assertTrue(reloaded.get(key, os.path.join(self.work_dir, "out.mp4")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+MediaProbeService 테스트
+ffprobe 실행을 목킹하여 결과 파싱/내용 지문 캐시/재시작 후 재사용 검증
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.media_probe_service import MediaProbeService
+
+FFPROBE_OUTPUT = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264", "profile": "High", "width": 1080, "height": 1920,
+         "pix_fmt": "yuv420p", "r_frame_rate": "24/1", "avg_frame_rate": "24/1",
+         "sample_aspect_ratio": "1:1", "duration": "5.041667"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2,
+         "duration": "5.034667"}
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "5.041667"}
+}
+
+
+class TestMediaProbeService(unittest.TestCase):
+    """미디어 정보 조회 캐시 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.work_dir, "probe.json")
+        self.service = MediaProbeService(cache_path=self.cache_path)
+        self.clip = self._write("clip.mp4", b"clip" * 1000)
+
+    def tearDown(self):
+        self.service.flush()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.work_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _ffprobe(self):
+        return patch("services.media_probe_service.subprocess.run",
+                     return_value=subprocess.CompletedProcess([], 0, stdout=json.dumps(FFPROBE_OUTPUT), stderr=""))
+
+    def test_probe_parses_streams(self):
+        with self._ffprobe():
+            info = self.service.probe(self.clip)
+
+        self.assertTrue(info["has_video"])
+        self.assertTrue(info["has_audio"])
+        self.assertAlmostEqual(info["duration"], 5.041667)
+        self.assertEqual(info["video"]["codec"], "h264")
+        self.assertEqual((info["video"]["width"], info["video"]["height"]), (1080, 1920))
+        self.assertEqual(info["video"]["fps"], 24.0)
+        self.assertTrue(info["video"]["cfr"])
+        self.assertEqual((info["audio"]["sample_rate"], info["audio"]["channels"]), (48000, 2))
+
+    def test_same_content_is_probed_once(self):
+        copy = os.path.join(self.work_dir, "copy.mp4")
+        shutil.copy(self.clip, copy)
+
+        with self._ffprobe() as run:
+            self.service.probe(self.clip)
+            self.assertTrue(self.service.has_audio(self.clip))
+            self.assertEqual(self.service.video_info(copy)["height"], 1920)
+            self.assertEqual(run.call_count, 1)
+
+        self.assertEqual(self.service.get_stats()["hits"], 2)
+
+    def test_changed_file_is_probed_again(self):
+        with self._ffprobe() as run:
+            self.service.probe(self.clip)
+            self._write("clip.mp4", b"other" * 1000)
+            self.service.probe(self.clip)
+            self.assertEqual(run.call_count, 2)
+
+    def test_cache_survives_restart(self):
+        with self._ffprobe():
+            self.service.probe(self.clip)
+        self.service.flush()
+
+        restarted = MediaProbeService(cache_path=self.cache_path)
+        with patch("services.media_probe_service.subprocess.run") as run:
+            self.assertEqual(restarted.probe(self.clip)["video"]["codec"], "h264")
+            run.assert_not_called()
+
+    def test_saves_are_batched(self):
+        clips = [self._write(f"clip_{i}.mp4", bytes([i]) * 1000) for i in range(5)]
+        with self._ffprobe(), patch.object(self.service, "_save", wraps=self.service._save) as save:
+            for clip in clips:
+                self.service.probe(clip)
+            save.assert_not_called()
+            self.service.flush()
+            self.service.flush()
+
+        self.assertEqual(save.call_count, 1)
+        with open(self.cache_path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["entries"]), 5)
+
+    def test_probe_returns_copy(self):
+        with self._ffprobe():
+            self.service.probe(self.clip)["video"]["width"] = 1
+            self.assertEqual(self.service.video_info(self.clip)["width"], 1080)
+
+    def test_failed_probe_is_not_cached(self):
+        with patch("services.media_probe_service.subprocess.run", side_effect=FileNotFoundError("ffprobe")), \
+             patch.object(MediaProbeService, "_probe_with_opencv", return_value=None):
+            self.assertIsNone(self.service.probe(self.clip))
+            self.assertFalse(self.service.has_audio(self.clip))
+
+        self.assertEqual(self.service.get_stats()["total_entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
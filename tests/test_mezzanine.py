@@ -0,0 +1,137 @@
+"""
+MezzanineService 테스트
+FFmpeg 없이 변환 명령을 목킹하여 파일명 규칙/조회/작업 취소 검증
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.mezzanine_service import MezzanineService
+from services.task_service import task_manager
+
+
+class TestMezzanineService(unittest.TestCase):
+    """메자닌 인제스트 테스트"""
+
+    SOURCE = "https://replicate.delivery/pbxt/abc/output.mp4"
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.service = MezzanineService(max_workers=1)
+        self.service.mezzanine_dir = self.work_dir
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _fake_run(self, commands):
+        def run(cmd, **kwargs):
+            commands.append(cmd)
+            with open(cmd[-1], "wb") as f:
+                f.write(b"mezzanine")
+
+            class Result:
+                returncode = 0
+                stderr = ""
+            return Result()
+        return run
+
+    def _fake_fetch(self, source_url, temp_dir):
+        path = os.path.join(temp_dir, "source.mp4")
+        with open(path, "wb") as f:
+            f.write(b"source")
+        return path
+
+    def test_key_depends_on_spec(self):
+        key = self.service.make_key(self.SOURCE, "1920x1080", 30)
+        self.assertEqual(key, self.service.make_key(self.SOURCE, "1920x1080", 30))
+        self.assertNotEqual(key, self.service.make_key(self.SOURCE, "1080x1920", 30))
+        self.assertNotEqual(key, self.service.make_key(self.SOURCE, "1920x1080", 24))
+        self.assertTrue(key.endswith("_1920x1080_30fps"))
+
+    def test_ingest_makes_clip_available(self):
+        self.assertIsNone(self.service.lookup(self.SOURCE, "1920x1080", 30))
+
+        commands = []
+        with patch.object(self.service, "_fetch_source", side_effect=self._fake_fetch), \
+             patch("services.mezzanine_service.run_ffmpeg", side_effect=self._fake_run(commands)):
+            url = self.service.ingest(self.SOURCE, "1920x1080", 30)
+
+        self.assertEqual(url, self.service.lookup(self.SOURCE, "1920x1080", 30))
+        cmd = commands[0]
+        self.assertIn("fps=30", cmd[cmd.index("-vf") + 1])
+        self.assertEqual(cmd[cmd.index("-g") + 1], "60")
+        self.assertEqual(cmd[cmd.index("-sc_threshold") + 1], "0")
+        self.assertEqual(cmd[cmd.index("-profile:v") + 1], "high")
+
+        # 같은 클립은 다시 변환하지 않음
+        with patch("services.mezzanine_service.run_ffmpeg") as run:
+            self.assertEqual(self.service.ingest(self.SOURCE, "1920x1080", 30), url)
+            run.assert_not_called()
+        self.assertEqual(self.service.get_stats()["reused"], 1)
+
+    def test_failed_ingest_leaves_no_clip(self):
+        class Failed:
+            returncode = 1
+            stderr = "boom"
+
+        with patch.object(self.service, "_fetch_source", side_effect=self._fake_fetch), \
+             patch("services.mezzanine_service.run_ffmpeg", return_value=Failed()):
+            self.assertIsNone(self.service.ingest(self.SOURCE, "1920x1080", 30))
+
+        self.assertIsNone(self.service.lookup(self.SOURCE, "1920x1080", 30))
+        self.assertEqual(self.service.get_stats()["failed"], 1)
+
+    def test_ingest_does_not_write_project(self):
+        # 프로젝트 저장은 프론트엔드 자동 저장만 담당 (렌더링 시 lookup으로 메자닌 클립 조회)
+        with patch.object(self.service, "_fetch_source", side_effect=self._fake_fetch), \
+             patch("services.mezzanine_service.run_ffmpeg", side_effect=self._fake_run([])), \
+             patch("services.project_service.project_service.save_project") as save_project:
+            url = self.service.ingest(self.SOURCE, "1920x1080", 30)
+
+        save_project.assert_not_called()
+        self.assertEqual(self.service.lookup(self.SOURCE, "1920x1080", 30), url)
+
+
+    def test_ingest_runs_under_cancellable_task(self):
+        task_id = task_manager.create_task("mezzanine")
+        calls = []
+
+        def cancel_during_encode(cmd, timeout, task_id=None, **kwargs):
+            calls.append(task_id)
+            task_manager.cancel_task(task_id)
+            return self._fake_run([])(cmd)
+
+        with patch.object(self.service, "_fetch_source", side_effect=self._fake_fetch), \
+             patch("services.mezzanine_service.run_ffmpeg", side_effect=cancel_during_encode):
+            self.assertIsNone(self.service.ingest(self.SOURCE, "1920x1080", 30, task_id=task_id))
+
+        # FFmpeg 프로세스는 작업에 등록되어 실행되고, 취소되면 결과를 노출하지 않음
+        self.assertEqual(calls, [task_id])
+        self.assertIsNone(self.service.lookup(self.SOURCE, "1920x1080", 30))
+        self.assertEqual(self.service.get_job(self.service.make_key(self.SOURCE, "1920x1080", 30))["status"],
+                         "cancelled")
+        self.assertEqual(self.service.get_stats()["failed"], 0)
+
+    def test_finished_submit_removes_its_task(self):
+        commands = []
+        with patch.object(self.service, "_fetch_source", side_effect=self._fake_fetch), \
+             patch("services.mezzanine_service.run_ffmpeg", side_effect=self._fake_run(commands)):
+            job = self.service.submit(self.SOURCE, "1920x1080", 30)
+            self.assertIsNotNone(job["taskId"])
+            self.service.executor.shutdown(wait=True)
+
+        # 결과는 변환 작업 상태에 남고, 클립마다 만든 작업 기록은 쌓이지 않음
+        self.assertIsNone(task_manager.get_task(job["taskId"]))
+        finished = self.service.get_job(job["key"])
+        self.assertEqual(finished["status"], "completed")
+        self.assertIsNone(finished["taskId"])
+        self.assertIsNotNone(self.service.lookup(self.SOURCE, "1920x1080", 30))
+
+if __name__ == "__main__":
+    unittest.main()
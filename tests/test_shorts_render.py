@@ -0,0 +1,43 @@
+"""
+ShortsService 렌더링 호출 테스트
+VideoService.generate_final_video를 시그니처가 같은 목으로 교체하여 쇼츠 렌더링 인자/결과 처리 검증
+"""
+import os
+import sys
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.shorts_service import shorts_service
+from services.video_service import video_service
+
+
+class TestShortsRender(unittest.TestCase):
+    """쇼츠 최종 영상 렌더링 테스트"""
+
+    def test_render_returns_video_url(self):
+        scenes = [{"sceneId": 1, "visualUrl": "/output/img.png", "audioUrl": "/output/tts.mp3", "duration": 3}]
+        progress = []
+
+        # autospec: 지원하지 않는 인자를 넘기면 실제 메서드처럼 TypeError 발생
+        with patch.object(video_service, "generate_final_video", autospec=True,
+                          return_value={"videoUrl": "/output/final_video_1.mp4"}) as render:
+            video_url = asyncio.run(shorts_service._render_video(
+                scenes, progress_callback=lambda p, m: progress.append(p)
+            ))
+
+        self.assertEqual(video_url, "/output/final_video_1.mp4")
+        kwargs = render.call_args.kwargs
+        self.assertEqual(kwargs["standalone"], scenes)
+        self.assertEqual(kwargs["resolution"], "shorts")
+
+        # 렌더링 진행률은 전체 진행률의 50~100% 구간으로 변환
+        kwargs["progress_callback"](40, "렌더링 중")
+        self.assertEqual(progress, [70])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+TaskManager 작업 취소 테스트
+실제 자식 프로세스를 띄워 취소 시 종료되는지 검증
+"""
+import os
+import sys
+import time
+import shutil
+import threading
+import subprocess
+import unittest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.task_service import TaskManager, TaskCancelledError, task_manager
+from services.ffmpeg_runner import run_ffmpeg
+
+
+def _sleeper():
+    return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+class TestTaskCancel(unittest.TestCase):
+    """작업 취소 테스트"""
+
+    def setUp(self):
+        self.manager = TaskManager()
+        self.task_id = self.manager.create_task("video_generation")
+        self.manager.update_task(self.task_id, status="processing", progress=30)
+
+    def test_cancel_kills_registered_processes(self):
+        process = _sleeper()
+        self.manager.register_process(self.task_id, process)
+
+        self.assertTrue(self.manager.cancel_task(self.task_id))
+        self.assertIsNotNone(process.wait(timeout=5))
+        self.assertEqual(self.manager.get_task(self.task_id)["status"], "cancelled")
+        with self.assertRaises(TaskCancelledError):
+            self.manager.check_cancelled(self.task_id)
+
+    def test_process_started_after_cancel_is_killed(self):
+        self.manager.cancel_task(self.task_id)
+        process = _sleeper()
+        self.manager.register_process(self.task_id, process)
+        self.assertIsNotNone(process.wait(timeout=5))
+
+    def test_late_updates_do_not_override_cancel(self):
+        self.manager.cancel_task(self.task_id)
+        self.manager.update_task(self.task_id, status="completed", progress=100, result={"videoUrl": "x"})
+        task = self.manager.get_task(self.task_id)
+        self.assertEqual(task["status"], "cancelled")
+        self.assertIsNone(task["result"])
+
+    def test_finished_task_cannot_be_cancelled(self):
+        self.manager.update_task(self.task_id, status="completed", progress=100)
+        self.assertFalse(self.manager.cancel_task(self.task_id))
+        self.assertFalse(self.manager.cancel_task("missing"))
+        self.manager.check_cancelled(self.task_id)
+
+
+
+@unittest.skipIf(shutil.which("ffmpeg") is None, "FFmpeg 필요")
+class TestFFmpegRunnerCancel(unittest.TestCase):
+    """작업에 등록된 FFmpeg 프로세스 취소 테스트"""
+
+    def test_cancel_stops_running_ffmpeg(self):
+        task_id = task_manager.create_task("video_generation")
+        task_manager.update_task(task_id, status="processing")
+        # 실시간 속도(-re)로 30초 분량을 출력하므로 취소하지 않으면 30초 걸림
+        cmd = ['ffmpeg', '-y', '-re', '-f', 'lavfi', '-i', 'anullsrc=d=30', '-f', 'null', '-']
+        threading.Timer(0.5, task_manager.cancel_task, args=(task_id,)).start()
+
+        started = time.time()
+        result = run_ffmpeg(cmd, timeout=60, task_id=task_id)
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertLess(time.time() - started, 10)
+        self.assertNotIn(task_id, task_manager.processes)
+
+if __name__ == "__main__":
+    unittest.main()
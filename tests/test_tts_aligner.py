@@ -0,0 +1,86 @@
+"""
+로컬 에너지 기반 정렬 테스트
+합성 신호(톤 + 무음)로 휴지 구간 검출과 문장/절 경계 정렬 검증
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    from services.tts_aligner import EnergyAligner
+except ImportError:  # numpy 미설치 환경
+    np = None
+
+SAMPLE_RATE = 24000
+
+
+def build_signal(parts):
+    """[(길이 ms, 발화 여부), ...] → float 샘플 (발화 구간은 220Hz 톤, 무음 구간은 약한 잡음)"""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for duration_ms, voiced in parts:
+        n = SAMPLE_RATE * duration_ms // 1000
+        if voiced:
+            t = np.arange(n) / SAMPLE_RATE
+            chunks.append(0.5 * np.sin(2 * np.pi * 220 * t))
+        else:
+            chunks.append(rng.normal(0, 0.0005, n))
+    return np.concatenate(chunks).astype(np.float32)
+
+
+@unittest.skipIf(np is None, "numpy 필요")
+class TestEnergyAligner(unittest.TestCase):
+    """휴지 구간 검출 + 텍스트 정렬 테스트"""
+
+    def setUp(self):
+        self.aligner = EnergyAligner(frame_ms=20, min_pause_ms=150)
+
+    def test_detects_speech_span_and_pauses(self):
+        samples = build_signal([(200, False), (1000, True), (400, False), (800, True), (100, False),
+                                (600, True), (300, False)])
+        start, end, pauses = self.aligner.detect_pauses(samples, SAMPLE_RATE)
+
+        self.assertEqual((start, end), (200, 3100))
+        self.assertEqual(pauses, [(1200, 1600)])  # 100ms 무음은 휴지로 보지 않음
+
+    def test_phrase_boundaries_snap_to_pauses(self):
+        text = "첫 번째 문장입니다. 두 번째 문장이고, 마지막 구절"
+        samples = build_signal([(200, False), (1000, True), (400, False), (900, True), (260, False),
+                                (700, True), (300, False)])
+        timestamps = self.aligner.align(text, samples, SAMPLE_RATE)
+
+        self.assertEqual([ts.text for ts in timestamps], text.split())
+        by_word = {ts.text: ts for ts in timestamps}
+        self.assertEqual(timestamps[0].start_ms, 200)
+        self.assertEqual(by_word["문장입니다."].end_ms, 1200)
+        self.assertEqual(by_word["두"].start_ms, 1600)
+        self.assertEqual(by_word["문장이고,"].end_ms, 2500)
+        self.assertEqual(by_word["마지막"].start_ms, 2760)
+        self.assertEqual(timestamps[-1].end_ms, 3460)
+        # 단어는 시간 순서대로 겹치지 않음
+        for prev, cur in zip(timestamps, timestamps[1:]):
+            self.assertLessEqual(prev.end_ms, cur.start_ms)
+
+    def test_without_pauses_falls_back_to_character_ratio(self):
+        samples = build_signal([(2000, True)])
+        timestamps = self.aligner.align("가나다 라마. 바사아자", samples, SAMPLE_RATE)
+
+        self.assertEqual([ts.text for ts in timestamps], ["가나다", "라마.", "바사아자"])
+        self.assertEqual(timestamps[0].start_ms, 0)
+        self.assertEqual(timestamps[1].end_ms, 1200)  # 문장부호 포함 6자 / 10자
+        self.assertEqual(timestamps[-1].end_ms, 2000)
+
+    def test_pcm_bytes_and_silence(self):
+        pcm = (build_signal([(500, True), (300, False), (500, True)]) * 32767).astype("<i2").tobytes()
+        timestamps = self.aligner.align_pcm("하나. 둘셋.", pcm, SAMPLE_RATE)
+        self.assertEqual([(ts.start_ms, ts.end_ms) for ts in timestamps], [(0, 500), (800, 1300)])
+
+        self.assertEqual(self.aligner.align("무음", np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
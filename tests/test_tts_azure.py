@@ -0,0 +1,185 @@
+"""
+AzureTTSEngine 동시 합성 테스트
+Speech SDK를 가짜 객체로 교체하여 동시 요청 간 단어 타임스탬프 분리, Synthesizer 풀 재사용, 비동기 합성 검증
+"""
+import os
+import re
+import sys
+import asyncio
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import tts_azure
+from services.tts_azure import AzureTTSEngine
+
+
+class _Signal:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+
+class FakeSynthesizer:
+    """SSML의 단어마다 Word Boundary 이벤트를 (SDK처럼 별도 스레드에서) 발생시키는 가짜 Synthesizer"""
+
+    complete = True  # False면 완료 이벤트를 보내지 않음 (응답 없는 연결)
+
+    def __init__(self, speech_config=None, audio_config=None):
+        self.synthesis_word_boundary = _Signal()
+        self.synthesis_completed = _Signal()
+        self.synthesis_canceled = _Signal()
+
+    def speak_ssml_async(self, ssml):
+        text = re.search(r"<prosody[^>]*>\s*(.*?)\s*</prosody>", ssml, re.S).group(1)
+        result = SimpleNamespace(reason="completed", audio_data=text.encode("utf-8"))
+
+        def synthesize():
+            for i, word in enumerate(text.split()):
+                time.sleep(0.002)  # 다른 요청과 이벤트가 섞이도록 지연
+                evt = SimpleNamespace(text=word, audio_offset=i * 5_000_000, duration=4_000_000)
+                for handler in self.synthesis_word_boundary.handlers:
+                    handler(evt)
+            if self.complete:
+                for handler in self.synthesis_completed.handlers:
+                    handler(SimpleNamespace(result=result))
+
+        worker = threading.Thread(target=synthesize)
+        worker.start()
+        return SimpleNamespace(get=lambda: (worker.join(), result)[1])
+
+
+class FakeConnection:
+    @classmethod
+    def from_speech_synthesizer(cls, synthesizer):
+        return cls()
+
+    def open(self, for_continuous):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSpeechConfig:
+    def __init__(self, subscription=None, region=None):
+        self.speech_synthesis_voice_name = None
+
+    def set_speech_synthesis_output_format(self, fmt):
+        pass
+
+
+FAKE_SDK = SimpleNamespace(
+    SpeechConfig=FakeSpeechConfig,
+    SpeechSynthesizer=FakeSynthesizer,
+    Connection=FakeConnection,
+    SpeechSynthesisOutputFormat=SimpleNamespace(Audio16Khz32KBitRateMonoMp3="mp3"),
+    ResultReason=SimpleNamespace(SynthesizingAudioCompleted="completed", Canceled="canceled"),
+    CancellationReason=SimpleNamespace(Error="error")
+)
+
+
+class TestAzureConcurrentSynthesis(unittest.TestCase):
+    """Azure 동시 합성 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        patches = [
+            patch.object(tts_azure, "speechsdk", FAKE_SDK),
+            patch.object(tts_azure, "OUTPUT_DIR", self.work_dir),
+            patch.dict(os.environ, {"AZURE_TTS_PREWARM": "0", "AZURE_TTS_POOL_SIZE": "4"})
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.engine = AzureTTSEngine(api_key="test-key", region="koreacentral")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_concurrent_requests_keep_their_own_timestamps(self):
+        texts = [" ".join(f"s{n}w{i}" for i in range(6)) for n in range(12)]
+        voices = ["female", "male"]
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(
+                lambda n: self.engine.synthesize_speech(texts[n], voice_id=voices[n % 2]), range(len(texts))
+            ))
+
+        for text, result in zip(texts, results):
+            self.assertTrue(result.success, result.error)
+            self.assertEqual([ts.text for ts in result.timestamps], text.split())
+            self.assertEqual(result.total_duration_ms, 2900)
+            with open(result.audio_path, "rb") as f:
+                self.assertEqual(f.read().decode("utf-8"), text)
+
+        stats = self.engine.get_pool_stats()
+        self.assertGreater(stats["reused"], 0)
+        self.assertLessEqual(stats["created"], 12)
+        self.assertEqual(set(stats["idle"]), {"ko-KR-SunHiNeural", "ko-KR-InJoonNeural"})
+
+    def test_failed_synthesizer_is_not_reused(self):
+        with patch.object(FakeSynthesizer, "speak_ssml_async", side_effect=RuntimeError("socket closed")):
+            result = self.engine.synthesize_speech("안녕하세요", voice_id="female")
+
+        self.assertFalse(result.success)
+        self.assertEqual(self.engine.get_pool_stats()["discarded"], 1)
+        self.assertEqual(self.engine.get_pool_stats()["idle"]["ko-KR-SunHiNeural"], 0)
+
+
+    def test_async_requests_complete_via_events(self):
+        texts = [" ".join(f"a{n}w{i}" for i in range(6)) for n in range(8)]
+
+        async def run_all():
+            return await asyncio.gather(*(
+                self.engine.synthesize_speech_async(text, voice_id="female") for text in texts
+            ))
+
+        results = asyncio.run(run_all())
+        for text, result in zip(texts, results):
+            self.assertTrue(result.success, result.error)
+            self.assertEqual([ts.text for ts in result.timestamps], text.split())
+        self.assertEqual(self.engine.get_pool_stats()["idle"]["ko-KR-SunHiNeural"], 4)
+
+    def test_async_timeout_discards_synthesizer(self):
+        self.engine.async_timeout = 0.2
+        with patch.object(FakeSynthesizer, "complete", False):
+            result = asyncio.run(self.engine.synthesize_speech_async("응답 없음", voice_id="female"))
+
+        self.assertFalse(result.success)
+        self.assertIn("시간 초과", result.error)
+        self.assertEqual(self.engine.get_pool_stats()["discarded"], 1)
+
+    def test_cancelled_request_discards_synthesizer(self):
+        async def cancel_mid_synthesis():
+            task = asyncio.ensure_future(
+                self.engine.synthesize_speech_async("취소될 요청 입니다 아주 긴 문장", voice_id="female")
+            )
+            await asyncio.sleep(0.003)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # 취소된 요청의 Synthesizer가 재사용되면 남은 단어 이벤트가 다음 요청에 섞임
+            return await self.engine.synthesize_speech_async("다음 요청", voice_id="female")
+
+        result = asyncio.run(cancel_mid_synthesis())
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual([ts.text for ts in result.timestamps], ["다음", "요청"])
+        stats = self.engine.get_pool_stats()
+        self.assertEqual(stats["discarded"], 1)
+        self.assertEqual(stats["reused"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,387 @@
+"""
+TTSService 테스트
+가짜 엔진으로 엔진별 동시 요청 한도, 결과 순서/진행 콜백, 취소, 오디오 전달 방식, 청크 병렬 합성, 비동기 생성 검증
+"""
+import os
+import sys
+import time
+import asyncio
+import wave
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_base import TTSEngineBase, TTSResult, WordTimestamp
+from services.tts_service import TTSService, EngineSlot
+from services.task_service import task_manager, TaskCancelledError
+
+
+class FakeEngine(TTSEngineBase):
+    """동시 실행 수를 기록하는 테스트용 엔진"""
+
+    def __init__(self, name, delay=0.02, fail_texts=()):
+        super().__init__(name)
+        self.delay = delay
+        self.fail_texts = set(fail_texts)
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def synthesize_speech(self, text, voice_id=None, language="ko-KR", speed=1.0, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if text in self.fail_texts:
+            return TTSResult(success=False, audio_url="", engine=self.engine_name, error="quota")
+        return TTSResult(success=True, audio_url=f"data:{text}", engine=self.engine_name)
+
+
+class AsyncFakeEngine(FakeEngine):
+    """이벤트 루프에서 응답을 기다리는 테스트용 비동기 엔진 (스레드 사용 여부 기록)"""
+
+    def __init__(self, name, delay=0.02, fail_texts=()):
+        super().__init__(name, delay, fail_texts)
+        self.threads = set()
+
+    async def synthesize_speech_async(self, text, voice_id=None, language="ko-KR", speed=1.0, **kwargs):
+        self.threads.add(threading.get_ident())
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if text in self.fail_texts:
+            return TTSResult(success=False, audio_url="", engine=self.engine_name, error="quota")
+        return TTSResult(success=True, audio_url=f"data:{text}", engine=self.engine_name)
+
+
+class TestTTSBatch(unittest.TestCase):
+    """엔진별 동시 요청 한도 내 일괄 생성 테스트"""
+
+    def setUp(self):
+        self.google = FakeEngine("google", fail_texts=("실패",))
+        self.azure = FakeEngine("azure")
+        env = {"TTS_CONCURRENCY_GOOGLE": "3", "TTS_CONCURRENCY_AZURE": "1"}
+        with patch.dict(os.environ, env), \
+             patch("services.tts_service.google_tts_engine", self.google), \
+             patch("services.tts_service.azure_tts_engine", self.azure), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        cache_patch = patch("services.tts_service.tts_cache_service.enabled", False)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def _items(self, engine, count, prefix="문장"):
+        return [{"text": f"{prefix}{i}", "scene_id": f"{engine}-{i}", "engine": engine} for i in range(count)]
+
+    def test_respects_per_engine_concurrency(self):
+        items = self._items("google", 9) + self._items("azure", 4)
+        reported = []
+        results = self.service.generate_batch(items, on_result=lambda i, r: reported.append(i))
+
+        self.assertEqual([r["sceneId"] for r in results], [item["scene_id"] for item in items])
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(sorted(reported), list(range(len(items))))
+        self.assertEqual(self.google.peak, 3)
+        self.assertEqual(self.azure.peak, 1)
+
+    def test_failed_scene_does_not_stop_batch(self):
+        items = self._items("google", 3)
+        items[1]["text"] = "실패"
+        results = self.service.generate_batch(items)
+
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.assertIn("quota", results[1]["error"])
+
+    def test_cancelled_task_stops_remaining_scenes(self):
+        tid = task_manager.create_task("tts_batch")
+
+        def on_result(index, result):
+            task_manager.cancel_task(tid)
+
+        with self.assertRaises(TaskCancelledError):
+            self.service.generate_batch(self._items("azure", 6), on_result=on_result, task_id=tid)
+        self.assertLess(self.azure.calls, 6)
+
+
+
+class TestAsyncBatch(unittest.TestCase):
+    """비동기 일괄 생성 테스트 (엔진 한도 유지 + 이벤트 루프 스레드에서만 실행)"""
+
+    def setUp(self):
+        self.google = AsyncFakeEngine("google", fail_texts=("실패",))
+        self.azure = AsyncFakeEngine("azure")
+        env = {"TTS_CONCURRENCY_GOOGLE": "3", "TTS_CONCURRENCY_AZURE": "1"}
+        with patch.dict(os.environ, env), \
+             patch("services.tts_service.google_tts_engine", self.google), \
+             patch("services.tts_service.azure_tts_engine", self.azure), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        cache_patch = patch("services.tts_service.tts_cache_service.enabled", False)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def test_runs_on_event_loop_within_engine_limits(self):
+        items = [{"text": f"문장{i}", "scene_id": f"g-{i}", "engine": "google"} for i in range(9)]
+        items += [{"text": "실패", "scene_id": "g-fail", "engine": "google"}]
+        items += [{"text": f"문장{i}", "scene_id": f"a-{i}", "engine": "azure"} for i in range(3)]
+        reported = []
+
+        results = asyncio.run(self.service.generate_batch_async(items, on_result=lambda i, r: reported.append(i)))
+
+        self.assertEqual([r["sceneId"] for r in results], [item["scene_id"] for item in items])
+        self.assertEqual([r["success"] for r in results].count(False), 1)
+        self.assertEqual(sorted(reported), list(range(len(items))))
+        self.assertEqual(self.google.peak, 3)
+        self.assertEqual(self.azure.peak, 1)
+        self.assertEqual(len(self.google.threads | self.azure.threads), 1)
+
+    def test_cancelled_task_stops_remaining_scenes(self):
+        task_id = task_manager.create_task("tts_batch")
+        items = [{"text": f"문장{i}", "scene_id": f"a-{i}", "engine": "azure"} for i in range(6)]
+
+        def on_result(index, result):
+            task_manager.cancel_task(task_id)
+
+        with self.assertRaises(TaskCancelledError):
+            asyncio.run(self.service.generate_batch_async(items, on_result=on_result, task_id=task_id))
+        self.assertLess(self.azure.calls, len(items))
+
+    def test_cache_work_runs_off_event_loop(self):
+        threads = {}
+
+        def record(name, value=None):
+            def call(*args, **kwargs):
+                threads[name] = threading.get_ident()
+                return value
+            return call
+
+        async def main():
+            threads["loop"] = threading.get_ident()
+            return await self.service.generate_async("안녕하세요", engine="azure")
+
+        with patch("services.tts_service.tts_cache_service.enabled", True), \
+             patch("services.tts_service.tts_cache_service.make_key", return_value="key"), \
+             patch("services.tts_service.tts_cache_service.get", side_effect=record("get")), \
+             patch("services.tts_service.tts_cache_service.put", side_effect=record("put", True)):
+            self.assertTrue(asyncio.run(main())["success"])
+
+        self.assertNotEqual(threads["get"], threads["loop"])
+        self.assertNotEqual(threads["put"], threads["loop"])
+
+    def test_elevenlabs_reuses_async_client(self):
+        import base64
+        import httpx
+        from services.tts_elevenlabs import ElevenLabsTTSEngine
+
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir, ignore_errors=True)
+        clients = []
+        real_client = httpx.AsyncClient
+
+        def handler(request):
+            return httpx.Response(200, json={
+                "audio_base64": base64.b64encode(b"ID3-eleven").decode(),
+                "alignment": {"characters": list("안녕"), "character_start_times_seconds": [0.0, 0.2],
+                              "character_end_times_seconds": [0.2, 0.4]}
+            })
+
+        def make_client(**kwargs):
+            clients.append(real_client(transport=httpx.MockTransport(handler), **kwargs))
+            return clients[-1]
+
+        engine = ElevenLabsTTSEngine(api_key="test")
+
+        async def main():
+            return [await engine.synthesize_speech_async("안녕") for _ in range(3)]
+
+        with patch("httpx.AsyncClient", side_effect=make_client), \
+             patch("services.tts_elevenlabs.OUTPUT_DIR", output_dir):
+            results = asyncio.run(main())
+
+        self.assertTrue(all(result.success for result in results), [result.error for result in results])
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(len(os.listdir(output_dir)), 3)
+
+    def test_sync_engine_falls_back_to_thread(self):
+        engine = FakeEngine("google", delay=0)
+        with patch.dict(self.service.engines, {"google": engine}):
+            result = asyncio.run(self.service.generate_async("안녕하세요", engine="google"))
+        self.assertTrue(result["success"])
+        self.assertEqual(engine.calls, 1)
+
+
+class TestEngineSlot(unittest.TestCase):
+    """동기/비동기 요청이 공유하는 엔진 슬롯 테스트"""
+
+    def test_async_waiters_share_limit_with_threads(self):
+        slot = EngineSlot(2)
+        peak = [0]
+        release_thread = threading.Event()
+
+        def thread_holder():
+            with slot:
+                release_thread.wait(2)
+
+        holder = threading.Thread(target=thread_holder)
+        holder.start()
+
+        async def worker():
+            await slot.acquire_async()
+            try:
+                peak[0] = max(peak[0], slot.in_use)
+                await asyncio.sleep(0.01)
+            finally:
+                slot.release()
+
+        async def main():
+            tasks = [asyncio.create_task(worker()) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            # 스레드가 슬롯 하나를 잡고 있는 동안 비동기 요청은 남은 1개만 사용
+            self.assertEqual(slot.in_use, 2)
+            release_thread.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        holder.join()
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(slot.in_use, 0)
+
+    def test_cancelled_waiter_does_not_leak_slot(self):
+        slot = EngineSlot(1)
+
+        async def main():
+            await slot.acquire_async()
+            waiter = asyncio.create_task(slot.acquire_async())
+            await asyncio.sleep(0)
+            slot.release()      # 대기자에게 슬롯을 넘기는 중에
+            waiter.cancel()     # 대기자가 취소됨
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0)
+            await asyncio.wait_for(slot.acquire_async(), 1)
+            slot.release()
+
+        asyncio.run(main())
+        self.assertEqual(slot.in_use, 0)
+
+
+class TestAudioDelivery(unittest.TestCase):
+    """오디오 전달 방식 (URL / 인라인 Base64) 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.audio_path = os.path.join(self.work_dir, "tts_clip.mp3")
+        with open(self.audio_path, "wb") as f:
+            f.write(b"ID3" + b"\0" * 2000)
+
+        engine = FakeEngine("google", delay=0)
+        engine.synthesize_speech = lambda text, **kwargs: TTSResult(
+            success=True, audio_url="/output/tts_clip.mp3", audio_path=self.audio_path, engine="google"
+        )
+        with patch.dict(os.environ, {"TTS_AUDIO_DELIVERY": "url", "TTS_INLINE_MAX_KB": "1"}), \
+             patch("services.tts_service.google_tts_engine", engine), \
+             patch("services.tts_service.azure_tts_engine", None), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        cache_patch = patch("services.tts_service.tts_cache_service.enabled", False)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_url_delivery_omits_base64(self):
+        result = self.service.generate("안녕하세요")
+        self.assertEqual(result["audioUrl"], "/output/tts_clip.mp3")
+        self.assertIsNone(result["audioBase64"])
+        self.assertEqual(result["audioPath"], self.audio_path)
+
+    def test_inline_delivery_encodes_file_once(self):
+        result = self.service.generate("안녕하세요", delivery="inline")
+        self.assertTrue(result["audioBase64"].startswith("SUQz"))
+        self.assertEqual(result["audioUrl"], f"data:audio/mpeg;base64,{result['audioBase64']}")
+
+    def test_auto_delivery_inlines_only_small_clips(self):
+        self.assertIsNone(self.service.generate("안녕하세요", delivery="auto")["audioBase64"])
+        self.service.inline_max_bytes = 4096
+        self.assertIsNotNone(self.service.generate("안녕하세요", delivery="auto")["audioBase64"])
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "FFmpeg 필요")
+class TestChunkedSynthesis(unittest.TestCase):
+    """긴 텍스트 청크 병렬 합성 + 병합 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.engine = FakeEngine("azure", delay=0.02, fail_texts=("실패합니다.",))
+        self.engine.synthesize_speech = self._synthesize
+        self.counter = 0
+        with patch.dict(os.environ, {"TTS_CONCURRENCY_AZURE": "2", "TTS_CHUNK_CHARS": "12"}), \
+             patch("services.tts_service.google_tts_engine", None), \
+             patch("services.tts_service.azure_tts_engine", self.engine), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        for target in ("services.tts_service.tts_cache_service.enabled", "services.tts_service.OUTPUT_DIR"):
+            patcher = patch(target, False if target.endswith("enabled") else self.work_dir)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _synthesize(self, text, **kwargs):
+        """글자당 100ms 길이의 WAV + 글자 단위 타임스탬프 생성"""
+        with self.engine.lock:
+            self.counter += 1
+            self.engine.active += 1
+            self.engine.peak = max(self.engine.peak, self.engine.active)
+            path = os.path.join(self.work_dir, f"chunk_{self.counter}.wav")
+        time.sleep(self.engine.delay)
+        with self.engine.lock:
+            self.engine.active -= 1
+        if text in self.engine.fail_texts:
+            return TTSResult(success=False, audio_url="", engine="azure", error="quota")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(b"\x00\x00" * 1600 * len(text))
+        timestamps = [WordTimestamp(ch, i * 100, i * 100 + 100) for i, ch in enumerate(text)]
+        return TTSResult(success=True, audio_url="", audio_path=path, timestamps=timestamps, engine="azure")
+
+    def test_long_text_is_stitched_into_one_timeline(self):
+        text = "첫번째 문장입니다. 두번째 문장입니다. 세번째."
+        result = self.service.generate(text, engine="azure")
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(self.engine.peak, 2)
+        self.assertEqual(result["duration"], 2.4)
+        starts = {ts["text"]: ts["start"] for ts in result["alignment"]["timeline"]}
+        self.assertEqual(starts["두"], 1.0)
+        self.assertEqual(starts["세"], 2.0)
+        # 청크 중간 파일은 정리되고 최종 MP3만 남음
+        self.assertEqual(os.listdir(self.work_dir), [os.path.basename(result["audioPath"])])
+
+    def test_failed_chunk_fails_whole_request(self):
+        result = self.service.generate("첫번째 문장입니다. 실패합니다.", engine="azure")
+        self.assertFalse(result["success"])
+        self.assertIn("청크 2/2", result["error"])
+        self.assertEqual(os.listdir(self.work_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
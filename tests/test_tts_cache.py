@@ -0,0 +1,131 @@
+"""
+TTSCacheService 테스트
+음성 이름 해석/텍스트 정규화 기반 캐시 키, 오디오 + 타임스탬프 복원, 적중/미스 통계 검증
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.file_cache_service import FileCacheService
+from services.tts_base import TTSEngineBase, TTSResult, WordTimestamp
+from services.tts_cache_service import TTSCacheService
+
+
+class FakeEngine(TTSEngineBase):
+    """숏컷 음성과 안정성 설정을 가진 테스트용 엔진"""
+
+    SHORTCUTS = {"female": "ko-KR-SunHiNeural"}
+
+    def __init__(self):
+        super().__init__("fake")
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def synthesize_speech(self, text, voice_id=None, language="ko-KR", speed=1.0, **kwargs):
+        raise NotImplementedError
+
+    def resolve_voice(self, voice_id=None, **kwargs):
+        return self.SHORTCUTS.get(voice_id, voice_id or "ko-KR-SunHiNeural")
+
+    def cache_params(self, **kwargs):
+        return {"stability": kwargs.get("stability", 0.5)}
+
+
+class TestTTSCacheService(unittest.TestCase):
+    """TTS 결과 캐시 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.work_dir, "output")
+        os.makedirs(self.output_dir)
+        self.service = TTSCacheService(
+            FileCacheService("tts-test", os.path.join(self.work_dir, "cache"), max_size_mb=1, suffix=".mp3"),
+            output_dir=self.output_dir
+        )
+        self.engine = FakeEngine()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _result(self):
+        audio_path = os.path.join(self.work_dir, "generated.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"ID3-mp3-bytes")
+        timestamps = [WordTimestamp("안녕하세요", 0, 600), WordTimestamp("여러분", 650, 1100)]
+        return TTSResult(success=True, audio_url="data:audio/mpeg;base64,", audio_path=audio_path,
+                         timestamps=timestamps, total_duration_ms=1100,
+                         srt=self.engine.generate_srt(timestamps), engine="fake")
+
+    def test_key_uses_resolved_voice_and_normalized_text(self):
+        key = self.service.make_key(self.engine, "안녕하세요  여러분\n", "female")
+        self.assertEqual(key, self.service.make_key(self.engine, "안녕하세요 여러분", "ko-KR-SunHiNeural"))
+        self.assertNotEqual(key, self.service.make_key(self.engine, "안녕하세요 여러분", "female", speed=1.2))
+        self.assertNotEqual(key, self.service.make_key(self.engine, "안녕하세요 여러분", "female", stability=0.8))
+
+    def test_round_trip_restores_audio_and_timestamps(self):
+        key = self.service.make_key(self.engine, "안녕하세요 여러분", "female")
+        self.assertIsNone(self.service.get(key))
+        self.assertTrue(self.service.put(key, self._result()))
+
+        cached = self.service.get(key)
+        self.assertTrue(cached.success)
+        self.assertEqual([ts.text for ts in cached.timestamps], ["안녕하세요", "여러분"])
+        self.assertEqual(cached.timestamps[1].start_ms, 650)
+        self.assertEqual(cached.total_duration_ms, 1100)
+        self.assertIn("00:00:00,650 --> 00:00:01,100", cached.srt)
+        self.assertEqual(cached.audio_url, f"/output/{os.path.basename(cached.audio_path)}")
+
+        # 호출 측에서 파일을 덮어써도 캐시 원본은 그대로 (하드링크가 아닌 복사)
+        self.assertEqual(os.path.dirname(cached.audio_path), self.output_dir)
+        with open(cached.audio_path, "wb") as f:
+            f.write(b"edited")
+        with open(self.service.get(key).audio_path, "rb") as f:
+            self.assertEqual(f.read(), b"ID3-mp3-bytes")
+
+        stats = self.service.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (2, 1, 1))
+
+    def test_repeated_hits_reuse_one_output_copy(self):
+        key = self.service.make_key(self.engine, "안녕하세요 여러분", "female")
+        self.service.put(key, self._result())
+
+        paths = {self.service.get(key).audio_path for _ in range(5)}
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(len(os.listdir(self.output_dir)), 1)
+
+        # 수정된 사본은 덮어쓰지 않고 새 사본을 만듦
+        edited = paths.pop()
+        with open(edited, "wb") as f:
+            f.write(b"normalized")
+        fresh = self.service.get(key).audio_path
+        self.assertNotEqual(fresh, edited)
+        with open(edited, "rb") as f:
+            self.assertEqual(f.read(), b"normalized")
+        self.assertEqual(self.service.get_stats()["hits"], 6)
+
+    def test_failed_copy_counts_as_miss(self):
+        key = self.service.make_key(self.engine, "안녕하세요 여러분", "female")
+        self.service.put(key, self._result())
+
+        with patch("services.tts_cache_service.shutil.copyfile", side_effect=OSError("disk full")):
+            self.assertIsNone(self.service.get(key))
+        self.assertIsNotNone(self.service.get(key))
+
+        stats = self.service.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_failed_result_is_not_stored(self):
+        key = self.service.make_key(self.engine, "실패", None)
+        self.assertFalse(self.service.put(key, TTSResult(success=False, audio_url="", error="quota")))
+        self.assertEqual(self.service.get_stats()["total_entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
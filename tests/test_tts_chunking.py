@@ -0,0 +1,79 @@
+"""
+TTS 청크 분할/병합 테스트
+문장 경계 분할, 샘플 단위 병합과 단어 타임스탬프 오프셋 보정 검증
+"""
+import os
+import sys
+import wave
+import shutil
+import tempfile
+import unittest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_base import TTSResult, WordTimestamp
+from services.tts_chunking import split_text, stitch_chunks
+
+
+def write_wav(path, frames, sample_rate=16000):
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(b"\x10\x00" * frames)
+
+
+class TestSplitText(unittest.TestCase):
+    """문장 경계 청크 분할 테스트"""
+
+    def test_short_text_is_single_chunk(self):
+        self.assertEqual(split_text("  짧은 문장입니다.  ", 100), ["짧은 문장입니다."])
+        self.assertEqual(split_text("긴 문장도 분할하지 않음. 두 번째.", 0), ["긴 문장도 분할하지 않음. 두 번째."])
+
+    def test_splits_at_sentence_boundaries(self):
+        text = '첫 문장입니다. "인용이에요!" 그리고 세번째 문장? 네.\n새 줄입니다.'
+        chunks = split_text(text, 20)
+        self.assertEqual(chunks, ['첫 문장입니다. "인용이에요!"', '그리고 세번째 문장? 네.', '새 줄입니다.'])
+        self.assertTrue(all(len(chunk) <= 20 for chunk in chunks))
+
+    def test_long_sentence_falls_back_to_clauses(self):
+        chunks = split_text("아주 긴 절이 이어지고, 또 이어지고, 계속 이어집니다.", 16)
+        self.assertEqual(chunks, ["아주 긴 절이 이어지고,", "또 이어지고,", "계속 이어집니다."])
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "FFmpeg 필요")
+class TestStitchChunks(unittest.TestCase):
+    """청크 오디오 병합 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _chunk(self, name, frames, words):
+        path = os.path.join(self.work_dir, f"{name}.wav")
+        write_wav(path, frames)
+        timestamps = [WordTimestamp(word, i * 200, i * 200 + 150) for i, word in enumerate(words)]
+        return TTSResult(success=True, audio_url="", audio_path=path, timestamps=timestamps)
+
+    def test_offsets_follow_exact_sample_counts(self):
+        chunks = [
+            self._chunk("a", 16000 + 8, ["하나", "둘"]),   # 1000.5ms
+            self._chunk("b", 8000, ["셋"]),                # 500ms
+            self._chunk("c", 4000, ["넷", "다섯"])
+        ]
+        output = os.path.join(self.work_dir, "out.mp3")
+        timestamps, total_ms = stitch_chunks(chunks, output, self.work_dir)
+
+        self.assertTrue(os.path.getsize(output) > 0)
+        self.assertEqual(total_ms, 1750)
+        self.assertEqual([ts.text for ts in timestamps], ["하나", "둘", "셋", "넷", "다섯"])
+        self.assertEqual((timestamps[2].start_ms, timestamps[2].end_ms), (1000, 1150))
+        self.assertEqual(timestamps[4].start_ms, 1700)
+        self.assertEqual(sorted(os.listdir(self.work_dir)), ["a.wav", "b.wav", "c.wav", "out.mp3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
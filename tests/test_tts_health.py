@@ -0,0 +1,134 @@
+"""
+TTS 엔진 상태 추적 / 서킷 브레이커 / 라우팅 테스트
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_base import TTSEngineBase, TTSResult
+from services.tts_health import EngineHealth
+from services.tts_service import TTSService
+
+
+class GenderEngine(TTSEngineBase):
+    """성별 음성 매핑을 지원하는 테스트용 엔진"""
+
+    def __init__(self, name, voices, fail=False):
+        super().__init__(name)
+        self.voices = voices  # {"female": "...", "male": "..."}
+        self.fail = fail
+        self.calls = []
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def voice_gender(self, voice_id=None, **kwargs):
+        if voice_id is None:
+            return "female"
+        return next((gender for gender, name in self.voices.items() if name == voice_id), None)
+
+    def voice_for_gender(self, gender):
+        return self.voices.get(gender)
+
+    def synthesize_speech(self, text, voice_id=None, language="ko-KR", speed=1.0, **kwargs):
+        self.calls.append(voice_id)
+        if self.fail:
+            return TTSResult(success=False, audio_url="", engine=self.engine_name, error="503 unavailable")
+        return TTSResult(success=True, audio_url=f"/output/{self.engine_name}.mp3", engine=self.engine_name)
+
+
+class TestEngineHealth(unittest.TestCase):
+    """서킷 브레이커 상태 전이 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        health = EngineHealth("google", failure_threshold=3, cooldown_seconds=30)
+        health.record(False, 1.0, "timeout")
+        health.record(True, 0.5)
+        health.record(False, 1.0, "timeout")
+        health.record(False, 1.0, "timeout")
+        self.assertTrue(health.allow_request())  # 성공이 끼어 있어 연속 2회
+
+        health.record(False, 1.0, "timeout")
+        self.assertFalse(health.allow_request())
+        snapshot = health.snapshot()
+        self.assertEqual(snapshot["state"], "open")
+        self.assertEqual(snapshot["errorRatePercent"], 80.0)
+        self.assertEqual(snapshot["avgLatencySeconds"], 0.5)
+
+    def test_half_open_allows_single_probe(self):
+        health = EngineHealth("google", failure_threshold=1, cooldown_seconds=30)
+        with patch("services.tts_health.time.time", return_value=1000.0):
+            health.record(False, 1.0, "timeout")
+        with patch("services.tts_health.time.time", return_value=1031.0):
+            self.assertTrue(health.allow_request())
+            self.assertFalse(health.allow_request())  # 시험 요청 진행 중
+            health.record(False, 1.0, "timeout")       # 시험 실패 → 다시 열림
+            self.assertEqual(health.state, "open")
+        with patch("services.tts_health.time.time", return_value=1062.0):
+            self.assertTrue(health.allow_request())
+            health.record(True, 0.4)
+        self.assertEqual(health.state, "closed")
+        self.assertTrue(health.allow_request())
+
+
+class TestHealthRouting(unittest.TestCase):
+    """회로가 열린 엔진 요청의 라우팅 / 즉시 실패 테스트"""
+
+    def setUp(self):
+        self.google = GenderEngine("google", {"female": "Aoede", "male": "Charon"}, fail=True)
+        self.azure = GenderEngine("azure", {"female": "ko-KR-SunHiNeural", "male": "ko-KR-InJoonNeural"})
+        with patch.dict(os.environ, {"TTS_BREAKER_FAILURES": "2", "TTS_BREAKER_COOLDOWN": "60"}), \
+             patch("services.tts_service.google_tts_engine", self.google), \
+             patch("services.tts_service.azure_tts_engine", self.azure), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        cache_patch = patch("services.tts_service.tts_cache_service.enabled", False)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def _open_google_circuit(self):
+        for _ in range(2):
+            result = self.service.generate("문장", voice_id="Charon", engine="google")
+            # 회로가 닫혀 있는 동안에는 실패해도 다른 엔진으로 넘기지 않음 (NO FALLBACK)
+            self.assertFalse(result["success"])
+            self.assertFalse(result["fallbackUsed"])
+        self.assertEqual(self.azure.calls, [])
+
+    def test_open_circuit_routes_to_compatible_voice(self):
+        self._open_google_circuit()
+        result = self.service.generate("문장", voice_id="Charon", engine="google")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["usedEngine"], "azure")
+        self.assertEqual(result["routedFrom"], "google")
+        self.assertEqual(self.azure.calls, ["ko-KR-InJoonNeural"])
+        self.assertEqual(len(self.google.calls), 2)  # 열린 회로로는 호출하지 않음
+
+        status = self.service.get_status()
+        self.assertFalse(status["engineStatus"]["google"])
+        self.assertEqual(status["engineHealth"]["engines"]["google"]["state"], "open")
+        self.assertEqual(status["engineHealth"]["routing"]["counts"], {"google->azure": 1})
+
+    def test_incompatible_voice_fails_fast(self):
+        self._open_google_circuit()
+        result = self.service.generate("문장", voice_id="Puck", engine="google")
+
+        self.assertFalse(result["success"])
+        self.assertTrue(result["circuitOpen"])
+        self.assertEqual(len(self.google.calls), 2)
+        self.assertEqual(self.azure.calls, [])
+
+    def test_routing_can_be_disabled(self):
+        self.service.health_routing = False
+        self._open_google_circuit()
+        result = self.service.generate("문장", voice_id="Charon", engine="google")
+        self.assertTrue(result["circuitOpen"])
+        self.assertEqual(self.azure.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+TTS 클립 라우드니스 정규화 테스트
+BS.1770 기준 톤 측정값, 게이팅, 피크 제한, 파일 일괄 정규화 검증
+"""
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    from services.tts_loudness import LoudnessNormalizer
+except ImportError:  # numpy 미설치 환경
+    np = None
+
+SAMPLE_RATE = 48000
+
+
+def tone(seconds, amplitude, frequency=997):
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+@unittest.skipIf(np is None, "numpy 필요")
+class TestLoudnessMeasure(unittest.TestCase):
+    """통합 라우드니스 측정 테스트"""
+
+    def setUp(self):
+        self.normalizer = LoudnessNormalizer()
+
+    def test_reference_tones(self):
+        # BS.1770: 997Hz 0dBFS 사인 (모노) = -3.01 LUFS
+        loudness = self.normalizer.measure([tone(3, 1.0), tone(3, 0.1), tone(0.2, 0.1), np.zeros(SAMPLE_RATE)])
+        self.assertAlmostEqual(loudness[0], -3.01, delta=0.05)
+        self.assertAlmostEqual(loudness[1], -23.01, delta=0.05)
+        self.assertAlmostEqual(loudness[2], -23.01, delta=0.1)  # 400ms 미만은 전체를 한 블록으로
+        self.assertEqual(loudness[3], -np.inf)
+
+    def test_relative_gate_ignores_quiet_tail(self):
+        quiet = np.random.default_rng(0).normal(0, 0.001, SAMPLE_RATE * 5).astype(np.float32)
+        loudness = self.normalizer.measure([np.concatenate([tone(3, 0.1), quiet])])
+        self.assertAlmostEqual(loudness[0], -23.01, delta=0.3)
+
+    def test_batches_match_single_measurement(self):
+        signals = [tone(1 + index * 0.7, 0.05 * (index + 1)) for index in range(6)]
+        small = LoudnessNormalizer(max_batch_samples=LoudnessNormalizer.FFT_SIZE * 4)
+        np.testing.assert_allclose(small.measure(signals), self.normalizer.measure(signals), atol=1e-6)
+        single = [self.normalizer.measure([signal])[0] for signal in signals]
+        np.testing.assert_allclose(self.normalizer.measure(signals), single, atol=1e-6)
+
+    def test_peak_limit_keeps_ceiling(self):
+        signal = np.concatenate([tone(1, 0.1), tone(0.05, 0.9), tone(1, 0.1)])
+        limited = self.normalizer.apply_gain(signal, 6.0, -1.0)
+        self.assertLessEqual(np.abs(limited).max(), 10 ** (-1 / 20) + 1e-6)
+        # 피크에서 떨어진 구간은 이득이 그대로 적용됨
+        self.assertAlmostEqual(np.abs(limited[:SAMPLE_RATE // 2]).max(), 0.1 * 10 ** (6 / 20), places=3)
+
+
+@unittest.skipIf(np is None or shutil.which("ffmpeg") is None, "numpy/FFmpeg 필요")
+class TestLoudnessFiles(unittest.TestCase):
+    """파일 일괄 정규화 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.normalizer = LoudnessNormalizer(workers=2)
+
+    def test_normalizes_clips_to_target(self):
+        paths = []
+        for index, amplitude in enumerate([0.02, 0.2, 0.6]):
+            path = os.path.join(self.temp_dir, f"clip_{index}.wav")
+            self.normalizer._encode(tone(2, amplitude), path)
+            paths.append(path)
+
+        progress = []
+        results = self.normalizer.normalize_files(paths, target_lufs=-18.0,
+                                                  on_result=lambda index, result: progress.append(index))
+
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(sorted(progress), [0, 1, 2])
+        loudness = self.normalizer.measure([self.normalizer._decode(path) for path in paths])
+        np.testing.assert_allclose(loudness, [-18.0] * 3, atol=0.1)
+
+        # 이미 목표 라우드니스인 파일은 다시 인코딩하지 않음
+        again = self.normalizer.normalize_files(paths, target_lufs=-18.0)
+        self.assertTrue(all(result["skipped"] for result in again))
+
+    def test_missing_file_reports_error(self):
+        results = self.normalizer.normalize_files([os.path.join(self.temp_dir, "missing.mp3")])
+        self.assertFalse(results[0]["success"])
+        self.assertIn("디코딩 실패", results[0]["error"])
+
+    def test_non_audio_file_is_not_overwritten(self):
+        path = os.path.join(self.temp_dir, "final.mp4")
+        subprocess.run(["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", "sine=d=1", "-f", "lavfi",
+                        "-i", "color=s=64x64:d=1", "-shortest", path], check=True)
+        with open(path, "rb") as f:
+            original = f.read()
+
+        results = self.normalizer.normalize_files([path], target_lufs=-18.0)
+
+        self.assertFalse(results[0]["success"])
+        self.assertIn("지원하지 않는 오디오 형식", results[0]["error"])
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+음성 목록 캐시 / 미리듣기 클립 테스트
+TTL 만료 시 백그라운드 갱신, 갱신 실패 시 이전 목록 유지, 음성별 미리듣기 1회 합성 검증
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_base import TTSEngineBase, TTSResult
+from services.tts_service import TTSService
+from services.tts_voice_catalog import VoiceCatalog, VoicePreviewStore
+
+
+class PreviewEngine(TTSEngineBase):
+    """합성 횟수를 기록하고 출력 폴더에 가짜 MP3를 쓰는 테스트용 엔진"""
+
+    def __init__(self, name, output_dir):
+        super().__init__(name)
+        self.output_dir = output_dir
+        self.calls = []
+        self.list_calls = 0
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def get_voices_list(self) -> list:
+        self.list_calls += 1
+        return [{"id": "voice-a", "name": "A"}, {"id": "voice-b", "name": "B"}]
+
+    def synthesize_speech(self, text, voice_id=None, language="ko-KR", speed=1.0, **kwargs):
+        self.calls.append(voice_id)
+        path = os.path.join(self.output_dir, f"tts_{len(self.calls)}.mp3")
+        with open(path, "wb") as f:
+            f.write(f"{voice_id}:{text}".encode("utf-8"))
+        return TTSResult(success=True, audio_url=f"/output/{os.path.basename(path)}", audio_path=path,
+                         engine=self.engine_name)
+
+
+class TestVoiceCatalog(unittest.TestCase):
+    """TTL 캐시 + 백그라운드 갱신 테스트"""
+
+    def test_serves_cached_list_and_refreshes_in_background(self):
+        calls = []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            if len(calls) > 1:
+                release.wait(1)
+            return {"azure": [{"id": f"v{len(calls)}"}]}
+
+        catalog = VoiceCatalog(loader, ttl_seconds=60)
+        self.assertEqual(catalog.get(), {"azure": [{"id": "v1"}]})
+        self.assertEqual(catalog.get(), {"azure": [{"id": "v1"}]})
+        self.assertEqual(len(calls), 1)
+
+        catalog.invalidate()
+        # 만료되어도 갱신을 기다리지 않고 이전 목록을 바로 반환
+        self.assertEqual(catalog.get(), {"azure": [{"id": "v1"}]})
+        self.assertTrue(catalog.get_stats()["refreshing"])
+        release.set()
+        for _ in range(100):
+            if not catalog.get_stats()["refreshing"]:
+                break
+            time.sleep(0.01)
+        self.assertEqual(catalog.get(), {"azure": [{"id": "v2"}]})
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_refresh_keeps_previous_list(self):
+        responses = [{"azure": [{"id": "v1"}]}, RuntimeError("API 오류")]
+
+        def loader():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        catalog = VoiceCatalog(loader, ttl_seconds=60)
+        catalog.get()
+        self.assertEqual(catalog.get(force_refresh=True), {"azure": [{"id": "v1"}]})
+        self.assertEqual(catalog.get_stats()["lastError"], "API 오류")
+
+
+class TestVoicePreviews(unittest.TestCase):
+    """음성별 미리듣기 클립 1회 합성 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.azure = PreviewEngine("azure", self.temp_dir)
+        with patch("services.tts_service.google_tts_engine", None), \
+             patch("services.tts_service.azure_tts_engine", self.azure), \
+             patch("services.tts_service.elevenlabs_tts_engine", None):
+            self.service = TTSService()
+        self.service.voice_previews = VoicePreviewStore(
+            os.path.join(self.temp_dir, "voice_previews"), text="미리듣기", output_dir=self.temp_dir
+        )
+        cache_patch = patch("services.tts_service.tts_cache_service.enabled", False)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def test_preview_is_rendered_once(self):
+        with patch("services.tts_service.tts_cache_service.put") as cache_put:
+            first = self.service.get_voice_preview("azure", "voice-a")
+            second = self.service.get_voice_preview("azure", "voice-a")
+
+        # 합성된 파일은 미리듣기 경로로 옮겨지고 출력 폴더/TTS 캐시에 사본이 남지 않음
+        cache_put.assert_not_called()
+        self.assertEqual(os.listdir(self.temp_dir), ["voice_previews"])
+
+        self.assertTrue(first["success"])
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(first["previewUrl"], second["previewUrl"])
+        self.assertTrue(first["previewUrl"].startswith("/output/voice_previews/azure_"))
+        self.assertEqual(self.azure.calls, ["voice-a"])
+
+    def test_voice_list_is_cached_and_marks_rendered_previews(self):
+        self.service.get_voice_preview("azure", "voice-a")
+        voices = self.service.get_voices_list()["azure"]
+        self.service.get_voices_list()
+
+        self.assertEqual(self.azure.list_calls, 1)
+        self.assertIsNotNone(voices[0]["previewUrl"])
+        self.assertIsNone(voices[1]["previewUrl"])
+
+    def test_render_missing_previews(self):
+        self.service.get_voice_preview("azure", "voice-a")
+        results = self.service.render_voice_previews()
+
+        self.assertEqual([r["voiceId"] for r in results], ["voice-b"])
+        self.assertEqual(sorted(self.azure.calls), ["voice-a", "voice-b"])
+        self.assertEqual(self.service.render_voice_previews(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
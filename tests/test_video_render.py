@@ -0,0 +1,951 @@
+"""
+VideoService 렌더링 파이프라인 테스트
+FFmpeg 없이 세그먼트 생성 함수를 목킹하여 씬 순서/대체 세그먼트/진행률 검증
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import random
+import shutil
+import subprocess
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.video_service import VideoService, RenderProgress, EncodeSpeedEstimator
+from services.file_cache_service import FileCacheService
+from services.task_service import task_manager, TaskCancelledError
+
+
+def _make_scenes(count: int):
+    return [
+        {"sceneId": i + 1, "visualUrl": f"/output/img_{i}.png", "audioUrl": f"/output/tts_{i}.mp3", "duration": 3}
+        for i in range(count)
+    ]
+
+
+class TestParallelRender(unittest.TestCase):
+    """병렬 씬 렌더링 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.service.render_workers = 4
+        self.service.ffmpeg_threads = 2
+
+    def _fake_segment(self, fail_ids=()):
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            # 완료 순서가 뒤섞이도록 임의 지연
+            time.sleep(random.uniform(0, 0.02))
+            if any(f"img_{i}." in visual_url for i in fail_ids):
+                return False
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            return True
+        return create_segment
+
+    def _fake_empty(self, duration, output_path, resolution=None, **kwargs):
+        with open(output_path, "w") as f:
+            f.write("empty")
+        return True
+
+    def _render(self, scenes, parallel=True, profile=None):
+        written = {}
+        progress = []
+
+        def fake_run(cmd, **kwargs):
+            concat_file = cmd[cmd.index("-i") + 1]
+            with open(concat_file) as f:
+                written["concat"] = [line.split("'")[1] for line in f if line.strip()]
+            written["contents"] = []
+            for path in written["concat"]:
+                with open(path) as seg:
+                    written["contents"].append(seg.read())
+
+            class Result:
+                returncode = 0
+                stderr = ""
+            return Result()
+
+        with patch.object(self.service, "_create_segment", side_effect=self._fake_segment(fail_ids=(2,))), \
+             patch.object(self.service, "_create_empty_segment", side_effect=self._fake_empty), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            written["result"] = self.service.generate_final_video(
+                merged_groups=[], standalone=scenes, parallel=parallel, profile=profile,
+                progress_callback=lambda p, m: progress.append(p)
+            )
+        return written, progress
+
+    def test_segment_order_is_preserved(self):
+        scenes = _make_scenes(8)
+        written, _ = self._render(scenes)
+        expected = [s["visualUrl"] if i != 2 else "empty" for i, s in enumerate(scenes)]
+        self.assertEqual(written["contents"], expected)
+
+    def test_progress_counts_completed_scenes(self):
+        written, progress = self._render(_make_scenes(8))
+        scene_progress = [p for p in progress if 10 < p <= 80]
+        self.assertEqual(len(scene_progress), 8)
+        self.assertEqual(scene_progress, sorted(scene_progress))
+        self.assertEqual(scene_progress[-1], 80)
+
+    def test_draft_result_is_tagged(self):
+        written, _ = self._render(_make_scenes(2), profile="draft")
+        result = written["result"]
+        self.assertTrue(result["isDraft"])
+        self.assertEqual(result["profile"], "draft")
+        self.assertTrue(result["videoUrl"].endswith("_draft.mp4"))
+
+    def test_result_reports_scene_modes(self):
+        written, _ = self._render(_make_scenes(4))
+        stats = written["result"]["renderStats"]
+        self.assertEqual((stats["encoded"], stats["filler"], stats["copied"]), (3, 1, 0))
+        self.assertEqual([s["mode"] for s in stats["scenes"]], ["encoded", "encoded", "filler", "encoded"])
+
+    def test_sequential_mode_matches_parallel(self):
+        scenes = _make_scenes(5)
+        parallel_written, _ = self._render(scenes, parallel=True)
+        sequential_written, _ = self._render(scenes, parallel=False)
+        self.assertEqual(parallel_written["contents"], sequential_written["contents"])
+
+
+class TestResumableRender(unittest.TestCase):
+    """렌더링 매니페스트 기반 이어서 렌더링 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.work_dir = tempfile.mkdtemp()
+        self.service.renders_dir = os.path.join(self.work_dir, "renders")
+        self.service.output_dir = self.work_dir
+        self.service.render_workers = 2
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _render(self, scenes, merge_ok=True, resume=False):
+        rendered = []
+        concat = {}
+
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            rendered.append(visual_url)
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            return True
+
+        def fake_run(cmd, **kwargs):
+            with open(cmd[cmd.index("-i") + 1]) as f:
+                concat["files"] = [line.split("'")[1] for line in f if line.strip()]
+            if merge_ok:
+                with open(cmd[-1], "w") as f:
+                    f.write("final")
+            return subprocess.CompletedProcess(cmd, 0 if merge_ok else 1, stdout="", stderr="")
+
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            if resume:
+                result = self.service.resume_render("task-1")
+            else:
+                result = self.service.generate_final_video(merged_groups=[], standalone=scenes,
+                                                           render_id="task-1")
+        return result, rendered, concat
+
+    def test_resume_skips_finished_segments(self):
+        scenes = _make_scenes(4)
+        with self.assertRaises(Exception):
+            self._render(scenes, merge_ok=False)
+
+        manifest = self.service.load_render_manifest("task-1")
+        self.assertEqual(manifest["status"], "failed")
+        self.assertEqual([seg["status"] for seg in manifest["segments"]], ["done"] * 4)
+        self.assertEqual(self.service.list_resumable_renders()[0]["completedScenes"], 4)
+
+        result, rendered, concat = self._render(None, resume=True)
+        self.assertEqual(rendered, [])
+        self.assertEqual([os.path.basename(f) for f in concat["files"]],
+                         [f"segment_{i:04d}.mp4" for i in range(4)])
+        self.assertEqual(result["renderStats"]["resumed"], 4)
+        self.assertEqual(result["videoUrl"], f"/output/{manifest['finalFilename']}")
+        self.assertEqual(self.service.load_render_manifest("task-1")["status"], "completed")
+        self.assertEqual(self.service.list_resumable_renders(), [])
+
+    def test_changed_scene_is_rendered_again(self):
+        scenes = _make_scenes(3)
+        with self.assertRaises(Exception):
+            self._render(scenes, merge_ok=False)
+
+        scenes[1] = dict(scenes[1], visualUrl="/output/img_new.png")
+        _, rendered, _ = self._render(scenes)
+        self.assertEqual(rendered, ["/output/img_new.png"])
+
+    def test_completed_render_returns_stored_result(self):
+        result, _, _ = self._render(_make_scenes(2))
+        again, rendered, _ = self._render(None, resume=True)
+        self.assertEqual(rendered, [])
+        self.assertEqual(again["videoUrl"], result["videoUrl"])
+
+
+class TestRenderCancellation(unittest.TestCase):
+    """작업 취소 시 남은 씬 중단 + 중간 파일 정리 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.work_dir = tempfile.mkdtemp()
+        self.service.renders_dir = os.path.join(self.work_dir, "renders")
+        self.task_id = task_manager.create_task("video_generation")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_cancel_stops_remaining_scenes(self):
+        rendered = []
+
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            rendered.append(output_path)
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            if len(rendered) == 2:
+                task_manager.cancel_task(self.task_id)
+            return True
+
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_create_empty_segment") as empty, \
+             patch.object(self.service, "_run_ffmpeg") as run:
+            with self.assertRaises(TaskCancelledError):
+                self.service.generate_final_video(merged_groups=[], standalone=_make_scenes(5), parallel=False,
+                                                  render_id=self.task_id, task_id=self.task_id)
+            empty.assert_not_called()
+            run.assert_not_called()
+
+        self.assertEqual(len(rendered), 2)
+        self.assertFalse(any(os.path.exists(path) for path in rendered))
+        self.assertIsNone(self.service.load_render_manifest(self.task_id))
+
+    def test_killed_encode_is_not_replaced_with_filler(self):
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            # FFmpeg가 취소로 종료되어 실패한 상황
+            task_manager.cancel_task(self.task_id)
+            return False
+
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_create_empty_segment") as empty:
+            with self.assertRaises(TaskCancelledError):
+                self.service._render_scene(0, _make_scenes(1)[0], 1, task_id=self.task_id)
+            empty.assert_not_called()
+
+
+class TestMasterAudio(unittest.TestCase):
+    """공용 마스터 오디오 mux 테스트"""
+
+    MASTER = "http://localhost:8000/output/segments/session_1/merged_audio.mp3"
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+
+    def _scenes(self, ranges, url=None):
+        return [
+            {"sceneId": i + 1, "visualUrl": f"/output/img_{i}.png",
+             "audioUrl": f"{url or self.MASTER}#t={start},{end}", "duration": round(end - start)}
+            for i, (start, end) in enumerate(ranges)
+        ]
+
+    def test_durations_follow_master_timeline(self):
+        # 구간 사이의 빈 공간(2.5~3.0)은 앞 씬 영상 길이에 포함되어야 싱크 유지
+        master = self.service._detect_master_audio(self._scenes([(1.0, 2.5), (3.0, 5.2), (5.2, 7.0)]))
+        self.assertEqual(master["url"], self.MASTER)
+        self.assertEqual(master["start"], 1.0)
+        self.assertEqual(master["durations"], [2.0, 2.2, 1.8])
+        self.assertAlmostEqual(master["total"], 6.0)
+
+    def test_mixed_sources_are_not_master(self):
+        scenes = self._scenes([(0, 2), (2, 4)])
+        scenes[1]["audioUrl"] = "/output/tts_1.mp3"
+        self.assertIsNone(self.service._detect_master_audio(scenes))
+
+        scenes = self._scenes([(0, 2)]) + self._scenes([(2, 4)], url="/output/other.mp3")
+        self.assertIsNone(self.service._detect_master_audio(scenes))
+
+    def test_visual_audio_disables_master(self):
+        scenes = self._scenes([(0, 2), (2, 4)])
+        scenes[0]["visualUrl"] = "https://example.com/clip.mp4"
+        with patch.object(self.service, "_has_audio", return_value=True):
+            self.assertIsNone(self.service._detect_master_audio(scenes))
+        with patch.object(self.service, "_has_audio", return_value=False):
+            self.assertIsNotNone(self.service._detect_master_audio(scenes))
+        scenes[0]["videoVolume"] = 0
+        with patch.object(self.service, "_has_audio", return_value=True):
+            self.assertIsNotNone(self.service._detect_master_audio(scenes))
+
+    def test_master_mode_renders_video_only_and_muxes_once(self):
+        calls = []
+        commands = []
+
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            calls.append((audio_url, duration, kwargs.get("video_only")))
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            return True
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+
+            class Result:
+                returncode = 0
+                stderr = ""
+            return Result()
+
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_resolve_input", return_value="/data/merged_audio.mp3"), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            result = self.service.generate_final_video(
+                merged_groups=[], standalone=self._scenes([(0.5, 2.0), (2.0, 4.5)]), parallel=False
+            )
+
+        self.assertEqual(result["audioMode"], "master")
+        self.assertEqual(calls, [(None, 1.5, True), (None, 2.5, True)])
+        self.assertEqual(len(commands), 1)
+        cmd = commands[0]
+        self.assertEqual(cmd[cmd.index("-ss") + 1], "0.5")
+        self.assertEqual(cmd[cmd.index("-t") + 1], "4.0")
+        self.assertIn("/data/merged_audio.mp3", cmd)
+        self.assertEqual(cmd[cmd.index("-c:v") + 1], "copy")
+
+    def test_master_mode_aborts_when_scene_is_missing(self):
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            if "img_1." in visual_url:
+                return False
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            return True
+
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_create_empty_segment", return_value=False), \
+             patch.object(self.service, "_resolve_input", return_value="/data/merged_audio.mp3"), \
+             patch.object(self.service, "_concat_with_master_audio") as concat:
+            with self.assertRaises(Exception) as ctx:
+                self.service.generate_final_video(
+                    merged_groups=[], standalone=self._scenes([(0, 2), (2, 4), (4, 6)]), parallel=False
+                )
+
+        # 빠진 씬을 건너뛰고 mux하면 이후 씬이 모두 어긋나므로 병합하지 않음
+        self.assertIn("[2]", str(ctx.exception))
+        concat.assert_not_called()
+
+    @unittest.skipIf(shutil.which("ffmpeg") is None, "FFmpeg 필요")
+    def test_short_clip_is_padded_to_scene_length(self):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        clip_path = os.path.join(work_dir, "clip.mp4")
+        subprocess.run(["ffmpeg", "-y", "-f", "lavfi", "-i", "testsrc=s=320x180:r=30:d=2",
+                        "-c:v", "libx264", "-pix_fmt", "yuv420p", clip_path], capture_output=True, check=True)
+        output_path = os.path.join(work_dir, "segment.mp4")
+        profile = self.service.get_render_profile("draft", "640x360")
+
+        with patch.object(self.service, "_download_file", side_effect=lambda url, dest: shutil.copy(clip_path, dest)), \
+             patch.object(self.service, "_has_audio", return_value=False), \
+             patch.object(self.service, "_is_stream_copy_compatible", return_value=True), \
+             patch("services.video_service.media_probe_service.probe", return_value={"duration": 2.0}):
+            success = self.service._create_segment("/output/clip.mp4", None, 5, output_path,
+                                                   use_cache=False, profile=profile, video_only=True)
+
+        self.assertTrue(success)
+        # 마스터 오디오는 씬 길이 기준으로 이어지므로 2초 클립도 5초 세그먼트가 되어야 싱크 유지
+        probe = subprocess.run(["ffmpeg", "-i", output_path], capture_output=True, text=True)
+        hours, minutes, seconds = probe.stderr.split("Duration: ")[1].split(",")[0].split(":")
+        self.assertAlmostEqual(int(hours) * 3600 + int(minutes) * 60 + float(seconds), 5.0, delta=0.1)
+
+    def test_per_scene_mode_keeps_scene_audio(self):
+        calls = []
+
+        def create_segment(visual_url, audio_url, duration, output_path, **kwargs):
+            calls.append((audio_url, kwargs.get("video_only")))
+            with open(output_path, "w") as f:
+                f.write(visual_url)
+            return True
+
+        class Result:
+            returncode = 0
+            stderr = ""
+
+        scenes = self._scenes([(0, 2), (2, 4)])
+        with patch.object(self.service, "_create_segment", side_effect=create_segment), \
+             patch.object(self.service, "_run_ffmpeg", return_value=Result()):
+            result = self.service.generate_final_video(
+                merged_groups=[], standalone=scenes, parallel=False, audio_mode="per_scene"
+            )
+
+        self.assertEqual(result["audioMode"], "per_scene")
+        self.assertEqual(calls, [(s["audioUrl"], False) for s in scenes])
+
+
+class TestStreamCopy(unittest.TestCase):
+    """렌더링 설정과 일치하는 클립의 스트림 복사 경로 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.profile = self.service.get_render_profile("final", "1920x1080")
+
+    def _probe(self, clip_options=None, **overrides):
+        clip_options = clip_options or {}
+        stream = {
+            "codec_type": "video", "codec_name": "h264", "profile": "High", "width": 1920, "height": 1080,
+            "pix_fmt": "yuv420p", "r_frame_rate": "30/1", "avg_frame_rate": "30/1",
+            "sample_aspect_ratio": "1:1"
+        }
+        stream.update(overrides)
+
+        class Result:
+            stdout = json.dumps({"streams": [stream]})
+        options = {"cabac": "1", "ref": "3", "8x8dct": "1", "bframes": "3", "rc": "abr"}
+        with patch("services.media_probe_service.subprocess.run", return_value=Result()), \
+             patch.object(self.service, "_clip_x264_options", return_value=dict(options, **clip_options)), \
+             patch.object(self.service, "_profile_x264_options", return_value=options):
+            return self.service._is_stream_copy_compatible("clip.mp4", self.profile)
+
+    def test_conformant_clip_is_copied(self):
+        self.assertTrue(self._probe())
+
+    def test_clip_from_other_encoder_settings_is_encoded(self):
+        # 코덱/프로필 이름이 같아도 SPS/PPS가 다르면 concat 후 디코딩이 깨짐
+        self.assertFalse(self._probe(clip_options={"cabac": "0"}))
+        self.assertFalse(self._probe(clip_options={"ref": "1"}))
+        self.assertFalse(self._probe(clip_options={"rc": "crf"}))
+        with patch.object(self.service, "_clip_x264_options", return_value=None), \
+             patch.object(self.service, "_probe_video_stream", return_value={
+                 "codec": "h264", "profile": "High", "width": 1920, "height": 1080,
+                 "pix_fmt": "yuv420p", "fps": 30.0, "cfr": True, "sar": "1:1"}):
+            self.assertFalse(self.service._is_stream_copy_compatible("clip.mp4", self.profile))
+
+    def test_x264_options_are_read_from_sei(self):
+        sei = (b"\x00\x00\x01\x06\x05x264 - core 164 - H.264/MPEG-4 AVC codec - Copyleft 2003-2024 - "
+               b"http://www.videolan.org/x264.html - options: cabac=1 ref=3 deblock=1:0:0 rc=abr\x00\x80")
+        self.assertEqual(VideoService._parse_x264_options(b"ftyp" + sei),
+                         {"cabac": "1", "ref": "3", "deblock": "1:0:0", "rc": "abr"})
+        self.assertIsNone(VideoService._parse_x264_options(b"ftyp no sei"))
+
+    @unittest.skipIf(shutil.which("ffmpeg") is None, "FFmpeg 필요")
+    def test_copied_clip_concats_with_encoded_segments(self):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        profile = self.service.get_render_profile("draft", "640x360")
+
+        def make_clip(name, video_args):
+            path = os.path.join(work_dir, name)
+            subprocess.run(["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "testsrc=s=640x360:r=30:d=2"]
+                           + video_args + [path], check=True)
+            return path
+
+        clips = {
+            # 렌더링 프로필과 같은 설정 (복사 대상)
+            "/output/same.mp4": make_clip("same.mp4", profile.video_encode_args()),
+            # 같은 H.264/해상도/fps지만 다른 프리셋 (CABAC High) - 재인코딩 대상
+            "/output/other.mp4": make_clip("other.mp4", ["-c:v", "libx264", "-preset", "medium",
+                                                          "-pix_fmt", "yuv420p", "-r", "30"]),
+        }
+        stream = {"codec": "h264", "profile": "High", "width": 640, "height": 360,
+                  "pix_fmt": "yuv420p", "fps": 30.0, "cfr": True, "sar": "1:1"}
+        master_path = os.path.join(work_dir, "master.m4a")
+        subprocess.run(["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "sine=d=6", master_path], check=True)
+
+        segments, modes = [], []
+        with patch.object(self.service, "_download_file", side_effect=lambda url, dest: shutil.copy(clips[url], dest)), \
+             patch.object(self.service, "_has_audio", return_value=False), \
+             patch.object(self.service, "_probe_video_stream", return_value=stream), \
+             patch("services.video_service.media_probe_service.probe", return_value={"duration": 2.0}):
+            for index, url in enumerate(["/output/other.mp4", "/output/same.mp4", None]):
+                output_path = os.path.join(work_dir, f"segment_{index}.mp4")
+                render_info = {}
+                self.assertTrue(self.service._create_segment(url, None, 2, output_path, use_cache=False,
+                                                             profile=profile, video_only=True,
+                                                             render_info=render_info))
+                segments.append(output_path)
+                modes.append(render_info["mode"])
+
+        self.assertEqual(modes, ["encoded", "copied", "encoded"])
+        final_path = os.path.join(work_dir, "final.mp4")
+        self.service._concat_with_master_audio(segments, {"start": 0, "total": 6, "path": master_path},
+                                               final_path, profile)
+
+        decoded = subprocess.run(["ffmpeg", "-v", "error", "-i", final_path, "-map", "0:v", "-f", "null", "-"],
+                                 capture_output=True, text=True)
+        self.assertEqual(decoded.returncode, 0)
+        self.assertEqual(decoded.stderr, "")
+
+    def test_non_conformant_clips_are_encoded(self):
+        self.assertFalse(self._probe(avg_frame_rate="24/1", r_frame_rate="24/1"))
+        self.assertFalse(self._probe(width=1280, height=720))
+        self.assertFalse(self._probe(codec_name="hevc"))
+        self.assertFalse(self._probe(pix_fmt="yuv444p"))
+        # 가변 프레임레이트
+        self.assertFalse(self._probe(r_frame_rate="60/1"))
+
+    def test_segment_uses_stream_copy(self):
+        commands = []
+
+        def fake_download(url, output_path):
+            with open(output_path, "wb") as f:
+                f.write(b"clip")
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            with open(cmd[-1], "wb") as f:
+                f.write(b"segment")
+
+            class Result:
+                returncode = 0
+                stderr = ""
+                stdout = ""
+            return Result()
+
+        output_path = os.path.join(tempfile.mkdtemp(), "segment.mp4")
+        render_info = {}
+        with patch.object(self.service, "_download_file", side_effect=fake_download), \
+             patch.object(self.service, "_has_audio", return_value=False), \
+             patch.object(self.service, "_is_stream_copy_compatible", return_value=True), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            success = self.service._create_segment(
+                "/output/motion.mp4", None, 4, output_path,
+                use_cache=False, profile=self.profile, render_info=render_info
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(render_info["mode"], "copied")
+        cmd = commands[0]
+        self.assertEqual(cmd[cmd.index("-c:v") + 1], "copy")
+        self.assertIn("0:v:0", cmd)
+        self.assertNotIn("libx264", cmd)
+        self.assertIn("aac", cmd)
+
+
+    def test_ingested_mezzanine_replaces_source_clip(self):
+        scene = {"visualUrl": "https://replicate.delivery/clip.mp4"}
+        with patch("services.video_service.mezzanine_service.lookup", return_value="/output/mezzanine/k.mp4") as lookup:
+            self.assertEqual(
+                self.service._mezzanine_visual(scene, scene["visualUrl"], self.profile), "/output/mezzanine/k.mp4"
+            )
+            lookup.assert_called_once_with(scene["visualUrl"], "1920x1080", 30)
+            # 이미지는 조회하지 않음
+            self.assertEqual(self.service._mezzanine_visual({}, "/output/img.png", self.profile), "/output/img.png")
+
+
+class TestFillerSegments(unittest.TestCase):
+    """캐시된 대체(검은 화면) 세그먼트 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.work_dir = tempfile.mkdtemp()
+        self.cache = FileCacheService("test", os.path.join(self.work_dir, "cache"), suffix=".mp4")
+        self.commands = []
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _fake_run(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        with open(cmd[-1], "wb") as f:
+            f.write(b"filler")
+
+        class Result:
+            returncode = 0
+            stderr = ""
+        return Result()
+
+    def test_filler_unit_is_encoded_once(self):
+        profile = self.service.get_render_profile("final", "1080p")
+        with patch("services.video_service.segment_cache", self.cache), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=self._fake_run):
+            for i, duration in enumerate((3, 7.5, 2)):
+                self.assertTrue(self.service._create_empty_segment(
+                    duration, os.path.join(self.work_dir, f"empty_{i}.mp4"), profile=profile
+                ))
+
+        encodes = [cmd for cmd in self.commands if "libx264" in cmd]
+        loops = [cmd for cmd in self.commands if "-stream_loop" in cmd]
+        self.assertEqual(len(encodes), 1)
+        self.assertIn("color=black:s=1920x1080:r=30:d=1", encodes[0])
+        self.assertEqual(encodes[0][encodes[0].index("-g") + 1], "30")
+        self.assertEqual([cmd[cmd.index("-t") + 1] for cmd in loops], ["3", "7.5", "2"])
+        self.assertTrue(all(cmd[cmd.index("-c") + 1] == "copy" for cmd in loops))
+        # 반복 입력은 캐시 파일이 아닌 렌더링 폴더의 사본 (사용 후 삭제), 적중률 통계에는 포함하지 않음
+        unit_inputs = [cmd[cmd.index("-i") + 1] for cmd in loops]
+        self.assertTrue(all(os.path.dirname(path) == self.work_dir for path in unit_inputs))
+        self.assertFalse(any(os.path.exists(path) for path in unit_inputs))
+        self.assertEqual((self.cache.get_stats()["hits"], self.cache.get_stats()["misses"]), (0, 0))
+
+    def test_units_are_separate_per_profile(self):
+        with patch("services.video_service.segment_cache", self.cache), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=self._fake_run):
+            self.service._create_empty_segment(3, os.path.join(self.work_dir, "a.mp4"),
+                                               profile=self.service.get_render_profile("final", "1080p"))
+            self.service._create_empty_segment(3, os.path.join(self.work_dir, "b.mp4"),
+                                               profile=self.service.get_render_profile("draft", "1080p"))
+            self.service._create_empty_segment(3, os.path.join(self.work_dir, "c.mp4"),
+                                               profile=self.service.get_render_profile("final", "1080p"),
+                                               video_only=True)
+
+        self.assertEqual(len([cmd for cmd in self.commands if "libx264" in cmd]), 3)
+
+    def test_falls_back_to_direct_encode(self):
+        with patch("services.video_service.segment_cache", self.cache), \
+             patch.object(self.service, "_get_filler_unit", return_value=None), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=self._fake_run):
+            self.assertTrue(self.service._create_empty_segment(4, os.path.join(self.work_dir, "e.mp4")))
+
+        self.assertEqual(len(self.commands), 1)
+        self.assertIn("libx264", self.commands[0])
+        self.assertIn("color=black:s=1920x1080:r=30:d=4", self.commands[0])
+
+
+class TestStillImagePath(unittest.TestCase):
+    """이미지 씬 고속 경로 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.work_dir = tempfile.mkdtemp()
+        self.profile = self.service.get_render_profile("final", "1080p")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _segment_command(self, still_path="/tmp/still.png", unit_path="/tmp/still_unit.mp4", **kwargs):
+        commands = []
+
+        def fake_download(url, output_path):
+            with open(output_path, "wb") as f:
+                f.write(b"png")
+
+        def fake_run(cmd, **run_kwargs):
+            commands.append(cmd)
+            with open(cmd[-1], "wb") as f:
+                f.write(b"segment")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch.object(self.service, "_download_file", side_effect=fake_download), \
+             patch.object(self.service, "_prepare_still_image", return_value=still_path), \
+             patch.object(self.service, "_encode_still_unit", return_value=unit_path), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            self.assertTrue(self.service._create_segment(
+                "/output/scene.png", None, 4, os.path.join(self.work_dir, "seg.mp4"),
+                use_cache=False, profile=self.profile, **kwargs
+            ))
+        cmd = commands[0]
+        return cmd, cmd[cmd.index("-filter_complex") + 1]
+
+    def test_still_image_loops_encoded_unit(self):
+        cmd, graph = self._segment_command()
+        self.assertEqual(cmd[cmd.index("-stream_loop") + 1], "-1")
+        self.assertEqual(cmd[cmd.index("-stream_loop") + 3], "/tmp/still_unit.mp4")
+        self.assertEqual(cmd[cmd.index("-c:v") + 1], "copy")
+        self.assertEqual(cmd[cmd.index("-frames:v") + 1], "120")
+        self.assertNotIn("[0:v]", graph)
+
+    def test_still_image_falls_back_when_unit_fails(self):
+        cmd, graph = self._segment_command(unit_path=None)
+        self.assertNotIn("-stream_loop", cmd)
+        self.assertIn("scale=1920:1080:force_original_aspect_ratio=decrease", graph)
+
+    def test_ken_burns_pans_with_crop(self):
+        cmd, graph = self._segment_command(ken_burns=True)
+        self.assertEqual(cmd[cmd.index("-framerate") + 1], "30")
+        self.assertIn("crop=1920:1080:x='(iw-ow)*min(t/4.0,1)'", graph)
+        self.assertNotIn("-stream_loop", cmd)
+
+    def test_falls_back_without_prescaled_image(self):
+        cmd, graph = self._segment_command(still_path=None)
+        self.assertNotIn("-framerate", cmd)
+        self.assertIn("scale=1920:1080:force_original_aspect_ratio=decrease", graph)
+
+    def test_cache_hit_skips_still_preparation(self):
+        cache = FileCacheService("test", os.path.join(self.work_dir, "cache"), suffix=".mp4")
+        visual = os.path.join(self.work_dir, "scene.png")
+        with open(visual, "wb") as f:
+            f.write(b"png")
+
+        def fake_download(url, output_path):
+            shutil.copyfile(visual, output_path)
+
+        def fake_run(cmd, **run_kwargs):
+            with open(cmd[-1], "wb") as f:
+                f.write(b"segment")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch("services.video_service.segment_cache", cache), \
+             patch.object(self.service, "_download_file", side_effect=fake_download), \
+             patch.object(self.service, "_prepare_still_image", return_value="/tmp/still.png") as prepare, \
+             patch.object(self.service, "_encode_still_unit", return_value=None) as encode_unit, \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            # 첫 렌더링은 단위 인코딩에 실패해 기존 방식으로 만들어도 같은 키로 저장됨
+            self.assertTrue(self.service._create_segment(
+                "/output/scene.png", None, 4, os.path.join(self.work_dir, "a.mp4"), use_cache=True, profile=self.profile
+            ))
+            encode_unit.return_value = "/tmp/still_unit.mp4"
+            info = {}
+            self.assertTrue(self.service._create_segment(
+                "/output/scene.png", None, 4, os.path.join(self.work_dir, "b.mp4"), use_cache=True,
+                profile=self.profile, render_info=info
+            ))
+
+        self.assertEqual(info["mode"], "cached")
+        self.assertEqual(prepare.call_count, 1)
+        self.assertEqual(encode_unit.call_count, 1)
+
+    def test_still_unit_uses_stillimage_tune(self):
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            with open(cmd[-1], "wb") as f:
+                f.write(b"unit")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            self.assertTrue(self.service._encode_still_unit("/tmp/still.png", self.profile, self.work_dir))
+        self.assertEqual(commands[0][commands[0].index("-tune") + 1], "stillimage")
+
+    @unittest.skipUnless(importlib.util.find_spec("PIL"), "Pillow 필요")
+    def test_prescale_letterboxes_to_exact_resolution(self):
+        from PIL import Image
+
+        source = os.path.join(self.work_dir, "square.png")
+        Image.new("RGBA", (512, 512), (255, 0, 0, 255)).save(source)
+
+        still = self.service._prepare_still_image(source, self.profile, self.work_dir)
+        with Image.open(still) as img:
+            self.assertEqual(img.size, (1920, 1080))
+            self.assertEqual(img.getpixel((0, 540)), (0, 0, 0))
+            self.assertEqual(img.getpixel((960, 540)), (255, 0, 0))
+
+        still = self.service._prepare_still_image(source, self.profile, self.work_dir, ken_burns=True)
+        with Image.open(still) as img:
+            self.assertEqual(img.size, (2112, 1188))
+
+
+class TestRenderProgress(unittest.TestCase):
+    """FFmpeg 진행 상황 파싱 및 진행률/남은 시간 계산 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+
+    def test_progress_pipe_is_parsed(self):
+        progress_output = [
+            "frame=30\n", "out_time_us=1000000\n", "out_time_ms=1000000\n", "speed=2.5x\n", "progress=continue\n",
+            "frame=60\n", "out_time_us=N/A\n", "speed=N/A\n", "progress=continue\n",
+            "out_time_us=3000000\n", "speed=3x\n", "progress=end\n"
+        ]
+
+        class FakeProcess:
+            stdout = iter(progress_output)
+            stderr = iter(["encoder warning\n"])
+            returncode = 0
+
+            def wait(self):
+                return 0
+
+            def poll(self):
+                return 0
+
+        reports = []
+        with patch("services.ffmpeg_runner.subprocess.Popen", return_value=FakeProcess()) as popen:
+            result = self.service._run_ffmpeg(["ffmpeg", "-y", "-i", "in.mp4", "out.mp4"], timeout=10,
+                                              on_progress=lambda t, sp: reports.append((t, sp)))
+
+        self.assertEqual(popen.call_args[0][0][:4], ["ffmpeg", "-progress", "pipe:1", "-nostats"])
+        self.assertEqual(reports, [(1.0, 2.5), (1.0, None), (3.0, 3.0)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("encoder warning", result.stderr)
+
+    def test_tracker_reports_percent_speed_and_eta(self):
+        progress, details = [], []
+        tracker = RenderProgress([4, 6], lambda p, m: progress.append((p, m)), details.append, min_interval=0)
+        tracker.started_at -= 2  # 2초 경과로 가정
+
+        tracker.update(0, 2.0, 1.0)
+        tracker.update(1, 3.0, 1.5)
+        self.assertEqual(details[-1]["percent"], 50.0)
+        self.assertEqual(details[-1]["encodedSeconds"], 5.0)
+        self.assertAlmostEqual(details[-1]["speed"], 2.5, places=1)
+        self.assertAlmostEqual(details[-1]["etaSeconds"], 2.0, places=0)
+        self.assertEqual(progress[-1][0], 45)
+        self.assertIn("남은 시간", progress[-1][1])
+
+        # 진행 보고가 이전 값보다 작아도 진행률은 줄지 않음
+        tracker.update(0, 1.0)
+        self.assertEqual(details[-1]["encodedSeconds"], 5.0)
+
+        tracker.scene_done(0)
+        tracker.scene_done(1)
+        self.assertEqual(progress[-1], (80, "씬 2/2 완료"))
+        self.assertEqual(details[-1]["etaSeconds"], 0)
+
+
+class TestAdaptiveTimeouts(unittest.TestCase):
+    """측정된 인코딩 속도 기반 FFmpeg 타임아웃 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+        self.work_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.work_dir, "encode_speed.json")
+        self.service.encode_speed = EncodeSpeedEstimator(state_path=self.state_path, safety=3, min_timeout=60)
+        self.profile = self.service.get_render_profile("final", "1080p")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _segment_timeout(self, duration, side_effect=None):
+        timeouts = []
+
+        def fake_download(url, output_path):
+            with open(output_path, "wb") as f:
+                f.write(b"png")
+
+        def fake_run(cmd, timeout, **kwargs):
+            timeouts.append(timeout)
+            if side_effect:
+                raise side_effect
+            with open(cmd[-1], "wb") as f:
+                f.write(b"segment")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch.object(self.service, "_download_file", side_effect=fake_download), \
+             patch.object(self.service, "_prepare_still_image", return_value=None), \
+             patch.object(self.service, "_run_ffmpeg", side_effect=fake_run):
+            ok = self.service._create_segment(
+                "/output/scene.png", None, duration, os.path.join(self.work_dir, "seg.mp4"),
+                use_cache=False, profile=self.profile
+            )
+        return ok, timeouts[0]
+
+    def test_prior_scales_with_preset_and_resolution(self):
+        estimator = self.service.encode_speed
+        fast_1080 = estimator.estimate(self.service.get_render_profile("draft", "1080p"))
+        slow_1080 = estimator.estimate(self.service.get_render_profile("final", "1080p"))
+        slow_4k = estimator.estimate(self.service.get_render_profile("final", "4k"))
+
+        self.assertGreater(fast_1080, slow_1080)
+        self.assertAlmostEqual(slow_4k, slow_1080 / 4)
+        self.assertEqual(estimator.timeout(self.profile, 1), 60)
+
+    def test_segment_timeout_scales_with_duration(self):
+        _, short_timeout = self._segment_timeout(5)
+        _, long_timeout = self._segment_timeout(120)
+
+        self.assertEqual(short_timeout, 60)
+        expected = 120 / self.service.encode_speed.estimate(self.profile) * 3 + 30
+        self.assertAlmostEqual(long_timeout, expected, places=0)
+        self.assertGreater(long_timeout, 120)
+
+    def test_measurements_update_estimate_and_persist(self):
+        estimator = self.service.encode_speed
+        estimator.record(self.profile, 10, 5)   # 2.0x
+        self.assertEqual(estimator.estimate(self.profile), 2.0)
+        estimator.record(self.profile, 10, 10)  # 1.0x → EWMA
+        self.assertAlmostEqual(estimator.estimate(self.profile), 0.3 * 1.0 + 0.7 * 2.0)
+        estimator.record(self.profile, 10, 0.01)  # 시작 비용뿐인 실행은 무시
+        self.assertAlmostEqual(estimator.estimate(self.profile), 1.7)
+
+        restarted = EncodeSpeedEstimator(state_path=self.state_path)
+        self.assertAlmostEqual(restarted.estimate(self.profile), 1.7)
+        self.assertEqual(restarted.snapshot()["medium@1920x1080"]["samples"], 2)
+
+    def test_timeout_lowers_estimate(self):
+        self.service.encode_speed.record(self.profile, 60, 10)  # 6.0x
+        ok, timeout = self._segment_timeout(60, side_effect=subprocess.TimeoutExpired(["ffmpeg"], 60))
+
+        self.assertFalse(ok)
+        self.assertLess(self.service.encode_speed.estimate(self.profile), 6.0)
+        self.assertGreater(self.service.encode_speed.timeout(self.profile, 60), timeout)
+
+
+class TestRenderProfiles(unittest.TestCase):
+    """작업별 렌더링 프로필 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+
+    def test_draft_keeps_aspect_ratio(self):
+        self.assertEqual(self.service.get_render_profile("draft", "1080p").resolution, "854x480")
+        self.assertEqual(self.service.get_render_profile("draft", "shorts").resolution, "480x854")
+
+    def test_draft_does_not_touch_shared_settings(self):
+        before = self.service.get_settings()
+        draft = self.service.get_render_profile("draft")
+        self.assertEqual(draft.preset, "ultrafast")
+        self.assertEqual(draft.audio_channels, 1)
+        self.assertEqual(self.service.get_settings(), before)
+
+    def test_final_follows_service_settings(self):
+        self.service.update_settings(preset="slow", bitrate="12M")
+        final = self.service.get_render_profile("final", "4k")
+        self.assertEqual((final.resolution, final.preset, final.bitrate), ("3840x2160", "slow", "12M"))
+
+    def test_unknown_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.get_render_profile("cinema")
+
+
+class TestSinglePassGraph(unittest.TestCase):
+    """단일 패스 필터 그래프 구성 테스트"""
+
+    def setUp(self):
+        with patch.object(VideoService, "_check_ffmpeg"):
+            self.service = VideoService()
+
+    def _item(self, **overrides):
+        item = {
+            "duration": 3.0, "video_volume": 1.0, "visual_path": None, "is_image": False,
+            "has_visual_audio": False, "audio_path": None, "audio_seek": 0.0
+        }
+        item.update(overrides)
+        return item
+
+    def test_graph_concats_all_scenes_in_order(self):
+        inputs = [
+            self._item(visual_path="a.png", is_image=True, audio_path="master.mp3", audio_seek=1.5),
+            self._item(visual_path="b.mp4", has_visual_audio=True, video_volume=0.5, audio_path="tts.mp3"),
+            self._item(duration=2.0)
+        ]
+        profile = self.service.get_render_profile("final", "1920x1080")
+        input_args, graph = self.service._build_single_pass_graph(inputs, profile)
+
+        self.assertEqual(input_args.count("-i"), 4)
+        self.assertIn("-ss", input_args)
+        self.assertTrue(graph.rstrip().endswith("[v0][a0][v1][a1][v2][a2]concat=n=3:v=1:a=1[v_out][a_out]"))
+        self.assertIn("[2:a]volume=0.5[va1]", graph)
+        self.assertIn("[va1][3:a]amix=inputs=2:duration=longest", graph)
+        self.assertIn("color=black:s=1920x1080", graph)
+        self.assertIn("anullsrc", graph)
+
+    def test_master_audio_replaces_scene_audio(self):
+        inputs = [self._item(visual_path="a.png", is_image=True), self._item(duration=2.0)]
+        master = {"path": "master.mp3", "start": 1.5, "total": 5.0}
+        input_args, graph = self.service._build_single_pass_graph(
+            inputs, self.service.get_render_profile("final", "720p"), master
+        )
+        self.assertEqual(input_args[-6:], ["-ss", "1.5", "-t", "5.0", "-i", "master.mp3"])
+        self.assertIn("[v0][v1]concat=n=2:v=1:a=0[v_out]", graph)
+        self.assertIn("[1:a]aresample=44100", graph)
+        self.assertTrue(graph.rstrip().endswith("[a_out]"))
+        self.assertNotIn("anullsrc", graph)
+
+    def test_every_scene_is_trimmed_to_its_duration(self):
+        inputs = [self._item(duration=4.25), self._item(visual_path="b.png", is_image=True, duration=1.5)]
+        _, graph = self.service._build_single_pass_graph(inputs, self.service.get_render_profile("final", "720p"))
+        self.assertEqual(graph.count("trim=duration=4.25"), 2)
+        self.assertEqual(graph.count("trim=duration=1.5"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Vrew 내보내기 미디어 경로 테스트
+TTS url 전달 방식(/output/...) 오디오가 .vrew 패키지에 포함되는지 검증
+"""
+import os
+import sys
+import shutil
+import zipfile
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_base import TTSResult, output_url
+from services.vrew_formatter import VrewProjectBuilder
+from services.vrew_service import VrewService
+
+
+class TestVrewOutputUrls(unittest.TestCase):
+    """/output/... 오디오 URL 내보내기 테스트"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, ignore_errors=True)
+        output_patch = patch("services.vrew_formatter.OUTPUT_DIR", self.output_dir)
+        output_patch.start()
+        self.addCleanup(output_patch.stop)
+
+    def test_tts_output_url_is_packaged(self):
+        audio_path = os.path.join(self.output_dir, "tts_scene.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"ID3-tts-audio")
+        tts_result = TTSResult(success=True, audio_url=output_url(audio_path, self.output_dir),
+                               audio_path=audio_path, engine="google")
+        self.assertEqual(tts_result.audio_url, "/output/tts_scene.mp3")
+
+        vrew_url = VrewService().generate_vrew_project({"mergedGroups": [], "standalone": [{
+            "audioUrl": tts_result.audio_url,
+            "duration": 3.0,
+            "srtData": "1\n00:00:00,000 --> 00:00:03,000\n테스트 스크립트"
+        }]})
+
+        with zipfile.ZipFile(os.path.join(self.output_dir, vrew_url.rsplit("/", 1)[-1])) as zf:
+            media = [name for name in zf.namelist() if name.startswith("media/")]
+            self.assertEqual(len(media), 1)
+            self.assertEqual(zf.read(media[0]), b"ID3-tts-audio")
+
+    def test_output_url_outside_output_dir_is_rejected(self):
+        builder = VrewProjectBuilder()
+        self.assertIsNone(builder._resolve_file("/output/../secret.mp3", ".mp3"))
+        self.assertIsNone(builder._resolve_file("/output/missing.mp3", ".mp3"))
+
+
+if __name__ == "__main__":
+    unittest.main()